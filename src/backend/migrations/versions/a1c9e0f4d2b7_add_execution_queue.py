@@ -0,0 +1,57 @@
+"""Create execution_queue table
+
+Revision ID: a1c9e0f4d2b7
+Revises: 61d6a53cc4b8
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c9e0f4d2b7'
+down_revision: Union[str, None] = '61d6a53cc4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check if table already exists
+    inspector = sa.inspect(connection)
+    if 'execution_queue' in inspector.get_table_names():
+        logger.info("Table execution_queue already exists, skipping creation")
+        return
+    
+    op.create_table(
+        'execution_queue',
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('job_id', sa.String, nullable=False, unique=True, index=True),
+        sa.Column('execution_type', sa.String, nullable=False, server_default='crew'),
+        sa.Column('trigger_type', sa.String, nullable=False, server_default='api'),
+        sa.Column('payload', sa.JSON, nullable=False),
+        sa.Column('status', sa.String, nullable=False, server_default='pending'),
+        sa.Column('priority', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer, nullable=False, server_default='3'),
+        sa.Column('worker_id', sa.String, nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime, nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime, nullable=True),
+        sa.Column('available_at', sa.DateTime, nullable=True),
+        sa.Column('last_error', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=True),
+        sa.Column('updated_at', sa.DateTime, nullable=True)
+    )
+    op.create_index('idx_execution_queue_claim', 'execution_queue', ['status', 'priority', 'available_at'])
+    op.create_index('idx_execution_queue_lease', 'execution_queue', ['status', 'lease_expires_at'])
+
+def downgrade() -> None:
+    op.drop_index('idx_execution_queue_lease', table_name='execution_queue')
+    op.drop_index('idx_execution_queue_claim', table_name='execution_queue')
+    op.drop_table('execution_queue')
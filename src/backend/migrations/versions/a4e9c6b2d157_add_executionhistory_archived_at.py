@@ -0,0 +1,36 @@
+"""Add archived_at to executionhistory
+
+Revision ID: a4e9c6b2d157
+Revises: f3c7d2a8b914
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9c6b2d157'
+down_revision: Union[str, None] = 'f3c7d2a8b914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check if column already exists
+    inspector = sa.inspect(connection)
+    columns = [column['name'] for column in inspector.get_columns('executionhistory')]
+    if 'archived_at' in columns:
+        logger.info("Column executionhistory.archived_at already exists, skipping creation")
+        return
+    
+    op.add_column('executionhistory', sa.Column('archived_at', sa.DateTime, nullable=True))
+
+def downgrade() -> None:
+    op.drop_column('executionhistory', 'archived_at')
@@ -0,0 +1,46 @@
+"""Create task_checkpoint table
+
+Revision ID: b7d3f8a2c915
+Revises: a1c9e0f4d2b7
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3f8a2c915'
+down_revision: Union[str, None] = 'a1c9e0f4d2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check if table already exists
+    inspector = sa.inspect(connection)
+    if 'task_checkpoint' in inspector.get_table_names():
+        logger.info("Table task_checkpoint already exists, skipping creation")
+        return
+    
+    op.create_table(
+        'task_checkpoint',
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('job_id', sa.String, nullable=False, index=True),
+        sa.Column('task_index', sa.Integer, nullable=False),
+        sa.Column('task_key', sa.String, nullable=False),
+        sa.Column('agent_name', sa.String, nullable=True),
+        sa.Column('raw_output', sa.Text, nullable=False),
+        sa.Column('json_output', sa.JSON, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=True),
+        sa.UniqueConstraint('job_id', 'task_index', name='uq_task_checkpoint_job_task')
+    )
+
+def downgrade() -> None:
+    op.drop_table('task_checkpoint')
@@ -0,0 +1,47 @@
+"""Create execution_purge table
+
+Revision ID: b8f2d4e6a931
+Revises: a4e9c6b2d157
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f2d4e6a931'
+down_revision: Union[str, None] = 'a4e9c6b2d157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+
+    # Check if table already exists
+    inspector = sa.inspect(connection)
+    if 'execution_purge' in inspector.get_table_names():
+        logger.info("Table execution_purge already exists, skipping creation")
+        return
+
+    op.create_table(
+        'execution_purge',
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('status', sa.String, nullable=False, index=True),
+        sa.Column('scope', sa.String, nullable=False),
+        sa.Column('job_ids', sa.JSON, nullable=True),
+        sa.Column('max_ids', sa.JSON, nullable=True),
+        sa.Column('current_table', sa.String, nullable=True),
+        sa.Column('deleted', sa.JSON, nullable=False),
+        sa.Column('started_at', sa.DateTime, nullable=True, index=True),
+        sa.Column('finished_at', sa.DateTime, nullable=True),
+        sa.Column('error', sa.Text, nullable=True)
+    )
+
+def downgrade() -> None:
+    op.drop_table('execution_purge')
@@ -0,0 +1,39 @@
+"""Add rpm_limit and tpm_limit to modelconfig
+
+Revision ID: c4e8a1d7f302
+Revises: b7d3f8a2c915
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1d7f302'
+down_revision: Union[str, None] = 'b7d3f8a2c915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check which columns already exist
+    inspector = sa.inspect(connection)
+    columns = {column['name'] for column in inspector.get_columns('modelconfig')}
+    
+    for name in ('rpm_limit', 'tpm_limit'):
+        if name in columns:
+            logger.info(f"Column modelconfig.{name} already exists, skipping")
+            continue
+        op.add_column('modelconfig', sa.Column(name, sa.Integer(), nullable=True))
+        logger.info(f"Added column modelconfig.{name}")
+
+def downgrade() -> None:
+    op.drop_column('modelconfig', 'tpm_limit')
+    op.drop_column('modelconfig', 'rpm_limit')
@@ -0,0 +1,52 @@
+"""Create llm_usage table
+
+Revision ID: d5a2f7c3e810
+Revises: c4e8a1d7f302
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a2f7c3e810'
+down_revision: Union[str, None] = 'c4e8a1d7f302'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check if table already exists
+    inspector = sa.inspect(connection)
+    if 'llm_usage' in inspector.get_table_names():
+        logger.info("Table llm_usage already exists, skipping creation")
+        return
+    
+    op.create_table(
+        'llm_usage',
+        sa.Column('id', sa.Integer, primary_key=True, index=True),
+        sa.Column('execution_id', sa.String, nullable=False, index=True),
+        sa.Column('agent_name', sa.String, nullable=False, server_default=''),
+        sa.Column('model', sa.String, nullable=False, index=True),
+        sa.Column('calls', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('failed_calls', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('prompt_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('completion_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('total_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('cost', sa.Float, nullable=False, server_default='0'),
+        sa.Column('latency_ms_total', sa.Float, nullable=False, server_default='0'),
+        sa.Column('latency_ms_max', sa.Float, nullable=False, server_default='0'),
+        sa.Column('first_call_at', sa.DateTime, nullable=True),
+        sa.Column('last_call_at', sa.DateTime, nullable=True),
+        sa.UniqueConstraint('execution_id', 'agent_name', 'model', name='uq_llm_usage_execution_agent_model')
+    )
+
+def downgrade() -> None:
+    op.drop_table('llm_usage')
@@ -0,0 +1,98 @@
+"""Create llmlog_daily_stats table
+
+Revision ID: e8b4c1a9d263
+Revises: d5a2f7c3e810
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4c1a9d263'
+down_revision: Union[str, None] = 'd5a2f7c3e810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Latency bucket upper bounds in ms as of this revision (src.models.log)
+LATENCY_BUCKET_BOUNDS_MS = (100, 250, 500, 1000, 2000, 5000, 10000, 20000, 30000, 60000, 120000)
+LLMLOG_DAILY_STATS_COLUMNS = [
+    'day', 'endpoint', 'model', 'latency_bucket', 'calls', 'errors',
+    'tokens_used', 'duration_ms_total', 'duration_ms_max',
+]
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    
+    # Check if table already exists
+    inspector = sa.inspect(connection)
+    if 'llmlog_daily_stats' in inspector.get_table_names():
+        logger.info("Table llmlog_daily_stats already exists, skipping creation")
+        return
+    
+    op.create_table(
+        'llmlog_daily_stats',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('day', sa.Date, nullable=False, index=True),
+        sa.Column('endpoint', sa.String, nullable=False),
+        sa.Column('model', sa.String, nullable=False),
+        sa.Column('latency_bucket', sa.Integer, nullable=False),
+        sa.Column('calls', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('errors', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('tokens_used', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('duration_ms_total', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('duration_ms_max', sa.Integer, nullable=False, server_default='0'),
+        sa.UniqueConstraint('day', 'endpoint', 'model', 'latency_bucket', name='uq_llmlog_daily_stats_key')
+    )
+    
+    # Roll up the logs written before this table existed
+    if 'llmlog' in inspector.get_table_names():
+        llmlog = sa.table(
+            'llmlog',
+            sa.column('created_at', sa.DateTime),
+            sa.column('endpoint', sa.String),
+            sa.column('model', sa.String),
+            sa.column('status', sa.String),
+            sa.column('tokens_used', sa.Integer),
+            sa.column('duration_ms', sa.Integer),
+        )
+        daily_stats = sa.table(
+            'llmlog_daily_stats',
+            *[sa.column(name) for name in LLMLOG_DAILY_STATS_COLUMNS]
+        )
+        # Bounds are inlined so PostgreSQL sees identical SELECT and GROUP BY expressions
+        bucket = sa.case(
+            (llmlog.c.duration_ms.is_(None), sa.literal_column('-1')),
+            *[
+                (llmlog.c.duration_ms <= sa.literal_column(str(bound)), sa.literal_column(str(index)))
+                for index, bound in enumerate(LATENCY_BUCKET_BOUNDS_MS)
+            ],
+            else_=sa.literal_column(str(len(LATENCY_BUCKET_BOUNDS_MS))),
+        )
+        day = sa.func.date(llmlog.c.created_at)
+        rollup = (
+            sa.select(
+                day,
+                llmlog.c.endpoint,
+                llmlog.c.model,
+                bucket,
+                sa.func.count(),
+                sa.func.sum(sa.case((llmlog.c.status == 'success', 0), else_=1)),
+                sa.func.coalesce(sa.func.sum(llmlog.c.tokens_used), 0),
+                sa.func.coalesce(sa.func.sum(llmlog.c.duration_ms), 0),
+                sa.func.coalesce(sa.func.max(llmlog.c.duration_ms), 0),
+            )
+            .where(llmlog.c.created_at.is_not(None))
+            .group_by(day, llmlog.c.endpoint, llmlog.c.model, bucket)
+        )
+        result = connection.execute(daily_stats.insert().from_select(LLMLOG_DAILY_STATS_COLUMNS, rollup))
+        logger.info(f"Backfilled {result.rowcount} llmlog_daily_stats rows from existing logs")
+
+def downgrade() -> None:
+    op.drop_table('llmlog_daily_stats')
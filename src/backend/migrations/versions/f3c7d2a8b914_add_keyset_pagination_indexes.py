@@ -0,0 +1,46 @@
+"""Add keyset pagination indexes to execution history and traces
+
+Revision ID: f3c7d2a8b914
+Revises: e8b4c1a9d263
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7d2a8b914'
+down_revision: Union[str, None] = 'e8b4c1a9d263'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index name, columns)
+INDEXES = [
+    ('executionhistory', 'idx_executionhistory_created_at_id', ['created_at', 'id']),
+    ('execution_trace', 'idx_execution_trace_created_at_id', ['created_at', 'id']),
+    ('execution_trace', 'idx_execution_trace_job_id_created_at_id', ['job_id', 'created_at', 'id']),
+]
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    tables = set(inspector.get_table_names())
+    
+    for table, name, columns in INDEXES:
+        if table not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if name in existing:
+            logger.info(f"Index {name} already exists, skipping creation")
+            continue
+        op.create_index(name, table, columns)
+
+def downgrade() -> None:
+    for table, name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
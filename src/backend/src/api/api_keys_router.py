@@ -42,6 +42,17 @@ async def get_api_keys(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache-stats")
+async def get_api_key_cache_stats():
+    """
+    Get hit/miss statistics of the decrypted API key cache.
+    
+    Returns:
+        Cache statistics
+    """
+    return ApiKeysService.get_cache_stats()
+
+
 @router.post("", response_model=ApiKeyResponse, status_code=status.HTTP_201_CREATED)
 async def create_api_key(
     api_key_data: ApiKeyCreate,
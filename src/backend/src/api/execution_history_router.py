@@ -5,6 +5,7 @@ This module provides API endpoints for retrieving, managing, and deleting
 execution history records and related data.
 """
 
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
 
@@ -13,9 +14,11 @@ from src.services.execution_history_service import ExecutionHistoryService, get_
 from src.schemas.execution_history import (
     ExecutionHistoryList,
     ExecutionHistoryItem,
+    ExecutionResult,
     ExecutionOutputList,
     ExecutionOutputDebugList,
-    DeleteResponse
+    DeleteResponse,
+    PurgeStatusResponse
 )
 
 # Get logger from the centralized logging system
@@ -30,21 +33,35 @@ router = APIRouter(
 async def get_execution_history(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all executions"),
+    summary: bool = Query(False, description="Return result previews instead of inputs and full results"),
     service: ExecutionHistoryService = Depends(get_execution_history_service)
 ):
     """
     Get a paginated list of execution history.
     
+    In summary mode the inputs and results are not loaded; each item has a
+    result_preview, and the full result is available from /{job_id}/result.
+    
     Args:
         limit: Maximum number of executions to return (1-100)
-        offset: Pagination offset
+        offset: Pagination offset, ignored when a cursor is given
+        cursor: Cursor of the previous page for keyset pagination
+        include_total: Whether to count all executions
+        summary: Whether to return summary items
         service: ExecutionHistoryService instance
     
     Returns:
         ExecutionHistoryList with paginated execution history
     """
     try:
-        return await service.get_execution_history(limit, offset)
+        return await service.get_execution_history(limit, offset, cursor, include_total, summary)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting execution history: {str(e)}")
         raise HTTPException(
@@ -120,11 +137,45 @@ async def get_execution_by_id(
             detail=f"Failed to retrieve execution: {str(e)}"
         )
 
+@router.get("/{job_id}/result", response_model=ExecutionResult)
+async def get_execution_result(
+    job_id: str,
+    service: ExecutionHistoryService = Depends(get_execution_history_service)
+):
+    """
+    Get the full result of an execution.
+    
+    Args:
+        job_id: String ID of the execution
+        service: ExecutionHistoryService instance
+    
+    Returns:
+        ExecutionResult with the execution's result
+    """
+    try:
+        result = await service.get_execution_result(job_id)
+        if not result:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Execution with job_id {job_id} not found"
+            )
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting result of execution {job_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve execution result: {str(e)}"
+        )
+
 @router.get("/{execution_id}/outputs", response_model=ExecutionOutputList)
 async def get_execution_outputs(
     execution_id: str,
     limit: int = Query(1000, ge=1, le=5000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all outputs of the execution"),
     service: ExecutionHistoryService = Depends(get_execution_history_service)
 ):
     """
@@ -133,14 +184,21 @@ async def get_execution_outputs(
     Args:
         execution_id: String ID of the execution
         limit: Maximum number of outputs to return (1-5000)
-        offset: Pagination offset
+        offset: Pagination offset, ignored when a cursor is given
+        cursor: Cursor of the previous page for keyset pagination
+        include_total: Whether to count all outputs of the execution
         service: ExecutionHistoryService instance
     
     Returns:
         ExecutionOutputList with paginated execution outputs
     """
     try:
-        return await service.get_execution_outputs(execution_id, limit, offset)
+        return await service.get_execution_outputs(execution_id, limit, offset, cursor, include_total)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting outputs for execution {execution_id}: {str(e)}")
         raise HTTPException(
@@ -180,15 +238,38 @@ async def get_execution_debug_outputs(
             detail=f"Failed to retrieve debug outputs: {str(e)}"
         )
 
-@router.delete("/history", response_model=DeleteResponse)
+@router.get("/purges/{purge_id}", response_model=PurgeStatusResponse)
+async def get_purge_status(
+    purge_id: str,
+    service: ExecutionHistoryService = Depends(get_execution_history_service)
+):
+    """
+    Get the progress of a background purge started by a delete request.
+    
+    Args:
+        purge_id: ID returned by the delete request
+        service: ExecutionHistoryService instance
+    
+    Returns:
+        PurgeStatusResponse with the rows deleted so far
+    """
+    result = await service.get_purge_status(purge_id)
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Purge {purge_id} not found"
+        )
+    return result
+
+@router.delete("/history", response_model=DeleteResponse, status_code=status.HTTP_202_ACCEPTED)
 async def delete_all_executions(
     service: ExecutionHistoryService = Depends(get_execution_history_service)
 ):
     """
-    Delete all executions and their associated data.
+    Delete all executions and their associated data in the background.
     
     Returns:
-        DeleteResponse with information about the deleted data
+        DeleteResponse with the purge ID to poll at /purges/{purge_id}
     """
     try:
         return await service.delete_all_executions()
@@ -199,20 +280,20 @@ async def delete_all_executions(
             detail=f"Failed to delete executions: {str(e)}"
         )
 
-@router.delete("/history/{execution_id}", response_model=DeleteResponse)
+@router.delete("/history/{execution_id}", response_model=DeleteResponse, status_code=status.HTTP_202_ACCEPTED)
 async def delete_execution(
     execution_id: int, 
     service: ExecutionHistoryService = Depends(get_execution_history_service)
 ):
     """
-    Delete a specific execution and its associated data.
+    Delete a specific execution and its associated data in the background.
     
     Args:
         execution_id: Database ID of the execution
         service: ExecutionHistoryService instance
     
     Returns:
-        DeleteResponse with information about the deleted data
+        DeleteResponse with the purge ID to poll at /purges/{purge_id}
     """
     try:
         result = await service.delete_execution(execution_id)
@@ -231,20 +312,20 @@ async def delete_execution(
             detail=f"Failed to delete execution: {str(e)}"
         )
 
-@router.delete("/{job_id}", response_model=DeleteResponse)
+@router.delete("/{job_id}", response_model=DeleteResponse, status_code=status.HTTP_202_ACCEPTED)
 async def delete_execution_by_job_id(
     job_id: str, 
     service: ExecutionHistoryService = Depends(get_execution_history_service)
 ):
     """
-    Delete an execution by its job_id.
+    Delete an execution by its job_id in the background.
     
     Args:
         job_id: String ID (UUID) of the execution
         service: ExecutionHistoryService instance
     
     Returns:
-        DeleteResponse with information about the deleted data
+        DeleteResponse with the purge ID to poll at /purges/{purge_id}
     """
     try:
         result = await service.delete_execution_by_job_id(job_id)
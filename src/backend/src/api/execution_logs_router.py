@@ -5,8 +5,8 @@ This module provides endpoints for real-time execution log streaming
 and retrieving historical execution logs.
 """
 
-from typing import List, Dict
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
+from typing import List, Dict, Optional
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query, Response
 
 from src.core.logger import LoggerManager
 from src.services.execution_logs_service import execution_logs_service
@@ -56,26 +56,35 @@ async def websocket_execution_logs(websocket: WebSocket, execution_id: str):
 
 @logs_router.get("/executions/{execution_id}", response_model=List[ExecutionLogResponse])
 async def get_execution_logs(
+    response: Response,
     execution_id: str,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor of the previous page"),
 ):
     """
     Get historical execution logs.
     
     This endpoint allows retrieval of past logs for a specific execution.
+    The cursor of the next page is returned in the X-Next-Cursor header.
     
     Args:
+        response: FastAPI Response object
         execution_id: ID of the execution to get logs for
         limit: Maximum number of logs to return
-        offset: Number of logs to skip
+        offset: Number of logs to skip, ignored when a cursor is given
+        cursor: Cursor of the previous page
         
     Returns:
         List of execution logs with their timestamps
     """
     try:
-        logs = await execution_logs_service.get_execution_logs(execution_id, limit, offset)
-        return logs
+        page = await execution_logs_service.get_execution_logs_page(execution_id, limit, offset, cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.logs
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching execution logs: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch execution logs: {str(e)}")
@@ -85,6 +94,7 @@ async def get_run_logs(
     run_id: str,
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
 ):
     """
     Get historical logs for a specific run.
@@ -95,14 +105,16 @@ async def get_run_logs(
     Args:
         run_id: ID of the run to get logs for
         limit: Maximum number of logs to return
-        offset: Number of logs to skip
+        offset: Number of logs to skip, ignored when a cursor is given
+        cursor: Cursor of the previous page
         
     Returns:
-        Dictionary with a list of run logs with their timestamps
+        Dictionary with a list of run logs with their timestamps and the next cursor
     """
     try:
-        logs = await execution_logs_service.get_execution_logs(run_id, limit, offset)
-        return ExecutionLogsResponse(logs=logs)
+        return await execution_logs_service.get_execution_logs_page(run_id, limit, offset, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching run logs: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch run logs: {str(e)}")
@@ -16,7 +16,8 @@ from src.schemas.execution_trace import (
     ExecutionTraceList,
     ExecutionTraceResponseByRunId,
     ExecutionTraceResponseByJobId,
-    DeleteTraceResponse
+    DeleteTraceResponse,
+    ExecutionQueueStatsResponse
 )
 
 # Get logger from the centralized logging system
@@ -30,20 +31,29 @@ router = APIRouter(
 @router.get("/", response_model=ExecutionTraceList)
 async def get_all_traces(
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True, description="Count all traces")
 ):
     """
     Get a paginated list of all execution traces.
     
     Args:
         limit: Maximum number of traces to return (1-500)
-        offset: Pagination offset
+        offset: Pagination offset, ignored when a cursor is given
+        cursor: Cursor of the previous page for keyset pagination
+        include_total: Whether to count all traces
     
     Returns:
         ExecutionTraceList with paginated execution traces
     """
     try:
-        return await ExecutionTraceService.get_all_traces(limit, offset)
+        return await ExecutionTraceService.get_all_traces(limit, offset, cursor, include_total)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting all traces: {str(e)}")
         raise HTTPException(
@@ -55,21 +65,23 @@ async def get_all_traces(
 async def get_traces_by_run_id(
     run_id: int, 
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
 ):
     """
-    Get traces for an execution by run_id.
+    Get traces for an execution by run_id, oldest first.
     
     Args:
         run_id: Database ID of the execution
         limit: Maximum number of traces to return (1-500)
-        offset: Pagination offset
+        offset: Pagination offset, ignored when a cursor is given
+        cursor: Cursor of the previous page for keyset pagination
     
     Returns:
         ExecutionTraceResponseByRunId with traces for the execution
     """
     try:
-        result = await ExecutionTraceService.get_traces_by_run_id(None, run_id, limit, offset)
+        result = await ExecutionTraceService.get_traces_by_run_id(None, run_id, limit, offset, cursor)
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -78,6 +90,11 @@ async def get_traces_by_run_id(
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting traces for execution {run_id}: {str(e)}")
         raise HTTPException(
@@ -89,21 +106,23 @@ async def get_traces_by_run_id(
 async def get_traces_by_job_id(
     job_id: str, 
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
 ):
     """
-    Get traces for an execution by job_id.
+    Get traces for an execution by job_id, oldest first.
     
     Args:
         job_id: String ID of the execution (job_id)
         limit: Maximum number of traces to return (1-500)
-        offset: Pagination offset
+        offset: Pagination offset, ignored when a cursor is given
+        cursor: Cursor of the previous page for keyset pagination
     
     Returns:
         ExecutionTraceResponseByJobId with traces for the execution
     """
     try:
-        result = await ExecutionTraceService.get_traces_by_job_id(None, job_id, limit, offset)
+        result = await ExecutionTraceService.get_traces_by_job_id(None, job_id, limit, offset, cursor)
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -112,6 +131,11 @@ async def get_traces_by_job_id(
         return result
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting traces for execution with job_id {job_id}: {str(e)}")
         raise HTTPException(
@@ -119,6 +143,26 @@ async def get_traces_by_job_id(
             detail=f"Failed to retrieve traces: {str(e)}"
         )
 
+@router.get("/job/{job_id}/queue-stats", response_model=ExecutionQueueStatsResponse)
+async def get_queue_stats_by_job_id(job_id: str):
+    """
+    Get trace and log queue drop/lag counters for an execution.
+    
+    Args:
+        job_id: String ID of the execution (job_id)
+    
+    Returns:
+        ExecutionQueueStatsResponse with per-queue counters
+    """
+    try:
+        return ExecutionTraceService.get_queue_stats(job_id)
+    except Exception as e:
+        logger.error(f"Error getting queue stats for job_id {job_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve queue stats: {str(e)}"
+        )
+
 @router.get("/{trace_id}", response_model=ExecutionTraceItem)
 async def get_trace_by_id(trace_id: int):
     """
@@ -9,6 +9,7 @@ import logging
 import asyncio
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 import uuid
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, UTC
 from sqlalchemy import select
@@ -25,7 +26,9 @@ from src.schemas.execution import (
     ExecutionNameGenerationRequest,
     ExecutionNameGenerationResponse
 )
+from src.schemas.llm_usage import ExecutionLLMUsageResponse, ModelUsageSummary
 from src.services.execution_service import ExecutionService
+from src.services.llm_usage_service import LLMUsageService
 from src.services.flow_service import FlowService
 
 # Get logger from the centralized logging system
@@ -102,6 +105,34 @@ async def create_execution(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/llm-usage", response_model=list[ModelUsageSummary])
+async def get_llm_usage_summary(days: Optional[int] = None, db: AsyncSession = Depends(get_db)):
+    """
+    Get LLM calls, tokens, cost and latency per model across executions.
+    
+    Args:
+        days: Only include usage from the last N days
+        
+    Returns:
+        List of ModelUsageSummary ordered by model
+    """
+    return await LLMUsageService(db).get_model_summary(days)
+
+
+@router.get("/{execution_id}/llm-usage", response_model=ExecutionLLMUsageResponse)
+async def get_execution_llm_usage(execution_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Get the LLM usage of an execution per agent and model.
+    
+    Args:
+        execution_id: ID of the execution
+        
+    Returns:
+        ExecutionLLMUsageResponse with per agent and model rows and totals
+    """
+    return await LLMUsageService(db).get_execution_usage(execution_id)
+
+
 @router.get("/{execution_id}", response_model=ExecutionResponse)
 async def get_execution_status(execution_id: str, db: AsyncSession = Depends(get_db)):
     """
@@ -95,7 +95,8 @@ async def get_log_stats(
         log_service: Injected log service
         
     Returns:
-        Dictionary with usage statistics
+        Dictionary with counts, token sums, error rates and latency
+        percentiles in total, per endpoint, per model and per endpoint and model
     """
     try:
         return await log_service.get_log_stats(days)
@@ -14,6 +14,7 @@ from src.schemas.model_config import (
     ModelToggleUpdate
 )
 from src.services.model_config_service import ModelConfigService
+from src.utils.rate_limiter import get_rate_limiter
 
 router = APIRouter(
     prefix="/models",
@@ -84,6 +85,17 @@ async def get_enabled_models(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/rate-limits", response_model=Dict[str, Dict[str, Any]])
+async def get_rate_limits():
+    """
+    Get the current request and token bucket levels of rate-limited models.
+    
+    Returns:
+        Bucket levels and wait counters by model
+    """
+    return get_rate_limiter().get_levels()
+
+
 @router.get("/{model_key}", response_model=ModelConfigResponse)
 async def get_model(
     model_key: str,
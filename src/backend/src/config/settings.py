@@ -34,10 +34,25 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     DATABASE_URI: Optional[str] = None
     SYNC_DATABASE_URI: Optional[str] = None
+    # Pool sizing for the per-event-loop engines used off the main loop
+    DB_LOOP_ENGINE_POOL_SIZE: int = 2
+    DB_LOOP_ENGINE_MAX_OVERFLOW: int = 3
     
     # Database file path for SQLite
     SQLITE_DB_PATH: str = os.getenv("SQLITE_DB_PATH", "./app.db")
     DB_FILE_PATH: str = os.getenv("DB_FILE_PATH", "sqlite.db")
+    # SQLite performance profile applied to every new connection: WAL journal,
+    # synchronous=NORMAL and the limits below
+    SQLITE_TUNING_ENABLED: bool = True
+    # Milliseconds a connection waits for the write lock before "database is locked"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # Page cache in KiB, allocated by every connection separately: each pooled
+    # engine (one per event loop) holds several, so keep this small
+    SQLITE_CACHE_SIZE_KB: int = 4096
+    # Bytes of the database file memory-mapped per connection
+    SQLITE_MMAP_SIZE_BYTES: int = 268435456
+    # Serialize write transactions of the main writers through one writer task
+    SQLITE_SINGLE_WRITER: bool = False
 
     @field_validator("DATABASE_URI", mode="before")
     def assemble_db_connection(cls, v: Optional[str], info) -> Any:
@@ -89,6 +104,146 @@ class Settings(BaseSettings):
     # Add the following setting to control database seeding
     AUTO_SEED_DATABASE: bool = True
 
+    # Trace/log writer batching: flush when this many rows are pending or the
+    # oldest pending row has waited this many seconds
+    WRITER_BATCH_SIZE: int = 200
+    WRITER_FLUSH_INTERVAL_SECONDS: float = 0.5
+
+    # Trace/log queue bounds and overflow policies (block, drop_oldest, sample)
+    TRACE_QUEUE_MAXSIZE: int = 10000
+    LOG_QUEUE_MAXSIZE: int = 20000
+    TRACE_QUEUE_DEFAULT_POLICY: str = "drop_oldest"
+    TRACE_QUEUE_EVENT_POLICIES: Dict[str, str] = {
+        "crew_started": "block",
+        "crew_completed": "block",
+        "task_started": "block",
+        "task_completed": "block",
+        "llm_call": "sample",
+    }
+    LOG_QUEUE_POLICY: str = "drop_oldest"
+    QUEUE_BLOCK_TIMEOUT_SECONDS: float = 1.0
+    # SAMPLE items are kept 1 in QUEUE_SAMPLE_RATE once the queue is this full
+    QUEUE_SAMPLE_RATE: int = 10
+    QUEUE_SAMPLE_HIGH_WATERMARK: float = 0.5
+
+    # Registry of job IDs known to exist, checked by the trace writer before the DB
+    JOB_REGISTRY_MAX_SIZE: int = 5000
+    JOB_REGISTRY_TTL_SECONDS: float = 6 * 60 * 60
+    JOB_REGISTRY_FINISHED_TTL_SECONDS: float = 300
+
+    # Where crews run: "thread" (in the API process) or "process" (worker processes)
+    CREW_EXECUTION_BACKEND: str = "thread"
+    # Maximum number of concurrent crew worker processes
+    CREW_PROCESS_POOL_SIZE: int = 4
+    # Seconds to wait for a cancelled worker to exit before killing it
+    CREW_PROCESS_TERMINATE_TIMEOUT_SECONDS: float = 10.0
+
+    # Execution admission control; 0 means unlimited
+    EXECUTION_MAX_CONCURRENT: int = 0
+    EXECUTION_MAX_CONCURRENT_PER_MODEL: Dict[str, int] = {}
+    EXECUTION_DEFAULT_MAX_CONCURRENT_PER_MODEL: int = 0
+    # Queue priority by trigger type (lower is admitted first)
+    EXECUTION_TRIGGER_PRIORITIES: Dict[str, int] = {"api": 0, "schedule": 1, "flow": 2}
+    # Seconds of waiting that raise a pending execution by one priority level
+    EXECUTION_PRIORITY_AGING_SECONDS: float = 300.0
+
+    # Durable execution queue: the API only enqueues, workers claim and run
+    EXECUTION_QUEUE_ENABLED: bool = False
+    # Run a queue worker inside the API process (disable on API-only nodes)
+    EXECUTION_WORKER_ENABLED: bool = True
+    # Executions a single worker runs at once
+    EXECUTION_WORKER_CONCURRENCY: int = 4
+    # Seconds a claim stays valid without a heartbeat
+    EXECUTION_QUEUE_LEASE_SECONDS: float = 120.0
+    EXECUTION_QUEUE_HEARTBEAT_SECONDS: float = 30.0
+    # Seconds between claim attempts of an idle worker
+    EXECUTION_QUEUE_POLL_SECONDS: float = 2.0
+    # Claims allowed before a queued execution is failed
+    EXECUTION_QUEUE_MAX_ATTEMPTS: int = 3
+    EXECUTION_QUEUE_RETRY_DELAY_SECONDS: float = 30.0
+
+    # Checkpoint finished task outputs so execution retries resume from the first unfinished task
+    TASK_CHECKPOINTS_ENABLED: bool = True
+
+    # Cache of resolved model configs and provider API keys used by LLMManager; 0 disables
+    LLM_CONFIG_CACHE_TTL_SECONDS: float = 300.0
+    LLM_CONFIG_CACHE_MAX_SIZE: int = 256
+
+    # Cache of decrypted API keys held by ApiKeysService; 0 disables.
+    # Writing a key only invalidates the cache of the process that wrote it:
+    # other API workers, queue workers (python -m src.worker) and crew worker
+    # processes keep serving a rotated or deleted key for up to this TTL.
+    # Lower it where keys must take effect sooner.
+    SECRET_CACHE_TTL_SECONDS: float = 300.0
+    SECRET_CACHE_MAX_SIZE: int = 128
+
+    # Structured LLM call log (llm_calls.jsonl), written by a background thread
+    LLM_CALL_LOG_ENABLED: bool = True
+    LLM_CALL_LOG_QUEUE_SIZE: int = 10000
+    # Maximum characters kept per prompt/response string; 0 keeps them whole
+    LLM_CALL_LOG_MAX_PAYLOAD_CHARS: int = 2000
+    # Fraction of successful calls logged with their prompt and response
+    LLM_CALL_LOG_PAYLOAD_SAMPLE_RATE: float = 1.0
+
+    # Disk-backed cache of generation completions (crews, agents, tasks, templates, names)
+    LLM_RESPONSE_CACHE_ENABLED: bool = False
+    # SQLite file for cached responses; empty uses cache/llm_responses.db under the backend
+    LLM_RESPONSE_CACHE_PATH: str = ""
+    LLM_RESPONSE_CACHE_TTL_SECONDS: float = 86400.0
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 5000
+    # Also cache completions sampled with temperature above zero
+    LLM_RESPONSE_CACHE_FORCE: bool = False
+
+    # Texts per embedding request; 0 uses the provider's limit
+    EMBEDDING_BATCH_SIZE: int = 0
+    # Embedding batches sent concurrently
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+
+    # Persistent embedding cache keyed by provider, model and text hash
+    EMBEDDING_CACHE_ENABLED: bool = True
+    # SQLite file for cached vectors; empty uses cache/embeddings.db under the backend
+    EMBEDDING_CACHE_PATH: str = ""
+
+    # Per-model request/token rate limits from model configs (rpm_limit, tpm_limit)
+    RATE_LIMIT_ENABLED: bool = True
+    # Limits for models without their own; 0 is unlimited
+    RATE_LIMIT_DEFAULT_RPM: int = 0
+    RATE_LIMIT_DEFAULT_TPM: int = 0
+    # Directory of lock-protected bucket files shared by processes on this host; empty keeps limits per process
+    RATE_LIMIT_SHARED_DIR: str = ""
+
+    # Aggregated LLM usage per execution, agent and model (llm_usage table)
+    LLM_USAGE_ENABLED: bool = True
+    # Seconds between batched writes of usage totals
+    LLM_USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0
+    # Pending execution/agent/model combinations that trigger an early write
+    LLM_USAGE_MAX_PENDING: int = 500
+
+    # Token streaming to execution WebSockets for executions with stream_tokens set
+    # Seconds over which token deltas are coalesced into one WebSocket frame
+    TOKEN_STREAM_FRAME_INTERVAL_SECONDS: float = 0.05
+
+    # Characters of the serialized result included in summary history lists
+    EXECUTION_HISTORY_RESULT_PREVIEW_CHARS: int = 500
+
+    # Background purge of deleted executions
+    # Rows deleted per table and transaction
+    EXECUTION_PURGE_BATCH_SIZE: int = 1000
+
+    # Retention of execution logs and traces: finished executions older than
+    # the retention period are moved to gzip-compressed NDJSON archives
+    EXECUTION_RETENTION_ENABLED: bool = False
+    EXECUTION_RETENTION_DAYS: int = 30
+    # Directory of the archives; empty uses archives/executions under the backend
+    EXECUTION_ARCHIVE_DIR: str = ""
+    # Seconds between retention runs
+    EXECUTION_RETENTION_INTERVAL_SECONDS: float = 3600.0
+    # Executions archived per run before checking for more
+    EXECUTION_RETENTION_BATCH: int = 50
+    # Allow a full VACUUM after archiving when SQLite cannot vacuum incrementally;
+    # locks the database while it rebuilds the file
+    EXECUTION_ARCHIVE_VACUUM: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
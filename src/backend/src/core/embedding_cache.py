@@ -0,0 +1,171 @@
+"""
+Persistent content-addressed cache of embedding vectors.
+
+Documentation chunks and memory snippets are embedded again on every seed
+run and every crew with memory enabled, although the text has not changed.
+Vectors are stored in a local SQLite file keyed by provider, model and the
+SHA-256 of the text, as float32 blobs, so unchanged text is never sent to
+the embedding provider twice.
+"""
+import hashlib
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Keep each IN (...) list below SQLite's bound variable limit
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def text_hash(text: str) -> str:
+    """Get the content address of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite store of embedding vectors by (provider, model, text hash).
+
+    All methods are blocking and thread-safe; async callers run them in a
+    worker thread.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _model_key(provider: str, model: str) -> str:
+        # "databricks/gte" and "gte" name the same Databricks model
+        prefix = f"{provider}/"
+        return model[len(prefix):] if model.startswith(prefix) else model
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self._db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "provider TEXT NOT NULL, model TEXT NOT NULL, text_hash TEXT NOT NULL, "
+                "dimensions INTEGER NOT NULL, vector BLOB NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (provider, model, text_hash))"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get_many(self, provider: str, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up the cached vectors of many texts.
+
+        Args:
+            provider: Embedding provider name
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            One vector per text, None for texts that are not cached
+        """
+        hashes = [text_hash(text) for text in texts]
+        model_key = self._model_key(provider, model)
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            connection = self._connect_locked()
+            for start in range(0, len(unique), _LOOKUP_CHUNK_SIZE):
+                chunk = unique[start:start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT text_hash, vector FROM embedding_cache "
+                    f"WHERE provider = ? AND model = ? AND text_hash IN ({placeholders})",
+                    (provider, model_key, *chunk),
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = np.frombuffer(blob, dtype=np.float32).tolist()
+            vectors = [found.get(digest) for digest in hashes]
+            hits = sum(1 for vector in vectors if vector is not None)
+            self._hits += hits
+            self._misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, provider: str, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> int:
+        """
+        Store vectors for texts, replacing existing entries.
+
+        Args:
+            provider: Embedding provider name
+            model: Embedding model name
+            texts: Embedded texts
+            vectors: One vector per text
+
+        Returns:
+            Number of vectors stored
+        """
+        model_key = self._model_key(provider, model)
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((provider, model_key, text_hash(text), int(array.shape[0]), array.tobytes(), now))
+        if not rows:
+            return 0
+        with self._lock:
+            connection = self._connect_locked()
+            connection.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(provider, model, text_hash, dimensions, vector, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.commit()
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            size = self._connect_locked().execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            lookups = self._hits + self._misses
+            return {
+                "size": size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+# Function to get the singleton cache instance easily
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    global _cache
+    from src.config.settings import settings
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                db_path = settings.EMBEDDING_CACHE_PATH or str(
+                    pathlib.Path(__file__).parent.parent.parent / "cache" / "embeddings.db"
+                )
+                _cache = EmbeddingCache(db_path)
+    return _cache
@@ -0,0 +1,274 @@
+"""
+Non-blocking structured logging of LLM calls.
+
+LiteLLM invokes its success and failure callbacks on the thread making the
+call. The callbacks only put a reference to the call on a bounded queue; a
+background thread turns it into one compact JSON line per call with latency,
+token usage and cost, truncating and sampling prompt/response payloads, and
+appends it to ``llm_calls.jsonl``. When the queue is full, calls are counted
+as dropped instead of blocking the agent.
+"""
+import atexit
+import json
+import os
+import pathlib
+import queue
+import random
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.core.logger import LoggerManager
+
+logger = LoggerManager.get_instance().system
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """Read a key from a dict-like or attribute-style LiteLLM object."""
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    getter = getattr(obj, "get", None)
+    if callable(getter):
+        try:
+            return getter(key, default)
+        except Exception:
+            pass
+    return getattr(obj, key, default)
+
+
+def _seconds(delta: Any) -> Optional[float]:
+    if delta is None:
+        return None
+    total_seconds = getattr(delta, "total_seconds", None)
+    return total_seconds() if callable(total_seconds) else float(delta)
+
+
+class LLMCallLogWriter:
+    """
+    Bounded queue of finished LLM calls written as JSON lines by a daemon thread.
+
+    Payloads (messages and response content) are kept for a
+    ``payload_sample_rate`` fraction of successful calls and always for
+    failures, truncated to ``max_payload_chars`` per string.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        maxsize: int = 10000,
+        max_payload_chars: int = 2000,
+        payload_sample_rate: float = 1.0,
+        flush_interval: float = 1.0,
+    ):
+        self._file_path = file_path
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize)
+        self._max_payload_chars = max_payload_chars
+        self._payload_sample_rate = payload_sample_rate
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._random = random.Random()
+        self._written = 0
+        self._dropped = 0
+        self._errors = 0
+
+    # --- Producer side (LLM calling threads) ---
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="llm-call-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _submit(self, call: Dict[str, Any]) -> bool:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(call)
+            return True
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+    def record_success(self, kwargs: Dict[str, Any], response_obj: Any, start_time: Any, end_time: Any) -> bool:
+        """
+        Queue a successful call; all formatting happens on the writer thread.
+
+        Returns:
+            False if the call was dropped because the queue is full
+        """
+        messages = kwargs.get("messages")
+        return self._submit({
+            "status": "success",
+            "kwargs": kwargs,
+            # Agents keep appending to their message list; log the call's own view
+            "messages": list(messages) if isinstance(messages, list) else messages,
+            "response": response_obj,
+            "start_time": start_time,
+            "end_time": end_time,
+            "with_payload": self._random.random() < self._payload_sample_rate,
+        })
+
+    def record_failure(self, kwargs: Dict[str, Any], response_obj: Any, start_time: Any, end_time: Any) -> bool:
+        """
+        Queue a failed call, always with its payload.
+
+        Returns:
+            False if the call was dropped because the queue is full
+        """
+        messages = kwargs.get("messages")
+        return self._submit({
+            "status": "failure",
+            "kwargs": kwargs,
+            "messages": list(messages) if isinstance(messages, list) else messages,
+            "response": response_obj,
+            "start_time": start_time,
+            "end_time": end_time,
+            "with_payload": True,
+        })
+
+    # --- Writer thread ---
+
+    def _truncate(self, value: Any) -> Any:
+        if isinstance(value, str) and self._max_payload_chars > 0 and len(value) > self._max_payload_chars:
+            return f"{value[:self._max_payload_chars]}...[truncated {len(value) - self._max_payload_chars} chars]"
+        if isinstance(value, list):
+            return [self._truncate(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._truncate(item) for key, item in value.items()}
+        return value
+
+    @staticmethod
+    def _response_contents(response: Any) -> List[Any]:
+        contents = []
+        for choice in _get(response, "choices", None) or []:
+            message = _get(choice, "message", None)
+            contents.append(_get(message, "content", None))
+        return contents
+
+    @staticmethod
+    def _cost(kwargs: Dict[str, Any], response: Any) -> Optional[float]:
+        cost = kwargs.get("response_cost")
+        if cost is not None:
+            return cost
+        try:
+            import litellm
+            return litellm.completion_cost(completion_response=response)
+        except Exception:
+            return None
+
+    def build_entry(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn a queued call into its log entry.
+
+        Args:
+            call: Queued call as produced by record_success/record_failure
+
+        Returns:
+            JSON-serializable log entry
+        """
+        kwargs = call["kwargs"] or {}
+        response = call["response"]
+        start_time = call["start_time"]
+        latency = _seconds(call["end_time"] - start_time) if start_time is not None and call["end_time"] is not None else None
+        entry: Dict[str, Any] = {
+            "ts": start_time.isoformat() if isinstance(start_time, datetime) else datetime.utcnow().isoformat(),
+            "call_id": kwargs.get("litellm_call_id"),
+            "model": kwargs.get("model"),
+            "status": call["status"],
+            "latency_ms": round(latency * 1000, 1) if latency is not None else None,
+        }
+
+        if call["status"] == "success":
+            usage = _get(response, "usage", None)
+            entry["prompt_tokens"] = _get(usage, "prompt_tokens", 0)
+            entry["completion_tokens"] = _get(usage, "completion_tokens", 0)
+            entry["total_tokens"] = _get(usage, "total_tokens", 0)
+            entry["cost"] = self._cost(kwargs, response)
+        else:
+            exception = kwargs.get("exception")
+            entry["error"] = self._truncate(str(exception if exception is not None else response))
+
+        if call["with_payload"]:
+            entry["messages"] = self._truncate(call["messages"])
+            if call["status"] == "success":
+                entry["response"] = self._truncate(self._response_contents(response))
+        return entry
+
+    def _write(self, handle: Any, call: Dict[str, Any]) -> None:
+        try:
+            line = json.dumps(self.build_entry(call), default=str, separators=(",", ":"))
+            handle.write(line + "\n")
+            with self._lock:
+                self._written += 1
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            logger.error(f"[LLMCallLogWriter] Error writing LLM call entry: {e}")
+
+    def _run(self) -> None:
+        os.makedirs(os.path.dirname(self._file_path) or ".", exist_ok=True)
+        with open(self._file_path, "a", encoding="utf-8") as handle:
+            while True:
+                try:
+                    call = self._queue.get(timeout=self._flush_interval)
+                except queue.Empty:
+                    handle.flush()
+                    continue
+                if call is None:
+                    break
+                self._write(handle, call)
+                # Flush once the backlog is drained rather than per line
+                if self._queue.empty():
+                    handle.flush()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write the queued calls and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get written, dropped and pending counts.
+
+        Returns:
+            Dictionary of writer statistics
+        """
+        with self._lock:
+            return {
+                "written": self._written,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "pending": self._queue.qsize(),
+            }
+
+
+_writer: Optional[LLMCallLogWriter] = None
+_writer_lock = threading.Lock()
+
+# Function to get the singleton writer instance easily
+def get_llm_call_log_writer() -> LLMCallLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                from src.config.settings import settings
+                log_dir = os.environ.get("LOG_DIR", str(pathlib.Path(__file__).parent.parent.parent / "logs"))
+                _writer = LLMCallLogWriter(
+                    file_path=os.path.join(log_dir, "llm_calls.jsonl"),
+                    maxsize=settings.LLM_CALL_LOG_QUEUE_SIZE,
+                    max_payload_chars=settings.LLM_CALL_LOG_MAX_PAYLOAD_CHARS,
+                    payload_sample_rate=settings.LLM_CALL_LOG_PAYLOAD_SAMPLE_RATE,
+                )
+    return _writer
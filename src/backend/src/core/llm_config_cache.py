@@ -0,0 +1,125 @@
+"""
+Versioned cache of resolved LLM configurations.
+
+LLMManager resolves a model key to its provider, provider model name and API
+key with two database round trips and a decryption. A crew creates one LLM
+per agent, so the same model used to be resolved once per agent. This cache
+keeps resolved bundles per model; every write to model configurations or API
+keys bumps the cache version, which drops all bundles and rejects bundles
+that were being resolved while the write happened.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResolvedLLMConfigCache:
+    """
+    Bounded TTL cache of resolved model configuration bundles.
+
+    Bundles are only stored if the cache version did not change since the
+    caller started resolving, so a write racing a resolve cannot leave a stale
+    bundle behind. The TTL bounds staleness for writes made by other processes.
+    Bundles are deep-copied on the way in and out, so callers may modify
+    nested values such as the model configuration without affecting the cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max(1, max_size)
+        self._lock = threading.Lock()
+        self._version = 0
+        # model -> (expiry in monotonic seconds, bundle), oldest use first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        """Current cache version; pass it to ``put`` after resolving."""
+        with self._lock:
+            return self._version
+
+    def get(self, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the resolved bundle of a model.
+
+        Args:
+            model: Model key
+
+        Returns:
+            Copy of the bundle, or None if not cached or expired
+        """
+        with self._lock:
+            entry = self._entries.get(model)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[model]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(model)
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, model: str, bundle: Dict[str, Any], version: int) -> bool:
+        """
+        Store a resolved bundle if nothing was invalidated since version was read.
+
+        Args:
+            model: Model key
+            bundle: Resolved configuration bundle
+            version: Cache version read before resolving
+
+        Returns:
+            True if the bundle was stored
+        """
+        if self._ttl_seconds <= 0:
+            return False
+        with self._lock:
+            if version != self._version:
+                return False
+            self._entries[model] = (time.monotonic() + self._ttl_seconds, copy.deepcopy(bundle))
+            self._entries.move_to_end(model)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self) -> None:
+        """Drop all bundles, e.g. after a model configuration or API key was written."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size, version and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "version": self._version,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_cache: Optional[ResolvedLLMConfigCache] = None
+_cache_lock = threading.Lock()
+
+# Function to get the singleton cache instance easily
+def get_llm_config_cache() -> ResolvedLLMConfigCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from src.config.settings import settings
+                _cache = ResolvedLLMConfigCache(
+                    ttl_seconds=settings.LLM_CONFIG_CACHE_TTL_SECONDS,
+                    max_size=settings.LLM_CONFIG_CACHE_MAX_SIZE,
+                )
+    return _cache
@@ -5,10 +5,10 @@ This module provides a centralized manager for configuring and interacting with
 different LLM providers through litellm.
 """
 
+import asyncio
 import logging
 import os
-import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import time
 
 from crewai import LLM
@@ -16,6 +16,11 @@ from src.schemas.model_provider import ModelProvider
 from src.services.model_config_service import ModelConfigService
 from src.services.api_keys_service import ApiKeysService
 from src.core.unit_of_work import UnitOfWork
+from src.core.llm_config_cache import get_llm_config_cache
+from src.core.llm_call_logger import get_llm_call_log_writer
+from src.core.embedding_cache import get_embedding_cache
+from src.core.llm_usage import get_llm_usage_recorder, usage_metadata
+from src.utils.rate_limiter import estimate_tokens, get_rate_limiter
 import litellm
 import pathlib
 from litellm.integrations.custom_logger import CustomLogger
@@ -39,208 +44,69 @@ if not logger.handlers:
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
-# Create a custom file logger for LiteLLM
+# Custom LiteLLM logger that records one structured entry per call
 class LiteLLMFileLogger(CustomLogger):
+    """
+    Forwards finished LLM calls to the background LLM call log writer.
+    
+    The callbacks run on the thread making the LLM call, so they only queue
+    the call; serialization, cost calculation and file writes happen on the
+    writer thread. The pre-call hook makes synchronous completions, such as
+    those of crew agents, wait for their model's rate limit, and tags calls
+    made for an execution with its ID and the executing agent. Successful
+    calls also take their completion tokens from the model's rate limit, and
+    tagged calls are added to the execution's aggregated LLM usage.
+    """
+    
     def __init__(self):
-        self.file_path = log_file_path
-        # Set up a file logger
-        self.logger = logging.getLogger("litellm_file_logger")
-        self.logger.setLevel(logging.DEBUG)
-        # Check if handlers already exist to avoid duplicates
-        if not self.logger.handlers:
-            file_handler = logging.FileHandler(self.file_path)
-            formatter = logging.Formatter('[LiteLLM] %(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+        from src.config.settings import settings
+        self.enabled = settings.LLM_CALL_LOG_ENABLED
+        self.writer = get_llm_call_log_writer()
+        self.usage_enabled = settings.LLM_USAGE_ENABLED
     
-    def log_pre_api_call(self, model, messages, kwargs):
+    def _record_usage(self, kwargs, response_obj, start_time, end_time, success):
+        if not self.usage_enabled:
+            return
         try:
-            self.logger.info(f"Pre-API Call - Model: {model}")
-            self.logger.info(f"Messages: {json.dumps(messages, indent=2)}")
-            # Log all kwargs except messages which we've already logged
-            kwargs_to_log = {k: v for k, v in kwargs.items() if k != 'messages'}
-            self.logger.info(f"Parameters: {json.dumps(kwargs_to_log, default=str, indent=2)}")
+            get_llm_usage_recorder().record_call(kwargs, response_obj, start_time, end_time, success=success)
         except Exception as e:
-            self.logger.error(f"Error in log_pre_api_call: {str(e)}")
+            logger.debug(f"Could not record LLM usage: {e}")
     
-    def log_post_api_call(self, kwargs, response_obj, start_time, end_time):
-        try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            self.logger.info(f"Post-API Call - Duration: {duration_seconds:.2f}s")
-            # Log the full response object
-            if response_obj:
-                self.logger.info("Response:")
-                # Log response metadata
-                response_meta = {k: v for k, v in response_obj.items() if k != 'choices'}
-                self.logger.info(f"Metadata: {json.dumps(response_meta, default=str, indent=2)}")
-                
-                # Log full response content
-                if 'choices' in response_obj:
-                    try:
-                        for i, choice in enumerate(response_obj['choices']):
-                            if 'message' in choice and 'content' in choice['message']:
-                                content = choice['message']['content']
-                                self.logger.info(f"Choice {i} content:\n{content}")
-                            else:
-                                self.logger.info(f"Choice {i}: {json.dumps(choice, default=str, indent=2)}")
-                    except Exception as e:
-                        self.logger.error(f"Error logging choices: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Error in log_post_api_call: {str(e)}")
+    def log_pre_api_call(self, model, messages, kwargs):
+        call_type = kwargs.get("call_type")
+        if call_type not in ("completion", "acompletion"):
+            return
+        # Async callers take from the rate limit themselves before awaiting the call
+        if call_type == "completion":
+            get_rate_limiter().acquire_blocking(model or "", estimate_tokens(messages))
+        metadata = usage_metadata()
+        litellm_params = kwargs.get("litellm_params")
+        if metadata is not None and isinstance(litellm_params, dict):
+            # Set on this call's parameters only, so nothing outlives the call
+            litellm_params["metadata"] = {**metadata, **(litellm_params.get("metadata") or {})}
     
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        if self.enabled:
+            self.writer.record_success(kwargs, response_obj, start_time, end_time)
+        self._record_usage(kwargs, response_obj, start_time, end_time, True)
+        # Completion tokens are only known now; prompt tokens were taken before the call
         try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            model = kwargs.get('model', 'unknown')
-            self.logger.info(f"Success - Model: {model}, Duration: {duration_seconds:.2f}s")
-            
-            # Calculate tokens and cost if available
-            try:
-                usage = response_obj.get('usage', {})
-                prompt_tokens = usage.get('prompt_tokens', 0)
-                completion_tokens = usage.get('completion_tokens', 0)
-                total_tokens = usage.get('total_tokens', 0)
-                
-                cost = litellm.completion_cost(completion_response=response_obj)
-                
-                self.logger.info(f"Tokens - Prompt: {prompt_tokens}, Completion: {completion_tokens}, Total: {total_tokens}, Cost: ${cost:.6f}")
-                
-                # Log request messages again for convenience
-                if 'messages' in kwargs:
-                    self.logger.info(f"Request messages: {json.dumps(kwargs['messages'], indent=2)}")
-                
-                # Log complete response content
-                if 'choices' in response_obj:
-                    try:
-                        for i, choice in enumerate(response_obj['choices']):
-                            if 'message' in choice and 'content' in choice['message']:
-                                content = choice['message']['content']
-                                self.logger.info(f"Response content (choice {i}):\n{content}")
-                    except Exception as e:
-                        self.logger.error(f"Error logging response content: {str(e)}")
-            except Exception as e:
-                self.logger.warning(f"Could not calculate token usage: {str(e)}")
+            usage = response_obj.get("usage") if isinstance(response_obj, dict) else getattr(response_obj, "usage", None)
+            completion_tokens = (usage.get("completion_tokens") if isinstance(usage, dict) else getattr(usage, "completion_tokens", 0)) or 0
+            get_rate_limiter().record_usage(kwargs.get("model"), completion_tokens)
         except Exception as e:
-            self.logger.error(f"Error in log_success_event: {str(e)}")
+            logger.debug(f"Could not record token usage for rate limiting: {e}")
     
     def log_failure_event(self, kwargs, response_obj, start_time, end_time):
-        try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            model = kwargs.get('model', 'unknown')
-            error_msg = str(response_obj) if response_obj else "Unknown error"
-            
-            self.logger.error(f"Failure - Model: {model}, Duration: {duration_seconds:.2f}s")
-            self.logger.error(f"Error: {error_msg}")
-            
-            # Log exception details if available
-            exception = kwargs.get('exception', None)
-            if exception:
-                self.logger.error(f"Exception: {str(exception)}")
-                
-            # Traceback if available
-            traceback = kwargs.get('traceback_exception', None)
-            if traceback:
-                self.logger.error(f"Traceback: {str(traceback)}")
-        except Exception as e:
-            self.logger.error(f"Error in log_failure_event: {str(e)}")
-    
-    # Async versions of callback methods for async operations
-    async def async_log_pre_api_call(self, model, messages, kwargs):
-        try:
-            self.logger.info(f"Pre-API Call - Model: {model}")
-            self.logger.info(f"Messages: {json.dumps(messages, indent=2)}")
-            # Log all kwargs except messages which we've already logged
-            kwargs_to_log = {k: v for k, v in kwargs.items() if k != 'messages'}
-            self.logger.info(f"Parameters: {json.dumps(kwargs_to_log, default=str, indent=2)}")
-        except Exception as e:
-            self.logger.error(f"Error in async_log_pre_api_call: {str(e)}")
+        if self.enabled:
+            self.writer.record_failure(kwargs, response_obj, start_time, end_time)
+        self._record_usage(kwargs, response_obj, start_time, end_time, False)
     
-    async def async_log_post_api_call(self, kwargs, response_obj, start_time, end_time):
-        try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            self.logger.info(f"Post-API Call - Duration: {duration_seconds:.2f}s")
-            # Log the full response object
-            if response_obj:
-                self.logger.info("Response:")
-                # Log response metadata
-                response_meta = {k: v for k, v in response_obj.items() if k != 'choices'}
-                self.logger.info(f"Metadata: {json.dumps(response_meta, default=str, indent=2)}")
-                
-                # Log full response content
-                if 'choices' in response_obj:
-                    try:
-                        for i, choice in enumerate(response_obj['choices']):
-                            if 'message' in choice and 'content' in choice['message']:
-                                content = choice['message']['content']
-                                self.logger.info(f"Choice {i} content:\n{content}")
-                            else:
-                                self.logger.info(f"Choice {i}: {json.dumps(choice, default=str, indent=2)}")
-                    except Exception as e:
-                        self.logger.error(f"Error logging choices: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Error in async_log_post_api_call: {str(e)}")
-            
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
-        try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            model = kwargs.get('model', 'unknown')
-            self.logger.info(f"Success - Model: {model}, Duration: {duration_seconds:.2f}s")
-            
-            # Calculate tokens and cost if available
-            try:
-                usage = response_obj.get('usage', {})
-                prompt_tokens = usage.get('prompt_tokens', 0)
-                completion_tokens = usage.get('completion_tokens', 0)
-                total_tokens = usage.get('total_tokens', 0)
-                
-                cost = litellm.completion_cost(completion_response=response_obj)
-                
-                self.logger.info(f"Tokens - Prompt: {prompt_tokens}, Completion: {completion_tokens}, Total: {total_tokens}, Cost: ${cost:.6f}")
-                
-                # Log request messages again for convenience
-                if 'messages' in kwargs:
-                    self.logger.info(f"Request messages: {json.dumps(kwargs['messages'], indent=2)}")
-                
-                # Log complete response content
-                if 'choices' in response_obj:
-                    try:
-                        for i, choice in enumerate(response_obj['choices']):
-                            if 'message' in choice and 'content' in choice['message']:
-                                content = choice['message']['content']
-                                self.logger.info(f"Response content (choice {i}):\n{content}")
-                    except Exception as e:
-                        self.logger.error(f"Error logging response content: {str(e)}")
-            except Exception as e:
-                self.logger.warning(f"Could not calculate token usage: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Error in async_log_success_event: {str(e)}")
+        self.log_success_event(kwargs, response_obj, start_time, end_time)
     
     async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
-        try:
-            duration = end_time - start_time
-            duration_seconds = duration.total_seconds()
-            model = kwargs.get('model', 'unknown')
-            error_msg = str(response_obj) if response_obj else "Unknown error"
-            
-            self.logger.error(f"Failure - Model: {model}, Duration: {duration_seconds:.2f}s")
-            self.logger.error(f"Error: {error_msg}")
-            
-            # Log exception details if available
-            exception = kwargs.get('exception', None)
-            if exception:
-                self.logger.error(f"Exception: {str(exception)}")
-                
-            # Traceback if available
-            traceback = kwargs.get('traceback_exception', None)
-            if traceback:
-                self.logger.error(f"Traceback: {str(traceback)}")
-        except Exception as e:
-            self.logger.error(f"Error in async_log_failure_event: {str(e)}")
+        self.log_failure_event(kwargs, response_obj, start_time, end_time)
 
 # Create logger instance
 litellm_file_logger = LiteLLMFileLogger()
@@ -251,6 +117,7 @@ litellm.num_retries = 5  # Global retries setting
 litellm.retry_on = ["429", "timeout", "rate_limit_error"]  # Retry on these error types
 
 # Add the file logger to litellm callbacks
+litellm.input_callback = [litellm_file_logger]
 litellm.success_callback = [litellm_file_logger]
 litellm.failure_callback = [litellm_file_logger]
 
@@ -263,6 +130,56 @@ __all__ = ['LLMManager']
 class LLMManager:
     """Manager for LLM configurations and interactions."""
     
+    # Providers whose models need an API key, mapped to the key's provider name
+    _CREDENTIAL_PROVIDERS = {
+        ModelProvider.OPENAI: ModelProvider.OPENAI,
+        ModelProvider.ANTHROPIC: ModelProvider.ANTHROPIC,
+        ModelProvider.DEEPSEEK: ModelProvider.DEEPSEEK,
+        ModelProvider.GEMINI: ModelProvider.GEMINI,
+        ModelProvider.DATABRICKS: "DATABRICKS",
+    }
+    
+    # Maximum number of texts per embedding request for each provider
+    EMBEDDING_BATCH_SIZES = {
+        "openai": 2048,
+        "databricks": 150,
+        "google": 100,
+        "ollama": 32,
+    }
+    
+    @staticmethod
+    async def _resolve_model(model: str) -> Dict[str, Any]:
+        """
+        Resolve a model key to its configuration and provider API key, using the cache.
+        
+        Args:
+            model: Model identifier to resolve
+            
+        Returns:
+            Dict with the model configuration under "config" and the API key under "api_key"
+            
+        Raises:
+            ValueError: If model configuration is not found
+        """
+        cache = get_llm_config_cache()
+        bundle = cache.get(model)
+        if bundle is not None:
+            return bundle
+        
+        version = cache.version
+        async with UnitOfWork() as uow:
+            model_config_service = await ModelConfigService.from_unit_of_work(uow)
+            model_config_dict = await model_config_service.get_model_config(model)
+        
+        api_key = None
+        key_provider = LLMManager._CREDENTIAL_PROVIDERS.get(model_config_dict["provider"])
+        if key_provider is not None:
+            api_key = await ApiKeysService.get_provider_api_key(key_provider)
+        
+        bundle = {"config": model_config_dict, "api_key": api_key}
+        cache.put(model, bundle, version)
+        return bundle
+    
     @staticmethod
     async def configure_litellm(model: str) -> Dict[str, Any]:
         """
@@ -278,10 +195,9 @@ class LLMManager:
             ValueError: If model configuration is not found
             Exception: For other configuration errors
         """
-        # Get model configuration from database using ModelConfigService
-        async with UnitOfWork() as uow:
-            model_config_service = await ModelConfigService.from_unit_of_work(uow)
-            model_config_dict = await model_config_service.get_model_config(model)
+        # Get model configuration and API key, resolved once per model
+        resolved = await LLMManager._resolve_model(model)
+        model_config_dict = resolved["config"]
             
         # Extract provider and other configuration details
         provider = model_config_dict["provider"]
@@ -296,8 +212,7 @@ class LLMManager:
         
         # Get API key for the provider using ApiKeysService
         if provider in [ModelProvider.OPENAI, ModelProvider.ANTHROPIC, ModelProvider.DEEPSEEK]:
-            # Get API key using the provider name
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             if api_key:
                 model_params["api_key"] = api_key
             else:
@@ -318,7 +233,7 @@ class LLMManager:
             model_params["model"] = prefixed_model
         elif provider == ModelProvider.DATABRICKS:
             # For Databricks, we need to get a token, not an API key
-            token = await ApiKeysService.get_provider_api_key("DATABRICKS")
+            token = resolved["api_key"]
             if token:
                 model_params["api_key"] = token
             model_params["api_base"] = os.getenv("DATABRICKS_ENDPOINT", "")
@@ -326,7 +241,7 @@ class LLMManager:
                 model_params["model"] = f"databricks/{model_params['model']}"
         elif provider == ModelProvider.GEMINI:
             # For Gemini, get the API key
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             # Set in environment variables for better compatibility with various libraries
             if api_key:
                 model_params["api_key"] = api_key
@@ -346,6 +261,10 @@ class LLMManager:
             # NOT using Vertex AI which requires application default credentials
             model_params["model"] = f"gemini/{model_name}"
         
+        # Share the model's request and token limits with every caller in the process
+        get_rate_limiter().configure(
+            model_params["model"], model_config_dict.get("rpm_limit"), model_config_dict.get("tpm_limit")
+        )
         return model_params
 
     @staticmethod
@@ -363,10 +282,9 @@ class LLMManager:
             ValueError: If model configuration is not found
             Exception: For other configuration errors
         """
-        # Get model configuration using ModelConfigService
-        async with UnitOfWork() as uow:
-            model_config_service = await ModelConfigService.from_unit_of_work(uow)
-            model_config_dict = await model_config_service.get_model_config(model_name)
+        # Get model configuration and API key, resolved once per model
+        resolved = await LLMManager._resolve_model(model_name)
+        model_config_dict = resolved["config"]
         
         # Extract provider and model name
         provider = model_config_dict["provider"]
@@ -380,15 +298,15 @@ class LLMManager:
         
         # Set the correct provider prefix based on provider
         if provider == ModelProvider.DEEPSEEK:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             api_base = os.getenv("DEEPSEEK_ENDPOINT", "https://api.deepseek.com")
             prefixed_model = f"deepseek/{model_name_value}"
         elif provider == ModelProvider.OPENAI:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             # OpenAI doesn't need a prefix
             prefixed_model = model_name_value
         elif provider == ModelProvider.ANTHROPIC:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             prefixed_model = f"anthropic/{model_name_value}"
         elif provider == ModelProvider.OLLAMA:
             api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
@@ -398,7 +316,7 @@ class LLMManager:
                 normalized_model_name = normalized_model_name.replace("-", ":")
             prefixed_model = f"ollama/{normalized_model_name}"
         elif provider == ModelProvider.DATABRICKS:
-            api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+            api_key = resolved["api_key"]
             api_base = os.getenv("DATABRICKS_ENDPOINT", "")
             prefixed_model = f"databricks/{model_name_value}"
             
@@ -416,9 +334,9 @@ class LLMManager:
                 llm_params["api_base"] = api_base
                 
             logger.info(f"Creating CrewAI LLM with model: {prefixed_model}")
-            return LLM(**llm_params)
+            return LLMManager._create_crewai_llm(llm_params, model_config_dict)
         elif provider == ModelProvider.GEMINI:
-            api_key = await ApiKeysService.get_provider_api_key(provider)
+            api_key = resolved["api_key"]
             # Set in environment variables for better compatibility with various libraries
             if api_key:
                 os.environ["GEMINI_API_KEY"] = api_key
@@ -452,6 +370,26 @@ class LLMManager:
         
         # Create and return the CrewAI LLM
         logger.info(f"Creating CrewAI LLM with model: {prefixed_model}")
+        return LLMManager._create_crewai_llm(llm_params, model_config_dict)
+
+    @staticmethod
+    def _create_crewai_llm(llm_params: Dict[str, Any], model_config_dict: Dict[str, Any]) -> LLM:
+        """
+        Create a CrewAI LLM after registering its model's rate limits.
+        
+        The LiteLLM pre-call hook of LiteLLMFileLogger makes each call of the
+        LLM wait for these limits.
+        
+        Args:
+            llm_params: Parameters for the CrewAI LLM
+            model_config_dict: Resolved model configuration with optional rpm_limit and tpm_limit
+            
+        Returns:
+            LLM: CrewAI LLM instance
+        """
+        get_rate_limiter().configure(
+            llm_params["model"], model_config_dict.get("rpm_limit"), model_config_dict.get("tpm_limit")
+        )
         return LLM(**llm_params)
 
     @staticmethod
@@ -470,112 +408,200 @@ class LLMManager:
         return llm
 
     @staticmethod
-    async def get_embedding(text: str, model: str = "text-embedding-ada-002", embedder_config: Optional[Dict[str, Any]] = None) -> Optional[List[float]]:
+    async def _embedding_request(model: str, embedder_config: Optional[Dict[str, Any]] = None) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
-        Get an embedding vector for the given text using configurable embedder.
+        Resolve the provider and litellm.aembedding arguments for an embedder.
         
         Args:
-            text: The text to create an embedding for
             model: The embedding model to use (can be overridden by embedder_config)
             embedder_config: Optional embedder configuration with provider and model settings
             
         Returns:
-            List[float]: The embedding vector or None if creation fails
+            Tuple of (provider, aembedding keyword arguments), or None if no API key is available
         """
-        try:
-            # Determine provider and model from embedder_config or defaults
-            if embedder_config:
-                provider = embedder_config.get('provider', 'openai')
-                config = embedder_config.get('config', {})
-                embedding_model = config.get('model', model)
-            else:
-                provider = 'openai'
-                embedding_model = model
+        # Determine provider and model from embedder_config or defaults
+        if embedder_config:
+            provider = embedder_config.get('provider', 'openai')
+            config = embedder_config.get('config', {})
+            embedding_model = config.get('model', model)
+        else:
+            provider = 'openai'
+            embedding_model = model
+        
+        logger.info(f"Creating embedding using provider: {provider}, model: {embedding_model}")
+        
+        # Handle different embedding providers
+        if provider == 'databricks' or 'databricks' in embedding_model:
+            # Use Databricks for embeddings
+            api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
+            api_base = os.getenv("DATABRICKS_ENDPOINT", "")
             
-            logger.info(f"Creating embedding using provider: {provider}, model: {embedding_model}")
+            if not api_key:
+                logger.warning("No Databricks API key found for creating embeddings")
+                return None
             
-            # Handle different embedding providers
-            if provider == 'databricks' or 'databricks' in embedding_model:
-                # Use Databricks for embeddings
-                api_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
-                api_base = os.getenv("DATABRICKS_ENDPOINT", "")
-                
-                if not api_key:
-                    logger.warning("No Databricks API key found for creating embeddings")
-                    return None
-                
-                # Ensure model has databricks prefix for litellm
-                if not embedding_model.startswith('databricks/'):
-                    if embedding_model == 'databricks-gte-large-en' or 'databricks' in embedding_model:
-                        # Keep the model name as is for Databricks models
-                        pass
-                    else:
-                        embedding_model = f"databricks/{embedding_model}"
-                
-                # Create the embedding using litellm with Databricks
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_key=api_key,
-                    api_base=api_base
-                )
-                
-            elif provider == 'ollama':
-                # Use Ollama for embeddings
-                api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
-                
-                # Ensure model has ollama prefix
-                if not embedding_model.startswith('ollama/'):
-                    embedding_model = f"ollama/{embedding_model}"
-                
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_base=api_base
-                )
-                
-            elif provider == 'google':
-                # Use Google AI for embeddings
-                api_key = await ApiKeysService.get_provider_api_key(ModelProvider.GEMINI)
-                
-                if not api_key:
-                    logger.warning("No Google API key found for creating embeddings")
-                    return None
-                
-                # Ensure model has gemini prefix for embeddings
-                if not embedding_model.startswith('gemini/'):
-                    embedding_model = f"gemini/{embedding_model}"
-                
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_key=api_key
-                )
-                
-            else:
-                # Default to OpenAI for embeddings
-                api_key = await ApiKeysService.get_provider_api_key(ModelProvider.OPENAI)
-                
-                if not api_key:
-                    logger.warning("No OpenAI API key found for creating embeddings")
-                    return None
-                    
-                # Create the embedding using litellm
-                response = await litellm.aembedding(
-                    model=embedding_model,
-                    input=text,
-                    api_key=api_key
-                )
+            # Ensure model has databricks prefix for litellm
+            if not embedding_model.startswith('databricks/'):
+                if embedding_model == 'databricks-gte-large-en' or 'databricks' in embedding_model:
+                    # Keep the model name as is for Databricks models
+                    pass
+                else:
+                    embedding_model = f"databricks/{embedding_model}"
             
-            # Extract the embedding vector
-            if response and "data" in response and len(response["data"]) > 0:
-                embedding = response["data"][0]["embedding"]
-                logger.info(f"Successfully created embedding with {len(embedding)} dimensions using {provider}")
-                return embedding
-            else:
-                logger.warning("Failed to get embedding from response")
+            return 'databricks', {"model": embedding_model, "api_key": api_key, "api_base": api_base}
+            
+        elif provider == 'ollama':
+            # Use Ollama for embeddings
+            api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
+            
+            # Ensure model has ollama prefix
+            if not embedding_model.startswith('ollama/'):
+                embedding_model = f"ollama/{embedding_model}"
+            
+            return 'ollama', {"model": embedding_model, "api_base": api_base}
+            
+        elif provider == 'google':
+            # Use Google AI for embeddings
+            api_key = await ApiKeysService.get_provider_api_key(ModelProvider.GEMINI)
+            
+            if not api_key:
+                logger.warning("No Google API key found for creating embeddings")
                 return None
-                
+            
+            # Ensure model has gemini prefix for embeddings
+            if not embedding_model.startswith('gemini/'):
+                embedding_model = f"gemini/{embedding_model}"
+            
+            return 'google', {"model": embedding_model, "api_key": api_key}
+            
+        # Default to OpenAI for embeddings
+        api_key = await ApiKeysService.get_provider_api_key(ModelProvider.OPENAI)
+        
+        if not api_key:
+            logger.warning("No OpenAI API key found for creating embeddings")
+            return None
+        
+        return 'openai', {"model": embedding_model, "api_key": api_key}
+
+    @staticmethod
+    def embedding_batch_size(provider: str) -> int:
+        """
+        Get the number of texts sent per embedding request for a provider.
+        
+        Args:
+            provider: Embedding provider name
+            
+        Returns:
+            EMBEDDING_BATCH_SIZE if set, otherwise the provider's limit
+        """
+        from src.config.settings import settings
+        return settings.EMBEDDING_BATCH_SIZE or LLMManager.EMBEDDING_BATCH_SIZES.get(provider, 16)
+
+    @staticmethod
+    async def get_embeddings(
+        texts: List[str],
+        model: str = "text-embedding-ada-002",
+        embedder_config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Optional[List[float]]]:
+        """
+        Get embedding vectors for many texts in provider-sized batches.
+        
+        Vectors already in the embedding cache are not requested again and
+        duplicate texts are embedded once. Batches are sent concurrently, at
+        most max_concurrency at a time, and the vectors are returned in input
+        order.
+        
+        Args:
+            texts: The texts to create embeddings for
+            model: The embedding model to use (can be overridden by embedder_config)
+            embedder_config: Optional embedder configuration with provider and model settings
+            max_concurrency: Maximum batches in flight; defaults to EMBEDDING_MAX_CONCURRENCY
+            
+        Returns:
+            One embedding vector per text, None for texts whose batch failed
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        if not texts:
+            return embeddings
+        
+        try:
+            request = await LLMManager._embedding_request(model, embedder_config)
         except Exception as e:
             logger.error(f"Error creating embedding: {str(e)}")
-            return None
+            return embeddings
+        if request is None:
+            return embeddings
+        provider, params = request
+        
+        from src.config.settings import settings
+        cache = get_embedding_cache()
+        if cache is not None:
+            try:
+                embeddings = await asyncio.to_thread(cache.get_many, provider, params["model"], texts)
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed: {str(e)}")
+        
+        # Embed each distinct uncached text once
+        pending: Dict[str, List[int]] = {}
+        for position, (text, embedding) in enumerate(zip(texts, embeddings)):
+            if embedding is None:
+                pending.setdefault(text, []).append(position)
+        if not pending:
+            logger.info(f"All {len(texts)} embeddings served from the embedding cache")
+            return embeddings
+        pending_texts = list(pending)
+        created: Dict[str, List[float]] = {}
+        
+        batch_size = LLMManager.embedding_batch_size(provider)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.EMBEDDING_MAX_CONCURRENCY))
+        
+        async def embed_batch(start: int) -> None:
+            batch = pending_texts[start:start + batch_size]
+            try:
+                async with semaphore:
+                    await get_rate_limiter().acquire(params["model"], estimate_tokens(batch))
+                    response = await litellm.aembedding(input=batch, **params)
+                data = response["data"] if response and "data" in response else []
+                if len(data) != len(batch):
+                    logger.warning(f"Embedding response has {len(data)} vectors for {len(batch)} texts")
+                    return
+                # Providers may return vectors out of order; place them by index
+                for position, item in enumerate(data):
+                    index = item["index"] if "index" in item else position
+                    created[batch[index]] = item["embedding"]
+            except Exception as e:
+                logger.error(f"Error creating embeddings for batch at {start}: {str(e)}")
+        
+        await asyncio.gather(*(embed_batch(start) for start in range(0, len(pending_texts), batch_size)))
+        for text, embedding in created.items():
+            for position in pending[text]:
+                embeddings[position] = embedding
+        
+        if cache is not None and created:
+            try:
+                await asyncio.to_thread(cache.put_many, provider, params["model"], list(created), list(created.values()))
+            except Exception as e:
+                logger.warning(f"Embedding cache store failed: {str(e)}")
+        
+        logger.info(
+            f"Created {len(created)}/{len(pending_texts)} embeddings using {provider} in batches of {batch_size}, "
+            f"{len(texts) - sum(len(positions) for positions in pending.values())} served from cache"
+        )
+        return embeddings
+
+    @staticmethod
+    async def get_embedding(text: str, model: str = "text-embedding-ada-002", embedder_config: Optional[Dict[str, Any]] = None) -> Optional[List[float]]:
+        """
+        Get an embedding vector for the given text using configurable embedder.
+        
+        Args:
+            text: The text to create an embedding for
+            model: The embedding model to use (can be overridden by embedder_config)
+            embedder_config: Optional embedder configuration with provider and model settings
+            
+        Returns:
+            List[float]: The embedding vector or None if creation fails
+        """
+        embeddings = await LLMManager.get_embeddings([text], model=model, embedder_config=embedder_config)
+        return embeddings[0]
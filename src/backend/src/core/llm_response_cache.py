@@ -0,0 +1,280 @@
+"""
+Disk-backed cache of LLM completion responses.
+
+The generation services (crews, agents, tasks, templates, execution names)
+send the same prompts again whenever the UI repeats a request. When enabled,
+completions are stored in a SQLite file keyed on the model, the messages and
+the sampling parameters, so a repeated generation is answered from disk
+without spending tokens. Entries expire after a TTL and the least recently
+used ones are evicted beyond a maximum count.
+
+Sampled completions (temperature above zero) are not deterministic, so they
+bypass the cache unless caching is forced.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import litellm
+
+from src.core.logger import LoggerManager
+from src.utils.rate_limiter import estimate_tokens, get_rate_limiter
+
+logger = LoggerManager.get_instance().system
+
+# Parameters that change the completion; credentials and endpoints do not
+_SAMPLING_PARAMS = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "stop",
+    "seed",
+    "n",
+    "presence_penalty",
+    "frequency_penalty",
+    "response_format",
+)
+
+
+def _to_dict(response: Any) -> Dict[str, Any]:
+    """Convert a LiteLLM ModelResponse (or plain dict) into a JSON-serializable dict."""
+    if isinstance(response, dict):
+        return response
+    for method in ("model_dump", "to_dict", "dict"):
+        convert = getattr(response, method, None)
+        if callable(convert):
+            return convert()
+    return json.loads(response.json())
+
+
+class LLMResponseCache:
+    """
+    SQLite store of completion responses with TTL expiry and LRU eviction.
+
+    All methods are blocking; async callers run them in a worker thread.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float, max_entries: int):
+        self._db_path = db_path
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a completion request.
+
+        Args:
+            model: Model name sent to LiteLLM
+            messages: Chat messages
+            params: Remaining completion parameters; only sampling parameters are used
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        sampling = {name: params[name] for name in _SAMPLING_PARAMS if params.get(name) is not None}
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": sampling},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect_locked(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._db_path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self._db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_last_access "
+                "ON llm_response_cache (last_access)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response and mark it as recently used.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The stored response dict, or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect_locked()
+            row = connection.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] + self._ttl_seconds <= now:
+                if row is not None:
+                    connection.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    connection.commit()
+                self._misses += 1
+                return None
+            connection.execute("UPDATE llm_response_cache SET last_access = ? WHERE key = ?", (now, key))
+            connection.commit()
+            self._hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, model: str, response: Dict[str, Any]) -> bool:
+        """
+        Store a response, evicting the least recently used entries beyond the limit.
+
+        Args:
+            key: Key from make_key
+            model: Model name, kept for inspection
+            response: JSON-serializable response dict
+
+        Returns:
+            True if the response was stored
+        """
+        if self._ttl_seconds <= 0:
+            return False
+        data = json.dumps(response, default=str, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            connection = self._connect_locked()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_response_cache (key, model, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, data, now, now),
+            )
+            evicted = connection.execute(
+                "DELETE FROM llm_response_cache WHERE key IN ("
+                "SELECT key FROM llm_response_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            ).rowcount
+            connection.commit()
+            self._evictions += max(evicted, 0)
+        return True
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            connection = self._connect_locked()
+            connection.execute("DELETE FROM llm_response_cache")
+            connection.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            size = self._connect_locked().execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+            lookups = self._hits + self._misses
+            return {
+                "size": size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+# Function to get the singleton cache instance easily
+def get_llm_response_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from src.config.settings import settings
+                db_path = settings.LLM_RESPONSE_CACHE_PATH or str(
+                    pathlib.Path(__file__).parent.parent.parent / "cache" / "llm_responses.db"
+                )
+                _cache = LLMResponseCache(
+                    db_path=db_path,
+                    ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+                    max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+                )
+    return _cache
+
+
+async def _limited_acompletion(**kwargs: Any) -> Any:
+    """Call litellm.acompletion once the model's rate limit allows it."""
+    await get_rate_limiter().acquire(kwargs.get("model", ""), estimate_tokens(kwargs.get("messages")))
+    return await litellm.acompletion(**kwargs)
+
+
+async def cached_acompletion(force: Optional[bool] = None, **kwargs: Any) -> Any:
+    """
+    Call ``litellm.acompletion`` through the response cache.
+
+    The cache is used only when ``LLM_RESPONSE_CACHE_ENABLED`` is set and the
+    request is deterministic (temperature 0, no streaming), or when caching is
+    forced by the ``force`` argument or ``LLM_RESPONSE_CACHE_FORCE``. Cache
+    failures never fail the completion. Calls that reach the provider wait
+    for the model's rate limit first.
+
+    Args:
+        force: Cache even sampled completions; defaults to LLM_RESPONSE_CACHE_FORCE
+        **kwargs: Arguments for litellm.acompletion
+
+    Returns:
+        The LiteLLM response, or the cached response dict on a hit
+    """
+    from src.config.settings import settings
+
+    if force is None:
+        force = settings.LLM_RESPONSE_CACHE_FORCE
+    temperature = kwargs.get("temperature")
+    cacheable = (
+        settings.LLM_RESPONSE_CACHE_ENABLED
+        and not kwargs.get("stream")
+        and (force or not temperature)
+    )
+    if not cacheable:
+        return await _limited_acompletion(**kwargs)
+
+    cache = get_llm_response_cache()
+    model = kwargs.get("model", "")
+    key = cache.make_key(model, kwargs.get("messages") or [], kwargs)
+    try:
+        cached = await asyncio.to_thread(cache.get, key)
+    except Exception as e:
+        logger.warning(f"[cached_acompletion] Response cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        logger.debug(f"[cached_acompletion] Cache hit for model {model}")
+        return cached
+
+    response = await _limited_acompletion(**kwargs)
+    try:
+        await asyncio.to_thread(cache.put, key, model, _to_dict(response))
+    except Exception as e:
+        logger.warning(f"[cached_acompletion] Response cache store failed: {e}")
+    return response
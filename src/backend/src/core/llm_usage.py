@@ -0,0 +1,346 @@
+"""
+Aggregated LLM usage accounting per execution, agent and model.
+
+The LiteLLM pre-call hook tags crew LLM calls with the execution ID and
+agent role in their metadata. The LiteLLM callbacks hand every finished call to the recorder,
+which only adds it to in-memory totals. A background thread upserts the
+totals into the ``llm_usage`` table every few seconds, so a crew making
+hundreds of calls causes a handful of writes.
+"""
+import asyncio
+import contextvars
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.logger import LoggerManager
+
+logger = LoggerManager.get_instance().system
+
+# Execution whose LLM calls are being made; set by the execution runner and
+# copied into the crew's thread by asyncio.to_thread
+_current_execution: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "llm_usage_execution_id", default=None
+)
+
+
+def set_current_execution(execution_id: Optional[str]) -> contextvars.Token:
+    """
+    Attribute LLM calls made in the current context to an execution.
+
+    Args:
+        execution_id: Execution ID, or None to stop attributing calls
+
+    Returns:
+        Token for reset_current_execution
+    """
+    return _current_execution.set(execution_id)
+
+
+def reset_current_execution(token: contextvars.Token) -> None:
+    """Restore the execution attribution active before set_current_execution."""
+    _current_execution.reset(token)
+
+
+def get_current_execution() -> Optional[str]:
+    """Get the execution LLM calls in the current context are attributed to."""
+    return _current_execution.get()
+
+
+# Roles of the agents executing in the current context, innermost last; kept
+# by handlers of CrewAI's agent execution events, which run in the agent's thread
+_current_agents: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar(
+    "llm_usage_agents", default=()
+)
+_agent_tracking_lock = threading.Lock()
+_agent_tracking_installed = False
+
+
+def _agent_started(source: Any, event: Any) -> None:
+    _current_agents.set(_current_agents.get() + (getattr(event.agent, "role", None) or "",))
+
+
+def _agent_finished(source: Any, event: Any) -> None:
+    agents = _current_agents.get()
+    if agents:
+        _current_agents.set(agents[:-1])
+
+
+def track_agent_executions() -> None:
+    """
+    Attribute LLM calls to the agent executing them.
+
+    CrewAI does not pass the agent to ``LLM.call``, so the role is taken from
+    the agent execution events instead. Installs the event handlers once per process.
+    """
+    global _agent_tracking_installed
+    if _agent_tracking_installed:
+        return
+    with _agent_tracking_lock:
+        if _agent_tracking_installed:
+            return
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.agent_events import (
+            AgentExecutionCompletedEvent,
+            AgentExecutionErrorEvent,
+            AgentExecutionStartedEvent,
+        )
+        crewai_event_bus.on(AgentExecutionStartedEvent)(_agent_started)
+        crewai_event_bus.on(AgentExecutionCompletedEvent)(_agent_finished)
+        crewai_event_bus.on(AgentExecutionErrorEvent)(_agent_finished)
+        _agent_tracking_installed = True
+
+
+def get_current_agent() -> str:
+    """Get the role of the agent executing in the current context, empty if unknown."""
+    agents = _current_agents.get()
+    return agents[-1] if agents else ""
+
+
+def usage_metadata() -> Optional[Dict[str, str]]:
+    """
+    Get the LiteLLM metadata identifying the current execution and agent.
+
+    Returns:
+        Metadata dict, or None outside of an execution
+    """
+    execution_id = _current_execution.get()
+    if not execution_id:
+        return None
+    return {"execution_id": execution_id, "agent_name": get_current_agent()}
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+class LLMUsageRecorder:
+    """
+    In-memory totals of LLM calls by (execution, agent, model), flushed in batches.
+
+    Recording only updates a dict under a lock. Totals are written by a daemon
+    thread with its own event loop every ``flush_interval`` seconds, or sooner
+    once ``max_pending`` combinations are waiting, and by ``flush`` at the end
+    of an execution.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 500):
+        self._flush_interval = flush_interval
+        self._max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._recorded = 0
+        self._written_rows = 0
+        self._errors = 0
+
+    @staticmethod
+    def call_metadata(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the metadata a LiteLLM call was made with."""
+        litellm_params = kwargs.get("litellm_params") or {}
+        return litellm_params.get("metadata") or kwargs.get("metadata") or {}
+
+    def record_call(
+        self,
+        kwargs: Dict[str, Any],
+        response_obj: Any,
+        start_time: Any,
+        end_time: Any,
+        success: bool = True,
+    ) -> bool:
+        """
+        Add a finished LiteLLM call to the totals if it belongs to an execution.
+
+        Args:
+            kwargs: LiteLLM callback kwargs
+            response_obj: LiteLLM response
+            start_time: Call start time
+            end_time: Call end time
+            success: Whether the call succeeded
+
+        Returns:
+            True if the call was recorded
+        """
+        metadata = self.call_metadata(kwargs)
+        execution_id = metadata.get("execution_id") if isinstance(metadata, dict) else None
+        if not execution_id:
+            return False
+
+        usage = _get(response_obj, "usage") if success else None
+        latency_ms = 0.0
+        if start_time is not None and end_time is not None:
+            try:
+                latency_ms = (end_time - start_time).total_seconds() * 1000
+            except Exception:
+                latency_ms = 0.0
+        self.record(
+            execution_id=execution_id,
+            agent_name=metadata.get("agent_name") or "",
+            model=kwargs.get("model") or "unknown",
+            prompt_tokens=_get(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=_get(usage, "completion_tokens", 0) or 0,
+            cost=(kwargs.get("response_cost") or 0.0) if success else 0.0,
+            latency_ms=latency_ms,
+            success=success,
+        )
+        return True
+
+    def record(
+        self,
+        execution_id: str,
+        agent_name: str,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        latency_ms: float = 0.0,
+        success: bool = True,
+    ) -> None:
+        """
+        Add one LLM call to the pending totals of its execution, agent and model.
+
+        Args:
+            execution_id: Execution ID
+            agent_name: Agent role, empty if unknown
+            model: Model name as reported by LiteLLM
+            prompt_tokens: Prompt tokens of the call
+            completion_tokens: Completion tokens of the call
+            cost: Cost of the call in USD
+            latency_ms: Call latency in milliseconds
+            success: Whether the call succeeded
+        """
+        now = datetime.utcnow()
+        key = (execution_id, agent_name, model)
+        with self._lock:
+            totals = self._pending.get(key)
+            if totals is None:
+                totals = self._pending[key] = {
+                    "execution_id": execution_id,
+                    "agent_name": agent_name,
+                    "model": model,
+                    "calls": 0,
+                    "failed_calls": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                    "cost": 0.0,
+                    "latency_ms_total": 0.0,
+                    "latency_ms_max": 0.0,
+                    "first_call_at": now,
+                    "last_call_at": now,
+                }
+            totals["calls"] += 1
+            totals["failed_calls"] += 0 if success else 1
+            totals["prompt_tokens"] += prompt_tokens
+            totals["completion_tokens"] += completion_tokens
+            totals["total_tokens"] += prompt_tokens + completion_tokens
+            totals["cost"] += cost
+            totals["latency_ms_total"] += latency_ms
+            totals["latency_ms_max"] = max(totals["latency_ms_max"], latency_ms)
+            totals["last_call_at"] = now
+            self._recorded += 1
+            pending = len(self._pending)
+        self._ensure_started()
+        if pending >= self._max_pending:
+            self._wake.set()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = list(self._pending.values())
+            self._pending = {}
+        return rows
+
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        # Keep totals that failed to write for the next flush
+        with self._lock:
+            for row in rows:
+                key = (row["execution_id"], row["agent_name"], row["model"])
+                totals = self._pending.get(key)
+                if totals is None:
+                    self._pending[key] = row
+                    continue
+                for name in ("calls", "failed_calls", "prompt_tokens", "completion_tokens",
+                             "total_tokens", "cost", "latency_ms_total"):
+                    totals[name] += row[name]
+                totals["latency_ms_max"] = max(totals["latency_ms_max"], row["latency_ms_max"])
+                totals["first_call_at"] = min(totals["first_call_at"], row["first_call_at"])
+
+    async def flush(self) -> int:
+        """
+        Write all pending totals on the calling event loop.
+
+        Returns:
+            Number of usage rows written
+        """
+        rows = self._drain()
+        if not rows:
+            return 0
+        from src.repositories.llm_usage_repository import LLMUsageRepository
+        from src.utils.asyncio_utils import execute_db_write
+        try:
+            written = await execute_db_write(lambda session: LLMUsageRepository(session).add_usage(rows))
+        except Exception as e:
+            self._requeue(rows)
+            with self._lock:
+                self._errors += 1
+            logger.error(f"[LLMUsageRecorder.flush] Error writing {len(rows)} usage rows: {e}")
+            return 0
+        with self._lock:
+            self._written_rows += written
+        return written
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="llm-usage-recorder", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                loop.run_until_complete(self.flush())
+            except Exception as e:
+                logger.error(f"[LLMUsageRecorder._run] Flush failed: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get recorded calls, written rows and pending combinations.
+
+        Returns:
+            Dictionary of recorder statistics
+        """
+        with self._lock:
+            return {
+                "recorded_calls": self._recorded,
+                "written_rows": self._written_rows,
+                "errors": self._errors,
+                "pending": len(self._pending),
+            }
+
+
+_recorder: Optional[LLMUsageRecorder] = None
+_recorder_lock = threading.Lock()
+
+# Function to get the singleton recorder instance easily
+def get_llm_usage_recorder() -> LLMUsageRecorder:
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                from src.config.settings import settings
+                _recorder = LLMUsageRecorder(
+                    flush_interval=settings.LLM_USAGE_FLUSH_INTERVAL_SECONDS,
+                    max_pending=settings.LLM_USAGE_MAX_PENDING,
+                )
+    return _recorder
@@ -10,7 +10,7 @@ from src.models.agent import Agent
 from src.models.task import Task
 from src.models.execution_history import ExecutionHistory, TaskStatus, ErrorTrace
 from src.models.tool import Tool
-from src.models.log import LLMLog
+from src.models.log import LLMLog, LLMLogDailyStats
 from src.models.model_config import ModelConfig
 from src.models.databricks_config import DatabricksConfig
 from src.models.initialization_status import InitializationStatus
@@ -23,6 +23,10 @@ from src.models.schedule import Schedule
 from src.models.api_key import ApiKey
 from src.models.schema import Schema
 from src.models.execution_logs import ExecutionLog
+from src.models.execution_queue import ExecutionQueueItem
+from src.models.task_checkpoint import TaskCheckpoint
+from src.models.llm_usage import LLMUsage
+from src.models.execution_purge import ExecutionPurge
 from src.models.mcp_server import MCPServer
 from src.models.mcp_settings import MCPSettings
 
@@ -40,6 +44,7 @@ __all__ = [
     "ErrorTrace",
     "Tool",
     "LLMLog",
+    "LLMLogDailyStats",
     "ModelConfig",
     "DatabricksConfig",
     "InitializationStatus",
@@ -54,6 +59,10 @@ __all__ = [
     "ApiKey",
     "Schema",
     "ExecutionLog",
+    "ExecutionQueueItem",
+    "TaskCheckpoint",
+    "LLMUsage",
+    "ExecutionPurge",
     "MCPServer",
     "MCPSettings"
 ] 
\ No newline at end of file
@@ -5,7 +5,7 @@ from pathlib import Path
 from datetime import datetime, timezone
 import sys
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -63,6 +63,74 @@ class SQLAlchemyLogger:
 # Initialize SQLAlchemy logging
 sql_logger = SQLAlchemyLogger()
 
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the SQLite performance profile to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        # Lets compact_sqlite_database release free pages without a full VACUUM;
+        # only takes effect for a database that has no tables yet
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # WAL lets readers run alongside the single writer; NORMAL only syncs at checkpoints
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        # A negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size={-int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    finally:
+        cursor.close()
+
+def configure_sqlite_engine(engine) -> None:
+    """
+    Apply the SQLite performance profile to every connection an engine opens.
+    
+    Does nothing for other databases or when SQLITE_TUNING_ENABLED is off.
+    
+    Args:
+        engine: Sync or async SQLAlchemy engine
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine.dialect.name != "sqlite" or not settings.SQLITE_TUNING_ENABLED:
+        return
+    if not event.contains(sync_engine, "connect", _apply_sqlite_pragmas):
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+
+def compact_sqlite_database(path: str, full_vacuum: bool = False) -> int:
+    """
+    Return the free pages of a SQLite database file to the file system.
+    
+    Databases in incremental auto-vacuum mode are compacted with
+    ``incremental_vacuum``. Others are only rebuilt by a full VACUUM, which
+    locks the database while it copies it, so that only runs when asked; it
+    also switches the database to incremental auto-vacuum for the next time.
+    The WAL file is truncated afterwards.
+    
+    Args:
+        path: Path of the database file
+        full_vacuum: Whether to VACUUM a database without incremental auto-vacuum
+        
+    Returns:
+        Number of free pages released
+    """
+    import sqlite3
+    
+    conn = sqlite3.connect(path, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+    try:
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if free_pages:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                # executescript steps the pragma to completion; execute frees one page
+                conn.executescript("PRAGMA incremental_vacuum;")
+            elif full_vacuum:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            else:
+                free_pages = 0
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return free_pages
+    finally:
+        conn.close()
+
 # Create async engine for the database
 engine = create_async_engine(
     str(settings.DATABASE_URI),
@@ -91,6 +159,9 @@ else:
         future=True,
     )
 
+configure_sqlite_engine(engine)
+configure_sqlite_engine(sync_engine)
+
 # Create async session factory
 async_session_factory = async_sessionmaker(
     engine,
@@ -106,6 +177,55 @@ SessionLocal = sessionmaker(
     autoflush=False
 )
 
+def _add_missing_columns(connection) -> None:
+    """Add nullable model columns that an existing database does not have yet."""
+    from sqlalchemy import inspect
+    from sqlalchemy.schema import CreateColumn
+    
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns or not column.nullable or column.primary_key:
+                continue
+            column_ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+            logger.info(f"Added column {table.name}.{column.name}")
+
+def _add_missing_indexes(connection) -> None:
+    """Create model indexes that an existing table does not have yet."""
+    from sqlalchemy import inspect
+    
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            index.create(connection)
+            logger.info(f"Added index {index.name} on {table.name}")
+
+def _get_table_names(connection) -> set:
+    """Get the names of the tables the database has."""
+    from sqlalchemy import inspect
+    
+    return set(inspect(connection).get_table_names())
+
+def _backfill_new_tables(connection, existing_tables) -> None:
+    """Fill derived tables created just now from the rows they summarize."""
+    from src.repositories.log_repository import daily_stats_backfill
+    
+    # In the creating transaction, so no log write can add a rollup row first
+    if "llmlog_daily_stats" not in existing_tables and "llmlog" in existing_tables:
+        result = connection.execute(daily_stats_backfill())
+        logger.info(f"Backfilled {result.rowcount} llmlog_daily_stats rows from existing logs")
+
 # Database initialization
 async def init_db() -> None:
     """Initialize database tables if they don't exist."""
@@ -180,6 +300,7 @@ async def init_db() -> None:
                 str(settings.DATABASE_URI),
                 **init_engine_opts
             )
+            configure_sqlite_engine(engine_for_init)
             
             # First ensure connection works
             async with engine_for_init.connect() as conn:
@@ -200,6 +321,19 @@ async def init_db() -> None:
             await engine_for_init.dispose()
             
             logger.info("Database tables initialized successfully")
+        else:
+            # Add tables and nullable columns introduced since the database was created
+            engine_for_init = create_async_engine(str(settings.DATABASE_URI), future=True)
+            configure_sqlite_engine(engine_for_init)
+            try:
+                async with engine_for_init.begin() as conn:
+                    existing_tables = await conn.run_sync(_get_table_names)
+                    await conn.run_sync(Base.metadata.create_all)
+                    await conn.run_sync(_add_missing_columns)
+                    await conn.run_sync(_add_missing_indexes)
+                    await conn.run_sync(_backfill_new_tables, existing_tables)
+            finally:
+                await engine_for_init.dispose()
         
         # Verify tables were created for SQLite
         if str(settings.DATABASE_URI).startswith('sqlite'):
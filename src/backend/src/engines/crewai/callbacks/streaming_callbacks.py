@@ -17,6 +17,7 @@ from crewai.utilities.events import (
     ToolUsageFinishedEvent,
     LLMCallStartedEvent,
     LLMCallCompletedEvent,
+    LLMStreamChunkEvent,
     crewai_event_bus
 )
 
@@ -28,6 +29,33 @@ from src.services.execution_logs_queue import enqueue_log
 # Initialize logger manager
 logger_manager = LoggerManager()
 
+# Whether the process-wide LLM stream chunk handler is registered
+_token_stream_handler_installed = False
+
+
+def install_token_stream_handler() -> None:
+    """
+    Forward streamed LLM chunks to the token streamer of their execution.
+    
+    The handler is registered once per process. CrewAI emits chunk events on
+    the thread making the LLM call, so the execution is taken from the
+    context the execution runner set for the crew.
+    """
+    global _token_stream_handler_installed
+    if _token_stream_handler_installed:
+        return
+    
+    from src.core.llm_usage import get_current_execution
+    from src.services.token_stream_service import get_token_streamer
+    
+    @crewai_event_bus.on(LLMStreamChunkEvent)
+    def on_llm_stream_chunk(source, event):
+        execution_id = get_current_execution()
+        if execution_id:
+            get_token_streamer().push(execution_id, event.chunk)
+    
+    _token_stream_handler_installed = True
+
 class LogCaptureHandler(logging.Handler):
     """Captures all log records for a specific job."""
     
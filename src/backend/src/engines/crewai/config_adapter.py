@@ -61,6 +61,7 @@ def adapt_config(config: CrewConfig) -> Dict[str, Any]:
         "model": config.model or "gpt-4o",
         "max_rpm": config.inputs.get("max_rpm", 10),
         "output_dir": config.inputs.get("output_dir", None),
+        "stream_tokens": config.stream_tokens,
         # Include the original frontend configuration for logging
         "original_config": {
             "model": config.model,
@@ -69,7 +70,8 @@ def adapt_config(config: CrewConfig) -> Dict[str, Any]:
             "tasks_yaml": config.tasks_yaml,
             "inputs": config.inputs,
             "planning": config.planning,
-            "reasoning": config.reasoning
+            "reasoning": config.reasoning,
+            "stream_tokens": config.stream_tokens
         }
     }
     
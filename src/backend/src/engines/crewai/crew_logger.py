@@ -3,11 +3,19 @@ Comprehensive logging solution for the CrewAI engine.
 
 This module provides a centralized approach to capturing and routing all CrewAI logs,
 including console output, event bus messages, and standard logging.
+
+Routing is context-local: the job ID of the running crew is carried in a
+contextvar that ``asyncio.to_thread`` copies into the kickoff thread. The
+Printer patch, event listeners, log handler and stdout/stderr router are
+installed once for the process and dispatch each record to the single job
+active in the current context, so concurrent crews never see each other's
+output.
 """
 
 import logging
 import traceback
-from typing import Optional, Any, Dict, Callable
+from contextvars import ContextVar
+from typing import Optional, Any, Dict, Callable, Tuple
 import sys
 import io
 import threading
@@ -39,6 +47,49 @@ from src.services.execution_logs_queue import enqueue_log
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Job ID whose logs the current context produces
+_current_job_id: ContextVar[Optional[str]] = ContextVar("crew_log_job_id", default=None)
+
+# stdout/stderr buffers of the capture active in the current context
+_current_capture: ContextVar[Optional[Tuple[io.StringIO, io.StringIO]]] = ContextVar(
+    "crew_log_capture", default=None
+)
+
+
+def get_current_job_id() -> Optional[str]:
+    """
+    Get the job ID that logs in the current context are routed to.
+    
+    Returns:
+        The job ID, or None outside of a job
+    """
+    return _current_job_id.get()
+
+
+class _ContextRoutingStream:
+    """
+    Replacement for sys.stdout/sys.stderr that writes to the capture buffer
+    of the current context, or to the original stream outside of a capture.
+    """
+    
+    def __init__(self, original: Any, index: int):
+        self._original = original
+        self._index = index
+    
+    def write(self, text: str) -> int:
+        capture = _current_capture.get()
+        if capture is None:
+            return self._original.write(text)
+        return capture[self._index].write(text)
+    
+    def flush(self) -> None:
+        if _current_capture.get() is None:
+            self._original.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._original, name)
+
+
 class CrewLogger:
     """
     Comprehensive logger for the CrewAI engine that integrates with the event bus,
@@ -62,14 +113,17 @@ class CrewLogger:
             # Get the crew logger from LoggerManager
             self._crew_logger = LoggerManager.get_instance().crew
             
-            # Store original print method for Printer class
+            # Process-wide hooks are installed once on first use
+            self._hooks_lock = threading.Lock()
+            self._hooks_installed = False
             self._original_print_method = None
             
-            # Initialize event listeners
-            self._event_handlers = {}
+            # Track active job IDs with the context token that set them
+            self._active_jobs: Dict[str, Dict[str, Any]] = {}
             
-            # Track active job IDs with their handlers
-            self._active_jobs = {}
+            # Single handler that routes crew logger records by job context
+            self._handler = CrewLoggerHandler(active_jobs=self._active_jobs)
+            self._handler.setFormatter(logging.Formatter('[CREW] %(asctime)s - %(levelname)s - %(message)s'))
             
             # Set up CrewAI's standard logging redirection
             self._setup_crewai_logging()
@@ -124,38 +178,41 @@ class CrewLogger:
         except Exception as e:
             logger.error(f"Error setting up CrewAI logging redirection: {str(e)}")
     
+    def _install_hooks(self) -> None:
+        """Install the routing handler, event listeners and Printer patch once per process."""
+        if self._hooks_installed:
+            return
+        with self._hooks_lock:
+            if self._hooks_installed:
+                return
+            self._crew_logger.addHandler(self._handler)
+            self._register_event_listeners()
+            self._patch_printer()
+            self._hooks_installed = True
+    
     def setup_for_job(self, job_id: str) -> None:
         """
         Set up comprehensive logging for a specific job.
         
+        Binds the job ID to the current context; work started from this
+        context (including ``asyncio.to_thread``) logs to this job only.
+        
         Args:
             job_id: The execution/job ID
         """
         if job_id in self._active_jobs:
             logger.warning(f"CrewLogger already set up for job {job_id}")
             return
-            
-        # Create a handler for this job
-        handler = CrewLoggerHandler(job_id=job_id)
-        handler.setFormatter(logging.Formatter('[CREW] %(asctime)s - %(levelname)s - %(message)s'))
+        
+        self._install_hooks()
         
         # Store job info
         self._active_jobs[job_id] = {
-            "handler": handler,
-            "original_print_method": None
+            "token": _current_job_id.set(job_id)
         }
         
-        # Attach handler to crew logger
-        self._crew_logger.addHandler(handler)
-        
         # Log setup confirmation
         self._crew_logger.info(f"CrewLogger set up for job {job_id}")
-        
-        # Set up event bus listeners
-        self._register_event_listeners(job_id)
-        
-        # Override CrewAI's Printer
-        self._patch_printer(job_id)
     
     def cleanup_for_job(self, job_id: str) -> None:
         """
@@ -164,40 +221,33 @@ class CrewLogger:
         Args:
             job_id: The execution/job ID
         """
-        if job_id not in self._active_jobs:
+        job_info = self._active_jobs.pop(job_id, None)
+        if job_info is None:
             logger.warning(f"No CrewLogger setup found for job {job_id}")
             return
-            
-        job_info = self._active_jobs[job_id]
-        
-        # Remove handler from crew logger
-        self._crew_logger.removeHandler(job_info["handler"])
         
-        # Restore original Printer.print method if we were the one who patched it
-        if job_info.get("original_print_method"):
-            try:
-                Printer.print = job_info["original_print_method"]
-                self._crew_logger.info(f"Restored original CrewAI Printer for job {job_id}")
-            except Exception as e:
-                logger.warning(f"Error restoring original CrewAI Printer: {str(e)}")
-        
-        # Remove job from active jobs
-        del self._active_jobs[job_id]
+        # Unbind the job from the context that set it up
+        try:
+            _current_job_id.reset(job_info["token"])
+        except ValueError:
+            # Cleanup from a different context; records are already unrouted
+            # because the job is no longer active
+            pass
         
-        # Log cleanup confirmation (won't go through our handler since it's removed)
+        # Log cleanup confirmation (no longer routed to the job)
         logger.info(f"CrewLogger cleaned up for job {job_id}")
     
-    def _register_event_listeners(self, job_id: str) -> None:
-        """
-        Register listeners for all relevant CrewAI events.
-        
-        Args:
-            job_id: The execution/job ID
-        """
+    def _register_event_listeners(self) -> None:
+        """Register listeners for all relevant CrewAI events."""
         # Helper to create event handlers
         def create_handler(event_type: str, level: str = "info"):
             def handler(source, event):
                 try:
+                    # Events with no job in context belong to no job sink
+                    job_id = _current_job_id.get()
+                    if job_id is None:
+                        return
+                    
                     # Format the message based on event type and contents
                     message = f"EVENT-{event_type}: "
                     
@@ -259,42 +309,53 @@ class CrewLogger:
         except Exception as e:
             logger.error(f"Error registering event handler for {event_type.__name__}: {str(e)}")
     
-    def _patch_printer(self, job_id: str) -> None:
+    def _patch_printer(self) -> None:
         """
         Patch CrewAI's Printer class to redirect output to our logger.
         
-        Args:
-            job_id: The execution/job ID
+        The patch is applied once for the process and never restored per job,
+        so overlapping jobs cannot undo each other's patch.
         """
         try:
             # Save the original print method
             original_print_method = Printer.print
-            
-            # Store in active jobs
-            self._active_jobs[job_id]["original_print_method"] = original_print_method
+            self._original_print_method = original_print_method
             
             # Create reference to crew logger for use in custom_print
             crew_logger = self._crew_logger
             
             # Override CrewAI's print method to redirect to our logger
             def custom_print(self, content: str, color: Optional[str] = None):
-                # Log to our crew logger
+                # Log to our crew logger; the handler routes it by job context
                 crew_logger.info(f"CREW-PRINT: {content}")
                 # Call the original method to maintain normal behavior
                 original_print_method(self, content, color)
             
             # Apply the override
             Printer.print = custom_print
-            self._crew_logger.info(f"Successfully redirected CrewAI's Printer output to crew logger for job {job_id}")
+            self._crew_logger.info("Successfully redirected CrewAI's Printer output to crew logger")
             
         except Exception as e:
             self._crew_logger.warning(f"Could not redirect CrewAI's print output: {str(e)}. Some logs may not be captured.")
 
+    @staticmethod
+    def _install_stream_router() -> None:
+        """Wrap sys.stdout/sys.stderr in context-routing streams if not already wrapped."""
+        with CrewLogger._lock:
+            if not isinstance(sys.stdout, _ContextRoutingStream):
+                sys.stdout = _ContextRoutingStream(sys.stdout, 0)
+            if not isinstance(sys.stderr, _ContextRoutingStream):
+                sys.stderr = _ContextRoutingStream(sys.stderr, 1)
+
     @contextmanager
     def capture_stdout_stderr(self, job_id: str):
         """
         Context manager to capture stdout and stderr during execution.
         
+        Only writes made from the current context (and threads started from it
+        with ``asyncio.to_thread``) are captured; other jobs and the server keep
+        writing to the real streams.
+        
         Args:
             job_id: The execution/job ID
             
@@ -302,23 +363,19 @@ class CrewLogger:
             None
         """
         # Set up stdout/stderr capture
-        original_stdout = sys.stdout
-        original_stderr = sys.stderr
+        self._install_stream_router()
         stdout_capture = io.StringIO()
         stderr_capture = io.StringIO()
+        job_token = _current_job_id.set(job_id)
+        capture_token = _current_capture.set((stdout_capture, stderr_capture))
         
         try:
-            # Redirect stdout/stderr
-            sys.stdout = stdout_capture
-            sys.stderr = stderr_capture
-            
             # Yield control back to caller
             yield
             
         finally:
-            # Restore original stdout/stderr
-            sys.stdout = original_stdout
-            sys.stderr = original_stderr
+            # Stop capturing for this context
+            _current_capture.reset(capture_token)
             
             # Process captured output
             stdout_content = stdout_capture.getvalue()
@@ -336,6 +393,7 @@ class CrewLogger:
                         self._crew_logger.error(f"CREW-STDERR: {line.strip()}")
             
             # Clean up
+            _current_job_id.reset(job_token)
             stdout_capture.close()
             stderr_capture.close()
 
@@ -344,17 +402,24 @@ class CrewLoggerHandler(logging.Handler):
     """
     Custom logging handler that captures logs from the crew logger
     and redirects them to the job_output_queue.
+    
+    Without a fixed job ID the handler routes each record to the job bound to
+    the current context, so one handler serves all concurrent jobs.
     """
     
-    def __init__(self, job_id: str):
+    def __init__(self, job_id: Optional[str] = None, active_jobs: Optional[Dict[str, Any]] = None):
         """
-        Initialize the handler with a job ID.
+        Initialize the handler.
         
         Args:
-            job_id: The execution/job ID to associate logs with
+            job_id: Fixed execution/job ID to associate logs with, or None to
+                route by the job bound to the current context
+            active_jobs: Mapping of active job IDs; context-routed records for
+                jobs not in it are skipped
         """
         super().__init__()
         self.job_id = job_id
+        self._active_jobs = active_jobs
         
     def emit(self, record: logging.LogRecord):
         """
@@ -364,11 +429,19 @@ class CrewLoggerHandler(logging.Handler):
             record: The logging record to process
         """
         try:
+            job_id = self.job_id
+            if job_id is None:
+                job_id = _current_job_id.get()
+                if job_id is None:
+                    return
+                if self._active_jobs is not None and job_id not in self._active_jobs:
+                    return
+            
             # Format the log message
             log_message = self.format(record)
             
             # Enqueue the log message with the job ID
-            enqueue_log(execution_id=self.job_id, content=log_message)
+            enqueue_log(execution_id=job_id, content=log_message)
         except Exception as e:
             # Don't use logging here to avoid potential infinite recursion
             print(f"Error in CrewLoggerHandler.emit: {e}", file=sys.stderr)
@@ -376,4 +449,4 @@ class CrewLoggerHandler(logging.Handler):
 
 
 # Create singleton instance
-crew_logger = CrewLogger() 
\ No newline at end of file
+crew_logger = CrewLogger() 
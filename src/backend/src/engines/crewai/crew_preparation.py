@@ -283,6 +283,8 @@ class CrewPreparation:
                     # For Databricks, create a custom embedding function using LiteLLM
                     try:
                         from src.services.api_keys_service import ApiKeysService
+                        from src.core.llm_manager import LLMManager
+                        from src.core.embedding_cache import get_embedding_cache
                         
                         # Get Databricks credentials directly with async/await
                         databricks_key = await ApiKeysService.get_provider_api_key("DATABRICKS")
@@ -304,18 +306,47 @@ class CrewPreparation:
                                     self.api_base = api_base 
                                     self.model = model if model.startswith('databricks/') else f"databricks/{model}"
                                 
+                                def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+                                    # Use LiteLLM for Databricks embeddings
+                                    response = litellm.embedding(
+                                        model=self.model,
+                                        input=batch,
+                                        api_key=self.api_key,
+                                        api_base=self.api_base
+                                    )
+                                    
+                                    # Extract embeddings from response in input order
+                                    data = sorted(response['data'], key=lambda item: item['index'] if 'index' in item else 0)
+                                    return [item['embedding'] for item in data]
+                                
+                                def _embed(self, texts: List[str]) -> List[List[float]]:
+                                    # Split into provider-sized batches and embed them concurrently
+                                    batch_size = LLMManager.embedding_batch_size('databricks')
+                                    batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+                                    if len(batches) <= 1:
+                                        return self._embed_batch(texts)
+                                    
+                                    from concurrent.futures import ThreadPoolExecutor
+                                    from src.config.settings import settings
+                                    workers = max(1, min(settings.EMBEDDING_MAX_CONCURRENCY, len(batches)))
+                                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                                        results = list(pool.map(self._embed_batch, batches))
+                                    return [embedding for batch in results for embedding in batch]
+                                
                                 def __call__(self, input: Documents) -> Embeddings:
                                     try:
-                                        # Use LiteLLM for Databricks embeddings
-                                        response = litellm.embedding(
-                                            model=self.model,
-                                            input=input,
-                                            api_key=self.api_key,
-                                            api_base=self.api_base
-                                        )
+                                        texts = list(input)
+                                        cache = get_embedding_cache()
+                                        if cache is None:
+                                            return cast(Embeddings, self._embed(texts))
                                         
-                                        # Extract embeddings from response
-                                        embeddings = [item['embedding'] for item in response['data']]
+                                        # Only embed the distinct texts missing from the embedding cache
+                                        embeddings = cache.get_many('databricks', self.model, texts)
+                                        missing = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+                                        if missing:
+                                            created = dict(zip(missing, self._embed(missing)))
+                                            cache.put_many('databricks', self.model, missing, [created[text] for text in missing])
+                                            embeddings = [embedding if embedding is not None else created[text] for text, embedding in zip(texts, embeddings)]
                                         return cast(Embeddings, embeddings)
                                     except Exception as e:
                                         logger.error(f"Error in Databricks embedding function: {e}")
@@ -126,70 +126,29 @@ class CrewAIEngineService(BaseEngineService):
                 "Preparing CrewAI execution"
             )
             
-            try:
-                # Create services using the Unit of Work pattern
-                from src.core.unit_of_work import UnitOfWork
-                from src.services.tool_service import ToolService
-                from src.services.api_keys_service import ApiKeysService
-                
-                # Use a single UnitOfWork to manage all repositories
-                async with UnitOfWork() as uow:
-                    # Create services from the UnitOfWork
-                    tool_service = await ToolService.from_unit_of_work(uow)
-                    api_keys_service = await ApiKeysService.from_unit_of_work(uow)
-                    
-                    # Create a tool factory instance with API keys service
-                    tool_factory = await ToolFactory.create(execution_config, api_keys_service)
-                    logger.info(f"[CrewAIEngineService] Created ToolFactory for {execution_id}")
-                    
-                    # Use the CrewPreparation class for crew setup with tool_service and tool_factory
-                    crew_preparation = CrewPreparation(execution_config, tool_service, tool_factory)
-                    if not await crew_preparation.prepare():
-                        logger.error(f"[CrewAIEngineService] Failed to prepare crew for {execution_id}")
-                        await self._update_execution_status(
-                            execution_id, 
-                            ExecutionStatus.FAILED.value,
-                            "Failed to prepare crew"
-                        )
-                        return execution_id
-                    
-                    # Get the prepared crew for use after UnitOfWork context
-                    crew = crew_preparation.crew
+            from src.config.settings import settings
+            if settings.CREW_EXECUTION_BACKEND == "process":
+                # Prepare and run the crew in an isolated worker process;
+                # traces and logs come back over IPC into the local queues
+                from src.engines.crewai.process_executor import get_crew_process_pool
+                execution_task = asyncio.create_task(get_crew_process_pool().run_crew(
+                    execution_id=execution_id,
+                    execution_config=execution_config,
+                    running_jobs=self._running_jobs
+                ))
+                self._running_jobs[execution_id] = {
+                    "task": execution_task,
+                    "crew": None,
+                    "start_time": datetime.now(),
+                    "config": execution_config
+                }
+                return execution_id
             
-            except Exception as e:
-                logger.error(f"[CrewAIEngineService] Error running CrewAI execution {execution_id}: {str(e)}", exc_info=True)
-                try:
-                    await self._update_execution_status(
-                        execution_id, 
-                        ExecutionStatus.FAILED.value,
-                        f"Failed during crew preparation/launch: {str(e)}"
-                    )
-                except Exception as update_err:
-                    logger.critical(f"[CrewAIEngineService] CRITICAL: Failed to update status to FAILED for {execution_id} after run_execution error: {update_err}", exc_info=True)
-                raise
+            crew = await self.prepare_crew(execution_id, execution_config)
+            if crew is None:
+                return execution_id
             
-            # --- Instantiate Event Listeners --- 
-            logger.debug(f"[CrewAIEngineService] Instantiating event listeners for {execution_id}")
-            try:
-                # Create the event listeners with proper error handling
-                # Just creating the instances is enough - they'll register with the event bus during init
-                agent_trace_callback = AgentTraceEventListener(job_id=execution_id)
-                logger.info(f"[CrewAIEngineService] Successfully created AgentTraceEventListener for {execution_id}")
-                
-                # Add task completion logger
-                task_completion_logger = TaskCompletionLogger(job_id=execution_id)
-                logger.info(f"[CrewAIEngineService] Successfully created TaskCompletionLogger for {execution_id}")
-                
-                # Add detailed output logger
-                detailed_output_logger = DetailedOutputLogger(job_id=execution_id)
-                logger.info(f"[CrewAIEngineService] Successfully created DetailedOutputLogger for {execution_id}")
-                
-                # No need to manually register with the crew - the listeners register with the global event bus
-                logger.info(f"[CrewAIEngineService] All event listeners initialized for {execution_id}")
-            except Exception as callback_error:
-                logger.error(f"[CrewAIEngineService] Error creating event listeners: {callback_error}", exc_info=True)
-                # Continue execution without the callbacks - we don't want to fail the entire execution
-                # if trace logging doesn't work
+            self.create_event_listeners(execution_id)
             
             # Update status to RUNNING
             await self._update_execution_status(
@@ -219,6 +178,91 @@ class CrewAIEngineService(BaseEngineService):
             logger.error(f"Error running execution {execution_id}: {str(e)}", exc_info=True)
             raise
     
+    async def prepare_crew(self, execution_id: str, execution_config: Dict[str, Any]) -> Optional[Crew]:
+        """
+        Build the crew for an execution from its normalized configuration.
+        
+        Args:
+            execution_id: Execution ID
+            execution_config: Normalized execution configuration
+            
+        Returns:
+            The prepared crew, or None if preparation failed
+        """
+        try:
+            # Create services using the Unit of Work pattern
+            from src.core.unit_of_work import UnitOfWork
+            from src.services.tool_service import ToolService
+            from src.services.api_keys_service import ApiKeysService
+            
+            # Use a single UnitOfWork to manage all repositories
+            async with UnitOfWork() as uow:
+                # Create services from the UnitOfWork
+                tool_service = await ToolService.from_unit_of_work(uow)
+                api_keys_service = await ApiKeysService.from_unit_of_work(uow)
+                
+                # Create a tool factory instance with API keys service
+                tool_factory = await ToolFactory.create(execution_config, api_keys_service)
+                logger.info(f"[CrewAIEngineService] Created ToolFactory for {execution_id}")
+                
+                # Use the CrewPreparation class for crew setup with tool_service and tool_factory
+                crew_preparation = CrewPreparation(execution_config, tool_service, tool_factory)
+                if not await crew_preparation.prepare():
+                    logger.error(f"[CrewAIEngineService] Failed to prepare crew for {execution_id}")
+                    await self._update_execution_status(
+                        execution_id, 
+                        ExecutionStatus.FAILED.value,
+                        "Failed to prepare crew"
+                    )
+                    return None
+                
+                # Get the prepared crew for use after UnitOfWork context
+                crew = crew_preparation.crew
+        
+        except Exception as e:
+            logger.error(f"[CrewAIEngineService] Error running CrewAI execution {execution_id}: {str(e)}", exc_info=True)
+            try:
+                await self._update_execution_status(
+                    execution_id, 
+                    ExecutionStatus.FAILED.value,
+                    f"Failed during crew preparation/launch: {str(e)}"
+                )
+            except Exception as update_err:
+                logger.critical(f"[CrewAIEngineService] CRITICAL: Failed to update status to FAILED for {execution_id} after run_execution error: {update_err}", exc_info=True)
+            raise
+        
+        return crew
+    
+    def create_event_listeners(self, execution_id: str) -> None:
+        """
+        Register the trace and output event listeners for an execution.
+        
+        Args:
+            execution_id: Execution ID
+        """
+        # --- Instantiate Event Listeners --- 
+        logger.debug(f"[CrewAIEngineService] Instantiating event listeners for {execution_id}")
+        try:
+            # Create the event listeners with proper error handling
+            # Just creating the instances is enough - they'll register with the event bus during init
+            agent_trace_callback = AgentTraceEventListener(job_id=execution_id)
+            logger.info(f"[CrewAIEngineService] Successfully created AgentTraceEventListener for {execution_id}")
+            
+            # Add task completion logger
+            task_completion_logger = TaskCompletionLogger(job_id=execution_id)
+            logger.info(f"[CrewAIEngineService] Successfully created TaskCompletionLogger for {execution_id}")
+            
+            # Add detailed output logger
+            detailed_output_logger = DetailedOutputLogger(job_id=execution_id)
+            logger.info(f"[CrewAIEngineService] Successfully created DetailedOutputLogger for {execution_id}")
+            
+            # No need to manually register with the crew - the listeners register with the global event bus
+            logger.info(f"[CrewAIEngineService] All event listeners initialized for {execution_id}")
+        except Exception as callback_error:
+            logger.error(f"[CrewAIEngineService] Error creating event listeners: {callback_error}", exc_info=True)
+            # Continue execution without the callbacks - we don't want to fail the entire execution
+            # if trace logging doesn't work
+    
     def _setup_output_directory(self, execution_id: Optional[str] = None) -> str:
         """
         Set up output directory for workflow execution
@@ -270,6 +314,19 @@ class CrewAIEngineService(BaseEngineService):
             result=result
         )
 
+    def get_execution_task(self, execution_id: str) -> Optional[asyncio.Task]:
+        """
+        Get the task running an execution, if it is still running.
+        
+        Args:
+            execution_id: Execution ID
+            
+        Returns:
+            The execution task, or None if the execution is not running
+        """
+        job_info = self._running_jobs.get(execution_id)
+        return job_info.get("task") if job_info else None
+
     async def get_execution_status(self, execution_id: str) -> Dict[str, Any]:
         """
         Get the status of an execution
@@ -352,8 +409,8 @@ class CrewAIEngineService(BaseEngineService):
                 "Execution cancelled by user"
             )
             
-            # Clean up
-            del self._running_jobs[execution_id]
+            # Clean up (the execution task may already have removed itself)
+            self._running_jobs.pop(execution_id, None)
             
             return True
         except Exception as e:
@@ -12,8 +12,15 @@ import os
 
 
 from crewai import Crew, LLM
+from src.config.settings import settings
 from src.models.execution_status import ExecutionStatus
 from src.core.llm_manager import LLMManager
+from src.core.llm_usage import (
+    get_llm_usage_recorder,
+    reset_current_execution,
+    set_current_execution,
+    track_agent_executions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +49,7 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict) -> None:
     
     # Set up CrewLogger and callback handlers
     from src.engines.crewai.crew_logger import crew_logger
-    from src.engines.crewai.callbacks.streaming_callbacks import EventStreamingCallback
+    from src.engines.crewai.callbacks.streaming_callbacks import EventStreamingCallback, install_token_stream_handler
     
     # Get the job configuration from the running jobs dictionary
     config = None
@@ -75,6 +82,25 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict) -> None:
     # Initialize event streaming with configuration
     event_streaming = EventStreamingCallback(job_id=execution_id, config=config)
     
+    # Stream LLM tokens to WebSocket subscribers if the execution asked for it
+    if config and config.get("stream_tokens"):
+        install_token_stream_handler()
+        streaming_llms = _enable_llm_streaming(crew)
+        logger.info(f"Streaming tokens of {streaming_llms} LLMs for execution {execution_id}")
+    
+    # Checkpoint finished tasks so retries resume from the first unfinished one
+    checkpointer = None
+    if settings.TASK_CHECKPOINTS_ENABLED:
+        from src.engines.crewai.task_checkpoints import TaskCheckpointer
+        checkpointer = TaskCheckpointer(execution_id, crew)
+        try:
+            restored = await checkpointer.load()
+            if restored:
+                logger.info(f"Restored {restored} task checkpoints for execution {execution_id}")
+        except Exception as checkpoint_error:
+            logger.error(f"Error loading task checkpoints for execution {execution_id}: {checkpoint_error}")
+        checkpointer.install()
+    
     # Retry counter
     retry_count = 0
     
@@ -226,9 +252,26 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict) -> None:
                         message=attempt_msg
                     )
                 
-                # Run the potentially blocking crew.kickoff() in a separate thread
-                # to avoid blocking the asyncio event loop
-                result = await asyncio.to_thread(crew.kickoff)
+                if checkpointer and checkpointer.is_complete():
+                    # Every task finished in an earlier attempt
+                    logger.info(f"All tasks of execution {execution_id} are checkpointed, skipping kickoff")
+                    result = checkpointer.final_output()
+                else:
+                    skipped = checkpointer.resume() if checkpointer else 0
+                    if skipped:
+                        logger.info(f"Resuming execution {execution_id} at task {skipped + 1} with {skipped} checkpointed task outputs")
+                    
+                    # Run the potentially blocking crew.kickoff() in a separate thread
+                    # to avoid blocking the asyncio event loop; the thread inherits the
+                    # execution ID its LLM calls are accounted to
+                    track_agent_executions()
+                    usage_token = set_current_execution(execution_id)
+                    try:
+                        result = await asyncio.to_thread(crew.kickoff)
+                    finally:
+                        reset_current_execution(usage_token)
+                        if checkpointer:
+                            checkpointer.restore()
             
             # If kickoff successful, prepare for COMPLETED status
             final_status = ExecutionStatus.COMPLETED.value
@@ -298,6 +341,22 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict) -> None:
         logger.error(f"Execution {execution_id} failed after maximum retries. Error: {str(last_error)}")
         
     try:
+        # Persist outstanding checkpoints; a completed execution no longer needs them
+        if checkpointer:
+            try:
+                await checkpointer.flush()
+                if final_status == ExecutionStatus.COMPLETED.value:
+                    await checkpointer.clear()
+            except Exception as checkpoint_error:
+                logger.error(f"Error finalizing task checkpoints for execution {execution_id}: {checkpoint_error}")
+        
+        # Write the execution's aggregated LLM usage now rather than on the next periodic flush
+        if settings.LLM_USAGE_ENABLED:
+            try:
+                await get_llm_usage_recorder().flush()
+            except Exception as usage_error:
+                logger.error(f"Error writing LLM usage for execution {execution_id}: {usage_error}")
+        
         # Clean up the event streaming
         event_streaming.cleanup()
         
@@ -330,6 +389,26 @@ async def run_crew(execution_id: str, crew: Crew, running_jobs: Dict) -> None:
         logger.error(f"Error during cleanup for execution {execution_id}: {str(cleanup_error)}")
 
 
+def _enable_llm_streaming(crew: Crew) -> int:
+    """
+    Switch the LLMs of a crew's agents and manager to streaming completions.
+    
+    Args:
+        crew: Crew about to be kicked off
+        
+    Returns:
+        Number of LLMs switched to streaming
+    """
+    llms = [getattr(agent, 'llm', None) for agent in crew.agents]
+    llms.append(getattr(crew, 'manager_llm', None))
+    enabled = 0
+    for llm in {id(llm): llm for llm in llms if llm is not None}.values():
+        if hasattr(llm, 'stream'):
+            llm.stream = True
+            enabled += 1
+    return enabled
+
+
 async def update_execution_status_with_retry(
     execution_id: str, 
     status: str,
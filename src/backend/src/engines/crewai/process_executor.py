@@ -0,0 +1,322 @@
+"""
+Process-pool execution backend for CrewAI crews.
+
+With ``CREW_EXECUTION_BACKEND="process"`` each crew is prepared and kicked off
+in its own spawned worker process, with at most ``CREW_PROCESS_POOL_SIZE``
+workers running at once. Inside a worker the trace and job output queues are
+replaced by forwarders that ship every item over a multiprocessing queue of
+that worker alone; a pump thread per worker in the API process feeds them into
+the local TraceQueue and JobOutputQueue, so the existing writers persist them
+unchanged. Streamed token deltas take the same route to the API process's
+token streamer. Cancelling the execution task terminates its worker; as no
+other worker shares its queue, a worker killed mid-write cannot block or
+corrupt the forwarding of the others.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import queue
+import threading
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, Optional
+
+from src.core.logger import LoggerManager
+from src.models.execution_status import ExecutionStatus
+
+logger = LoggerManager.get_instance().crew
+
+TRACE_CHANNEL = "trace"
+LOG_CHANNEL = "log"
+TOKEN_CHANNEL = "token"
+
+
+def _safe_value(value: Any) -> Any:
+    """Return value if it can be pickled, otherwise its string form."""
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return str(value)
+
+
+def _dumps(item: Any) -> bytes:
+    """Pickle a queue item, stringifying values that cannot cross the process boundary."""
+    try:
+        return pickle.dumps(item)
+    except Exception:
+        if isinstance(item, dict):
+            return pickle.dumps({key: _safe_value(value) for key, value in item.items()})
+        return pickle.dumps(str(item))
+
+
+class _IpcForwardingQueue:
+    """
+    Stand-in for a bridge queue inside a worker process.
+
+    Producers keep calling ``put_nowait``; items are forwarded to the API
+    process, where the real queue applies its overflow policy.
+    """
+
+    def __init__(self, ipc_queue: Any, channel: str):
+        self._ipc_queue = ipc_queue
+        self._channel = channel
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        # Writer shutdown signals belong to the API process, not to a worker
+        if item is None:
+            return
+        self._ipc_queue.put((self._channel, _dumps(item)))
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def qsize(self) -> int:
+        return 0
+
+    def get_job_stats(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return None
+
+
+def _install_ipc_queues(ipc_queue: Any) -> None:
+    """Point this process's trace and job output queues at the IPC channel."""
+    from src.services.trace_queue import TraceQueue
+    from src.services.execution_logs_queue import JobOutputQueue
+
+    from src.services.token_stream_service import get_token_streamer
+
+    TraceQueue()._queue = _IpcForwardingQueue(ipc_queue, TRACE_CHANNEL)
+    JobOutputQueue()._queue = _IpcForwardingQueue(ipc_queue, LOG_CHANNEL)
+    # Token deltas are framed in the API process, which holds the WebSockets
+    get_token_streamer().set_forwarder(
+        lambda execution_id, delta: ipc_queue.put((TOKEN_CHANNEL, _dumps((execution_id, delta))))
+    )
+
+
+async def _run_in_worker(execution_id: str, execution_config: Dict[str, Any]) -> None:
+    """Prepare and run a crew inside the worker process."""
+    from src.engines.crewai.crewai_engine_service import CrewAIEngineService
+    from src.engines.crewai.execution_runner import run_crew
+    from src.utils.asyncio_utils import engine_registry
+
+    engine = CrewAIEngineService()
+    try:
+        try:
+            crew = await engine.prepare_crew(execution_id, execution_config)
+        except Exception:
+            # prepare_crew already recorded the FAILED status
+            return
+        if crew is None:
+            return
+
+        engine.create_event_listeners(execution_id)
+
+        # run_crew reads retry limits and model from the running job's config
+        running_jobs = {execution_id: {"config": execution_config}}
+        await run_crew(execution_id=execution_id, crew=crew, running_jobs=running_jobs)
+    finally:
+        await engine_registry.dispose_loop()
+
+
+def _worker_main(execution_id: str, execution_config: Dict[str, Any], ipc_queue: Any) -> None:
+    """Entry point of a crew worker process."""
+    _install_ipc_queues(ipc_queue)
+    try:
+        asyncio.run(_run_in_worker(execution_id, execution_config))
+    finally:
+        # Make sure every forwarded trace and log reaches the pipe before exiting
+        ipc_queue.close()
+        ipc_queue.join_thread()
+
+
+class CrewProcessPool:
+    """
+    Bounded pool of crew worker processes.
+
+    Workers are spawned per execution rather than reused, so a crashing or
+    cancelled crew never leaves state behind in a process that runs the next one.
+    Each worker also gets its own IPC queue and pump thread.
+    """
+
+    # Seconds between liveness checks of a running worker or a free slot
+    POLL_INTERVAL_SECONDS = 0.5
+
+    def __init__(self, max_workers: int, terminate_timeout: float):
+        self._max_workers = max(1, max_workers)
+        self._terminate_timeout = terminate_timeout
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        # execution_id -> worker process (None while the slot is reserved)
+        self._processes: Dict[str, Optional[BaseProcess]] = {}
+
+    @staticmethod
+    def _pump(ipc_queue: Any, stop: Optional[threading.Event] = None, poll_interval: float = 0.5) -> None:
+        """
+        Move forwarded traces and logs from a worker into the local queues.
+
+        Runs until a None message arrives, the queue breaks, or ``stop`` is set
+        and no message arrived for ``poll_interval`` seconds. A message that
+        cannot be read or forwarded is logged and skipped.
+        """
+        from src.services.trace_queue import get_trace_queue
+        from src.services.execution_logs_queue import get_job_output_queue
+        from src.services.token_stream_service import get_token_streamer
+
+        while True:
+            try:
+                message = ipc_queue.get(timeout=poll_interval)
+            except queue.Empty:
+                if stop is not None and stop.is_set():
+                    break
+                continue
+            except (EOFError, OSError) as e:
+                logger.warning(f"[CrewProcessPool._pump] Worker queue closed: {e}")
+                break
+            except Exception as e:
+                logger.error(f"[CrewProcessPool._pump] Error reading worker item: {e}", exc_info=True)
+                continue
+            if message is None:
+                break
+            try:
+                channel, payload = message
+                item = pickle.loads(payload)
+                if channel == TOKEN_CHANNEL:
+                    get_token_streamer().push(*item)
+                    continue
+                target = get_trace_queue() if channel == TRACE_CHANNEL else get_job_output_queue()
+                target.put_nowait(item)
+            except Exception as e:
+                logger.error(f"[CrewProcessPool._pump] Error forwarding worker item: {e}", exc_info=True)
+
+    async def _acquire_slot(self, execution_id: str) -> None:
+        """Wait until fewer than max_workers workers are running and reserve a slot."""
+        while True:
+            with self._lock:
+                if len(self._processes) < self._max_workers:
+                    self._processes[execution_id] = None
+                    return
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+
+    async def _terminate(self, process: BaseProcess) -> None:
+        """Terminate a worker, killing it if it does not exit in time."""
+        process.terminate()
+        deadline = asyncio.get_running_loop().time() + self._terminate_timeout
+        while process.is_alive() and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.1)
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    async def run_crew(self, execution_id: str, execution_config: Dict[str, Any], running_jobs: Dict) -> None:
+        """
+        Run an execution in a worker process and wait for it to finish.
+
+        The worker records the execution's status itself; this only marks the
+        execution FAILED when the worker dies without finishing.
+
+        Args:
+            execution_id: Execution ID
+            execution_config: Normalized execution configuration
+            running_jobs: Dictionary tracking running jobs
+        """
+        from src.engines.crewai.execution_runner import update_execution_status_with_retry
+
+        process = None
+        ipc_queue = None
+        pump = None
+        pump_stop = threading.Event()
+        try:
+            await self._acquire_slot(execution_id)
+
+            ipc_queue = self._ctx.Queue()
+            pump = threading.Thread(
+                target=self._pump,
+                args=(ipc_queue, pump_stop, self.POLL_INTERVAL_SECONDS),
+                name=f"crew-ipc-pump-{execution_id}",
+                daemon=True
+            )
+            pump.start()
+
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(execution_id, execution_config, ipc_queue),
+                name=f"crew-{execution_id}"
+            )
+            process.start()
+            with self._lock:
+                self._processes[execution_id] = process
+            logger.info(f"[CrewProcessPool] Started worker pid={process.pid} for execution {execution_id}")
+
+            while process.is_alive():
+                await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+            process.join()
+
+            if process.exitcode != 0:
+                logger.error(f"[CrewProcessPool] Worker for execution {execution_id} exited with code {process.exitcode}")
+                await update_execution_status_with_retry(
+                    execution_id,
+                    ExecutionStatus.FAILED.value,
+                    f"Crew worker process exited unexpectedly with code {process.exitcode}"
+                )
+            else:
+                logger.info(f"[CrewProcessPool] Worker for execution {execution_id} finished")
+
+        except asyncio.CancelledError:
+            if process is not None and process.is_alive():
+                logger.warning(f"[CrewProcessPool] Terminating worker for cancelled execution {execution_id}")
+                await self._terminate(process)
+            raise
+
+        finally:
+            with self._lock:
+                self._processes.pop(execution_id, None)
+            running_jobs.pop(execution_id, None)
+            if pump is not None:
+                # Forward what the worker sent before it exited
+                pump_stop.set()
+                await asyncio.to_thread(pump.join, self._terminate_timeout + self.POLL_INTERVAL_SECONDS)
+                if pump.is_alive():
+                    logger.warning(f"[CrewProcessPool] IPC pump of execution {execution_id} did not stop")
+            if ipc_queue is not None:
+                ipc_queue.close()
+                ipc_queue.cancel_join_thread()
+
+    def active_count(self) -> int:
+        """Number of executions holding a worker slot."""
+        with self._lock:
+            return len(self._processes)
+
+    def shutdown(self) -> None:
+        """Terminate all running workers."""
+        with self._lock:
+            processes = [p for p in self._processes.values() if p is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(self._terminate_timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+
+_pool: Optional[CrewProcessPool] = None
+_pool_lock = threading.Lock()
+
+# Function to get the singleton pool instance easily
+def get_crew_process_pool() -> CrewProcessPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from src.config.settings import settings
+                _pool = CrewProcessPool(
+                    max_workers=settings.CREW_PROCESS_POOL_SIZE,
+                    terminate_timeout=settings.CREW_PROCESS_TERMINATE_TIMEOUT_SECONDS,
+                )
+    return _pool
+
+def shutdown_crew_process_pool() -> None:
+    """Shut down the worker pool if it was ever used."""
+    if _pool is not None:
+        _pool.shutdown()
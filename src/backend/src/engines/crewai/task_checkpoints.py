@@ -0,0 +1,189 @@
+"""
+Task-level checkpoints for crew executions.
+
+The output of every finished task is kept in memory and persisted to the
+task_checkpoint table. When ``run_crew`` retries after a rate-limit or
+guardrail error, the crew is trimmed to the first unfinished task and the
+finished tasks keep their outputs, so they are passed on as context instead
+of being run (and paid for) again. Persisted checkpoints let an execution
+picked up again by another queue worker resume the same way.
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.logger import LoggerManager
+from src.repositories.task_checkpoint_repository import TaskCheckpointRepository
+from src.utils.asyncio_utils import execute_db_operation
+
+logger = LoggerManager.get_instance().crew
+
+
+def task_key(task: Any) -> str:
+    """Identify a task by its description so checkpoints are never applied to a changed task."""
+    return hashlib.sha256(str(getattr(task, "description", "")).encode("utf-8")).hexdigest()
+
+
+def _build_task_output(task: Any, raw_output: str, json_output: Optional[Dict[str, Any]], agent_name: Optional[str]) -> Any:
+    """Rebuild a TaskOutput from a stored checkpoint."""
+    from crewai.tasks.task_output import TaskOutput
+
+    return TaskOutput(
+        description=str(getattr(task, "description", "")),
+        expected_output=getattr(task, "expected_output", None),
+        raw=raw_output,
+        json_dict=json_output,
+        agent=agent_name or "",
+    )
+
+
+class TaskCheckpointer:
+    """
+    Records finished task outputs of one crew and resumes it after a failure.
+
+    Resuming only applies to sequential crews; hierarchical crews are always
+    rerun in full because the manager decides which tasks run.
+    """
+
+    def __init__(self, execution_id: str, crew: Any):
+        self._execution_id = execution_id
+        self._crew = crew
+        self._tasks: List[Any] = list(crew.tasks)
+        self._contexts = [getattr(task, "context", None) for task in self._tasks]
+        self._lock = threading.Lock()
+        # task index -> TaskOutput of finished tasks
+        self._outputs: Dict[int, Any] = {}
+        self._pending: List[concurrent.futures.Future] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _supports_resume(self) -> bool:
+        process = getattr(self._crew, "process", None)
+        return str(getattr(process, "value", process)) == "sequential"
+
+    async def load(self) -> int:
+        """
+        Restore checkpoints persisted by an earlier attempt of this execution.
+
+        Returns:
+            Number of tasks restored
+        """
+        checkpoints = await execute_db_operation(
+            lambda session: TaskCheckpointRepository(session).find_by_job_id(self._execution_id)
+        )
+        restored = 0
+        for checkpoint in checkpoints:
+            index = checkpoint.task_index
+            if index >= len(self._tasks) or checkpoint.task_key != task_key(self._tasks[index]):
+                continue
+            task = self._tasks[index]
+            output = _build_task_output(task, checkpoint.raw_output, checkpoint.json_output, checkpoint.agent_name)
+            task.output = output
+            with self._lock:
+                self._outputs[index] = output
+            restored += 1
+        return restored
+
+    def install(self) -> None:
+        """Wrap each task's callback to checkpoint its output. Call from the loop running the crew."""
+        self._loop = asyncio.get_running_loop()
+        for index, task in enumerate(self._tasks):
+            task.callback = self._make_callback(index, task, getattr(task, "callback", None))
+
+    def _make_callback(self, index: int, task: Any, original: Optional[Callable]) -> Callable:
+        def callback(output):
+            try:
+                self._record(index, task, output)
+            except Exception as e:
+                logger.error(f"[TaskCheckpointer] Error checkpointing task {index} of {self._execution_id}: {e}")
+            if original is not None:
+                return original(output)
+        return callback
+
+    def _record(self, index: int, task: Any, output: Any) -> None:
+        """Keep a finished task's output and persist it from the crew's thread."""
+        with self._lock:
+            self._outputs[index] = output
+        raw_output = getattr(output, "raw", None)
+        if raw_output is None:
+            raw_output = str(output)
+        json_output = getattr(output, "json_dict", None)
+        agent_name = getattr(output, "agent", None)
+
+        async def _save():
+            await execute_db_operation(
+                lambda session: TaskCheckpointRepository(session).save(
+                    job_id=self._execution_id,
+                    task_index=index,
+                    task_key=task_key(task),
+                    raw_output=raw_output,
+                    json_output=json_output if isinstance(json_output, dict) else None,
+                    agent_name=str(agent_name) if agent_name else None
+                )
+            )
+
+        if self._loop is not None:
+            future = asyncio.run_coroutine_threadsafe(_save(), self._loop)
+            with self._lock:
+                self._pending.append(future)
+
+    def first_unfinished(self) -> int:
+        """Index of the first task without a checkpoint, or the task count if all finished."""
+        with self._lock:
+            index = 0
+            while index in self._outputs:
+                index += 1
+            return index
+
+    def is_complete(self) -> bool:
+        """Whether every task has a checkpoint and the crew can be resumed."""
+        return bool(self._tasks) and self._supports_resume() and self.first_unfinished() >= len(self._tasks)
+
+    def final_output(self) -> Optional[str]:
+        """Raw output of the last task, the crew's result when every task finished."""
+        with self._lock:
+            output = self._outputs.get(len(self._tasks) - 1)
+        return getattr(output, "raw", None) if output is not None else None
+
+    def resume(self) -> int:
+        """
+        Trim the crew to start at the first unfinished task.
+
+        Tasks that relied on the implicit sequential context get the earlier
+        tasks as explicit context, so checkpointed outputs still reach them.
+
+        Returns:
+            Number of finished tasks skipped
+        """
+        self.restore()
+        first = self.first_unfinished()
+        if first == 0 or first >= len(self._tasks) or not self._supports_resume():
+            return 0
+        for index in range(first, len(self._tasks)):
+            if not isinstance(self._contexts[index], list):
+                self._tasks[index].context = self._tasks[:index]
+        self._crew.tasks = self._tasks[first:]
+        return first
+
+    def restore(self) -> None:
+        """Give the crew back its full task list and original task contexts."""
+        self._crew.tasks = list(self._tasks)
+        for task, context in zip(self._tasks, self._contexts):
+            task.context = context
+
+    async def flush(self) -> None:
+        """Wait for checkpoints still being written."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        results = await asyncio.gather(*(asyncio.wrap_future(f) for f in pending), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"[TaskCheckpointer] Error saving checkpoint for {self._execution_id}: {result}")
+
+    async def clear(self) -> None:
+        """Delete the persisted checkpoints once the execution completed."""
+        await execute_db_operation(
+            lambda session: TaskCheckpointRepository(session).delete_by_job_id(self._execution_id)
+        )
@@ -286,7 +286,7 @@ class ToolFactory:
                     for key_name in api_keys_to_load:
                         try:
                             # Use utility function to avoid event loop issues
-                            from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
+                            from src.utils.asyncio_utils import execute_db_operation
                             
                             async def _get_key_operation(session):
                                 # Re-use the api_keys_service but with a fresh session
@@ -294,7 +294,7 @@ class ToolFactory:
                                 api_keys_service = ApiKeysService(session)
                                 return await api_keys_service.find_by_name(key_name)
                                 
-                            api_key_obj = await execute_db_operation_with_fresh_engine(_get_key_operation)
+                            api_key_obj = await execute_db_operation(_get_key_operation)
                             
                             if api_key_obj and api_key_obj.encrypted_value:
                                 # Decrypt the value
@@ -428,9 +428,9 @@ class ToolFactory:
             
             # Fallback to creating a new API keys service instance using isolated UnitOfWork
             # Import necessary modules here to avoid circular imports
-            from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
+            from src.utils.asyncio_utils import execute_db_operation
             
-            async def _get_key_with_fresh_engine(session):
+            async def _get_key_with_loop_engine(session):
                 from src.services.api_keys_service import ApiKeysService
                 api_keys_service = ApiKeysService(session)
                 api_key = await api_keys_service.find_by_name(key_name)
@@ -440,8 +440,8 @@ class ToolFactory:
                     return EncryptionUtils.decrypt_value(api_key.encrypted_value)
                 return None
             
-            # Use a fresh engine to avoid transaction conflicts
-            decrypted_value = await execute_db_operation_with_fresh_engine(_get_key_with_fresh_engine)
+            # Use the loop-local engine to avoid transaction conflicts
+            decrypted_value = await execute_db_operation(_get_key_with_loop_engine)
             
             if decrypted_value:
                 # Log first and last 4 characters of the key for debugging
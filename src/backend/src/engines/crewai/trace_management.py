@@ -26,16 +26,113 @@ class TraceManager:
     _writer_started: bool = False
     _lock = asyncio.Lock()  # Lock for starting the writer
     
+    # Event types persisted to execution_trace; everything else is dropped
+    IMPORTANT_EVENT_TYPES = [
+        "agent_execution", "tool_usage", "crew_started",
+        "crew_completed", "task_started", "task_completed", "llm_call"
+    ]
+    
+    @classmethod
+    async def _ensure_job_exists(cls, job_id: str, event_type: str, trace_info: str) -> bool:
+        """
+        Make sure an executionhistory row exists for job_id, creating a minimal one if needed.
+        
+        Jobs created through ExecutionStatusService.create_execution are already
+        in the shared job registry, so the database is only consulted for jobs
+        the registry does not know (e.g. started before a restart).
+        
+        Args:
+            job_id: Job ID of the trace
+            event_type: Event type of the trace, used to name auto-created jobs
+            trace_info: Log prefix identifying the trace
+            
+        Returns:
+            True if the job exists (or was created), False otherwise
+        """
+        from src.services.execution_status_service import ExecutionStatusService
+        from src.services.execution_history_service import get_execution_history_service
+        from src.services.job_registry import get_job_registry
+        
+        # Check if the job is already known to exist
+        job_registry = get_job_registry()
+        if job_registry.contains(job_id):
+            return True
+        
+        # Check if job exists in executionhistory using the service
+        execution = await get_execution_history_service().get_execution_by_job_id(job_id)
+        
+        if execution:
+            # Job exists, remember it
+            job_registry.register(job_id)
+            logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} Found existing job in database")
+            return True
+        
+        # Job doesn't exist, create it
+        logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Job not found, creating new execution record")
+        
+        # Create minimal execution record
+        job_data = {
+            "job_id": job_id,
+            "status": "running",
+            "trigger_type": "api",
+            "run_name": f"Auto-created for {event_type}",
+            "inputs": {"auto_created": True}
+        }
+        
+        # Try to create the job record (registers it on success)
+        success = await ExecutionStatusService.create_execution(job_data)
+        
+        if success:
+            logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Successfully created job record")
+            return True
+        
+        logger.error(f"[TraceManager._trace_writer_loop] {trace_info} Failed to create job record")
+        return False
+    
+    @classmethod
+    async def _flush_traces(cls, traces: list, batch_count: int) -> int:
+        """
+        Write prepared trace rows in a single transaction.
+        
+        Falls back to row-at-a-time inserts if the bulk insert fails, so one
+        bad trace does not drop the whole batch.
+        
+        Args:
+            traces: Trace dictionaries in the format expected by ExecutionTraceService
+            batch_count: Sequence number of the batch, for logging
+            
+        Returns:
+            Number of traces that could not be stored
+        """
+        from src.services.execution_trace_service import ExecutionTraceService
+        
+        try:
+            await ExecutionTraceService.create_traces(traces)
+            logger.debug(f"[TraceManager._trace_writer_loop] Batch #{batch_count} stored {len(traces)} traces")
+            return 0
+        except Exception as e:
+            logger.warning(f"[TraceManager._trace_writer_loop] Bulk insert of batch #{batch_count} failed, retrying one by one: {e}")
+        
+        failures = 0
+        for trace_dict in traces:
+            try:
+                await ExecutionTraceService.create_trace(trace_dict)
+            except Exception as e:
+                logger.error(f"[TraceManager._trace_writer_loop] [{trace_dict.get('job_id')}:{trace_dict.get('event_type')}] Failed to store trace: {e}")
+                failures += 1
+        return failures
+    
     @classmethod
     async def _trace_writer_loop(cls):
         """
         Background task that reads from the trace queue and writes to the database.
+        
+        Traces are accumulated and flushed as one multi-row insert when
+        WRITER_BATCH_SIZE rows are pending or the oldest pending row is
+        WRITER_FLUSH_INTERVAL_SECONDS old, whichever comes first.
         """
+        from src.config.settings import settings
         from src.services.trace_queue import get_trace_queue
-        from src.services.execution_trace_service import ExecutionTraceService
-        from src.services.execution_status_service import ExecutionStatusService
-        from src.services.execution_history_service import get_execution_history_service
-        from queue import Empty  # Import the Empty exception from queue module
         
         try:
             logger.info("[TraceManager._trace_writer_loop] Writer task started.")
@@ -44,159 +141,107 @@ class TraceManager:
             queue = get_trace_queue()
             logger.debug(f"[TraceManager._trace_writer_loop] Queue retrieved. Initial approximate size: {queue.qsize()}")
             
-            # Get service instance
-            execution_history_service = get_execution_history_service()
+            batch_size = max(1, settings.WRITER_BATCH_SIZE)
+            flush_interval = settings.WRITER_FLUSH_INTERVAL_SECONDS
             
             batch_count = 0
             total_trace_count = 0
             empty_count = 0  # Count consecutive empty queue occurrences
+            pending = []  # Prepared trace rows waiting to be flushed
+            first_pending_at = 0.0
+            loop = asyncio.get_running_loop()
             
-            # Keep track of jobs we've confirmed exist
-            confirmed_jobs = set()
-            
-            while not cls._shutdown_event.is_set():
-                # Create a small batch of traces to process together
-                batch = []
-                batch_target_size = 10  # Process up to this many at once
+            while True:
+                shutting_down = cls._shutdown_event.is_set()
                 
                 try:
-                    # Try to collect a batch of traces
-                    for _ in range(batch_target_size):
-                        try:
-                            # Log queue status periodically
-                            if _ == 0:
-                                logger.debug(f"[TraceManager._trace_writer_loop] Waiting for traces... Queue size: ~{queue.qsize()}")
-                            
-                            # Non-blocking get with timeout
-                            trace_data = queue.get(block=True, timeout=0.1)
-                            
+                    if not shutting_down:
+                        # Wait at most until the oldest pending row is due; when idle
+                        # the timeout only bounds how long we go without re-checking
+                        # the shutdown event
+                        if pending:
+                            timeout = max(0.0, flush_interval - (loop.time() - first_pending_at))
+                        else:
+                            timeout = 1.0
+                        
+                        # Await data without blocking the event loop
+                        items = await queue.get_batch(batch_size - len(pending), timeout=timeout)
+                        
+                        if items:
+                            empty_count = 0  # Reset empty count when we get an item
+                        else:
+                            empty_count += 1
+                            if empty_count % 100 == 0:  # Log every 100 consecutive idle waits
+                                logger.debug(f"[TraceManager._trace_writer_loop] Queue empty for {empty_count} consecutive waits")
+                        
+                        for idx, trace_data in enumerate(items):
                             # Check if this is the shutdown signal (None)
                             if trace_data is None:
                                 logger.debug("[TraceManager._trace_writer_loop] Received shutdown signal (None) in queue.")
                                 continue
-                                
-                            batch.append(trace_data)
-                            queue.task_done()
-                            empty_count = 0  # Reset empty count when we get an item
-                        except Empty:  # Use the imported Empty exception
-                            # Queue is empty, break out of the batch collection loop
-                            empty_count += 1
-                            if empty_count % 100 == 0:  # Log every 100 consecutive empty checks
-                                logger.debug(f"[TraceManager._trace_writer_loop] Queue empty for {empty_count} consecutive checks")
-                            break
-                    
-                    # If we collected any traces, process them
-                    if batch:
-                        batch_count += 1
-                        total_trace_count += len(batch)
-                        
-                        # Log batch processing
-                        logger.debug(f"[TraceManager._trace_writer_loop] Processing batch #{batch_count} with {len(batch)} traces. Total processed: {total_trace_count}")
-                        
-                        # Process each trace in the batch
-                        failures = 0
-                        for idx, trace_data in enumerate(batch):
+                            
                             try:
                                 job_id = trace_data.get("job_id", "unknown")
                                 event_type = trace_data.get("event_type", "unknown")
-                                trace_info = f"[{job_id}:{event_type}:{idx+1}/{len(batch)}]"
+                                trace_info = f"[{job_id}:{event_type}:{idx+1}/{len(items)}]"
                                 
                                 # Skip processing if this is an "unknown" job_id
                                 if job_id == "unknown":
                                     logger.warning(f"[TraceManager._trace_writer_loop] {trace_info} Skipping trace with unknown job_id")
                                     continue
                                 
-                                # Check if we've already confirmed this job exists
-                                job_exists = job_id in confirmed_jobs
-                                
-                                # If not confirmed, check the database
-                                if not job_exists:
-                                    # Check if job exists in executionhistory using the service
-                                    execution = await execution_history_service.get_execution_by_job_id(job_id)
-                                    
-                                    if execution:
-                                        # Job exists, add to confirmed set
-                                        confirmed_jobs.add(job_id)
-                                        job_exists = True
-                                        logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} Found existing job in database")
-                                    else:
-                                        # Job doesn't exist, create it
-                                        logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Job not found, creating new execution record")
-                                        
-                                        # Create minimal execution record
-                                        job_data = {
-                                            "job_id": job_id,
-                                            "status": "running",
-                                            "trigger_type": "api",
-                                            "run_name": f"Auto-created for {event_type}",
-                                            "inputs": {"auto_created": True}
-                                        }
-                                        
-                                        # Try to create the job record
-                                        success = await ExecutionStatusService.create_execution(job_data)
-                                        
-                                        if success:
-                                            logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Successfully created job record")
-                                            confirmed_jobs.add(job_id)
-                                            job_exists = True
-                                        else:
-                                            logger.error(f"[TraceManager._trace_writer_loop] {trace_info} Failed to create job record")
-                                
-                                # Detailed logging of trace data
-                                logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} Processing trace: {str(trace_data)[:200]}...")
+                                # FILTER: Store important events in execution_trace
+                                if event_type not in cls.IMPORTANT_EVENT_TYPES:
+                                    # Log that we're skipping this trace type
+                                    logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} ⏭️ Skipping non-important event type: {event_type}")
+                                    continue
                                 
                                 # Only proceed if job exists
-                                if job_exists:
-                                    # FILTER: Store important events in execution_trace
-                                    # Include agent_execution, tool_usage, crew_started, crew_completed, task_started, task_completed
-                                    important_event_types = [
-                                        "agent_execution", "tool_usage", "crew_started", 
-                                        "crew_completed", "task_started", "task_completed", "llm_call"
-                                    ]
-                                    
-                                    if event_type in important_event_types:
-                                        # Prepare trace data in the format expected by ExecutionTraceService
-                                        trace_dict = {
-                                            "job_id": job_id,
-                                            "agent_name": trace_data.get("agent_name", "Unknown Agent"),
-                                            "task_name": trace_data.get("task_name", "Unknown Task"),
-                                            "event_type": event_type,
-                                            "output": trace_data.get("output_content", ""),
-                                            "trace_metadata": trace_data.get("extra_data", {})
-                                        }
-                                        
-                                        try:
-                                            # Use the ExecutionTraceService to create the trace
-                                            await ExecutionTraceService.create_trace(trace_dict)
-                                            logger.info(f"[TraceManager._trace_writer_loop] {trace_info} Successfully stored {event_type} trace")
-                                        except Exception as e:
-                                            logger.error(f"[TraceManager._trace_writer_loop] {trace_info} Failed to store trace: {e}")
-                                            failures += 1
-                                    else:
-                                        # Log that we're skipping this trace type
-                                        logger.debug(f"[TraceManager._trace_writer_loop] {trace_info} ⏭️ Skipping non-important event type: {event_type}")
-                                else:
+                                if not await cls._ensure_job_exists(job_id, event_type, trace_info):
                                     logger.warning(f"[TraceManager._trace_writer_loop] {trace_info} Skipping trace due to missing job record")
-                                    failures += 1
+                                    continue
                                 
+                                # Prepare trace data in the format expected by ExecutionTraceService
+                                if not pending:
+                                    first_pending_at = loop.time()
+                                pending.append({
+                                    "job_id": job_id,
+                                    "agent_name": trace_data.get("agent_name", "Unknown Agent"),
+                                    "task_name": trace_data.get("task_name", "Unknown Task"),
+                                    "event_type": event_type,
+                                    "output": trace_data.get("output_content", ""),
+                                    "trace_metadata": trace_data.get("extra_data", {})
+                                })
                             except Exception as e:
                                 logger.error(f"[TraceManager._trace_writer_loop] Error processing trace: {e}", exc_info=True)
-                                failures += 1
+                    
+                    flush_due = pending and (
+                        shutting_down
+                        or len(pending) >= batch_size
+                        or loop.time() - first_pending_at >= flush_interval
+                    )
+                    if flush_due:
+                        batch, pending = pending, []
+                        batch_count += 1
+                        total_trace_count += len(batch)
+                        
+                        # Log batch processing
+                        logger.debug(f"[TraceManager._trace_writer_loop] Processing batch #{batch_count} with {len(batch)} traces. Total processed: {total_trace_count}")
                         
+                        failures = await cls._flush_traces(batch, batch_count)
                         if failures > 0:
                             logger.warning(f"[TraceManager._trace_writer_loop] Batch #{batch_count} processed with {failures} failures.")
                         else:
                             logger.debug(f"[TraceManager._trace_writer_loop] Batch #{batch_count} processed successfully.")
                     
-                    # If no traces were collected, sleep briefly to avoid CPU spinning
-                    else:
-                        await asyncio.sleep(0.5)
-                    
                 except Exception as e:
                     logger.error(f"[TraceManager._trace_writer_loop] Batch processing error: {e}", exc_info=True)
                     # Sleep to avoid rapid retry on persistent errors
                     await asyncio.sleep(1)
                 
+                if shutting_down:
+                    break
+                
             logger.info("[TraceManager._trace_writer_loop] Shutdown event received, exiting trace writer loop.")
         
         except asyncio.CancelledError:
@@ -240,7 +285,7 @@ class TraceManager:
             logger.info("[TraceManager] Setting shutdown event for all writer tasks...")
             cls._shutdown_event.set()
             
-            # Add None to trace queue to help unblock queue.get()
+            # Add None to trace queue to wake the writer
             try:
                 from queue import Full
                 from src.services.trace_queue import get_trace_queue
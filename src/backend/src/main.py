@@ -123,6 +123,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         system_logger.error(f"Error checking database: {e}")
     
+    # Serialize the main write paths through one writer task on this loop
+    from src.utils.asyncio_utils import writer_lane
+    if db_initialized and settings.SQLITE_SINGLE_WRITER and str(settings.DATABASE_URI).startswith('sqlite'):
+        writer_lane.start()
+        system_logger.info("SQLite single writer lane started.")
+    
     # Run database seeders after DB initialization
     if db_initialized:
         # Import needed for seeders
@@ -169,9 +175,54 @@ async def lifespan(app: FastAPI):
     else:
         system_logger.warning("Skipping scheduler initialization. Database not ready.")
     
+    # Start an execution queue worker in this process if the queue is enabled
+    queue_worker = None
+    if db_initialized and settings.EXECUTION_QUEUE_ENABLED and settings.EXECUTION_WORKER_ENABLED:
+        from src.services.execution_queue_service import get_execution_queue_worker
+        queue_worker = get_execution_queue_worker()
+        queue_worker.start()
+        system_logger.info(f"Execution queue worker {queue_worker.worker_id} started.")
+    
+    # Finish execution purges interrupted by the last shutdown or a crash
+    if db_initialized:
+        from src.services.execution_purge_service import get_execution_purger
+        try:
+            resumed = await get_execution_purger().resume_interrupted()
+            if resumed:
+                system_logger.info(f"Resumed {resumed} interrupted execution purges.")
+        except Exception as e:
+            system_logger.error(f"Error resuming execution purges: {e}")
+    
+    # Move logs and traces of old executions to archives in the background
+    execution_archiver = None
+    if db_initialized and settings.EXECUTION_RETENTION_ENABLED:
+        from src.services.execution_archive_service import get_execution_archiver
+        execution_archiver = get_execution_archiver()
+        execution_archiver.start()
+    
     try:
         yield
     finally:
+        if execution_archiver:
+            try:
+                await execution_archiver.stop()
+            except Exception as e:
+                system_logger.error(f"Error stopping execution archiver: {e}")
+        
+        # Stop claiming queued executions
+        if queue_worker:
+            try:
+                await queue_worker.stop()
+            except Exception as e:
+                system_logger.error(f"Error stopping execution queue worker: {e}")
+        
+        # Stop background purges before the DB engines go away
+        from src.services.execution_purge_service import get_execution_purger
+        try:
+            await get_execution_purger().stop()
+        except Exception as e:
+            system_logger.error(f"Error stopping execution purges: {e}")
+        
         # Shutdown scheduler if it was started
         if scheduler:
             system_logger.info("Shutting down scheduler...")
@@ -181,6 +232,26 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 system_logger.error(f"Error during scheduler shutdown: {e}")
         
+        # Stop any crew worker processes
+        from src.engines.crewai.process_executor import shutdown_crew_process_pool
+        try:
+            shutdown_crew_process_pool()
+        except Exception as e:
+            system_logger.error(f"Error shutting down crew worker processes: {e}")
+        
+        # Finish queued writes before releasing the engine they run on
+        try:
+            await writer_lane.stop()
+        except Exception as e:
+            system_logger.error(f"Error stopping SQLite writer lane: {e}")
+        
+        # Release the per-loop DB engine used by background services on this loop
+        from src.utils.asyncio_utils import engine_registry
+        try:
+            await engine_registry.dispose_loop()
+        except Exception as e:
+            system_logger.error(f"Error disposing loop DB engine: {e}")
+        
         system_logger.info("Application shutdown complete.")
 
 # Initialize FastAPI app
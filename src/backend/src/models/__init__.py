@@ -3,7 +3,7 @@ from src.models.task import Task
 from src.models.execution_history import ExecutionHistory, TaskStatus, ErrorTrace
 from src.models.execution_trace import ExecutionTrace
 from src.models.tool import Tool
-from src.models.log import LLMLog
+from src.models.log import LLMLog, LLMLogDailyStats
 from src.models.model_config import ModelConfig
 from src.models.databricks_config import DatabricksConfig
 from src.models.initialization_status import InitializationStatus
@@ -14,4 +14,8 @@ from src.models.schedule import Schedule
 from src.models.api_key import ApiKey
 from src.models.schema import Schema
 from src.models.execution_logs import ExecutionLog
+from src.models.execution_queue import ExecutionQueueItem
+from src.models.task_checkpoint import TaskCheckpoint
+from src.models.llm_usage import LLMUsage
+from src.models.execution_purge import ExecutionPurge
 from src.models.engine_config import EngineConfig
\ No newline at end of file
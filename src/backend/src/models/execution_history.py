@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, JSON, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from uuid import uuid4
 
@@ -34,6 +34,12 @@ class ExecutionHistory(Base):
     created_at = Column(DateTime, default=datetime.utcnow)  # Use timezone-naive UTC time
     run_name = Column(String)
     completed_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=True)  # Logs and traces moved to the archive
+    
+    # Sort key of the keyset pagination of the history list
+    __table_args__ = (
+        Index('idx_executionhistory_created_at_id', 'created_at', 'id'),
+    )
     
     # Relationships
     task_statuses = relationship("TaskStatus", back_populates="execution_history", 
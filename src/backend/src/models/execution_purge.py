@@ -0,0 +1,33 @@
+"""
+Models for background execution purges.
+
+This module defines the table tracking the progress of execution purges, so
+any API worker can report on a purge started by another.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, Text, JSON, DateTime
+
+from src.db.base import Base
+
+
+class ExecutionPurge(Base):
+    """
+    ExecutionPurge model for the progress of one background execution purge.
+
+    The purging worker updates the row after every batch it deletes. The row
+    holds the purge's scope, so a purge interrupted by a restart can be resumed.
+    """
+
+    __tablename__ = "execution_purge"
+
+    id = Column(String, primary_key=True)  # Purge ID returned by the delete endpoints
+    status = Column(String, nullable=False, index=True)
+    scope = Column(String, nullable=False)  # "all" or "executions"
+    job_ids = Column(JSON, nullable=True)  # Purged job IDs when scope is "executions"
+    max_ids = Column(JSON, nullable=True)  # Highest ID per table at the start when scope is "all"
+    current_table = Column(String, nullable=True)
+    deleted = Column(JSON, nullable=False)  # Rows deleted so far per table
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)  # Use timezone-naive UTC time
+    finished_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
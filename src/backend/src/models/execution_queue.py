@@ -0,0 +1,45 @@
+"""
+Models for the durable execution work queue.
+
+This module defines the table that API nodes enqueue executions into and
+that worker processes claim them from under a time-limited lease.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index
+
+from src.db.base import Base
+
+
+class ExecutionQueueItem(Base):
+    """
+    ExecutionQueueItem model for an execution waiting for or held by a worker.
+    
+    A worker owns a claimed item until ``lease_expires_at``; it extends the
+    lease with heartbeats while the execution runs. Items whose lease expires
+    are returned to the queue for another worker.
+    """
+    
+    __tablename__ = "execution_queue"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String, unique=True, index=True, nullable=False)
+    execution_type = Column(String, nullable=False, default="crew")
+    trigger_type = Column(String, nullable=False, default="api")
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="pending")  # pending, claimed, completed, failed
+    priority = Column(Integer, nullable=False, default=0)  # Lower is claimed first
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    worker_id = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    available_at = Column(DateTime, default=datetime.utcnow)  # Use timezone-naive UTC time
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('idx_execution_queue_claim', 'status', 'priority', 'available_at'),
+        Index('idx_execution_queue_lease', 'status', 'lease_expires_at'),
+    )
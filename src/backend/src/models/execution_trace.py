@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.db.base import Base
@@ -22,6 +22,12 @@ class ExecutionTrace(Base):
     trace_metadata = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # Sort keys of the keyset pagination of all traces and of one job's traces
+    __table_args__ = (
+        Index('idx_execution_trace_created_at_id', 'created_at', 'id'),
+        Index('idx_execution_trace_job_id_created_at_id', 'job_id', 'created_at', 'id'),
+    )
+    
     # Relationship with ExecutionHistory - Use specific foreign keys to resolve ambiguity
     run = relationship("ExecutionHistory", back_populates="execution_traces", foreign_keys=[run_id])
     run_by_job_id = relationship("ExecutionHistory", foreign_keys=[job_id], overlaps="execution_traces_by_job_id") 
\ No newline at end of file
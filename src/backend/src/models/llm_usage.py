@@ -0,0 +1,41 @@
+"""
+Models for aggregated LLM usage.
+
+This module defines the table accumulating LLM calls, tokens, cost and
+latency per execution, agent and model.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint
+
+from src.db.base import Base
+
+
+class LLMUsage(Base):
+    """
+    LLMUsage model for the LLM calls of one agent and model within an execution.
+    
+    Rows are incremented in batches as calls finish, so each row holds the
+    running totals of its (execution, agent, model) combination.
+    """
+    
+    __tablename__ = "llm_usage"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    execution_id = Column(String, index=True, nullable=False)
+    agent_name = Column(String, nullable=False, default="")  # Empty when the agent is unknown
+    model = Column(String, index=True, nullable=False)
+    calls = Column(Integer, nullable=False, default=0)
+    failed_calls = Column(Integer, nullable=False, default=0)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    total_tokens = Column(Integer, nullable=False, default=0)
+    cost = Column(Float, nullable=False, default=0.0)
+    latency_ms_total = Column(Float, nullable=False, default=0.0)
+    latency_ms_max = Column(Float, nullable=False, default=0.0)
+    first_call_at = Column(DateTime, default=datetime.utcnow)  # Use timezone-naive UTC time
+    last_call_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('execution_id', 'agent_name', 'model', name='uq_llm_usage_execution_agent_model'),
+    )
@@ -1,8 +1,11 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Date, UniqueConstraint
 
 from src.db.base import Base
 
+# Upper bounds in milliseconds of the latency buckets of LLMLogDailyStats; the last bucket is open-ended
+LATENCY_BUCKET_BOUNDS_MS = (100, 250, 500, 1000, 2000, 5000, 10000, 20000, 30000, 60000, 120000)
+
 
 class LLMLog(Base):
     """
@@ -19,4 +22,32 @@ class LLMLog(Base):
     status = Column(String, nullable=False)    # 'success' or 'error'
     error_message = Column(String)             # Error message if any
     created_at = Column(DateTime, default=datetime.utcnow)  # Use timezone-naive UTC time
-    extra_data = Column(JSON)                  # Any additional metadata 
\ No newline at end of file
+    extra_data = Column(JSON)                  # Any additional metadata 
+
+class LLMLogDailyStats(Base):
+    """
+    LLMLogDailyStats model for daily LLM log totals per endpoint, model and latency bucket.
+    
+    Rows are incremented as LLM logs are written, so statistics over a time
+    window read a few rollup rows per day instead of scanning llmlog. Each
+    row covers the calls of one day, endpoint and model whose duration fell
+    into one latency bucket, which lets percentiles be estimated by merging
+    the bucket counts.
+    """
+    
+    __tablename__ = "llmlog_daily_stats"
+    
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False, index=True)
+    endpoint = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    latency_bucket = Column(Integer, nullable=False)  # Index into LATENCY_BUCKET_BOUNDS_MS, -1 if unknown
+    calls = Column(Integer, nullable=False, default=0)
+    errors = Column(Integer, nullable=False, default=0)
+    tokens_used = Column(Integer, nullable=False, default=0)
+    duration_ms_total = Column(Integer, nullable=False, default=0)
+    duration_ms_max = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        UniqueConstraint('day', 'endpoint', 'model', 'latency_bucket', name='uq_llmlog_daily_stats_key'),
+    )
@@ -17,6 +17,8 @@ class ModelConfig(Base):
     context_window = Column(Integer)
     max_output_tokens = Column(Integer)
     extended_thinking = Column(Boolean, default=False)
+    rpm_limit = Column(Integer, nullable=True)  # Requests per minute, shared by all crews
+    tpm_limit = Column(Integer, nullable=True)  # Tokens per minute, shared by all crews
     enabled = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Models for task-level execution checkpoints.
+
+This module defines the table holding the output of every finished task of
+an execution, so a retried execution can resume from the first unfinished task.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, UniqueConstraint
+
+from src.db.base import Base
+
+
+class TaskCheckpoint(Base):
+    """
+    TaskCheckpoint model for the output of a finished task within a run.
+    
+    Checkpoints are keyed by the task's position in the crew and a hash of its
+    description, so a checkpoint is only reused for the same task.
+    """
+    
+    __tablename__ = "task_checkpoint"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String, index=True, nullable=False)
+    task_index = Column(Integer, nullable=False)
+    task_key = Column(String, nullable=False)  # Hash of the task description
+    agent_name = Column(String, nullable=True)
+    raw_output = Column(Text, nullable=False, default="")
+    json_output = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)  # Use timezone-naive UTC time
+    
+    __table_args__ = (
+        UniqueConstraint('job_id', 'task_index', name='uq_task_checkpoint_job_task'),
+    )
@@ -0,0 +1,137 @@
+"""
+Repository for archiving execution logs and traces.
+
+This module provides the queries of the retention job: finding finished
+executions past the retention period, reading their logs and traces in
+primary key order, and marking them archived once the rows left the hot
+tables.
+"""
+
+from datetime import datetime
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import func, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.models.execution_history import ExecutionHistory
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_status import ExecutionStatus
+from src.models.execution_trace import ExecutionTrace
+
+# Executions whose logs and traces can no longer change
+ARCHIVABLE_STATUSES = (
+    ExecutionStatus.COMPLETED.value,
+    ExecutionStatus.FAILED.value,
+    ExecutionStatus.CANCELLED.value,
+)
+
+
+class ExecutionArchiveRepository:
+    """Repository for execution archive data access operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    async def get_due_executions(self, cutoff: datetime, limit: int) -> List[Tuple[int, str]]:
+        """
+        Get finished, unarchived executions created before a cutoff, oldest first.
+
+        Args:
+            cutoff: Executions created before this time are due
+            limit: Maximum number of executions to return
+
+        Returns:
+            (id, job_id) pairs of the due executions
+        """
+        result = await self.session.execute(
+            select(ExecutionHistory.id, ExecutionHistory.job_id)
+            .where(
+                ExecutionHistory.created_at < cutoff,
+                ExecutionHistory.archived_at.is_(None),
+                func.upper(ExecutionHistory.status).in_(ARCHIVABLE_STATUSES),
+            )
+            .order_by(ExecutionHistory.created_at, ExecutionHistory.id)
+            .limit(limit)
+        )
+        return [(row.id, row.job_id) for row in result.all()]
+
+    async def get_logs(self, job_id: str, after_id: int, limit: int) -> Sequence[ExecutionLog]:
+        """
+        Get a chunk of an execution's logs in ID order.
+
+        Args:
+            job_id: Job ID of the execution
+            after_id: Only return logs with a higher ID
+            limit: Maximum number of logs to return
+
+        Returns:
+            List of ExecutionLog records
+        """
+        result = await self.session.execute(
+            select(ExecutionLog)
+            .where(ExecutionLog.execution_id == job_id, ExecutionLog.id > after_id)
+            .order_by(ExecutionLog.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_traces(self, run_id: int, job_id: str, after_id: int, limit: int) -> Sequence[ExecutionTrace]:
+        """
+        Get a chunk of an execution's traces in ID order.
+
+        Args:
+            run_id: Database ID of the execution
+            job_id: Job ID of the execution
+            after_id: Only return traces with a higher ID
+            limit: Maximum number of traces to return
+
+        Returns:
+            List of ExecutionTrace records
+        """
+        result = await self.session.execute(
+            select(ExecutionTrace)
+            .where(
+                or_(ExecutionTrace.job_id == job_id, ExecutionTrace.run_id == run_id),
+                ExecutionTrace.id > after_id,
+            )
+            .order_by(ExecutionTrace.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def mark_archived(self, run_id: int, archived_at: datetime) -> None:
+        """
+        Record that an execution's logs and traces were moved to the archive.
+
+        Args:
+            run_id: Database ID of the execution
+            archived_at: Time of archival
+        """
+        await self.session.execute(
+            update(ExecutionHistory).where(ExecutionHistory.id == run_id).values(archived_at=archived_at)
+        )
+        await self.session.commit()
+
+    @staticmethod
+    def hot_conditions(run_id: int, job_id: str) -> List[Tuple[str, Any]]:
+        """
+        Get the rows an archived execution leaves in the hot tables.
+
+        Args:
+            run_id: Database ID of the execution
+            job_id: Job ID of the execution
+
+        Returns:
+            (table name, filter) pairs for ExecutionPurgeRepository.delete_batch
+        """
+        return [
+            ("execution_trace", or_(ExecutionTrace.job_id == job_id, ExecutionTrace.run_id == run_id)),
+            ("execution_logs", ExecutionLog.execution_id == job_id),
+        ]
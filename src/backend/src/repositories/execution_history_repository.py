@@ -7,11 +7,18 @@ This module provides database operations for execution history models.
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, delete
+from sqlalchemy import String, cast, desc, func, delete
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.execution_history import ExecutionHistory, TaskStatus, ErrorTrace
 from src.db.session import async_session_factory
+from src.utils.pagination import keyset_paginate
+
+# Columns of the history list in summary mode, everything but the JSON inputs and result
+SUMMARY_COLUMNS = (
+    "id", "job_id", "status", "error", "planning", "trigger_type", "created_at", "run_name", "completed_at",
+    "archived_at"
+)
 
 
 class ExecutionHistoryRepository:
@@ -20,31 +27,72 @@ class ExecutionHistoryRepository:
     async def get_execution_history(
         self, 
         limit: int = 50, 
-        offset: int = 0
-    ) -> tuple[List[ExecutionHistory], int]:
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        summary: bool = False,
+        preview_chars: int = 500
+    ) -> tuple[List[Any], Optional[int]]:
         """
-        Get paginated execution history.
+        Get paginated execution history, newest first.
         
         Args:
             limit: Maximum number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Whether to count all executions
+            summary: Select only scalar columns and a result preview instead of full rows
+            preview_chars: Length of the result preview in summary mode
             
         Returns:
-            Tuple of (list of Run objects, total count)
+            Tuple of (list of Run objects, or summary rows with a result_preview
+            of up to preview_chars + 1 characters, total count or None)
         """
         async with async_session_factory() as session:
-            # Get total count
-            count_stmt = select(func.count()).select_from(ExecutionHistory)
-            total_count_result = await session.execute(count_stmt)
-            total_count = total_count_result.scalar() or 0
+            total_count = None
+            if include_total:
+                count_stmt = select(func.count()).select_from(ExecutionHistory)
+                total_count_result = await session.execute(count_stmt)
+                total_count = total_count_result.scalar() or 0
             
-            # Get paginated runs
-            stmt = select(ExecutionHistory).order_by(ExecutionHistory.created_at.desc()).offset(offset).limit(limit)
+            # Get paginated runs, keyed on (created_at, id) so the order is stable
+            query = self._summary_query(preview_chars) if summary else select(ExecutionHistory)
+            stmt = keyset_paginate(query, ExecutionHistory.created_at, ExecutionHistory.id, limit, cursor)
+            if not cursor and offset:
+                stmt = stmt.offset(offset)
             result = await session.execute(stmt)
-            runs = result.scalars().all()
+            runs = result.all() if summary else result.scalars().all()
             
             return runs, total_count
     
+    @staticmethod
+    def _summary_query(preview_chars: int):
+        # The JSON inputs and result stay in the database; one extra preview
+        # character tells the caller whether the result was cut off
+        preview = func.substr(cast(ExecutionHistory.result, String), 1, preview_chars + 1)
+        return select(
+            *[ExecutionHistory.__table__.c[name] for name in SUMMARY_COLUMNS],
+            preview.label("result_preview"),
+        )
+    
+    async def get_execution_result_by_job_id(self, job_id: str) -> tuple[bool, Any]:
+        """
+        Get only the result of an execution by job_id.
+        
+        Args:
+            job_id: Job ID of the execution
+            
+        Returns:
+            Tuple of (whether the execution exists, its result)
+        """
+        async with async_session_factory() as session:
+            stmt = select(ExecutionHistory.result).where(ExecutionHistory.job_id == job_id)
+            result = await session.execute(stmt)
+            row = result.first()
+            if row is None:
+                return False, None
+            return True, row.result
+    
     async def get_execution_by_id(self, execution_id: int) -> Optional[ExecutionHistory]:
         """
         Get a specific execution by ID.
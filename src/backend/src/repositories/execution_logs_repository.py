@@ -4,16 +4,18 @@ Repository for execution logs data access.
 This module provides database operations for execution logs.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, delete, text
+from sqlalchemy import func, delete, insert, text
 import logging
 from datetime import datetime, timezone
 
 from src.models.execution_logs import ExecutionLog
 from src.db.session import async_session_factory
 from src.core.logger import LoggerManager
+from src.utils.asyncio_utils import writer_lane
+from src.utils.pagination import keyset_paginate
 
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().system
@@ -89,6 +91,60 @@ class ExecutionLogsRepository:
             # Re-raise to caller
             raise
     
+    async def create_many(self, session: AsyncSession, logs: List[Dict[str, Any]]) -> int:
+        """
+        Create several execution log entries with a single multi-row INSERT.
+        
+        Args:
+            session: Database session
+            logs: List of dictionaries with execution_id, content and optional timestamp
+            
+        Returns:
+            Number of inserted log entries
+        """
+        if not logs:
+            return 0
+        
+        rows = [
+            {
+                "execution_id": log["execution_id"],
+                "content": log["content"],
+                "timestamp": self._normalize_timestamp(log.get("timestamp")) or datetime.utcnow()
+            }
+            for log in logs
+        ]
+        
+        try:
+            await session.execute(insert(ExecutionLog), rows)
+            await session.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"[ExecutionLogsRepository.create_many] Error creating {len(rows)} logs: {e}", exc_info=True)
+            
+            # Try to rollback if possible
+            try:
+                await session.rollback()
+            except Exception as rollback_error:
+                logger.error(f"[ExecutionLogsRepository.create_many] Rollback failed: {rollback_error}")
+            
+            # Re-raise to caller
+            raise
+    
+    async def create_many_with_managed_session(self, logs: List[Dict[str, Any]]) -> int:
+        """
+        Create several execution log entries in one transaction with internal session management.
+        
+        Args:
+            logs: List of dictionaries with execution_id, content and optional timestamp
+            
+        Returns:
+            Number of inserted log entries
+        """
+        if writer_lane.running:
+            return await writer_lane.submit(lambda session: self.create_many(session, logs))
+        async with async_session_factory() as session:
+            return await self.create_many(session, logs)
+    
     async def create_with_managed_session(self, execution_id: str, content: str, timestamp=None) -> ExecutionLog:
         """
         Create a new execution log entry with internal session management.
@@ -153,7 +209,8 @@ class ExecutionLogsRepository:
         execution_id: str, 
         limit: int = 1000, 
         offset: int = 0,
-        newest_first: bool = False
+        newest_first: bool = False,
+        cursor: Optional[str] = None
     ) -> List[ExecutionLog]:
         """
         Retrieve logs for a specific execution.
@@ -162,8 +219,9 @@ class ExecutionLogsRepository:
             session: Database session
             execution_id: ID of the execution to fetch logs for
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip, ignored when a cursor is given
             newest_first: If True, return newest logs first
+            cursor: Cursor of the previous page for keyset pagination
             
         Returns:
             List of ExecutionLog objects
@@ -172,12 +230,12 @@ class ExecutionLogsRepository:
             ExecutionLog.execution_id == execution_id
         )
         
-        if newest_first:
-            query = query.order_by(desc(ExecutionLog.timestamp))
-        else:
-            query = query.order_by(ExecutionLog.timestamp)
-            
-        query = query.offset(offset).limit(limit)
+        # Keyed on (timestamp, id) so pages stay stable for logs sharing a timestamp
+        query = keyset_paginate(
+            query, ExecutionLog.timestamp, ExecutionLog.id, limit, cursor, descending=newest_first
+        )
+        if not cursor and offset:
+            query = query.offset(offset)
         
         result = await session.execute(query)
         return result.scalars().all()
@@ -250,7 +308,8 @@ class ExecutionLogsRepository:
         execution_id: str, 
         limit: int = 1000, 
         offset: int = 0,
-        newest_first: bool = False
+        newest_first: bool = False,
+        cursor: Optional[str] = None
     ) -> List[ExecutionLog]:
         """
         Retrieve logs for a specific execution with internal session management.
@@ -258,8 +317,9 @@ class ExecutionLogsRepository:
         Args:
             execution_id: ID of the execution to fetch logs for
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip, ignored when a cursor is given
             newest_first: If True, return newest logs first
+            cursor: Cursor of the previous page for keyset pagination
             
         Returns:
             List of ExecutionLog objects
@@ -270,7 +330,8 @@ class ExecutionLogsRepository:
                 execution_id=execution_id,
                 limit=limit,
                 offset=offset,
-                newest_first=newest_first
+                newest_first=newest_first,
+                cursor=cursor
             )
     
     async def count_by_execution_id_with_managed_session(self, execution_id: str) -> int:
@@ -0,0 +1,215 @@
+"""
+Repository for purging executions and their dependent rows.
+
+This module provides the bounded, set-based deletes used by the background
+execution purge. Every delete removes at most one batch of rows selected by
+primary key, so each transaction stays short however large the execution.
+It also stores the progress of each purge in execution_purge.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.models.execution_history import ErrorTrace, ExecutionHistory, TaskStatus
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_purge import ExecutionPurge
+from src.models.execution_trace import ExecutionTrace
+from src.models.llm_usage import LLMUsage
+from src.models.task_checkpoint import TaskCheckpoint
+
+# Tables purged with an execution, dependent rows before executionhistory
+PURGE_MODELS = {
+    "execution_trace": ExecutionTrace,
+    "execution_logs": ExecutionLog,
+    "taskstatus": TaskStatus,
+    "errortrace": ErrorTrace,
+    "llm_usage": LLMUsage,
+    "task_checkpoint": TaskCheckpoint,
+    "executionhistory": ExecutionHistory,
+}
+
+
+class ExecutionPurgeRepository:
+    """Repository for execution purge data access operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        self.session = session
+
+    @staticmethod
+    def execution_conditions(executions: Sequence[Tuple[int, str]]) -> List[Tuple[str, Any]]:
+        """
+        Get the rows of each table belonging to a set of executions.
+
+        Args:
+            executions: (id, job_id) pairs of the executions
+
+        Returns:
+            (table name, filter) pairs in PURGE_MODELS order
+        """
+        run_ids = [run_id for run_id, _ in executions]
+        job_ids = [job_id for _, job_id in executions]
+        return [
+            ("execution_trace", or_(ExecutionTrace.job_id.in_(job_ids), ExecutionTrace.run_id.in_(run_ids))),
+            ("execution_logs", ExecutionLog.execution_id.in_(job_ids)),
+            ("taskstatus", TaskStatus.job_id.in_(job_ids)),
+            ("errortrace", ErrorTrace.run_id.in_(run_ids)),
+            ("llm_usage", LLMUsage.execution_id.in_(job_ids)),
+            ("task_checkpoint", TaskCheckpoint.job_id.in_(job_ids)),
+            ("executionhistory", ExecutionHistory.id.in_(run_ids)),
+        ]
+
+    @staticmethod
+    def snapshot_conditions(max_ids: Dict[str, Optional[int]]) -> List[Tuple[str, Any]]:
+        """
+        Get the rows of each table that existed when a purge of all executions started.
+
+        Args:
+            max_ids: Highest ID of each table, from get_max_ids
+
+        Returns:
+            (table name, filter) pairs in PURGE_MODELS order, skipping empty tables
+        """
+        return [
+            (name, PURGE_MODELS[name].id <= max_id)
+            for name, max_id in max_ids.items()
+            if max_id is not None
+        ]
+
+    async def get_max_ids(self) -> Dict[str, Optional[int]]:
+        """
+        Get the highest ID of each purged table.
+
+        Returns:
+            Dictionary of table name to highest ID, None for empty tables
+        """
+        max_ids = {}
+        for name, model in PURGE_MODELS.items():
+            result = await self.session.execute(select(func.max(model.id)))
+            max_ids[name] = result.scalar()
+        return max_ids
+
+    async def get_executions(
+        self,
+        job_ids: Sequence[str] = (),
+        run_ids: Sequence[int] = ()
+    ) -> List[Tuple[int, str]]:
+        """
+        Get the (id, job_id) pairs of existing executions.
+
+        Args:
+            job_ids: Job IDs to look up
+            run_ids: Database IDs to look up
+
+        Returns:
+            (id, job_id) pairs of the executions found
+        """
+        result = await self.session.execute(
+            select(ExecutionHistory.id, ExecutionHistory.job_id).where(
+                or_(ExecutionHistory.job_id.in_(job_ids), ExecutionHistory.id.in_(run_ids))
+            )
+        )
+        return [(row.id, row.job_id) for row in result.all()]
+
+    async def delete_batch(self, table: str, condition: Any, batch_size: int) -> int:
+        """
+        Delete up to batch_size rows of a table matching a filter and commit.
+
+        Args:
+            table: Table name from PURGE_MODELS
+            condition: Filter on the table's model
+            batch_size: Maximum number of rows to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        model = PURGE_MODELS[table]
+        batch = select(model.id).where(condition).limit(batch_size)
+        result = await self.session.execute(
+            delete(model).where(model.id.in_(batch)).execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def create_purge(self, values: Dict[str, Any]) -> ExecutionPurge:
+        """
+        Record a new purge and commit.
+
+        Args:
+            values: Column values of the purge
+
+        Returns:
+            The created ExecutionPurge
+        """
+        purge = ExecutionPurge(**values)
+        self.session.add(purge)
+        await self.session.commit()
+        return purge
+
+    async def update_purge(self, purge_id: str, values: Dict[str, Any]) -> None:
+        """
+        Update the progress of a purge and commit.
+
+        Args:
+            purge_id: ID of the purge
+            values: Column values to set
+        """
+        await self.session.execute(
+            update(ExecutionPurge).where(ExecutionPurge.id == purge_id).values(**values)
+        )
+        await self.session.commit()
+
+    async def get_purge(self, purge_id: str) -> Optional[ExecutionPurge]:
+        """
+        Get a purge by ID.
+
+        Args:
+            purge_id: ID of the purge
+
+        Returns:
+            ExecutionPurge if found, None otherwise
+        """
+        return await self.session.get(ExecutionPurge, purge_id)
+
+    async def get_purges_by_status(self, status: str) -> List[ExecutionPurge]:
+        """
+        Get the purges in a status, oldest first.
+
+        Args:
+            status: Purge status
+
+        Returns:
+            List of ExecutionPurge
+        """
+        result = await self.session.execute(
+            select(ExecutionPurge).where(ExecutionPurge.status == status).order_by(ExecutionPurge.started_at)
+        )
+        return list(result.scalars().all())
+
+    async def delete_old_purges(self, keep: int, running_status: str) -> int:
+        """
+        Delete finished purges beyond the most recent ones and commit.
+
+        Args:
+            keep: Number of most recently started purges to keep
+            running_status: Status of purges that are never deleted
+
+        Returns:
+            Number of purges deleted
+        """
+        recent = select(ExecutionPurge.id).order_by(ExecutionPurge.started_at.desc()).limit(keep)
+        result = await self.session.execute(
+            delete(ExecutionPurge)
+            .where(ExecutionPurge.status != running_status, ExecutionPurge.id.not_in(recent))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
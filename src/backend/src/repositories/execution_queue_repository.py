@@ -0,0 +1,319 @@
+"""
+Repository for the durable execution work queue.
+
+This module provides atomic claim, lease and heartbeat operations on the
+execution_queue table. On PostgreSQL claims use ``SELECT ... FOR UPDATE SKIP
+LOCKED`` so concurrent workers never block on each other; on SQLite, which
+serializes writers, each claim is a conditional UPDATE that only succeeds
+while the row is still pending.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.base_repository import BaseRepository
+from src.models.execution_queue import ExecutionQueueItem
+
+
+class ExecutionQueueStatus:
+    """Status values of execution queue items."""
+    PENDING = "pending"
+    CLAIMED = "claimed"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExecutionQueueRepository(BaseRepository[ExecutionQueueItem]):
+    """Repository for execution queue data access operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(ExecutionQueueItem, session)
+
+    def _supports_skip_locked(self) -> bool:
+        bind = self.session.bind
+        return bind is not None and bind.dialect.name == "postgresql"
+
+    async def enqueue(
+        self,
+        job_id: str,
+        payload: Dict[str, Any],
+        execution_type: str = "crew",
+        trigger_type: str = "api",
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> ExecutionQueueItem:
+        """
+        Add an execution to the queue.
+
+        Args:
+            job_id: Execution ID
+            payload: JSON-serializable execution configuration
+            execution_type: Type of execution (crew or flow)
+            trigger_type: What started the execution
+            priority: Claim priority, lower first
+            max_attempts: Claims allowed before the item is failed
+
+        Returns:
+            The queued item
+        """
+        now = datetime.utcnow()
+        item = ExecutionQueueItem(
+            job_id=job_id,
+            payload=payload,
+            execution_type=execution_type,
+            trigger_type=trigger_type,
+            priority=priority,
+            max_attempts=max_attempts,
+            status=ExecutionQueueStatus.PENDING,
+            available_at=now,
+            created_at=now,
+            updated_at=now
+        )
+        self.session.add(item)
+        await self.session.commit()
+        await self.session.refresh(item)
+        return item
+
+    async def claim(self, worker_id: str, lease_seconds: float, limit: int = 1) -> List[ExecutionQueueItem]:
+        """
+        Atomically claim up to limit pending items for a worker.
+
+        Args:
+            worker_id: ID of the claiming worker
+            lease_seconds: Lease duration before the claim expires
+            limit: Maximum number of items to claim
+
+        Returns:
+            The claimed items
+        """
+        now = datetime.utcnow()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        claimable = and_(
+            ExecutionQueueItem.status == ExecutionQueueStatus.PENDING,
+            ExecutionQueueItem.available_at <= now
+        )
+        order = (ExecutionQueueItem.priority, ExecutionQueueItem.created_at, ExecutionQueueItem.id)
+        claim_values = {
+            "status": ExecutionQueueStatus.CLAIMED,
+            "worker_id": worker_id,
+            "lease_expires_at": lease_expires_at,
+            "heartbeat_at": now,
+            "attempts": ExecutionQueueItem.attempts + 1,
+            "updated_at": now,
+        }
+
+        if self._supports_skip_locked():
+            # Rows locked by another worker's claim are skipped, not waited on
+            stmt = (
+                select(ExecutionQueueItem.id)
+                .where(claimable)
+                .order_by(*order)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            ids = list((await self.session.execute(stmt)).scalars().all())
+            if ids:
+                await self.session.execute(
+                    update(ExecutionQueueItem)
+                    .where(ExecutionQueueItem.id.in_(ids))
+                    .values(**claim_values)
+                )
+        else:
+            # Conditional update per candidate: only one worker can flip a row
+            # from pending to claimed, the others see rowcount 0
+            stmt = select(ExecutionQueueItem.id).where(claimable).order_by(*order).limit(limit)
+            candidates = list((await self.session.execute(stmt)).scalars().all())
+            ids = []
+            for item_id in candidates:
+                result = await self.session.execute(
+                    update(ExecutionQueueItem)
+                    .where(
+                        ExecutionQueueItem.id == item_id,
+                        ExecutionQueueItem.status == ExecutionQueueStatus.PENDING
+                    )
+                    .values(**claim_values)
+                )
+                if result.rowcount == 1:
+                    ids.append(item_id)
+
+        await self.session.commit()
+        if not ids:
+            return []
+
+        result = await self.session.execute(
+            select(ExecutionQueueItem).where(ExecutionQueueItem.id.in_(ids)).order_by(*order)
+        )
+        return list(result.scalars().all())
+
+    async def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease of an item held by a worker.
+
+        Args:
+            job_id: Execution ID
+            worker_id: ID of the worker holding the item
+            lease_seconds: New lease duration from now
+
+        Returns:
+            True if the worker still holds the item, False if it lost the lease
+        """
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(ExecutionQueueItem)
+            .where(
+                ExecutionQueueItem.job_id == job_id,
+                ExecutionQueueItem.worker_id == worker_id,
+                ExecutionQueueItem.status == ExecutionQueueStatus.CLAIMED
+            )
+            .values(
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                heartbeat_at=now,
+                updated_at=now
+            )
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+    async def complete(self, job_id: str, worker_id: str) -> bool:
+        """
+        Mark an item held by a worker as completed.
+
+        Args:
+            job_id: Execution ID
+            worker_id: ID of the worker holding the item
+
+        Returns:
+            True if the item was updated
+        """
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(ExecutionQueueItem)
+            .where(
+                ExecutionQueueItem.job_id == job_id,
+                ExecutionQueueItem.worker_id == worker_id,
+                ExecutionQueueItem.status == ExecutionQueueStatus.CLAIMED
+            )
+            .values(status=ExecutionQueueStatus.COMPLETED, lease_expires_at=None, updated_at=now)
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+    async def fail(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry: bool = True,
+        retry_delay_seconds: float = 0
+    ) -> bool:
+        """
+        Release a failed item, returning it to the queue if it may be retried.
+
+        Args:
+            job_id: Execution ID
+            worker_id: ID of the worker holding the item
+            error: Error message to record
+            retry: Whether the item may be claimed again while attempts remain
+            retry_delay_seconds: Delay before the item can be claimed again
+
+        Returns:
+            True if the item was updated
+        """
+        now = datetime.utcnow()
+        item = await self.get_by_job_id(job_id)
+        if item is None or item.worker_id != worker_id or item.status != ExecutionQueueStatus.CLAIMED:
+            return False
+        retry = retry and item.attempts < item.max_attempts
+        result = await self.session.execute(
+            update(ExecutionQueueItem)
+            .where(
+                ExecutionQueueItem.id == item.id,
+                ExecutionQueueItem.worker_id == worker_id,
+                ExecutionQueueItem.status == ExecutionQueueStatus.CLAIMED
+            )
+            .values(
+                status=ExecutionQueueStatus.PENDING if retry else ExecutionQueueStatus.FAILED,
+                worker_id=None,
+                lease_expires_at=None,
+                available_at=now + timedelta(seconds=retry_delay_seconds),
+                last_error=error,
+                updated_at=now
+            )
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+    async def reclaim_expired(self) -> int:
+        """
+        Return items whose lease expired to the queue, or fail them when out of attempts.
+
+        Returns:
+            Number of items reclaimed or failed
+        """
+        now = datetime.utcnow()
+        expired = and_(
+            ExecutionQueueItem.status == ExecutionQueueStatus.CLAIMED,
+            ExecutionQueueItem.lease_expires_at < now
+        )
+        requeued = await self.session.execute(
+            update(ExecutionQueueItem)
+            .where(expired, ExecutionQueueItem.attempts < ExecutionQueueItem.max_attempts)
+            .values(
+                status=ExecutionQueueStatus.PENDING,
+                worker_id=None,
+                lease_expires_at=None,
+                available_at=now,
+                last_error="Lease expired",
+                updated_at=now
+            )
+        )
+        failed = await self.session.execute(
+            update(ExecutionQueueItem)
+            .where(expired, ExecutionQueueItem.attempts >= ExecutionQueueItem.max_attempts)
+            .values(
+                status=ExecutionQueueStatus.FAILED,
+                worker_id=None,
+                lease_expires_at=None,
+                last_error="Lease expired after final attempt",
+                updated_at=now
+            )
+        )
+        await self.session.commit()
+        return (requeued.rowcount or 0) + (failed.rowcount or 0)
+
+    async def get_by_job_id(self, job_id: str) -> Optional[ExecutionQueueItem]:
+        """
+        Get a queue item by execution ID.
+
+        Args:
+            job_id: Execution ID
+
+        Returns:
+            The queue item, or None if the execution was never queued
+        """
+        result = await self.session.execute(
+            select(ExecutionQueueItem).where(ExecutionQueueItem.job_id == job_id)
+        )
+        return result.scalars().first()
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """
+        Count queue items per status.
+
+        Returns:
+            Dictionary of status to item count
+        """
+        result = await self.session.execute(
+            select(ExecutionQueueItem.status, func.count()).group_by(ExecutionQueueItem.status)
+        )
+        return {status: count for status, count in result.all()}
@@ -6,7 +6,8 @@ This module provides functions for CRUD operations on execution traces.
 
 import logging
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import select, delete, update, func
+from datetime import datetime
+from sqlalchemy import select, delete, update, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -15,6 +16,8 @@ from src.models.execution_trace import ExecutionTrace
 from src.models.execution_history import ExecutionHistory
 from src.core.logger import LoggerManager
 from src.db.session import async_session_factory
+from src.utils.asyncio_utils import writer_lane
+from src.utils.pagination import keyset_paginate
 
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().system
@@ -46,6 +49,44 @@ class ExecutionTraceRepository:
             logger.error(f"Database error creating execution trace: {str(e)}")
             raise
     
+    async def _create_many(self, session: AsyncSession, traces: List[Dict[str, Any]]) -> int:
+        """
+        Create several execution trace records with a single multi-row INSERT.
+        
+        Args:
+            session: Database session
+            traces: List of dictionaries with trace data
+            
+        Returns:
+            Number of inserted records
+        """
+        if not traces:
+            return 0
+        
+        # executemany requires every row to carry the same keys
+        rows = [
+            {
+                "run_id": trace.get("run_id"),
+                "job_id": trace.get("job_id"),
+                "agent_name": trace.get("agent_name"),
+                "task_name": trace.get("task_name"),
+                "event_type": trace.get("event_type"),
+                "output": trace.get("output"),
+                "trace_metadata": trace.get("trace_metadata"),
+                "created_at": trace.get("created_at") or datetime.utcnow(),
+            }
+            for trace in traces
+        ]
+        
+        try:
+            await session.execute(insert(ExecutionTrace), rows)
+            await session.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.error(f"Database error creating {len(rows)} execution traces: {str(e)}")
+            raise
+    
     async def _get_by_id(self, session: AsyncSession, trace_id: int) -> Optional[ExecutionTrace]:
         """
         Get an execution trace by ID with provided session.
@@ -65,12 +106,40 @@ class ExecutionTraceRepository:
             logger.error(f"Database error retrieving execution trace {trace_id}: {str(e)}")
             raise
     
+    async def _get_page(
+        self,
+        session: AsyncSession,
+        stmt,
+        limit: Optional[int],
+        cursor: str,
+        descending: bool = True
+    ) -> List[ExecutionTrace]:
+        """
+        Get the page of traces after a cursor, keyed on (created_at, id).
+        
+        Args:
+            session: Database session
+            stmt: Select statement with the caller's filters
+            limit: Maximum number of traces to return
+            cursor: Cursor of the previous page
+            descending: Newest traces first if True
+            
+        Returns:
+            List of ExecutionTrace records
+        """
+        stmt = keyset_paginate(
+            stmt, ExecutionTrace.created_at, ExecutionTrace.id, limit or 100, cursor, descending=descending
+        )
+        result = await session.execute(stmt)
+        return result.scalars().all()
+    
     async def _get_by_run_id(
         self, 
         session: AsyncSession, 
         run_id: int,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by run_id with provided session.
@@ -80,6 +149,7 @@ class ExecutionTraceRepository:
             run_id: Run ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             List of ExecutionTrace records
@@ -87,6 +157,9 @@ class ExecutionTraceRepository:
         try:
             stmt = select(ExecutionTrace).where(ExecutionTrace.run_id == run_id)
             
+            if cursor:
+                return await self._get_page(session, stmt, limit, cursor, descending=False)
+            stmt = stmt.order_by(ExecutionTrace.created_at, ExecutionTrace.id)
             if offset is not None:
                 stmt = stmt.offset(offset)
             if limit is not None:
@@ -103,7 +176,8 @@ class ExecutionTraceRepository:
         session: AsyncSession, 
         job_id: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by job_id with provided session.
@@ -113,6 +187,7 @@ class ExecutionTraceRepository:
             job_id: Job ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             List of ExecutionTrace records
@@ -120,6 +195,9 @@ class ExecutionTraceRepository:
         try:
             stmt = select(ExecutionTrace).where(ExecutionTrace.job_id == job_id)
             
+            if cursor:
+                return await self._get_page(session, stmt, limit, cursor, descending=False)
+            stmt = stmt.order_by(ExecutionTrace.created_at, ExecutionTrace.id)
             if offset is not None:
                 stmt = stmt.offset(offset)
             if limit is not None:
@@ -135,35 +213,44 @@ class ExecutionTraceRepository:
         self,
         session: AsyncSession,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
-    ) -> Tuple[List[ExecutionTrace], int]:
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[ExecutionTrace], Optional[int]]:
         """
         Get all execution traces with pagination with provided session.
         
         Args:
             session: Database session
             limit: Maximum number of traces to return
-            offset: Number of traces to skip
+            offset: Number of traces to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page, newest traces first
+            include_total: Whether to count all traces
             
         Returns:
-            Tuple of (list of ExecutionTrace records, total count)
+            Tuple of (list of ExecutionTrace records, total count or None)
         """
         try:
-            # Get all traces
-            stmt = select(ExecutionTrace).order_by(ExecutionTrace.created_at.desc())
-            
-            if offset is not None:
-                stmt = stmt.offset(offset)
-            if limit is not None:
-                stmt = stmt.limit(limit)
+            if cursor:
+                traces = await self._get_page(session, select(ExecutionTrace), limit, cursor)
+            else:
+                # Get all traces
+                stmt = select(ExecutionTrace).order_by(ExecutionTrace.created_at.desc(), ExecutionTrace.id.desc())
                 
-            result = await session.execute(stmt)
-            traces = result.scalars().all()
+                if offset is not None:
+                    stmt = stmt.offset(offset)
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                    
+                result = await session.execute(stmt)
+                traces = result.scalars().all()
             
             # Get total count
-            count_stmt = select(func.count()).select_from(ExecutionTrace)
-            total_count_result = await session.execute(count_stmt)
-            total_count = total_count_result.scalar() or 0
+            total_count = None
+            if include_total:
+                count_stmt = select(func.count()).select_from(ExecutionTrace)
+                total_count_result = await session.execute(count_stmt)
+                total_count = total_count_result.scalar() or 0
             
             return traces, total_count
         except SQLAlchemyError as e:
@@ -346,6 +433,24 @@ class ExecutionTraceRepository:
             # Now create the trace with the existing or newly created job
             return await self._create(session, trace_data)
     
+    async def create_many(self, traces: List[Dict[str, Any]]) -> int:
+        """
+        Create several execution trace records in one transaction.
+        
+        Unlike create(), this does not auto-create missing executions; callers
+        must make sure every job_id already exists in executionhistory.
+        
+        Args:
+            traces: List of dictionaries with trace data
+            
+        Returns:
+            Number of inserted records
+        """
+        if writer_lane.running:
+            return await writer_lane.submit(lambda session: self._create_many(session, traces))
+        async with async_session_factory() as session:
+            return await self._create_many(session, traces)
+    
     async def get_by_id(self, trace_id: int) -> Optional[ExecutionTrace]:
         """
         Get an execution trace by ID.
@@ -363,7 +468,8 @@ class ExecutionTraceRepository:
         self, 
         run_id: int,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by run_id.
@@ -372,18 +478,20 @@ class ExecutionTraceRepository:
             run_id: Run ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             List of ExecutionTrace records
         """
         async with async_session_factory() as session:
-            return await self._get_by_run_id(session, run_id, limit, offset)
+            return await self._get_by_run_id(session, run_id, limit, offset, cursor)
     
     async def get_by_job_id(
         self, 
         job_id: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None
     ) -> List[ExecutionTrace]:
         """
         Get execution traces by job_id.
@@ -392,30 +500,35 @@ class ExecutionTraceRepository:
             job_id: Job ID to filter by
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             List of ExecutionTrace records
         """
         async with async_session_factory() as session:
-            return await self._get_by_job_id(session, job_id, limit, offset)
+            return await self._get_by_job_id(session, job_id, limit, offset, cursor)
     
     async def get_all_traces(
         self,
         limit: Optional[int] = None,
-        offset: Optional[int] = 0
-    ) -> Tuple[List[ExecutionTrace], int]:
+        offset: Optional[int] = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[ExecutionTrace], Optional[int]]:
         """
         Get all execution traces with pagination.
         
         Args:
             limit: Maximum number of traces to return
-            offset: Number of traces to skip
+            offset: Number of traces to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page, newest traces first
+            include_total: Whether to count all traces
             
         Returns:
-            Tuple of (list of ExecutionTrace records, total count)
+            Tuple of (list of ExecutionTrace records, total count or None)
         """
         async with async_session_factory() as session:
-            return await self._get_all_traces(session, limit, offset)
+            return await self._get_all_traces(session, limit, offset, cursor, include_total)
     
     async def get_execution_job_id_by_run_id(self, run_id: int) -> Optional[str]:
         """
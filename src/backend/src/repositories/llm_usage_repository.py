@@ -0,0 +1,144 @@
+"""
+Repository for aggregated LLM usage.
+
+This module provides batched increments of per-execution, per-agent and
+per-model LLM usage rows, and the queries reading them back.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.base_repository import BaseRepository
+from src.models.llm_usage import LLMUsage
+
+# Counters added together when a batch row meets an existing row
+_SUM_COLUMNS = (
+    "calls",
+    "failed_calls",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cost",
+    "latency_ms_total",
+)
+
+
+class LLMUsageRepository(BaseRepository[LLMUsage]):
+    """Repository for LLM usage data access operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(LLMUsage, session)
+
+    def _is_postgresql(self) -> bool:
+        bind = self.session.bind
+        return bind is not None and bind.dialect.name == "postgresql"
+
+    async def add_usage(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Add a batch of aggregated usage to the stored totals in one transaction.
+
+        Args:
+            rows: Dicts with execution_id, agent_name, model, the counters of
+                _SUM_COLUMNS, latency_ms_max, first_call_at and last_call_at
+
+        Returns:
+            Number of rows upserted
+        """
+        if not rows:
+            return 0
+        if self._is_postgresql():
+            statement = postgresql_insert(LLMUsage).values(rows)
+            greatest = func.greatest
+        else:
+            statement = sqlite_insert(LLMUsage).values(rows)
+            # SQLite's two-argument max() is scalar
+            greatest = func.max
+        excluded = statement.excluded
+        table = LLMUsage.__table__
+        updates = {name: table.c[name] + excluded[name] for name in _SUM_COLUMNS}
+        updates["latency_ms_max"] = greatest(table.c.latency_ms_max, excluded.latency_ms_max)
+        updates["last_call_at"] = excluded.last_call_at
+        statement = statement.on_conflict_do_update(
+            index_elements=["execution_id", "agent_name", "model"],
+            set_=updates,
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+        return len(rows)
+
+    async def find_by_execution_id(self, execution_id: str) -> List[LLMUsage]:
+        """
+        Get the usage rows of an execution.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Usage rows ordered by agent and model
+        """
+        result = await self.session.execute(
+            select(LLMUsage)
+            .where(LLMUsage.execution_id == execution_id)
+            .order_by(LLMUsage.agent_name, LLMUsage.model)
+        )
+        return list(result.scalars().all())
+
+    async def summarize_by_model(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Sum usage per model over all executions.
+
+        Args:
+            since: Only include rows with calls after this time
+
+        Returns:
+            One dict per model with executions, calls, tokens, cost and average latency
+        """
+        query = select(
+            LLMUsage.model,
+            func.count(func.distinct(LLMUsage.execution_id)).label("executions"),
+            func.sum(LLMUsage.calls).label("calls"),
+            func.sum(LLMUsage.failed_calls).label("failed_calls"),
+            func.sum(LLMUsage.prompt_tokens).label("prompt_tokens"),
+            func.sum(LLMUsage.completion_tokens).label("completion_tokens"),
+            func.sum(LLMUsage.total_tokens).label("total_tokens"),
+            func.sum(LLMUsage.cost).label("cost"),
+            func.sum(LLMUsage.latency_ms_total).label("latency_ms_total"),
+        ).group_by(LLMUsage.model).order_by(LLMUsage.model)
+        if since is not None:
+            query = query.where(LLMUsage.last_call_at >= since)
+        result = await self.session.execute(query)
+        summary = []
+        for row in result.all():
+            item = dict(row._mapping)
+            calls = item["calls"] or 0
+            item["avg_latency_ms"] = (item.pop("latency_ms_total") or 0.0) / calls if calls else 0.0
+            summary.append(item)
+        return summary
+
+    async def delete_by_execution_id(self, execution_id: str) -> int:
+        """
+        Delete the usage rows of an execution.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await self.session.execute(
+            delete(LLMUsage).where(LLMUsage.execution_id == execution_id)
+        )
+        await self.session.commit()
+        return result.rowcount
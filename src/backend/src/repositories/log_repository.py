@@ -1,14 +1,78 @@
+from bisect import bisect_left
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func, case, literal_column
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Insert
 
 from src.core.base_repository import BaseRepository
-from src.models.log import LLMLog
+from src.models.log import LLMLog, LLMLogDailyStats, LATENCY_BUCKET_BOUNDS_MS
 from src.db.session import async_session_factory
 
 
+def latency_bucket(duration_ms: Optional[int]) -> int:
+    """
+    Get the LLMLogDailyStats latency bucket of a call duration.
+    
+    Args:
+        duration_ms: Call duration in milliseconds, None if unknown
+        
+    Returns:
+        Index into LATENCY_BUCKET_BOUNDS_MS, or len(LATENCY_BUCKET_BOUNDS_MS)
+        for longer calls, or -1 for unknown durations
+    """
+    if duration_ms is None:
+        return -1
+    return bisect_left(LATENCY_BUCKET_BOUNDS_MS, duration_ms)
+
+
+def daily_stats_backfill() -> Insert:
+    """
+    Build the statement computing the daily rollups of all existing logs.
+    
+    Runs once, in the transaction that creates llmlog_daily_stats for a
+    database whose llmlog already has rows; from then on every log write
+    maintains the rollups.
+    
+    Returns:
+        INSERT ... SELECT ... GROUP BY statement into llmlog_daily_stats
+    """
+    log = LLMLog
+    # Inline the bounds so PostgreSQL sees identical SELECT and GROUP BY expressions
+    bucket = case(
+        (log.duration_ms.is_(None), literal_column("-1")),
+        *[
+            (log.duration_ms <= literal_column(str(bound)), literal_column(str(index)))
+            for index, bound in enumerate(LATENCY_BUCKET_BOUNDS_MS)
+        ],
+        else_=literal_column(str(len(LATENCY_BUCKET_BOUNDS_MS))),
+    )
+    day = func.date(log.created_at)
+    rollup = (
+        select(
+            day,
+            log.endpoint,
+            log.model,
+            bucket,
+            func.count(),
+            func.sum(case((log.status == "success", 0), else_=1)),
+            func.coalesce(func.sum(log.tokens_used), 0),
+            func.coalesce(func.sum(log.duration_ms), 0),
+            func.coalesce(func.max(log.duration_ms), 0),
+        )
+        .where(log.created_at.is_not(None))
+        .group_by(day, log.endpoint, log.model, bucket)
+    )
+    return LLMLogDailyStats.__table__.insert().from_select(
+        ["day", "endpoint", "model", "latency_bucket", "calls", "errors",
+         "tokens_used", "duration_ms_total", "duration_ms_max"],
+        rollup,
+    )
+
+
 class LLMLogRepository(BaseRepository[LLMLog]):
     """
     Repository for LLMLog model with custom query methods.
@@ -62,8 +126,8 @@ class LLMLogRepository(BaseRepository[LLMLog]):
             Total count of matching logs
         """
         async with async_session_factory() as session:
-            # Start with a base query
-            query = select(self.model)
+            # Count in the database rather than loading every row
+            query = select(func.count()).select_from(self.model)
             
             # Apply endpoint filter if provided
             if endpoint and endpoint != 'all':
@@ -71,7 +135,7 @@ class LLMLogRepository(BaseRepository[LLMLog]):
             
             # Execute query
             result = await session.execute(query)
-            return len(list(result.scalars().all()))
+            return result.scalar_one()
     
     async def get_unique_endpoints(self) -> List[str]:
         """
@@ -105,6 +169,73 @@ class LLMLogRepository(BaseRepository[LLMLog]):
             
             db_obj = self.model(**normalized_obj)
             session.add(db_obj)
+            await session.flush()
+            
+            # Count the log in its daily rollup within the same transaction
+            await session.execute(self._daily_stats_upsert(session, [{
+                "day": (db_obj.created_at or datetime.utcnow()).date(),
+                "endpoint": db_obj.endpoint,
+                "model": db_obj.model,
+                "latency_bucket": latency_bucket(db_obj.duration_ms),
+                "calls": 1,
+                "errors": 0 if db_obj.status == "success" else 1,
+                "tokens_used": db_obj.tokens_used or 0,
+                "duration_ms_total": db_obj.duration_ms or 0,
+                "duration_ms_max": db_obj.duration_ms or 0,
+            }]))
             await session.commit()
             await session.refresh(db_obj)
-            return db_obj 
\ No newline at end of file
+            return db_obj
+    
+    @staticmethod
+    def _daily_stats_upsert(session: AsyncSession, rows: List[Dict[str, Any]]):
+        """Build an insert of rollup rows that adds to existing rows with the same key."""
+        if session.bind.dialect.name == "postgresql":
+            statement = postgresql_insert(LLMLogDailyStats).values(rows)
+            greatest = func.greatest
+        else:
+            statement = sqlite_insert(LLMLogDailyStats).values(rows)
+            # SQLite's two-argument max() is scalar
+            greatest = func.max
+        excluded = statement.excluded
+        table = LLMLogDailyStats.__table__
+        updates = {
+            name: table.c[name] + excluded[name]
+            for name in ("calls", "errors", "tokens_used", "duration_ms_total")
+        }
+        updates["duration_ms_max"] = greatest(table.c.duration_ms_max, excluded.duration_ms_max)
+        return statement.on_conflict_do_update(
+            index_elements=["day", "endpoint", "model", "latency_bucket"],
+            set_=updates,
+        )
+    
+    async def get_daily_stats(self, since: date) -> List[Dict[str, Any]]:
+        """
+        Sum the daily rollups from a day on, per endpoint, model and latency bucket.
+        
+        Args:
+            since: First day to include
+            
+        Returns:
+            One dict per endpoint, model and latency bucket with calls, errors,
+            tokens_used, duration_ms_total and duration_ms_max
+        """
+        async with async_session_factory() as session:
+            stats = LLMLogDailyStats
+            query = (
+                select(
+                    stats.endpoint,
+                    stats.model,
+                    stats.latency_bucket,
+                    func.sum(stats.calls).label("calls"),
+                    func.sum(stats.errors).label("errors"),
+                    func.sum(stats.tokens_used).label("tokens_used"),
+                    func.sum(stats.duration_ms_total).label("duration_ms_total"),
+                    func.max(stats.duration_ms_max).label("duration_ms_max"),
+                )
+                .where(stats.day >= since)
+                .group_by(stats.endpoint, stats.model, stats.latency_bucket)
+            )
+            result = await session.execute(query)
+            return [dict(row._mapping) for row in result.all()]
+ 
\ No newline at end of file
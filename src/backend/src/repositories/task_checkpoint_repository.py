@@ -0,0 +1,103 @@
+"""
+Repository for task checkpoints.
+
+This module provides storage of finished task outputs per execution, used to
+resume retried executions from the first unfinished task.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.base_repository import BaseRepository
+from src.models.task_checkpoint import TaskCheckpoint
+
+
+class TaskCheckpointRepository(BaseRepository[TaskCheckpoint]):
+    """Repository for task checkpoint data access operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with session.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(TaskCheckpoint, session)
+
+    async def save(
+        self,
+        job_id: str,
+        task_index: int,
+        task_key: str,
+        raw_output: str,
+        json_output: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None
+    ) -> TaskCheckpoint:
+        """
+        Store the output of a finished task, replacing an earlier checkpoint of the same task.
+
+        Args:
+            job_id: Execution ID
+            task_index: Position of the task in the crew
+            task_key: Hash of the task description
+            raw_output: Raw task output
+            json_output: Structured task output, if any
+            agent_name: Role of the agent that ran the task
+
+        Returns:
+            The stored checkpoint
+        """
+        result = await self.session.execute(
+            select(TaskCheckpoint).where(
+                TaskCheckpoint.job_id == job_id,
+                TaskCheckpoint.task_index == task_index
+            )
+        )
+        checkpoint = result.scalars().first()
+        if checkpoint is None:
+            checkpoint = TaskCheckpoint(job_id=job_id, task_index=task_index)
+            self.session.add(checkpoint)
+        checkpoint.task_key = task_key
+        checkpoint.raw_output = raw_output
+        checkpoint.json_output = json_output
+        checkpoint.agent_name = agent_name
+        checkpoint.created_at = datetime.utcnow()
+        await self.session.commit()
+        return checkpoint
+
+    async def find_by_job_id(self, job_id: str) -> List[TaskCheckpoint]:
+        """
+        Get the checkpoints of an execution in task order.
+
+        Args:
+            job_id: Execution ID
+
+        Returns:
+            List of checkpoints
+        """
+        result = await self.session.execute(
+            select(TaskCheckpoint)
+            .where(TaskCheckpoint.job_id == job_id)
+            .order_by(TaskCheckpoint.task_index)
+        )
+        return list(result.scalars().all())
+
+    async def delete_by_job_id(self, job_id: str) -> int:
+        """
+        Delete the checkpoints of an execution.
+
+        Args:
+            job_id: Execution ID
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        result = await self.session.execute(
+            delete(TaskCheckpoint).where(TaskCheckpoint.job_id == job_id)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
@@ -38,6 +38,7 @@ class CrewConfig(BaseModel):
     llm_provider: Optional[str] = Field(None, description="LLM provider to use (openai, anthropic, etc)")
     execution_type: Optional[str] = Field("crew", description="Type of execution (crew or flow)")
     schema_detection_enabled: Optional[bool] = Field(True, description="Whether schema detection is enabled")
+    stream_tokens: bool = Field(False, description="Whether to stream LLM tokens to execution WebSocket subscribers")
 
     @property
     def tasks(self) -> Dict:
@@ -105,6 +106,8 @@ class ExecutionResponse(BaseModel):
     execution_inputs: Optional[Dict[str, Any]] = Field(None, description="Input data for the execution")
     execution_outputs: Optional[Dict[str, Any]] = Field(None, description="Output data from the execution")
     execution_config: Optional[Dict[str, Any]] = Field(None, description="Configuration used for the execution")
+    queue_position: Optional[int] = Field(None, description="1-based position in the admission queue while pending")
+    queued_seconds: Optional[float] = Field(None, description="Seconds spent waiting for admission while pending")
 
     model_config = ConfigDict(from_attributes=True)
 
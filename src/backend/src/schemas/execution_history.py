@@ -26,14 +26,24 @@ class ExecutionHistoryItem(BaseModel):
     input: Optional[Dict[str, Any]] = None
     execution_type: Optional[str] = Field(default=None, description="Type of execution (crew or flow)")
     result: Optional[Dict[str, Any]] = None
+    result_preview: Optional[str] = Field(default=None, description="Start of the serialized result, in summary lists")
+    result_truncated: Optional[bool] = Field(default=None, description="Whether result_preview is cut off")
+    archived_at: Optional[datetime] = Field(default=None, description="When logs and traces were moved to the archive")
+    
+class ExecutionResult(BaseModel):
+    """Schema for the full result of an execution."""
+    
+    job_id: str = Field(description="Unique string identifier for the execution")
+    result: Optional[Dict[str, Any]] = None
     
 class ExecutionHistoryList(BaseModel):
     """Schema for a paginated list of execution history items."""
     
     executions: List[ExecutionHistoryItem]
-    total: int = Field(description="Total number of executions")
+    total: Optional[int] = Field(None, description="Total number of executions, if requested")
     limit: int = Field(description="Maximum number of items per page")
     offset: int = Field(description="Offset for pagination")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
     
 class ExecutionOutput(BaseModel):
     """Schema for an execution output entry."""
@@ -52,9 +62,10 @@ class ExecutionOutputList(BaseModel):
     
     execution_id: str = Field(description="ID of the execution these outputs belong to")
     outputs: List[ExecutionOutput]
-    total: int = Field(description="Total number of outputs for this execution")
+    total: Optional[int] = Field(None, description="Total number of outputs for this execution, if requested")
     limit: int = Field(description="Maximum number of items per page")
     offset: int = Field(description="Offset for pagination")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
     
 class ExecutionOutputDebug(BaseModel):
     """Schema for debugging information about an execution output."""
@@ -80,4 +91,18 @@ class DeleteResponse(BaseModel):
     deleted_run_id: Optional[int] = Field(None, description="ID of the deleted execution (if deleting by ID)")
     deleted_job_id: Optional[str] = Field(None, description="Job ID of the deleted execution (if deleting by job_id)")
     deleted_runs: Optional[int] = Field(None, description="Number of deleted executions (if deleting all)")
-    deleted_outputs: Optional[int] = Field(None, description="Number of deleted outputs") 
\ No newline at end of file
+    deleted_outputs: Optional[int] = Field(None, description="Number of deleted outputs")
+    purge_id: Optional[str] = Field(None, description="ID of the background purge deleting the data")
+    
+class PurgeStatusResponse(BaseModel):
+    """Schema for the progress of a background execution purge."""
+    
+    purge_id: str
+    status: str = Field(description="running, completed or failed")
+    scope: str = Field(description="all, or the executions listed in job_ids")
+    job_ids: Optional[List[str]] = None
+    current_table: Optional[str] = Field(None, description="Table being purged")
+    deleted: Dict[str, int] = Field(description="Rows deleted so far per table")
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None 
\ No newline at end of file
@@ -26,4 +26,5 @@ class ExecutionLogResponse(BaseModel):
 
 class ExecutionLogsResponse(BaseModel):
     """Schema for a collection of execution logs."""
-    logs: List[ExecutionLogResponse] = Field(..., description="List of execution logs") 
\ No newline at end of file
+    logs: List[ExecutionLogResponse] = Field(..., description="List of execution logs")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one") 
\ No newline at end of file
@@ -29,25 +29,46 @@ class ExecutionTraceList(BaseModel):
     """Schema for a paginated list of execution traces."""
     
     traces: List[ExecutionTraceItem]
-    total: int = Field(description="Total number of traces")
+    total: Optional[int] = Field(None, description="Total number of traces, if requested")
     limit: int = Field(description="Maximum number of items per page")
     offset: int = Field(description="Offset for pagination")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
     
 class ExecutionTraceResponseByRunId(BaseModel):
     """Schema for a list of traces for a specific run."""
     
     run_id: int = Field(description="Database ID of the execution")
     traces: List[ExecutionTraceItem]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
     
 class ExecutionTraceResponseByJobId(BaseModel):
     """Schema for a list of traces for a specific job."""
     
     job_id: str = Field(description="String ID of the execution (job_id)")
     traces: List[ExecutionTraceItem]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
     
 class DeleteTraceResponse(BaseModel):
     """Schema for a response to a delete trace operation."""
     
     message: str = Field(description="Success message")
     deleted_trace_id: Optional[int] = Field(None, description="ID of the deleted trace (if deleting by ID)")
-    deleted_traces: Optional[int] = Field(None, description="Number of deleted traces") 
\ No newline at end of file
+    deleted_traces: Optional[int] = Field(None, description="Number of deleted traces") 
+
+class QueueJobStats(BaseModel):
+    """Schema for drop and lag counters of one job in a trace/log queue."""
+    
+    enqueued: int = Field(0, description="Items accepted into the queue")
+    dropped: int = Field(0, description="Items dropped because the queue was full")
+    sampled_out: int = Field(0, description="Items skipped by sampling under pressure")
+    overflowed: int = Field(0, description="Never-drop items kept beyond the queue capacity")
+    pending: int = Field(0, description="Items currently waiting in the queue")
+    last_lag_seconds: float = Field(0.0, description="Queue wait of the most recently written item")
+    max_lag_seconds: float = Field(0.0, description="Longest queue wait observed")
+
+class ExecutionQueueStatsResponse(BaseModel):
+    """Schema for the trace and log queue counters of a job."""
+    
+    job_id: str = Field(description="String ID of the execution (job_id)")
+    trace_queue: QueueJobStats
+    log_queue: QueueJobStats
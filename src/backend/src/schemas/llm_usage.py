@@ -0,0 +1,55 @@
+"""
+Schemas for aggregated LLM usage.
+
+This module provides Pydantic models for the LLM calls, tokens, cost and
+latency recorded per execution, agent and model.
+"""
+
+from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class LLMUsageItem(BaseModel):
+    """Schema for the usage of one agent and model within an execution."""
+    
+    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+    
+    agent_name: str = Field("", description="Agent role, empty if unknown")
+    model: str
+    calls: int = 0
+    failed_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost: float = Field(0.0, description="Cost in USD as reported by LiteLLM")
+    avg_latency_ms: float = 0.0
+    latency_ms_max: float = 0.0
+    first_call_at: Optional[datetime] = None
+    last_call_at: Optional[datetime] = None
+
+
+class ExecutionLLMUsageResponse(BaseModel):
+    """Schema for the LLM usage of an execution with its totals."""
+    
+    execution_id: str
+    calls: int = 0
+    total_tokens: int = 0
+    cost: float = 0.0
+    usage: List[LLMUsageItem]
+
+
+class ModelUsageSummary(BaseModel):
+    """Schema for the usage of one model across executions."""
+    
+    model_config = ConfigDict(protected_namespaces=())
+    
+    model: str
+    executions: int = 0
+    calls: int = 0
+    failed_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost: float = 0.0
+    avg_latency_ms: float = 0.0
@@ -12,6 +12,8 @@ class ModelConfigBase(BaseModel):
     context_window: Optional[int] = Field(None, description="Maximum context window size in tokens")
     max_output_tokens: Optional[int] = Field(None, description="Maximum output tokens allowed")
     extended_thinking: Optional[bool] = Field(False, description="Whether extended thinking is enabled")
+    rpm_limit: Optional[int] = Field(None, description="Maximum requests per minute to this model, unlimited if not set")
+    tpm_limit: Optional[int] = Field(None, description="Maximum tokens per minute to this model, unlimited if not set")
     enabled: Optional[bool] = Field(True, description="Whether the model is enabled")
 
 
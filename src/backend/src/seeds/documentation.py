@@ -208,58 +208,62 @@ async def seed_documentation_embeddings(session: AsyncSession) -> None:
     # Initialize service
     doc_embedding_service = DocumentationEmbeddingService()
     
-    # Process each documentation URL
-    total_chunks_processed = 0
+    # Collect the chunks of every documentation URL
+    chunks = []
     
     for url in DOCS_URLS:
         try:
-            # Create documentation chunks
-            chunks = await create_documentation_chunks(url)
-            logger.info(f"Created {len(chunks)} chunks for {url}")
-            
-            # Create embedding for each chunk and store in database
-            for chunk in chunks:
-                try:
-                    # Create embedding using LLMManager with Databricks configuration
-                    try:
-                        embedder_config = {
-                            'provider': 'databricks',
-                            'config': {'model': EMBEDDING_MODEL}
-                        }
-                        embedding = await LLMManager.get_embedding(
-                            text=chunk["content"],
-                            model=EMBEDDING_MODEL,
-                            embedder_config=embedder_config
-                        )
-                    except Exception as e:
-                        logger.warning(f"Error with LLMManager.get_embedding: {str(e)}. Using mock embeddings instead.")
-                        embedding = await mock_create_embedding(chunk["content"])
-                    
-                    # Create schema for database record
-                    doc_embedding_create = DocumentationEmbeddingCreate(
-                        source=chunk["source"],
-                        title=chunk["title"],
-                        content=chunk["content"],
-                        embedding=embedding,
-                        doc_metadata={
-                            "page_name": chunk["source"].split('/')[-1].capitalize(),
-                            "chunk_index": chunk["chunk_index"],
-                            "total_chunks": chunk["total_chunks"]
-                        }
-                    )
-                    
-                    # Use service to create the record
-                    await doc_embedding_service.create_documentation_embedding(doc_embedding_create, db=session)
-                    total_chunks_processed += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing chunk: {str(e)}")
-                    # Continue with other chunks
-            
+            url_chunks = await create_documentation_chunks(url)
+            logger.info(f"Created {len(url_chunks)} chunks for {url}")
+            chunks.extend(url_chunks)
         except Exception as e:
             logger.error(f"Error processing URL {url}: {str(e)}")
             # Continue with other URLs
     
+    # Create embeddings for all chunks in batched, concurrent requests
+    embedder_config = {
+        'provider': 'databricks',
+        'config': {'model': EMBEDDING_MODEL}
+    }
+    try:
+        embeddings = await LLMManager.get_embeddings(
+            [chunk["content"] for chunk in chunks],
+            model=EMBEDDING_MODEL,
+            embedder_config=embedder_config
+        )
+    except Exception as e:
+        logger.warning(f"Error with LLMManager.get_embeddings: {str(e)}. Using mock embeddings instead.")
+        embeddings = [None] * len(chunks)
+    
+    # Store each chunk with its embedding
+    total_chunks_processed = 0
+    
+    for chunk, embedding in zip(chunks, embeddings):
+        try:
+            if embedding is None:
+                embedding = await mock_create_embedding(chunk["content"])
+            
+            # Create schema for database record
+            doc_embedding_create = DocumentationEmbeddingCreate(
+                source=chunk["source"],
+                title=chunk["title"],
+                content=chunk["content"],
+                embedding=embedding,
+                doc_metadata={
+                    "page_name": chunk["source"].split('/')[-1].capitalize(),
+                    "chunk_index": chunk["chunk_index"],
+                    "total_chunks": chunk["total_chunks"]
+                }
+            )
+            
+            # Use service to create the record
+            await doc_embedding_service.create_documentation_embedding(doc_embedding_create, db=session)
+            total_chunks_processed += 1
+            
+        except Exception as e:
+            logger.error(f"Error processing chunk: {str(e)}")
+            # Continue with other chunks
+    
     logger.info(f"Completed seeding documentation embeddings: {total_chunks_processed} chunks processed")
 
 async def seed_async():
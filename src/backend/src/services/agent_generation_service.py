@@ -13,13 +13,12 @@ import traceback
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-import litellm
-
 from src.models.log import LLMLog
 from src.utils.prompt_utils import robust_json_parser
 from src.services.template_service import TemplateService
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.llm_response_cache import cached_acompletion
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -183,7 +182,7 @@ class AgentGenerationService:
         # Generate completion with litellm directly
         try:
             # Use the rate limit handler utility to handle potential rate limit errors
-            response = await litellm.acompletion(
+            response = await cached_acompletion(
                 **model_params,
                 messages=messages,
                 temperature=0.7,
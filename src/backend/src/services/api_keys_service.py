@@ -7,15 +7,17 @@ and managing API keys stored in the local database.
 
 import logging
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.core.base_service import BaseService
+from src.core.llm_config_cache import get_llm_config_cache
 from src.models.api_key import ApiKey
 from src.repositories.api_key_repository import ApiKeyRepository
 from src.schemas.api_key import ApiKeyCreate, ApiKeyUpdate
 from src.utils.encryption_utils import EncryptionUtils
+from src.utils.secret_cache import get_secret_cache
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -98,6 +100,8 @@ class ApiKeysService(BaseService):
         
         # Save to database
         created_key = await self.repository.create(api_key_dict)
+        get_secret_cache().invalidate(api_key_data.name)
+        get_llm_config_cache().invalidate()
         
         # For the response, we need to set the decrypted value
         # This won't be saved to the database, it's just for the API response
@@ -131,6 +135,8 @@ class ApiKeysService(BaseService):
         
         # Update in database
         updated_key = await self.repository.update(api_key.id, update_dict)
+        get_secret_cache().invalidate(name)
+        get_llm_config_cache().invalidate()
         
         # For the response, we need to set the decrypted value
         # This won't be saved to the database, it's just for the API response
@@ -154,7 +160,10 @@ class ApiKeysService(BaseService):
             return False
         
         # Delete from database
-        return await self.repository.delete(api_key.id)
+        deleted = await self.repository.delete(api_key.id)
+        get_secret_cache().invalidate(name)
+        get_llm_config_cache().invalidate()
+        return deleted
     
     async def get_all_api_keys(self) -> List[ApiKey]:
         """
@@ -194,6 +203,26 @@ class ApiKeysService(BaseService):
             key_name = db
             db = None
         
+        found, value = get_secret_cache().lookup(key_name)
+        if found:
+            return value
+        
+        return await cls._load_decrypted_value(key_name)
+    
+    @classmethod
+    async def _load_decrypted_value(cls, key_name: str) -> Optional[str]:
+        """
+        Read and decrypt an API key from the database and cache the result.
+        
+        Args:
+            key_name: Name of the API key
+            
+        Returns:
+            Decrypted API key value if found, else None
+        """
+        cache = get_secret_cache()
+        version = cache.version
+        
         # Create a service instance using UnitOfWork pattern
         from src.core.unit_of_work import UnitOfWork
         async with UnitOfWork() as uow:
@@ -202,14 +231,17 @@ class ApiKeysService(BaseService):
             # Find the API key
             api_key = await service.find_by_name(key_name)
             if not api_key:
+                cache.put(key_name, None, version)
                 return None
             
             # Decrypt and return the value
             try:
-                return EncryptionUtils.decrypt_value(api_key.encrypted_value)
+                value = EncryptionUtils.decrypt_value(api_key.encrypted_value)
             except Exception as e:
                 logger.error(f"Error decrypting API key '{key_name}': {str(e)}")
                 return None
+            cache.put(key_name, value, version)
+            return value
     
     @classmethod
     async def setup_provider_api_key(cls, db: AsyncSession, key_name: str) -> bool:
@@ -247,6 +279,13 @@ class ApiKeysService(BaseService):
         Returns:
             True if successful, False otherwise
         """
+        cache = get_secret_cache()
+        found, value = cache.lookup(key_name)
+        if found and value:
+            os.environ[key_name] = value
+            return True
+        version = cache.version
+        
         # Create a service instance with a synchronous session
         service = ApiKeysService(db)
         
@@ -258,6 +297,7 @@ class ApiKeysService(BaseService):
             if api_key and api_key.encrypted_value:
                 # Decrypt the value
                 value = EncryptionUtils.decrypt_value(api_key.encrypted_value)
+                cache.put(key_name, value, version)
                 
                 # Set as environment variable
                 os.environ[key_name] = value
@@ -400,6 +440,16 @@ class ApiKeysService(BaseService):
             await cls.setup_deepseek_api_key()
             await cls.setup_gemini_api_key()
     
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the decrypted secret cache.
+        
+        Returns:
+            Dictionary of cache statistics
+        """
+        return get_secret_cache().get_stats()
+    
     @classmethod
     async def from_unit_of_work(cls, uow):
         """
@@ -426,25 +476,14 @@ class ApiKeysService(BaseService):
             Decrypted API key if found, None otherwise
         """
         try:
-            # Create a service instance using UnitOfWork pattern
-            from src.core.unit_of_work import UnitOfWork
-            async with UnitOfWork() as uow:
-                service = await cls.from_unit_of_work(uow)
-                
-                # Find the API key by name (provider name with _API_KEY suffix)
-                key_name = f"{provider.upper()}_API_KEY"
-                api_key = await service.find_by_name(key_name)
-                if not api_key:
-                    logger.warning(f"No API key found for provider: {provider}")
-                    return None
-                
-                # Decrypt the API key value
-                try:
-                    decrypted_value = EncryptionUtils.decrypt_value(api_key.encrypted_value)
-                    return decrypted_value
-                except Exception as e:
-                    logger.error(f"Error decrypting API key for provider {provider}: {str(e)}")
-                    return None
+            # Find the API key by name (provider name with _API_KEY suffix)
+            key_name = f"{provider.upper()}_API_KEY"
+            found, value = get_secret_cache().lookup(key_name)
+            if not found:
+                value = await cls._load_decrypted_value(key_name)
+            if value is None:
+                logger.warning(f"No API key found for provider: {provider}")
+            return value
                     
         except Exception as e:
             logger.error(f"Error getting provider API key: {str(e)}")
@@ -14,8 +14,6 @@ import uuid
 from typing import Dict, Any, List, Tuple, Optional
 
 
-import litellm
-
 from src.utils.prompt_utils import robust_json_parser
 from src.services.template_service import TemplateService
 from src.services.tool_service import ToolService
@@ -23,6 +21,7 @@ from src.services.documentation_embedding_service import DocumentationEmbeddingS
 from src.schemas.crew import CrewGenerationRequest, CrewGenerationResponse
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.llm_response_cache import cached_acompletion
 from src.models.agent import Agent
 from src.models.task import Task
 from src.repositories.crew_generator_repository import CrewGeneratorRepository
@@ -453,7 +452,7 @@ class CrewGenerationService:
                 # Generate completion with litellm
                 try:
                     logger.info("CREATE CREW: Calling LLM API...")
-                    response = await litellm.acompletion(
+                    response = await cached_acompletion(
                         **model_params,
                         messages=messages,
                         temperature=0.7,
@@ -22,6 +22,7 @@ from src.repositories.flow_repository import SyncFlowRepository, get_sync_flow_r
 from src.engines.factory import EngineFactory
 from src.engines.crewai.crewai_engine_service import CrewAIEngineService
 from src.services.execution_status_service import ExecutionStatusService
+from src.services.execution_admission import ExecutionTrigger, get_admission_controller
 from src.engines.crewai.crewai_flow_service import CrewAIFlowService
 
 
@@ -60,18 +61,25 @@ class CrewAIExecutionService:
     async def prepare_and_run_crew(
         self,
         execution_id: str,
-        config: CrewConfig
+        config: CrewConfig,
+        trigger_type: str = ExecutionTrigger.API.value
     ) -> Dict[str, Any]:
         """
         Prepare and run a crew execution.
         
+        Waits for admission before preparing; the admission slot is held
+        until the crew task finishes.
+        
         Args:
             execution_id: ID of the execution
             config: Configuration for the crew
+            trigger_type: What started the execution (api, schedule or flow)
             
         Returns:
             Dictionary with execution results
         """
+        admission = get_admission_controller()
+        await admission.acquire(execution_id, trigger=trigger_type, model=config.model)
         try:
             # Update status to PREPARING
             await ExecutionStatusService.update_status(
@@ -98,11 +106,19 @@ class CrewAIExecutionService:
             # The engine will update the status to COMPLETED or FAILED when done
             result = await engine.run_execution(execution_id, config)
             
+            # Hold the admission slot until the crew task completes
+            execution_task = engine.get_execution_task(execution_id)
+            if execution_task is not None:
+                execution_task.add_done_callback(lambda _: admission.release(execution_id))
+            else:
+                admission.release(execution_id)
+            
             # Return the execution ID - do NOT update status to COMPLETED here
             # as the execution is running asynchronously and will be updated by the engine
             return {"execution_id": execution_id, "status": ExecutionStatus.RUNNING.value}
             
         except Exception as e:
+            admission.release(execution_id)
             # Update status to FAILED
             await ExecutionStatusService.update_status(
                 job_id=execution_id,
@@ -133,13 +149,19 @@ class CrewAIExecutionService:
             
         return engine
     
-    async def run_crew_execution(self, execution_id: str, config: CrewConfig) -> Dict[str, Any]:
+    async def run_crew_execution(
+        self,
+        execution_id: str,
+        config: CrewConfig,
+        trigger_type: str = ExecutionTrigger.API.value
+    ) -> Dict[str, Any]:
         """
         Run a crew execution with the provided configuration.
         
         Args:
             execution_id: Unique ID for the execution
             config: Configuration for the execution
+            trigger_type: What started the execution (api, schedule or flow)
             
         Returns:
             Dictionary with execution results
@@ -149,7 +171,8 @@ class CrewAIExecutionService:
         # Create an asyncio task for executing the crew
         task = asyncio.create_task(self.prepare_and_run_crew(
             execution_id=execution_id,
-            config=config
+            config=config,
+            trigger_type=trigger_type
         ))
         
         # Store task reference to prevent garbage collection
@@ -254,6 +277,20 @@ class CrewAIExecutionService:
         if execution_id not in executions:
             crew_logger.warning(f"Execution {execution_id} not found in memory")
             return False
+        
+        # Executions still waiting for admission have no engine job yet
+        admission = get_admission_controller()
+        if admission.is_pending(execution_id):
+            admission.release(execution_id)
+            task = executions[execution_id].get("task")
+            if task:
+                task.cancel()
+            await self.update_execution_status(
+                execution_id,
+                ExecutionStatus.CANCELLED,
+                "Execution cancelled while queued"
+            )
+            return True
             
         # Get engine from factory
         engine = await EngineFactory.get_engine(
@@ -394,6 +431,14 @@ class CrewAIExecutionService:
             # Create a flow service instance
             flow_service = CrewAIFlowService()
             
+            # Wait for admission; the slot is released when the flow reaches a terminal status
+            admission = get_admission_controller()
+            await admission.acquire(
+                job_id,
+                trigger=ExecutionTrigger.FLOW.value,
+                model=execution_config.get('model')
+            )
+            
             # Run the flow
             try:
                 # Call the flow service to run the flow
@@ -403,9 +448,12 @@ class CrewAIExecutionService:
                     config=execution_config
                 )
                 
+                if isinstance(result, dict) and result.get("success") is False:
+                    admission.release(job_id)
                 crew_logger.info(f"Flow execution started successfully: {result}")
                 return result
             except Exception as e:
+                admission.release(job_id)
                 crew_logger.error(f"Error running flow execution: {e}", exc_info=True)
                 # Update status to FAILED
                 await ExecutionStatusService.update_status(
@@ -419,6 +467,7 @@ class CrewAIExecutionService:
                     "job_id": job_id
                 }
         except Exception as e:
+            get_admission_controller().release(job_id)
             crew_logger.error(f"Unexpected error in run_flow_execution: {e}", exc_info=True)
             await ExecutionStatusService.update_status(
                 job_id=job_id,
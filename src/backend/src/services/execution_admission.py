@@ -0,0 +1,250 @@
+"""
+Execution admission control.
+
+Caps how many executions run at once, globally and per model, so bursts of
+API calls or schedules do not start dozens of crews that hit provider rate
+limits together. Executions over the cap wait in a priority queue ordered by
+trigger type and age; waiting raises a trigger's priority over time so
+low-priority work is not starved.
+"""
+import asyncio
+import itertools
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from src.core.logger import LoggerManager
+
+logger = LoggerManager.get_instance().crew
+
+
+class ExecutionTrigger(str, Enum):
+    """What started an execution."""
+    API = "api"
+    SCHEDULE = "schedule"
+    FLOW = "flow"
+
+
+class _Ticket:
+    """A pending execution waiting for admission."""
+
+    __slots__ = ("execution_id", "trigger", "model", "enqueued_at", "seq", "loop", "future")
+
+    def __init__(self, execution_id: str, trigger: str, model: Optional[str], seq: int,
+                 loop: asyncio.AbstractEventLoop, future: asyncio.Future):
+        self.execution_id = execution_id
+        self.trigger = trigger
+        self.model = model
+        self.enqueued_at = time.monotonic()
+        self.seq = seq
+        self.loop = loop
+        self.future = future
+
+
+class ExecutionAdmissionController:
+    """
+    Admits executions under global and per-model concurrency caps.
+
+    A cap of 0 means unlimited. Pending executions are admitted in order of
+    their trigger priority (lower runs first) minus one level per
+    ``aging_seconds`` waited, then by arrival. An execution whose model is at
+    its cap does not hold up executions for other models behind it.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_per_model: Optional[Dict[str, int]] = None,
+        default_max_per_model: int = 0,
+        trigger_priorities: Optional[Dict[str, int]] = None,
+        aging_seconds: float = 0,
+    ):
+        self._max_concurrent = max_concurrent
+        self._max_per_model = max_per_model or {}
+        self._default_max_per_model = default_max_per_model
+        self._trigger_priorities = trigger_priorities or {
+            ExecutionTrigger.API.value: 0,
+            ExecutionTrigger.SCHEDULE.value: 1,
+            ExecutionTrigger.FLOW.value: 2,
+        }
+        self._aging_seconds = aging_seconds
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        # execution_id -> model of admitted executions
+        self._running: Dict[str, Optional[str]] = {}
+        self._running_by_model: Dict[Optional[str], int] = {}
+        self._pending: Dict[str, _Ticket] = {}
+
+    # --- Internal helpers (caller holds self._lock) ---
+
+    def _model_cap(self, model: Optional[str]) -> int:
+        return self._max_per_model.get(model, self._default_max_per_model) if model else 0
+
+    def _can_admit(self, model: Optional[str]) -> bool:
+        if self._max_concurrent > 0 and len(self._running) >= self._max_concurrent:
+            return False
+        cap = self._model_cap(model)
+        return cap <= 0 or self._running_by_model.get(model, 0) < cap
+
+    def _ordered_pending(self, now: float) -> List[_Ticket]:
+        lowest = max(self._trigger_priorities.values(), default=0) + 1
+
+        def sort_key(ticket: _Ticket):
+            priority = self._trigger_priorities.get(ticket.trigger, lowest)
+            if self._aging_seconds > 0:
+                priority -= (now - ticket.enqueued_at) / self._aging_seconds
+            return (priority, ticket.seq)
+
+        return sorted(self._pending.values(), key=sort_key)
+
+    def _admit(self, execution_id: str, model: Optional[str]) -> None:
+        self._running[execution_id] = model
+        self._running_by_model[model] = self._running_by_model.get(model, 0) + 1
+
+    def _dispatch(self) -> None:
+        """Admit pending executions in priority order while capacity allows."""
+        for ticket in self._ordered_pending(time.monotonic()):
+            if self._max_concurrent > 0 and len(self._running) >= self._max_concurrent:
+                break
+            if not self._can_admit(ticket.model):
+                continue
+            del self._pending[ticket.execution_id]
+            self._admit(ticket.execution_id, ticket.model)
+            waited = time.monotonic() - ticket.enqueued_at
+            logger.info(f"[ExecutionAdmissionController] Admitted {ticket.execution_id} ({ticket.trigger}) after {waited:.1f}s in queue")
+            _call_in_loop(ticket.loop, _resolve, ticket.future)
+
+    # --- Public API ---
+
+    async def acquire(self, execution_id: str, trigger: str = ExecutionTrigger.API.value,
+                      model: Optional[str] = None) -> None:
+        """
+        Wait until the execution may start.
+
+        Every successful acquire must be matched by ``release`` once the
+        execution finishes. Cancelling the waiting caller removes it from the queue.
+
+        Args:
+            execution_id: Execution ID
+            trigger: What started the execution (api, schedule or flow)
+            model: Model the execution runs on, for per-model caps
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if execution_id in self._running:
+                return
+            self._pending[execution_id] = _Ticket(execution_id, trigger, model, next(self._seq), loop, future)
+            self._dispatch()
+            if execution_id in self._running:
+                return
+            logger.info(f"[ExecutionAdmissionController] Queued {execution_id} ({trigger}, model={model}); {len(self._running)} running, {len(self._pending)} pending")
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            self.release(execution_id)
+            raise
+
+    def release(self, execution_id: str) -> None:
+        """
+        Free the slot of a finished execution, or withdraw a pending one.
+
+        Safe to call more than once and for executions that were never admitted.
+
+        Args:
+            execution_id: Execution ID
+        """
+        with self._lock:
+            ticket = self._pending.pop(execution_id, None)
+            if ticket is not None:
+                _call_in_loop(ticket.loop, ticket.future.cancel)
+                return
+            if execution_id not in self._running:
+                return
+            model = self._running.pop(execution_id)
+            self._running_by_model[model] -= 1
+            if self._running_by_model[model] <= 0:
+                del self._running_by_model[model]
+            self._dispatch()
+
+    def is_pending(self, execution_id: str) -> bool:
+        """Check whether an execution is waiting for admission."""
+        with self._lock:
+            return execution_id in self._pending
+
+    def get_queue_position(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the queue position of a pending execution.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Dictionary with 1-based position, seconds queued and trigger,
+            or None if the execution is not waiting
+        """
+        with self._lock:
+            ticket = self._pending.get(execution_id)
+            if ticket is None:
+                return None
+            now = time.monotonic()
+            position = self._ordered_pending(now).index(ticket) + 1
+            return {
+                "position": position,
+                "queued_seconds": now - ticket.enqueued_at,
+                "trigger": ticket.trigger,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get running and pending counts.
+
+        Returns:
+            Dictionary with running/pending totals and running counts per model
+        """
+        with self._lock:
+            return {
+                "running": len(self._running),
+                "pending": len(self._pending),
+                "max_concurrent": self._max_concurrent,
+                "running_by_model": {str(model): count for model, count in self._running_by_model.items()},
+            }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _call_in_loop(loop: asyncio.AbstractEventLoop, callback, *args) -> None:
+    """Run callback now if on loop's thread, otherwise schedule it thread-safely."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        callback(*args)
+    else:
+        loop.call_soon_threadsafe(callback, *args)
+
+
+_controller: Optional[ExecutionAdmissionController] = None
+_controller_lock = threading.Lock()
+
+# Function to get the singleton controller instance easily
+def get_admission_controller() -> ExecutionAdmissionController:
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                from src.config.settings import settings
+                _controller = ExecutionAdmissionController(
+                    max_concurrent=settings.EXECUTION_MAX_CONCURRENT,
+                    max_per_model=settings.EXECUTION_MAX_CONCURRENT_PER_MODEL,
+                    default_max_per_model=settings.EXECUTION_DEFAULT_MAX_CONCURRENT_PER_MODEL,
+                    trigger_priorities=settings.EXECUTION_TRIGGER_PRIORITIES,
+                    aging_seconds=settings.EXECUTION_PRIORITY_AGING_SECONDS,
+                )
+    return _controller
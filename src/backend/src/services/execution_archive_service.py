@@ -0,0 +1,370 @@
+"""
+Retention and archival of execution logs and traces.
+
+Logs and traces are only read while an execution is fresh, but they make up
+almost all rows of the database. Once a finished execution is older than the
+retention period, ``ExecutionArchiver`` writes its logs and traces to
+gzip-compressed NDJSON files (``<job_id>.logs.ndjson.gz`` and
+``<job_id>.traces.ndjson.gz``), deletes them from the hot tables in bounded
+batches and stamps ``executionhistory.archived_at``. The execution itself
+stays listed; the log and trace endpoints fall back to the archive when an
+execution has no rows left in the hot tables. On SQLite, a run that moved rows
+is followed by a compaction that returns the freed pages to the file system.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import DateTime, and_
+
+from src.core.logger import LoggerManager
+from src.db.session import compact_sqlite_database
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_trace import ExecutionTrace
+from src.repositories.execution_archive_repository import ExecutionArchiveRepository
+from src.repositories.execution_purge_repository import PURGE_MODELS, ExecutionPurgeRepository
+from src.utils.asyncio_utils import execute_db_operation
+
+logger = LoggerManager.get_instance().system
+
+# Archive kinds and the model of their records
+ARCHIVE_MODELS = {
+    "logs": ExecutionLog,
+    "traces": ExecutionTrace,
+}
+
+
+def _to_record(row: Any) -> Dict[str, Any]:
+    record = {}
+    for column in row.__table__.columns:
+        value = getattr(row, column.name)
+        record[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    return record
+
+
+def _from_record(model: Type[Any], record: Dict[str, Any]) -> Any:
+    values = {}
+    for column in model.__table__.columns:
+        if column.name not in record:
+            continue
+        value = record[column.name]
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.name] = value
+    return model(**values)
+
+
+class ExecutionArchiver:
+    """
+    Moves the logs and traces of old executions to compressed NDJSON archives.
+
+    ``archive_due`` archives up to ``executions_per_run`` due executions; the
+    retention loop started by ``start`` calls it every ``interval_seconds``.
+    Rows are read and deleted ``batch_size`` at a time. The most recently read
+    archives are cached so paging through one does not decompress it per page.
+    With ``sqlite_path`` set, the database file is compacted after a run that
+    moved rows; ``full_vacuum`` allows a VACUUM where incremental vacuum is off.
+    """
+
+    def __init__(
+        self,
+        archive_dir: str,
+        retention_days: int = 30,
+        batch_size: int = 1000,
+        executions_per_run: int = 50,
+        interval_seconds: float = 3600.0,
+        cache_size: int = 8,
+        sqlite_path: Optional[str] = None,
+        full_vacuum: bool = False,
+    ):
+        self._archive_dir = archive_dir
+        self._retention_days = retention_days
+        self._batch_size = max(1, batch_size)
+        self._executions_per_run = max(1, executions_per_run)
+        self._interval_seconds = interval_seconds
+        self._cache_size = max(1, cache_size)
+        self._sqlite_path = sqlite_path
+        self._full_vacuum = full_vacuum
+        self._cache_lock = threading.Lock()
+        # (job_id, kind) -> (file mtime, records)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._stopping: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def archive_path(self, job_id: str, kind: str) -> str:
+        """
+        Get the archive file of one kind of an execution's rows.
+
+        Args:
+            job_id: Job ID of the execution
+            kind: "logs" or "traces"
+
+        Returns:
+            Path of the archive file
+
+        Raises:
+            ValueError: If the job ID could escape the archive directory
+        """
+        if not job_id or os.path.basename(job_id) != job_id or job_id.startswith("."):
+            raise ValueError(f"Invalid job ID for archive: {job_id}")
+        return os.path.join(self._archive_dir, f"{job_id}.{kind}.ndjson.gz")
+
+    def _read(self, job_id: str, kind: str) -> List[Dict[str, Any]]:
+        path = self.archive_path(job_id, kind)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return []
+        key = (job_id, kind)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                self._cache.move_to_end(key)
+                return cached[1]
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle if line.strip()]
+        with self._cache_lock:
+            self._cache[key] = (mtime, records)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return records
+
+    async def get_archived(self, job_id: str, kind: str) -> List[Any]:
+        """
+        Get the archived rows of an execution as detached model instances.
+
+        Args:
+            job_id: Job ID of the execution
+            kind: "logs" or "traces"
+
+        Returns:
+            ExecutionLog or ExecutionTrace instances, empty if nothing was archived
+        """
+        model = ARCHIVE_MODELS[kind]
+        try:
+            path = self.archive_path(job_id, kind)
+        except ValueError:
+            return []
+        if not os.path.exists(path):
+            return []
+        records = await asyncio.to_thread(self._read, job_id, kind)
+        return [_from_record(model, record) for record in records]
+
+    async def _write_archive(self, run_id: int, job_id: str, kind: str) -> Tuple[int, Optional[int]]:
+        # Rows already archived by an interrupted earlier run are kept
+        path = self.archive_path(job_id, kind)
+        existing = await asyncio.to_thread(self._read, job_id, kind)
+        archived_ids = {record["id"] for record in existing}
+        temp_path = f"{path}.tmp"
+        handle = await asyncio.to_thread(gzip.open, temp_path, "wt", encoding="utf-8")
+        written = 0
+        max_id = None
+        try:
+            if existing:
+                await asyncio.to_thread(handle.write, "".join(json.dumps(record) + "\n" for record in existing))
+            after_id = 0
+            while True:
+                if kind == "logs":
+                    rows = await execute_db_operation(
+                        lambda session: ExecutionArchiveRepository(session).get_logs(job_id, after_id, self._batch_size)
+                    )
+                else:
+                    rows = await execute_db_operation(
+                        lambda session: ExecutionArchiveRepository(session).get_traces(
+                            run_id, job_id, after_id, self._batch_size
+                        )
+                    )
+                if not rows:
+                    break
+                after_id = max_id = rows[-1].id
+                lines = [json.dumps(_to_record(row)) + "\n" for row in rows if row.id not in archived_ids]
+                await asyncio.to_thread(handle.write, "".join(lines))
+                written += len(lines)
+        finally:
+            await asyncio.to_thread(handle.close)
+        if written or existing:
+            os.replace(temp_path, path)
+        else:
+            os.remove(temp_path)
+        return written, max_id
+
+    async def archive_execution(self, run_id: int, job_id: str) -> Dict[str, int]:
+        """
+        Move an execution's logs and traces to its archive files.
+
+        The files are complete before any row is deleted, and only rows that
+        were written to them are deleted.
+
+        Args:
+            run_id: Database ID of the execution
+            job_id: Job ID of the execution
+
+        Returns:
+            Number of archived rows per kind
+        """
+        os.makedirs(self._archive_dir, exist_ok=True)
+        archived = {}
+        max_ids = {}
+        for kind in ARCHIVE_MODELS:
+            archived[kind], max_ids[kind] = await self._write_archive(run_id, job_id, kind)
+
+        tables = {"execution_logs": "logs", "execution_trace": "traces"}
+        for table, condition in ExecutionArchiveRepository.hot_conditions(run_id, job_id):
+            max_id = max_ids[tables[table]]
+            if max_id is None:
+                continue
+            condition = and_(condition, PURGE_MODELS[table].id <= max_id)
+            while True:
+                deleted = await execute_db_operation(
+                    lambda session: ExecutionPurgeRepository(session).delete_batch(
+                        table, condition, self._batch_size
+                    )
+                )
+                if deleted < self._batch_size:
+                    break
+                await asyncio.sleep(0)
+
+        await execute_db_operation(
+            lambda session: ExecutionArchiveRepository(session).mark_archived(run_id, datetime.utcnow())
+        )
+        return archived
+
+    async def archive_due(self) -> int:
+        """
+        Archive finished executions older than the retention period.
+
+        Returns:
+            Number of executions archived
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self._retention_days)
+        due = await execute_db_operation(
+            lambda session: ExecutionArchiveRepository(session).get_due_executions(cutoff, self._executions_per_run)
+        )
+        count = 0
+        moved_rows = 0
+        for run_id, job_id in due:
+            try:
+                archived = await self.archive_execution(run_id, job_id)
+                count += 1
+                moved_rows += sum(archived.values())
+                logger.info(f"[ExecutionArchiver] Archived execution {job_id}: {archived}")
+            except Exception as e:
+                logger.error(f"[ExecutionArchiver] Error archiving execution {job_id}: {e}", exc_info=True)
+        if moved_rows:
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.error(f"[ExecutionArchiver] Error compacting the database: {e}", exc_info=True)
+        return count
+
+    async def compact(self) -> int:
+        """
+        Return the pages freed by archiving to the file system.
+
+        Returns:
+            Number of free pages released, 0 if the database is not SQLite
+        """
+        if not self._sqlite_path:
+            return 0
+        released = await asyncio.to_thread(compact_sqlite_database, self._sqlite_path, self._full_vacuum)
+        logger.info(f"[ExecutionArchiver] Compacted {self._sqlite_path}, released {released} free pages")
+        return released
+
+    def delete(self, job_ids: List[str]) -> int:
+        """
+        Delete the archive files of executions.
+
+        Args:
+            job_ids: Job IDs of the executions
+
+        Returns:
+            Number of files deleted
+        """
+        deleted = 0
+        for job_id in job_ids:
+            for kind in ARCHIVE_MODELS:
+                try:
+                    os.remove(self.archive_path(job_id, kind))
+                    deleted += 1
+                except (OSError, ValueError):
+                    pass
+        with self._cache_lock:
+            self._cache.clear()
+        return deleted
+
+    def delete_all(self) -> int:
+        """
+        Delete every archive file.
+
+        Returns:
+            Number of files deleted
+        """
+        if not os.path.isdir(self._archive_dir):
+            return 0
+        job_ids = {name.split(".", 1)[0] for name in os.listdir(self._archive_dir) if name.endswith(".ndjson.gz")}
+        return self.delete(sorted(job_ids))
+
+    async def run(self) -> None:
+        """Archive due executions every interval until stop() is called."""
+        self._stopping = asyncio.Event()
+        logger.info(f"[ExecutionArchiver] Archiving executions older than {self._retention_days} days to {self._archive_dir}")
+        while not self._stopping.is_set():
+            try:
+                # Keep going while full runs show a backlog
+                while await self.archive_due() >= self._executions_per_run and not self._stopping.is_set():
+                    pass
+            except Exception as e:
+                logger.error(f"[ExecutionArchiver] Error archiving executions: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> asyncio.Task:
+        """Start the retention loop in a task on the running loop."""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self.run())
+        return self._loop_task
+
+    async def stop(self) -> None:
+        """Stop the retention loop."""
+        if self._stopping is not None:
+            self._stopping.set()
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+
+
+_archiver: Optional[ExecutionArchiver] = None
+_archiver_lock = threading.Lock()
+
+# Function to get the singleton archiver instance easily
+def get_execution_archiver() -> ExecutionArchiver:
+    global _archiver
+    if _archiver is None:
+        with _archiver_lock:
+            if _archiver is None:
+                from src.config.settings import settings
+                archive_dir = settings.EXECUTION_ARCHIVE_DIR or str(
+                    pathlib.Path(__file__).parent.parent.parent / "archives" / "executions"
+                )
+                _archiver = ExecutionArchiver(
+                    archive_dir=archive_dir,
+                    retention_days=settings.EXECUTION_RETENTION_DAYS,
+                    batch_size=settings.EXECUTION_PURGE_BATCH_SIZE,
+                    executions_per_run=settings.EXECUTION_RETENTION_BATCH,
+                    interval_seconds=settings.EXECUTION_RETENTION_INTERVAL_SECONDS,
+                    sqlite_path=(
+                        settings.SQLITE_DB_PATH if str(settings.DATABASE_URI).startswith("sqlite") else None
+                    ),
+                    full_vacuum=settings.EXECUTION_ARCHIVE_VACUUM,
+                )
+    return _archiver
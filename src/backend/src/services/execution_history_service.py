@@ -9,17 +9,23 @@ from typing import Optional
 import logging
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.config.settings import settings
 from src.repositories.execution_logs_repository import execution_logs_repository
 from src.repositories.execution_trace_repository import execution_trace_repository
 from src.repositories.execution_history_repository import execution_history_repository
+from src.services.execution_purge_service import find_executions, get_execution_purger
+from src.services.execution_archive_service import get_execution_archiver
+from src.utils.pagination import next_cursor, paginate_rows
 from src.schemas.execution_history import (
     ExecutionHistoryItem, 
     ExecutionHistoryList,
+    ExecutionResult,
     ExecutionOutput,
     ExecutionOutputList,
     ExecutionOutputDebug,
     ExecutionOutputDebugList,
-    DeleteResponse
+    DeleteResponse,
+    PurgeStatusResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -45,27 +51,49 @@ class ExecutionHistoryService:
         self.logs_repo = execution_logs_repository
         self.trace_repo = execution_trace_repository
     
-    async def get_execution_history(self, limit: int = 50, offset: int = 0) -> ExecutionHistoryList:
+    async def get_execution_history(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        summary: bool = False
+    ) -> ExecutionHistoryList:
         """
         Get paginated execution history.
         
         Args:
             limit: Maximum number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Whether to count all executions
+            summary: Return a result preview instead of inputs and full results
             
         Returns:
             ExecutionHistoryList with paginated execution history items and metadata
         """
         try:
+            preview_chars = settings.EXECUTION_HISTORY_RESULT_PREVIEW_CHARS
             # Use the repository to get the paginated data and total count
             runs, total_count = await self.history_repo.get_execution_history(
                 limit=limit,
-                offset=offset
+                offset=offset,
+                cursor=cursor,
+                include_total=include_total,
+                summary=summary,
+                preview_chars=preview_chars
             )
                 
             # Convert each run to a pydantic model, handling string results properly
             execution_items = []
             for run in runs:
+                if summary:
+                    item = dict(run._mapping)
+                    preview = item.pop("result_preview")
+                    item["result_truncated"] = preview is not None and len(preview) > preview_chars
+                    item["result_preview"] = preview[:preview_chars] if preview is not None else None
+                    execution_items.append(ExecutionHistoryItem.model_validate(item))
+                    continue
                 if hasattr(run, 'result') and isinstance(run.result, str):
                     # Convert string result to a dictionary with the content field
                     run_dict = run.__dict__.copy()
@@ -79,7 +107,8 @@ class ExecutionHistoryService:
                 executions=execution_items,
                 total=total_count,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                next_cursor=next_cursor(runs, limit, "created_at")
             )
             
         except SQLAlchemyError as e:
@@ -123,6 +152,31 @@ class ExecutionHistoryService:
             logger.error(f"Error retrieving execution {execution_id}: {str(e)}", exc_info=True)
             raise
     
+    async def get_execution_result(self, job_id: str) -> Optional[ExecutionResult]:
+        """
+        Get the full result of an execution, for lists fetched in summary mode.
+        
+        Args:
+            job_id: String ID of the execution
+            
+        Returns:
+            ExecutionResult or None if not found
+        """
+        try:
+            found, result = await self.history_repo.get_execution_result_by_job_id(job_id)
+            if not found:
+                return None
+            if isinstance(result, str):
+                result = {"content": result}
+            return ExecutionResult(job_id=job_id, result=result)
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error retrieving result of execution {job_id}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving result of execution {job_id}: {str(e)}", exc_info=True)
+            raise
+    
     async def check_execution_exists(self, execution_id: int) -> bool:
         """
         Check if an execution exists.
@@ -150,7 +204,9 @@ class ExecutionHistoryService:
         self, 
         execution_id: str, 
         limit: int = 1000, 
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> ExecutionOutputList:
         """
         Get outputs for an execution.
@@ -158,24 +214,36 @@ class ExecutionHistoryService:
         Args:
             execution_id: String ID of the execution (job_id in database)
             limit: Maximum number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Whether to count all outputs of the execution
             
         Returns:
             ExecutionOutputList with paginated execution outputs
         """
         try:
             # Get logs from our repository
-            logs = await self.logs_repo.get_by_execution_id(
+            logs = await self.logs_repo.get_by_execution_id_with_managed_session(
                 execution_id=execution_id,
                 limit=limit,
                 offset=offset,
-                newest_first=True
+                newest_first=True,
+                cursor=cursor
             )
+            archived = None
+            if not logs:
+                # Executions past the retention period are read from their archive
+                archived = await get_execution_archiver().get_archived(execution_id, "logs")
+                logs = paginate_rows(archived, "timestamp", limit, offset, cursor)
                 
             # Get total count
-            total_count = await self.logs_repo.count_by_execution_id(
-                execution_id=execution_id
-            )
+            total_count = None
+            if archived:
+                total_count = len(archived)
+            elif include_total:
+                total_count = await self.logs_repo.count_by_execution_id_with_managed_session(
+                    execution_id=execution_id
+                )
             
             # Convert to schema objects
             output_items = [
@@ -192,7 +260,8 @@ class ExecutionHistoryService:
                 outputs=output_items,
                 limit=limit,
                 offset=offset,
-                total=total_count
+                total=total_count,
+                next_cursor=next_cursor(logs, limit, "timestamp")
             )
             
         except SQLAlchemyError as e:
@@ -249,123 +318,81 @@ class ExecutionHistoryService:
     
     async def delete_all_executions(self) -> DeleteResponse:
         """
-        Delete all executions and their associated data.
+        Start purging all executions and their associated data in the background.
         
         Returns:
-            DeleteResponse with information about the deleted data
+            DeleteResponse with the ID of the purge
         """
-        try:
-            logger.info("Attempting to delete all executions and their associated data")
-            
-            # Delete all traces first to avoid foreign key constraint violations
-            trace_count = await self.trace_repo.delete_all()
-            
-            # Delete all logs
-            log_count = await self.logs_repo.delete_all_with_managed_session()
-            
-            # Delete all executions and associated data last (after dependent records are gone)
-            result = await self.history_repo.delete_all_executions()
-            
-            return DeleteResponse(
-                success=True,
-                message=f"Deleted {result['run_count']} executions, {result['task_status_count']} task statuses, "
-                        f"{result['error_trace_count']} error traces, {log_count} logs, and {trace_count} traces."
-            )
-            
-        except SQLAlchemyError as e:
-            logger.error(f"Database error deleting all executions: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting all executions: {str(e)}")
-            raise
+        logger.info("Starting purge of all executions and their associated data")
+        purge_id = await get_execution_purger().start()
+        return DeleteResponse(
+            message=f"Purge {purge_id} of all executions started.",
+            purge_id=purge_id
+        )
     
-    async def delete_execution(self, execution_id: int) -> DeleteResponse:
+    async def delete_execution(self, execution_id: int) -> Optional[DeleteResponse]:
         """
-        Delete a specific execution and its associated data.
+        Start purging a specific execution and its associated data in the background.
         
         Args:
             execution_id: ID of the execution to delete
             
         Returns:
-            DeleteResponse with information about the deleted data
+            DeleteResponse with the ID of the purge, or None if not found
         """
         try:
-            logger.info(f"Attempting to delete execution {execution_id} and its associated data")
-            
-            # First get the job_id
-            run = await self.history_repo.get_execution_by_id(execution_id)
-            if not run:
-                return None
-                
-            job_id = run.job_id
-            
-            # Delete associated traces first (to avoid foreign key constraint violations)
-            trace_count = await self.trace_repo.delete_by_job_id(job_id)
-            
-            # Delete execution logs - use the managed session version
-            output_count = await self.logs_repo.delete_by_execution_id_with_managed_session(job_id)
-            
-            # Delete execution using repository (after dependent records are gone)
-            result = await self.history_repo.delete_execution(execution_id)
-            
-            return DeleteResponse(
-                success=True,
-                message=f"Deleted execution {execution_id} (job_id: {job_id}), "
-                        f"{result['task_status_count']} task statuses, "
-                        f"{result['error_trace_count']} error traces, "
-                        f"{trace_count} traces, and {output_count} logs."
-            )
-            
+            executions = await find_executions(run_ids=[execution_id])
         except SQLAlchemyError as e:
-            logger.error(f"Database error deleting execution {execution_id}: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting execution {execution_id}: {str(e)}")
+            logger.error(f"Database error looking up execution {execution_id}: {str(e)}")
             raise
+        if not executions:
+            return None
+        return await self._start_purge(executions)
     
-    async def delete_execution_by_job_id(self, job_id: str) -> DeleteResponse:
+    async def delete_execution_by_job_id(self, job_id: str) -> Optional[DeleteResponse]:
         """
-        Delete a specific execution and its associated data by job_id (UUID).
+        Start purging a specific execution and its associated data by job_id (UUID) in the background.
         
         Args:
             job_id: The job_id (UUID) of the execution
             
         Returns:
-            DeleteResponse with information about the deleted data
+            DeleteResponse with the ID of the purge, or None if not found
         """
         try:
-            logger.info(f"Attempting to delete execution with job_id {job_id} and its associated data")
-            
-            # Check if the execution exists
-            run = await self.history_repo.get_execution_by_job_id(job_id)
-            if not run:
-                return None
-                
-            execution_id = run.id
-            
-            # Delete associated traces first (to avoid foreign key constraint violations)
-            trace_count = await self.trace_repo.delete_by_job_id(job_id)
-            
-            # Delete execution logs - use the managed session version
-            output_count = await self.logs_repo.delete_by_execution_id_with_managed_session(job_id)
-            
-            # Delete execution using repository (after dependent records are gone)
-            result = await self.history_repo.delete_execution_by_job_id(job_id)
-            
-            return DeleteResponse(
-                success=True,
-                message=f"Deleted execution {execution_id} (job_id: {job_id}), "
-                        f"{result['task_status_count']} task statuses, "
-                        f"{result['error_trace_count']} error traces, "
-                        f"{trace_count} traces, and {output_count} logs."
-            )
-            
+            executions = await find_executions(job_ids=[job_id])
         except SQLAlchemyError as e:
-            logger.error(f"Database error deleting execution with job_id {job_id}: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting execution with job_id {job_id}: {str(e)}")
+            logger.error(f"Database error looking up execution with job_id {job_id}: {str(e)}")
             raise
+        if not executions:
+            return None
+        return await self._start_purge(executions)
+    
+    async def _start_purge(self, executions) -> DeleteResponse:
+        execution_id, job_id = executions[0]
+        logger.info(f"Starting purge of execution {execution_id} (job_id: {job_id}) and its associated data")
+        purge_id = await get_execution_purger().start(executions)
+        return DeleteResponse(
+            message=f"Purge {purge_id} of execution {execution_id} (job_id: {job_id}) started.",
+            deleted_run_id=execution_id,
+            deleted_job_id=job_id,
+            purge_id=purge_id
+        )
+    
+    async def get_purge_status(self, purge_id: str) -> Optional[PurgeStatusResponse]:
+        """
+        Get the progress of an execution purge.
+        
+        Args:
+            purge_id: ID returned by a delete request
+            
+        Returns:
+            PurgeStatusResponse, or None if the purge is unknown
+        """
+        progress = await get_execution_purger().get_status(purge_id)
+        if progress is None:
+            return None
+        return PurgeStatusResponse(**progress)
     
     async def get_execution_by_job_id(self, job_id: str) -> Optional[ExecutionHistoryItem]:
         """
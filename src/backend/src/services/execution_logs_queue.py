@@ -1,6 +1,17 @@
 import queue
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from src.utils.bounded_queue import BoundedBridgeQueue, OverflowPolicy
+
+def _log_policy(log_data: Any) -> OverflowPolicy:
+    """Resolve the overflow policy for a log entry."""
+    from src.config.settings import settings
+    
+    # Non-log items (e.g. the None shutdown signal) are never dropped
+    if not isinstance(log_data, dict):
+        return OverflowPolicy.BLOCK
+    return OverflowPolicy(settings.LOG_QUEUE_POLICY)
 
 class JobOutputQueue:
     """Singleton holder for the job output queue."""
@@ -9,18 +20,30 @@ class JobOutputQueue:
 
     def __new__(cls):
         if cls._instance is None:
+            from src.config.settings import settings
+            
             cls._instance = super(JobOutputQueue, cls).__new__(cls)
-            cls._instance._queue = queue.Queue()
+            cls._instance._queue = BoundedBridgeQueue(
+                maxsize=settings.LOG_QUEUE_MAXSIZE,
+                policy_resolver=_log_policy,
+                block_timeout=settings.QUEUE_BLOCK_TIMEOUT_SECONDS,
+                sample_rate=settings.QUEUE_SAMPLE_RATE,
+                sample_high_watermark=settings.QUEUE_SAMPLE_HIGH_WATERMARK,
+            )
         return cls._instance
 
-    def get_queue(self) -> queue.Queue:
+    def get_queue(self) -> BoundedBridgeQueue:
         """Get the singleton queue instance."""
         return self._queue
 
 # Function to get the singleton queue instance easily
-def get_job_output_queue() -> queue.Queue:
+def get_job_output_queue() -> BoundedBridgeQueue:
     return JobOutputQueue().get_queue()
 
+def get_log_queue_job_stats(job_id: str) -> Optional[Dict[str, Any]]:
+    """Get drop and lag counters of the job output queue for a job, or None if unseen."""
+    return get_job_output_queue().get_job_stats(job_id)
+
 def enqueue_log(execution_id: str, content: str, timestamp: Optional[datetime] = None) -> bool:
     """
     Enqueue a log message to be processed by the logs writer.
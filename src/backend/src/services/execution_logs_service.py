@@ -9,16 +9,17 @@ import asyncio
 import json
 from typing import Dict, Set, List, Any, Optional
 from datetime import datetime
-from queue import Empty
 
 from fastapi import WebSocket
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logger import LoggerManager
 from src.models.execution_logs import ExecutionLog
-from src.schemas.execution_logs import LogMessage, ExecutionLogResponse
+from src.schemas.execution_logs import LogMessage, ExecutionLogResponse, ExecutionLogsResponse
 from src.repositories.execution_logs_repository import execution_logs_repository
 from src.services.execution_logs_queue import enqueue_log, get_job_output_queue
+from src.services.execution_archive_service import get_execution_archiver
+from src.utils.pagination import next_cursor, paginate_rows
 
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().system
@@ -40,6 +41,8 @@ class ExecutionLogsService:
         """Initialize the execution logs service."""
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self._lock = asyncio.Lock()
+        # Event loop serving the WebSockets, for live messages produced on other threads
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def connect(self, websocket: WebSocket, execution_id: str):
         """
@@ -50,6 +53,7 @@ class ExecutionLogsService:
             execution_id: ID of the execution to connect to
         """
         await websocket.accept()
+        self.loop = asyncio.get_running_loop()
         async with self._lock:
             if execution_id not in self.active_connections:
                 self.active_connections[execution_id] = set()
@@ -115,6 +119,37 @@ class ExecutionLogsService:
             logger.error("[create_execution_log] Exception details:", exc_info=True)
             return False
 
+    async def create_execution_logs(self, logs: List[Dict[str, Any]]) -> int:
+        """
+        Create several execution log entries in a single transaction.
+        
+        Falls back to row-at-a-time inserts if the bulk insert fails, so one
+        bad entry does not drop the whole batch.
+        
+        Args:
+            logs: List of dictionaries with execution_id, content and timestamp
+            
+        Returns:
+            int: Number of logs stored
+        """
+        if not logs:
+            return 0
+        
+        try:
+            return await execution_logs_repository.create_many_with_managed_session(logs)
+        except Exception as e:
+            logger.warning(f"[create_execution_logs] Bulk insert of {len(logs)} logs failed, retrying one by one: {e}")
+        
+        stored = 0
+        for log in logs:
+            if await self.create_execution_log(
+                execution_id=log["execution_id"],
+                content=log["content"],
+                timestamp=log.get("timestamp")
+            ):
+                stored += 1
+        return stored
+
     async def broadcast_to_execution(self, execution_id: str, message: str):
         """
         Broadcast a log message to all clients connected to an execution.
@@ -131,33 +166,55 @@ class ExecutionLogsService:
             logger.error(f"[broadcast_to_execution] Failed to enqueue log for execution {execution_id}")
 
         # Now handle WebSocket connections if any exist
-        if execution_id not in self.active_connections:
-            logger.debug(f"[broadcast_to_execution] No active connections for execution {execution_id}")
-            return
-
-        message_data = {
+        await self.send_live(execution_id, {
             "execution_id": execution_id,
             "content": message,
             "timestamp": datetime.utcnow().isoformat(),
             "type": "live"
-        }
+        })
 
-        logger.debug(f"[broadcast_to_execution] Broadcasting to {len(self.active_connections[execution_id])} connections")
+    def has_subscribers(self, execution_id: str) -> bool:
+        """
+        Check whether any client is connected to an execution's stream.
+        
+        Args:
+            execution_id: ID of the execution
+            
+        Returns:
+            True if at least one WebSocket is connected
+        """
+        return bool(self.active_connections.get(execution_id))
+
+    async def send_live(self, execution_id: str, message_data: Dict[str, Any]) -> None:
+        """
+        Send a message to the clients connected to an execution without storing it.
+        
+        Args:
+            execution_id: ID of the execution to send to
+            message_data: JSON-serializable message
+        """
+        connections = self.active_connections.get(execution_id)
+        if not connections:
+            logger.debug(f"[send_live] No active connections for execution {execution_id}")
+            return
+
+        logger.debug(f"[send_live] Sending to {len(connections)} connections")
+        text = json.dumps(message_data)
         disconnected = set()
-        for connection in self.active_connections[execution_id]:
+        for connection in list(connections):
             try:
-                await connection.send_text(json.dumps(message_data))
-                logger.debug("[broadcast_to_execution] Successfully sent message to connection")
+                await connection.send_text(text)
             except Exception as e:
-                logger.error(f"[broadcast_to_execution] Error sending message to client: {e}")
-                logger.error("[broadcast_to_execution] Stack trace:", exc_info=True)
+                logger.error(f"[send_live] Error sending message to client: {e}")
+                logger.error("[send_live] Stack trace:", exc_info=True)
                 disconnected.add(connection)
 
         # Clean up disconnected clients
         if disconnected:
-            logger.info(f"[broadcast_to_execution] Cleaned up {len(disconnected)} disconnected clients")
+            logger.info(f"[send_live] Cleaned up {len(disconnected)} disconnected clients")
             async with self._lock:
-                self.active_connections[execution_id] -= disconnected
+                if execution_id in self.active_connections:
+                    self.active_connections[execution_id] -= disconnected
 
     async def get_execution_logs(self, execution_id: str, limit: int = 1000, offset: int = 0) -> List[ExecutionLogResponse]:
         """
@@ -171,19 +228,50 @@ class ExecutionLogsService:
         Returns:
             List of execution log responses
         """
+        page = await self.get_execution_logs_page(execution_id, limit, offset)
+        return page.logs
+    
+    async def get_execution_logs_page(
+        self,
+        execution_id: str,
+        limit: int = 1000,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> ExecutionLogsResponse:
+        """
+        Fetch a page of historical execution logs, oldest first.
+        
+        Args:
+            execution_id: ID of the execution to fetch logs for
+            limit: Maximum number of logs to fetch
+            offset: Number of logs to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page for keyset pagination
+            
+        Returns:
+            Execution logs with the cursor of the next page
+        """
         logs = await execution_logs_repository.get_by_execution_id_with_managed_session(
             execution_id=execution_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
+        if not logs:
+            # Executions past the retention period are read from their archive
+            archived = await get_execution_archiver().get_archived(execution_id, "logs")
+            if archived:
+                logs = paginate_rows(archived, "timestamp", limit, offset, cursor, descending=False)
         
-        return [
-            ExecutionLogResponse(
-                content=log.content,
-                timestamp=log.timestamp.isoformat()
-            )
-            for log in logs
-        ]
+        return ExecutionLogsResponse(
+            logs=[
+                ExecutionLogResponse(
+                    content=log.content,
+                    timestamp=log.timestamp.isoformat()
+                )
+                for log in logs
+            ],
+            next_cursor=next_cursor(logs, limit, "timestamp")
+        )
     
     async def count_logs(self, execution_id: str) -> int:
         """
@@ -214,13 +302,42 @@ execution_logs_service = ExecutionLogsService()
 
 # --- Logs Writer Functions ---
 
+async def _flush_logs(pending: List[Dict[str, Any]], batch_count: int) -> None:
+    """
+    Write a batch of queued log entries to the database in one transaction.
+    
+    Args:
+        pending: Queued log dictionaries (job_id, content, timestamp)
+        batch_count: Sequence number of the batch, for logging
+    """
+    logs = []
+    for log_data in pending:
+        logs.append({
+            "execution_id": log_data.get("job_id", "unknown"),
+            "content": log_data.get("content", ""),
+            "timestamp": log_data.get("timestamp") or datetime.now()
+        })
+    
+    stored = await execution_logs_service.create_execution_logs(logs)
+    failures = len(logs) - stored
+    if failures > 0:
+        logger.warning(f"[logs_writer_loop] Batch #{batch_count} processed with {failures} failures.")
+    else:
+        logger.debug(f"[logs_writer_loop] Batch #{batch_count} processed successfully.")
+
 async def logs_writer_loop(shutdown_event: asyncio.Event):
     """
     Background task that reads from the job output queue and writes logs to the database.
     
+    Logs are accumulated and flushed as one multi-row insert when
+    WRITER_BATCH_SIZE entries are pending or the oldest pending entry is
+    WRITER_FLUSH_INTERVAL_SECONDS old, whichever comes first.
+    
     Args:
         shutdown_event: Event to signal shutdown
     """
+    from src.config.settings import settings
+    
     try:
         logger.info("[logs_writer_loop] Logs writer task started.")
         
@@ -228,87 +345,70 @@ async def logs_writer_loop(shutdown_event: asyncio.Event):
         queue = get_job_output_queue()
         logger.debug(f"[logs_writer_loop] Queue retrieved. Initial approximate size: {queue.qsize()}")
         
+        batch_size = max(1, settings.WRITER_BATCH_SIZE)
+        flush_interval = settings.WRITER_FLUSH_INTERVAL_SECONDS
+        
         batch_count = 0
         total_log_count = 0
         empty_count = 0  # Count consecutive empty queue occurrences
+        pending: List[Dict[str, Any]] = []
+        first_pending_at = 0.0
+        loop = asyncio.get_running_loop()
         
-        while not shutdown_event.is_set():
-            # Create a small batch of logs to process together
-            batch = []
-            batch_target_size = 10  # Process up to this many at once
+        while True:
+            shutting_down = shutdown_event.is_set()
             
             try:
-                # Try to collect a batch of logs
-                for _ in range(batch_target_size):
-                    try:
-                        # Log queue status periodically
-                        if _ == 0:
-                            logger.debug(f"[logs_writer_loop] Waiting for logs... Queue size: ~{queue.qsize()}")
-                        
-                        # Non-blocking get with timeout
-                        log_data = queue.get(block=True, timeout=0.1)
-                        
+                if not shutting_down:
+                    # Wait at most until the oldest pending entry is due; when idle
+                    # the timeout only bounds how long we go without re-checking
+                    # the shutdown event
+                    if pending:
+                        timeout = max(0.0, flush_interval - (loop.time() - first_pending_at))
+                    else:
+                        timeout = 1.0
+                    
+                    # Await data without blocking the event loop
+                    items = await queue.get_batch(batch_size - len(pending), timeout=timeout)
+                    
+                    for log_data in items:
                         # Check if this is the shutdown signal (None)
                         if log_data is None:
                             logger.debug("[logs_writer_loop] Received shutdown signal (None) in queue.")
                             continue
-                            
-                        batch.append(log_data)
-                        queue.task_done()
+                        if not pending:
+                            first_pending_at = loop.time()
+                        pending.append(log_data)
+                    
+                    if items:
                         empty_count = 0  # Reset empty count when we get an item
-                    except Empty:
-                        # Queue is empty, break out of the batch collection loop
+                    else:
                         empty_count += 1
-                        if empty_count % 100 == 0:  # Log every 100 consecutive empty checks
-                            logger.debug(f"[logs_writer_loop] Queue empty for {empty_count} consecutive checks")
-                        break
+                        if empty_count % 100 == 0:  # Log every 100 consecutive idle waits
+                            logger.debug(f"[logs_writer_loop] Queue empty for {empty_count} consecutive waits")
                 
-                # If we collected any logs, process them
-                if batch:
+                flush_due = pending and (
+                    shutting_down
+                    or len(pending) >= batch_size
+                    or loop.time() - first_pending_at >= flush_interval
+                )
+                if flush_due:
+                    batch, pending = pending, []
                     batch_count += 1
                     total_log_count += len(batch)
                     
                     # Log batch processing
                     logger.debug(f"[logs_writer_loop] Processing batch #{batch_count} with {len(batch)} logs. Total processed: {total_log_count}")
-                    
-                    # Process each log in the batch
-                    failures = 0
-                    for idx, log_data in enumerate(batch):
-                        try:
-                            job_id = log_data.get("job_id", "unknown")
-                            content = log_data.get("content", "")
-                            timestamp = log_data.get("timestamp", datetime.now())
-                            log_info = f"[{job_id}:{idx+1}/{len(batch)}]"
-                            
-                            # Create log with execution_logs_service
-                            success = await execution_logs_service.create_execution_log(
-                                execution_id=job_id,
-                                content=content,
-                                timestamp=timestamp
-                            )
-                            
-                            if not success:
-                                logger.warning(f"[logs_writer_loop] {log_info} ❌ Failed to store log")
-                                failures += 1
-                                
-                        except Exception as e:
-                            logger.error(f"[logs_writer_loop] Error processing log: {e}", exc_info=True)
-                            failures += 1
-                    
-                    if failures > 0:
-                        logger.warning(f"[logs_writer_loop] Batch #{batch_count} processed with {failures} failures.")
-                    else:
-                        logger.debug(f"[logs_writer_loop] Batch #{batch_count} processed successfully.")
-                
-                # If no logs were collected, sleep briefly to avoid CPU spinning
-                else:
-                    await asyncio.sleep(0.5)
+                    await _flush_logs(batch, batch_count)
                 
             except Exception as e:
                 logger.error(f"[logs_writer_loop] Batch processing error: {e}", exc_info=True)
                 # Sleep to avoid rapid retry on persistent errors
                 await asyncio.sleep(1)
             
+            if shutting_down:
+                break
+            
         logger.info("[logs_writer_loop] Shutdown event received, exiting logs writer loop.")
     
     except asyncio.CancelledError:
@@ -357,7 +457,7 @@ async def stop_logs_writer(timeout: float = 5.0) -> bool:
         
     logger.info("[stop_logs_writer] Stopping logs writer task...")
     try:
-        # Add None to logs queue to help unblock queue.get()
+        # Add None to logs queue to wake the writer
         try:
             from queue import Full
             logs_queue = get_job_output_queue()
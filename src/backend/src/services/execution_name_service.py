@@ -13,6 +13,7 @@ from src.schemas.execution import ExecutionNameGenerationRequest, ExecutionNameG
 from src.services.template_service import TemplateService
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.llm_response_cache import cached_acompletion
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -101,9 +102,8 @@ Generate a short, memorable name that captures the essence of this execution."""
             # Configure litellm using the LLMManager
             model_params = await LLMManager.configure_litellm(request.model)
             
-            # Generate completion
-            import litellm
-            response = await litellm.acompletion(
+            # Generate completion, served from the response cache when enabled
+            response = await cached_acompletion(
                 **model_params,
                 messages=messages,
                 temperature=0.7,
@@ -0,0 +1,267 @@
+"""
+Background purge of executions.
+
+Deleting an execution removes its traces, logs, task statuses, error traces,
+LLM usage and checkpoints before the executionhistory row, and then its
+archived logs and traces. Large executions
+have hundreds of thousands of dependent rows, so the delete endpoints only
+start a purge and return its ID. The purge runs as a task on the API event
+loop, deleting each table's rows in bounded batches with a commit per batch.
+Its progress is stored in execution_purge after every batch, so
+``get_status`` answers from any API worker, not only the one running it.
+The stored scope lets a purge interrupted by a restart resume at startup.
+"""
+
+import asyncio
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.logger import LoggerManager
+from src.repositories.execution_purge_repository import PURGE_MODELS, ExecutionPurgeRepository
+from src.services.execution_archive_service import get_execution_archiver
+from src.services.job_registry import get_job_registry
+from src.utils.asyncio_utils import execute_db_operation
+
+logger = LoggerManager.get_instance().system
+
+
+class PurgeStatus:
+    """Status values of execution purges."""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExecutionPurger:
+    """
+    Starts execution purges in the background and records their progress.
+
+    The progress of the most recent ``max_tracked`` purges is kept in the
+    database, so a finished purge can still be polled for a while.
+    """
+
+    def __init__(self, batch_size: int = 1000, max_tracked: int = 100):
+        self._batch_size = max(1, batch_size)
+        self._max_tracked = max(1, max_tracked)
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def start(self, executions: Optional[Sequence[Tuple[int, str]]] = None) -> str:
+        """
+        Record a purge and start it on the running event loop.
+
+        Args:
+            executions: (id, job_id) pairs to purge, or None for all executions
+                existing when the purge starts
+
+        Returns:
+            Purge ID for get_status
+        """
+        purge_id = str(uuid.uuid4())
+        max_ids = None
+        if executions is None:
+            # Fix the rows to delete now, so a resumed purge never deletes newer executions
+            max_ids = await execute_db_operation(
+                lambda session: ExecutionPurgeRepository(session).get_max_ids()
+            )
+        job_ids = None if executions is None else [job_id for _, job_id in executions]
+        progress = {
+            "id": purge_id,
+            "status": PurgeStatus.RUNNING,
+            "scope": "all" if executions is None else "executions",
+            "job_ids": job_ids,
+            "max_ids": max_ids,
+            "current_table": None,
+            "deleted": {name: 0 for name in PURGE_MODELS},
+            "started_at": datetime.utcnow(),
+        }
+        await execute_db_operation(
+            lambda session: ExecutionPurgeRepository(session).create_purge(progress)
+        )
+        await execute_db_operation(
+            lambda session: ExecutionPurgeRepository(session).delete_old_purges(
+                self._max_tracked, PurgeStatus.RUNNING
+            )
+        )
+        if executions is None:
+            steps = ExecutionPurgeRepository.snapshot_conditions(max_ids)
+        else:
+            steps = ExecutionPurgeRepository.execution_conditions(executions)
+        self._tasks[purge_id] = asyncio.create_task(self._run(purge_id, steps, job_ids, progress["deleted"]))
+        return purge_id
+
+    async def resume_interrupted(self) -> int:
+        """
+        Resume purges left running by a process that stopped mid-purge.
+
+        Called at startup. A purge of all executions continues with the rows
+        that existed when it started, a purge of executions with those of its
+        executions still present. Purges whose scope was not stored are
+        marked failed. Deleting is idempotent, so resuming a purge that
+        another API worker is still running costs time but no data.
+
+        Returns:
+            Number of purges resumed
+        """
+        purges = await execute_db_operation(
+            lambda session: ExecutionPurgeRepository(session).get_purges_by_status(PurgeStatus.RUNNING)
+        )
+        resumed = 0
+        for purge in purges:
+            if purge.id in self._tasks:
+                continue
+            if purge.scope == "all" and purge.max_ids is not None:
+                job_ids = None
+                steps = ExecutionPurgeRepository.snapshot_conditions(purge.max_ids)
+            elif purge.scope == "executions" and purge.job_ids is not None:
+                job_ids = list(purge.job_ids)
+                executions = await find_executions(job_ids=job_ids)
+                steps = ExecutionPurgeRepository.execution_conditions(executions)
+            else:
+                logger.warning(f"[ExecutionPurger] Interrupted purge {purge.id} has no stored scope, marking it failed")
+                await execute_db_operation(
+                    lambda session, purge_id=purge.id: ExecutionPurgeRepository(session).update_purge(
+                        purge_id,
+                        {
+                            "status": PurgeStatus.FAILED,
+                            "current_table": None,
+                            "error": "Purge was interrupted",
+                            "finished_at": datetime.utcnow(),
+                        }
+                    )
+                )
+                continue
+            logger.info(f"[ExecutionPurger] Resuming interrupted purge {purge.id} of {purge.scope}")
+            deleted_rows = {name: 0 for name in PURGE_MODELS}
+            deleted_rows.update(purge.deleted or {})
+            self._tasks[purge.id] = asyncio.create_task(self._run(purge.id, steps, job_ids, deleted_rows))
+            resumed += 1
+        return resumed
+
+    async def _run(
+        self,
+        purge_id: str,
+        steps: List[Tuple[str, Any]],
+        job_ids: Optional[List[str]],
+        deleted_rows: Dict[str, int]
+    ) -> None:
+        deleted_rows = dict(deleted_rows)
+        result = {"status": PurgeStatus.COMPLETED, "error": None}
+        current_table = None
+
+        async def delete_batch(session, table, condition):
+            repository = ExecutionPurgeRepository(session)
+            deleted = await repository.delete_batch(table, condition, self._batch_size)
+            deleted_rows[table] += deleted
+            await repository.update_purge(purge_id, {"current_table": table, "deleted": dict(deleted_rows)})
+            return deleted
+
+        try:
+            for table, condition in steps:
+                current_table = table
+                while True:
+                    deleted = await execute_db_operation(
+                        lambda session: delete_batch(session, table, condition)
+                    )
+                    if deleted < self._batch_size:
+                        break
+                    # Let requests waiting for the database in between batches
+                    await asyncio.sleep(0)
+
+            if job_ids is None:
+                get_execution_archiver().delete_all()
+                get_job_registry().clear()
+            else:
+                get_execution_archiver().delete(job_ids)
+                for job_id in job_ids:
+                    get_job_registry().forget(job_id)
+            logger.info(f"[ExecutionPurger] Purge {purge_id} completed: {deleted_rows}")
+        except asyncio.CancelledError:
+            # Stopped with the process; left running so the next startup resumes it
+            result = None
+            raise
+        except Exception as e:
+            result = {"status": PurgeStatus.FAILED, "error": str(e)}
+            logger.error(f"[ExecutionPurger] Purge {purge_id} failed in {current_table}: {e}", exc_info=True)
+        finally:
+            self._tasks.pop(purge_id, None)
+            outcome = {"current_table": None, "deleted": deleted_rows}
+            if result is not None:
+                outcome.update(result, finished_at=datetime.utcnow())
+            try:
+                await execute_db_operation(
+                    lambda session: ExecutionPurgeRepository(session).update_purge(purge_id, outcome)
+                )
+            except Exception as e:
+                logger.error(f"[ExecutionPurger] Failed to record the outcome of purge {purge_id}: {e}")
+
+    async def get_status(self, purge_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress of a purge started by any API worker.
+
+        Args:
+            purge_id: ID returned by start
+
+        Returns:
+            Progress dictionary, or None if the purge is unknown
+        """
+        purge = await execute_db_operation(
+            lambda session: ExecutionPurgeRepository(session).get_purge(purge_id)
+        )
+        if purge is None:
+            return None
+        return {
+            "purge_id": purge.id,
+            "status": purge.status,
+            "scope": purge.scope,
+            "job_ids": purge.job_ids,
+            "current_table": purge.current_table,
+            "deleted": dict(purge.deleted),
+            "started_at": purge.started_at,
+            "finished_at": purge.finished_at,
+            "error": purge.error,
+        }
+
+    async def wait(self, purge_id: str) -> None:
+        """Wait until a purge started on the running loop has finished."""
+        task = self._tasks.get(purge_id)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Cancel running purges; they stay running in the database and resume at the next startup."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+
+async def find_executions(job_ids: Sequence[str] = (), run_ids: Sequence[int] = ()) -> List[Tuple[int, str]]:
+    """
+    Get the (id, job_id) pairs of the executions to purge.
+
+    Args:
+        job_ids: Job IDs to look up
+        run_ids: Database IDs to look up
+
+    Returns:
+        (id, job_id) pairs of the executions found
+    """
+    return await execute_db_operation(
+        lambda session: ExecutionPurgeRepository(session).get_executions(job_ids, run_ids)
+    )
+
+
+_purger: Optional[ExecutionPurger] = None
+_purger_lock = threading.Lock()
+
+# Function to get the singleton purger instance easily
+def get_execution_purger() -> ExecutionPurger:
+    global _purger
+    if _purger is None:
+        with _purger_lock:
+            if _purger is None:
+                from src.config.settings import settings
+                _purger = ExecutionPurger(batch_size=settings.EXECUTION_PURGE_BATCH_SIZE)
+    return _purger
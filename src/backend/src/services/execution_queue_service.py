@@ -0,0 +1,328 @@
+"""
+Durable execution work queue.
+
+With ``EXECUTION_QUEUE_ENABLED`` the API node only records an execution and
+enqueues it; ``ExecutionQueueWorker`` instances claim queued executions under
+a lease, keep the lease alive with heartbeats while the crew runs, and mark
+the item completed or failed once the execution reaches a terminal status.
+A worker that dies stops heartbeating, so its lease expires and any worker
+returns the item to the queue. Throughput grows by running more workers,
+either inside API processes or as standalone nodes via ``src.worker``.
+"""
+
+import asyncio
+import os
+import socket
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+from src.core.logger import LoggerManager
+from src.models.execution_status import ExecutionStatus
+from src.repositories.execution_queue_repository import ExecutionQueueRepository
+from src.utils.asyncio_utils import execute_db_operation
+
+logger = LoggerManager.get_instance().crew
+
+TERMINAL_STATUSES = {
+    ExecutionStatus.COMPLETED.value,
+    ExecutionStatus.FAILED.value,
+    ExecutionStatus.CANCELLED.value,
+}
+
+
+class ExecutionQueueService:
+    """
+    Service for queue operations, each run in its own short transaction.
+    """
+
+    @staticmethod
+    async def enqueue(
+        job_id: str,
+        payload: Dict[str, Any],
+        execution_type: str = "crew",
+        trigger_type: str = "api"
+    ) -> None:
+        """
+        Queue an execution for a worker to run.
+
+        Args:
+            job_id: Execution ID, already recorded in executionhistory
+            payload: JSON-serializable CrewConfig data
+            execution_type: Type of execution (crew or flow)
+            trigger_type: What started the execution
+        """
+        from src.config.settings import settings
+
+        priority = settings.EXECUTION_TRIGGER_PRIORITIES.get(
+            trigger_type, max(settings.EXECUTION_TRIGGER_PRIORITIES.values(), default=0) + 1
+        )
+
+        async def _enqueue_operation(session):
+            repo = ExecutionQueueRepository(session)
+            await repo.enqueue(
+                job_id=job_id,
+                payload=payload,
+                execution_type=execution_type,
+                trigger_type=trigger_type,
+                priority=priority,
+                max_attempts=settings.EXECUTION_QUEUE_MAX_ATTEMPTS
+            )
+
+        await execute_db_operation(_enqueue_operation)
+        logger.info(f"[ExecutionQueueService.enqueue] Queued {execution_type} execution {job_id} ({trigger_type}, priority {priority})")
+
+    @staticmethod
+    async def claim(worker_id: str, lease_seconds: float, limit: int) -> List[Dict[str, Any]]:
+        """
+        Claim up to limit queued executions.
+
+        Args:
+            worker_id: ID of the claiming worker
+            lease_seconds: Lease duration before the claim expires
+            limit: Maximum number of executions to claim
+
+        Returns:
+            List of claimed items as dictionaries
+        """
+        async def _claim_operation(session):
+            repo = ExecutionQueueRepository(session)
+            items = await repo.claim(worker_id, lease_seconds, limit)
+            return [
+                {
+                    "job_id": item.job_id,
+                    "execution_type": item.execution_type,
+                    "trigger_type": item.trigger_type,
+                    "payload": item.payload or {},
+                    "attempts": item.attempts,
+                }
+                for item in items
+            ]
+
+        return await execute_db_operation(_claim_operation)
+
+    @staticmethod
+    async def heartbeat(job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a worker's lease on an execution; False if the lease was lost."""
+        return await execute_db_operation(
+            lambda session: ExecutionQueueRepository(session).heartbeat(job_id, worker_id, lease_seconds)
+        )
+
+    @staticmethod
+    async def complete(job_id: str, worker_id: str) -> bool:
+        """Mark a claimed execution as done."""
+        return await execute_db_operation(
+            lambda session: ExecutionQueueRepository(session).complete(job_id, worker_id)
+        )
+
+    @staticmethod
+    async def fail(
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retry: bool = True,
+        retry_delay_seconds: float = 0
+    ) -> bool:
+        """Release a claimed execution after an error, requeueing it if allowed."""
+        return await execute_db_operation(
+            lambda session: ExecutionQueueRepository(session).fail(
+                job_id, worker_id, error, retry=retry, retry_delay_seconds=retry_delay_seconds
+            )
+        )
+
+    @staticmethod
+    async def reclaim_expired() -> int:
+        """Requeue executions whose worker stopped heartbeating."""
+        return await execute_db_operation(
+            lambda session: ExecutionQueueRepository(session).reclaim_expired()
+        )
+
+    @staticmethod
+    async def get_stats() -> Dict[str, int]:
+        """Count queued executions per queue status."""
+        return await execute_db_operation(
+            lambda session: ExecutionQueueRepository(session).count_by_status()
+        )
+
+
+class ExecutionQueueWorker:
+    """
+    Claims queued executions and runs them in this process.
+
+    Runs at most ``concurrency`` executions at once. An item is completed once
+    its execution reaches a terminal status; an error while starting it
+    returns the item to the queue until its attempts are used up. A run whose
+    lease was lost, or that is still going when the worker stops, is cancelled
+    so the item never runs twice at once.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        lease_seconds: float,
+        heartbeat_seconds: float,
+        poll_seconds: float,
+        retry_delay_seconds: float = 0,
+        worker_id: Optional[str] = None
+    ):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._concurrency = max(1, concurrency)
+        self._lease_seconds = lease_seconds
+        self._heartbeat_seconds = heartbeat_seconds
+        self._poll_seconds = poll_seconds
+        self._retry_delay_seconds = retry_delay_seconds
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stopping: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def _run_execution(self, job_id: str, payload: Dict[str, Any], execution_type: str, trigger_type: str) -> None:
+        """Start a claimed execution in this process."""
+        from src.schemas.execution import CrewConfig
+        from src.services.execution_service import ExecutionService
+
+        await ExecutionService.run_crew_execution(
+            execution_id=job_id,
+            config=CrewConfig(**payload),
+            execution_type=execution_type,
+            trigger_type=trigger_type
+        )
+
+    async def _cancel_execution(self, job_id: str) -> None:
+        """Cancel the local run of an execution, terminating its process when it has one."""
+        from src.services.crewai_execution_service import CrewAIExecutionService
+
+        try:
+            if not await CrewAIExecutionService().cancel_execution(job_id):
+                logger.warning(f"[ExecutionQueueWorker] No local run of {job_id} to cancel")
+        except Exception as e:
+            logger.error(f"[ExecutionQueueWorker] Error cancelling {job_id}: {e}", exc_info=True)
+
+    async def _wait_for_terminal_status(self, job_id: str) -> Optional[str]:
+        """
+        Heartbeat until the execution reaches a terminal status.
+
+        Returns:
+            The terminal status, or None if the lease was lost to another worker
+        """
+        from src.services.execution_status_service import ExecutionStatusService
+
+        while True:
+            execution = await ExecutionStatusService.get_status(job_id)
+            status = getattr(execution, "status", None)
+            if isinstance(status, str) and status.upper() in TERMINAL_STATUSES:
+                return status.upper()
+            await asyncio.sleep(self._heartbeat_seconds)
+            if not await ExecutionQueueService.heartbeat(job_id, self.worker_id, self._lease_seconds):
+                return None
+
+    async def _process(self, item: Dict[str, Any]) -> None:
+        """Run one claimed item and settle it in the queue."""
+        job_id = item["job_id"]
+        try:
+            logger.info(f"[ExecutionQueueWorker] {self.worker_id} running {job_id} (attempt {item['attempts']})")
+            await self._run_execution(job_id, item["payload"], item["execution_type"], item["trigger_type"])
+            status = await self._wait_for_terminal_status(job_id)
+            if status is None:
+                # The item may already run elsewhere; stop our copy and leave it to the new owner
+                logger.warning(f"[ExecutionQueueWorker] {self.worker_id} lost the lease on {job_id}, cancelling it")
+                await self._cancel_execution(job_id)
+            elif status == ExecutionStatus.FAILED.value:
+                # The crew ran and failed on its own; rerunning it is a retry decision, not ours
+                await ExecutionQueueService.fail(job_id, self.worker_id, "Execution failed", retry=False)
+            else:
+                await ExecutionQueueService.complete(job_id, self.worker_id)
+        except asyncio.CancelledError:
+            # stop() cancels the run and releases the item
+            raise
+        except Exception as e:
+            logger.error(f"[ExecutionQueueWorker] Error running {job_id}: {e}", exc_info=True)
+            try:
+                await ExecutionQueueService.fail(
+                    job_id, self.worker_id, str(e), retry_delay_seconds=self._retry_delay_seconds
+                )
+            except Exception as fail_error:
+                logger.error(f"[ExecutionQueueWorker] Error releasing {job_id}: {fail_error}")
+        finally:
+            self._tasks.pop(job_id, None)
+
+    async def poll_once(self) -> int:
+        """
+        Reclaim expired leases and claim work up to the free capacity.
+
+        Returns:
+            Number of executions claimed
+        """
+        reclaimed = await ExecutionQueueService.reclaim_expired()
+        if reclaimed:
+            logger.info(f"[ExecutionQueueWorker] Reclaimed {reclaimed} executions with expired leases")
+
+        free = self._concurrency - len(self._tasks)
+        if free <= 0:
+            return 0
+        items = await ExecutionQueueService.claim(self.worker_id, self._lease_seconds, free)
+        for item in items:
+            self._tasks[item["job_id"]] = asyncio.create_task(self._process(item))
+        return len(items)
+
+    async def run(self) -> None:
+        """Poll the queue until stop() is called."""
+        self._stopping = asyncio.Event()
+        logger.info(f"[ExecutionQueueWorker] {self.worker_id} started with concurrency {self._concurrency}")
+        while not self._stopping.is_set():
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"[ExecutionQueueWorker] Error polling the execution queue: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+        logger.info(f"[ExecutionQueueWorker] {self.worker_id} stopped")
+
+    def start(self) -> asyncio.Task:
+        """Start polling in a task on the running loop."""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self.run())
+        return self._loop_task
+
+    async def stop(self) -> None:
+        """Stop claiming work, cancel running executions and return their items to the queue."""
+        if self._stopping is not None:
+            self._stopping.set()
+        if self._loop_task is not None:
+            await self._loop_task
+        job_ids = list(self._tasks)
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        for job_id in job_ids:
+            await self._cancel_execution(job_id)
+            try:
+                await ExecutionQueueService.fail(job_id, self.worker_id, "Worker stopped")
+            except Exception as e:
+                logger.error(f"[ExecutionQueueWorker] Error releasing {job_id}: {e}")
+
+    def active_count(self) -> int:
+        """Number of claimed executions being run."""
+        return len(self._tasks)
+
+
+_worker: Optional[ExecutionQueueWorker] = None
+_worker_lock = threading.Lock()
+
+# Function to get the singleton worker instance easily
+def get_execution_queue_worker() -> ExecutionQueueWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                from src.config.settings import settings
+                _worker = ExecutionQueueWorker(
+                    concurrency=settings.EXECUTION_WORKER_CONCURRENCY,
+                    lease_seconds=settings.EXECUTION_QUEUE_LEASE_SECONDS,
+                    heartbeat_seconds=settings.EXECUTION_QUEUE_HEARTBEAT_SECONDS,
+                    poll_seconds=settings.EXECUTION_QUEUE_POLL_SECONDS,
+                    retry_delay_seconds=settings.EXECUTION_QUEUE_RETRY_DELAY_SECONDS,
+                )
+    return _worker
@@ -19,6 +19,7 @@ import litellm
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from src.config.settings import settings
 from src.core.logger import LoggerManager
 from src.schemas.execution import ExecutionStatus, CrewConfig, ExecutionNameGenerationRequest, ExecutionCreateResponse
 from src.utils.asyncio_utils import run_in_thread_with_loop, create_and_run_loop
@@ -225,7 +226,8 @@ class ExecutionService:
     async def run_crew_execution(
         execution_id: str,
         config: CrewConfig,
-        execution_type: str = "crew"
+        execution_type: str = "crew",
+        trigger_type: str = "api"
     ) -> Dict[str, Any]:
         """
         Run a crew execution with the provided configuration.
@@ -234,6 +236,7 @@ class ExecutionService:
             execution_id: Unique identifier for the execution
             config: Configuration for the execution
             execution_type: Type of execution (crew, flow)
+            trigger_type: What started the execution (api, schedule)
             
         Returns:
             Dictionary with execution result
@@ -308,7 +311,8 @@ class ExecutionService:
                 # This call should handle PREPARING/RUNNING updates internally
                 result = await crew_execution_service.run_crew_execution(
                     execution_id=execution_id,
-                    config=config
+                    config=config,
+                    trigger_type=trigger_type
                 )
                 exec_logger.info(f"[run_crew_execution] Successfully initiated crew execution via CrewAIExecutionService for job_id: {execution_id}. Result: {result}")
                 return result # Return result from run_crew_execution
@@ -501,7 +505,7 @@ class ExecutionService:
                 update_data["result"] = ExecutionService.sanitize_for_database(result)
             
             # Update execution status using the service
-            # No need to use create_and_run_loop here since execute_db_operation_with_fresh_engine 
+            # No need to use create_and_run_loop here since execute_db_operation
             # already handles event loop isolation
             success = await ExecutionStatusService.update_status(
                 job_id=execution_id,
@@ -539,7 +543,7 @@ class ExecutionService:
                 exec_logger.warning(f"Execution {execution_id} not found in database.")
                 return None
             
-            return {
+            status_data = {
                 "execution_id": execution_id,
                 "status": execution.status,
                 "created_at": execution.created_at,
@@ -547,6 +551,15 @@ class ExecutionService:
                 "run_name": execution.run_name,
                 "error": execution.error
             }
+            
+            # Executions waiting for admission report where they are in the queue
+            from src.services.execution_admission import get_admission_controller
+            queue_position = get_admission_controller().get_queue_position(execution_id)
+            if queue_position:
+                status_data["queue_position"] = queue_position["position"]
+                status_data["queued_seconds"] = queue_position["queued_seconds"]
+            
+            return status_data
         except Exception as e:
             exec_logger.error(f"Error getting execution status for {execution_id}: {str(e)}")
             return None
@@ -707,7 +720,16 @@ class ExecutionService:
             # Start execution in background
             crew_logger.info(f"[ExecutionService.create_execution] Preparing to launch background task for execution_id: {execution_id}...")
 
-            if background_tasks:
+            if settings.EXECUTION_QUEUE_ENABLED:
+                # A queue worker on this or another node claims and runs it
+                from src.services.execution_queue_service import ExecutionQueueService
+                await ExecutionQueueService.enqueue(
+                    job_id=execution_id,
+                    payload=config.model_dump(mode="json"),
+                    execution_type=execution_type
+                )
+                crew_logger.info(f"[ExecutionService.create_execution] Enqueued execution_id: {execution_id} on the execution queue")
+            elif background_tasks:
                 async def run_execution_task():
                     # Use a separate logger instance potentially if needed, or reuse crew_logger
                     task_logger = LoggerManager.get_instance().crew 
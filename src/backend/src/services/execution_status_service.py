@@ -11,7 +11,9 @@ from typing import Dict, Any, Optional
 
 from src.models.execution_status import ExecutionStatus
 from src.repositories.execution_repository import ExecutionRepository
-from src.utils.asyncio_utils import execute_db_operation_with_fresh_engine
+from src.services.execution_admission import get_admission_controller
+from src.services.job_registry import get_job_registry
+from src.utils.asyncio_utils import execute_db_operation, execute_db_write
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,15 @@ class ExecutionStatusService:
         if not job_id or not isinstance(job_id, str):
             logger.error(f"[ExecutionStatusService] Invalid job_id: {job_id}")
             return False
+        
+        # Normalize once so every terminal status check below agrees with the enum values
+        if isinstance(status, str):
+            status = status.upper()
+        is_terminal = status in [ExecutionStatus.COMPLETED.value, ExecutionStatus.FAILED.value, ExecutionStatus.CANCELLED.value]
+        
+        if is_terminal:
+            # A finished execution no longer counts against admission limits
+            get_admission_controller().release(job_id)
             
         try:
             # Define the database operation
@@ -88,7 +99,7 @@ class ExecutionStatusService:
                         update_data["result"] = str(result)
                 
                 # Set completed_at if status is a terminal status
-                if status in [ExecutionStatus.COMPLETED.value, ExecutionStatus.FAILED.value, ExecutionStatus.CANCELLED.value]:
+                if is_terminal:
                     from datetime import datetime
                     # Always set completed_at to current time for terminal statuses
                     update_data["completed_at"] = datetime.now()  # Use timezone-naive datetime
@@ -110,6 +121,9 @@ class ExecutionStatusService:
                     logger.debug(f"[ExecutionStatusService] Committing transaction after flushing update for record_id: {record_id}")
                     await session.commit() # Attempt to COMMIT the transaction
                     logger.info(f"[ExecutionStatusService] Successfully committed status update for job_id: {job_id} (record_id: {record_id}) to {status}.")
+                    if "completed_at" in update_data:
+                        # Let the job drop out of the known-job registry after a grace period
+                        get_job_registry().mark_finished(job_id)
                     return True
                 else:
                     logger.error(f"[ExecutionStatusService] Failed to update execution for job_id: {job_id} (record_id: {record_id}). Update method returned None.")
@@ -117,8 +131,8 @@ class ExecutionStatusService:
                     await session.rollback()
                     return False
 
-            # Execute the operation with a fresh engine/session
-            return await execute_db_operation_with_fresh_engine(_update_operation)
+            # Execute the operation on the engine owned by the running loop
+            return await execute_db_write(_update_operation)
                 
         except Exception as e:
             logger.error(f"[ExecutionStatusService] Error during update/flush/commit for job_id {job_id}: {str(e)}", exc_info=True)
@@ -146,8 +160,8 @@ class ExecutionStatusService:
                 repo = ExecutionRepository(session)
                 return await repo.get_execution_by_job_id(job_id=execution_id)
             
-            # Execute the operation with a fresh engine/session
-            return await execute_db_operation_with_fresh_engine(_get_operation)
+            # Execute the operation on the engine owned by the running loop
+            return await execute_db_operation(_get_operation)
             
         except Exception as e:
             logger.error(f"Error getting execution status: {str(e)}")
@@ -164,9 +178,6 @@ class ExecutionStatusService:
         Returns:
             True if successful, False otherwise
         """
-        from src.db.session import async_session_factory
-        from src.repositories.execution_repository import ExecutionRepository
-        
         # Validate job_id
         job_id = execution_data.get('job_id')
         if not job_id or not isinstance(job_id, str):
@@ -174,8 +185,7 @@ class ExecutionStatusService:
             return False
             
         try:
-            # Create database session internally
-            async with async_session_factory() as session:
+            async def _create_operation(session):
                 # Create repository instance
                 repo = ExecutionRepository(session)
                 
@@ -183,17 +193,24 @@ class ExecutionStatusService:
                 existing = await repo.get_execution_by_job_id(job_id=job_id)
                 if existing:
                     logger.info(f"[ExecutionStatusService] Execution record with job_id: {job_id} already exists, skipping creation")
+                    get_job_registry().register(job_id)
                     return True
                 
                 # Create execution record
                 logger.debug(f"[ExecutionStatusService] Creating execution record with job_id: {job_id}")
-                execution = await repo.create_execution(data=execution_data)
+                await repo.create_execution(data=execution_data)
                 
                 # Explicitly commit transaction
                 await session.commit()
                 
+                # Let the trace writer skip its existence lookup for this job
+                get_job_registry().register(job_id)
+                
                 logger.info(f"[ExecutionStatusService] Successfully created execution record with job_id: {job_id}")
                 return True
+            
+            # Execute the operation on the engine owned by the running loop
+            return await execute_db_write(_create_operation)
         except Exception as e:
             logger.error(f"[ExecutionStatusService] Error creating execution record: {e}", exc_info=True)
             return False 
\ No newline at end of file
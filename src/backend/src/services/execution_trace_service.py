@@ -15,10 +15,14 @@ from src.schemas.execution_trace import (
     ExecutionTraceList,
     ExecutionTraceResponseByRunId,
     ExecutionTraceResponseByJobId,
-    DeleteTraceResponse
+    DeleteTraceResponse,
+    ExecutionQueueStatsResponse,
+    QueueJobStats
 )
 
 from src.core.logger import LoggerManager
+from src.services.execution_archive_service import get_execution_archiver
+from src.utils.pagination import next_cursor, paginate_rows
 
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().system
@@ -31,7 +35,8 @@ class ExecutionTraceService:
         db, 
         run_id: int,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> ExecutionTraceResponseByRunId:
         """
         Get traces for an execution by run_id with pagination.
@@ -41,6 +46,7 @@ class ExecutionTraceService:
             run_id: Database ID of the execution
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             ExecutionTraceResponseByRunId with traces for the execution
@@ -56,8 +62,13 @@ class ExecutionTraceService:
             traces = await execution_trace_repository.get_by_run_id(
                 run_id,
                 limit,
-                offset
+                offset,
+                cursor
             )
+            if not traces:
+                # Executions past the retention period are read from their archive
+                archived = await get_execution_archiver().get_archived(job_id, "traces")
+                traces = paginate_rows(archived, "created_at", limit, offset or 0, cursor, descending=False)
             
             # Get job_id for these traces if needed
             if traces and not all(trace.job_id for trace in traces):
@@ -71,7 +82,8 @@ class ExecutionTraceService:
             
             return ExecutionTraceResponseByRunId(
                 run_id=run_id,
-                traces=trace_items
+                traces=trace_items,
+                next_cursor=next_cursor(traces, limit, "created_at")
             )
             
         except SQLAlchemyError as e:
@@ -86,7 +98,8 @@ class ExecutionTraceService:
         db, 
         job_id: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> ExecutionTraceResponseByJobId:
         """
         Get traces for an execution by job_id with pagination.
@@ -96,6 +109,7 @@ class ExecutionTraceService:
             job_id: String ID of the execution (job_id in database)
             limit: Maximum number of traces to return
             offset: Number of traces to skip
+            cursor: Cursor of the previous page, oldest traces first
             
         Returns:
             ExecutionTraceResponseByJobId with traces for the execution
@@ -111,7 +125,8 @@ class ExecutionTraceService:
             traces = await execution_trace_repository.get_by_job_id(
                 job_id,
                 limit,
-                offset
+                offset,
+                cursor
             )
             
             # If no traces found using the direct job_id field, try via the run_id (for backward compatibility)
@@ -120,7 +135,8 @@ class ExecutionTraceService:
                 traces = await execution_trace_repository.get_by_run_id(
                     run_id,
                     limit,
-                    offset
+                    offset,
+                    cursor
                 )
                 
                 # Update job_id for these traces if it's missing
@@ -128,12 +144,18 @@ class ExecutionTraceService:
                     if not trace.job_id:
                         trace.job_id = job_id
             
+            if not traces:
+                # Executions past the retention period are read from their archive
+                archived = await get_execution_archiver().get_archived(job_id, "traces")
+                traces = paginate_rows(archived, "created_at", limit, offset or 0, cursor, descending=False)
+            
             # Convert to schema objects
             trace_items = [ExecutionTraceItem.model_validate(trace) for trace in traces]
             
             return ExecutionTraceResponseByJobId(
                 job_id=job_id,
-                traces=trace_items
+                traces=trace_items,
+                next_cursor=next_cursor(traces, limit, "created_at")
             )
             
         except SQLAlchemyError as e:
@@ -146,14 +168,18 @@ class ExecutionTraceService:
     @staticmethod
     async def get_all_traces(
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> ExecutionTraceList:
         """
         Get all traces with pagination.
         
         Args:
             limit: Maximum number of traces to return
-            offset: Number of traces to skip
+            offset: Number of traces to skip, ignored when a cursor is given
+            cursor: Cursor of the previous page, newest traces first
+            include_total: Whether to count all traces
             
         Returns:
             ExecutionTraceList with paginated traces
@@ -162,7 +188,9 @@ class ExecutionTraceService:
             # Get all traces using repository
             traces, total_count = await execution_trace_repository.get_all_traces(
                 limit,
-                offset
+                offset,
+                cursor,
+                include_total
             )
             
             # Convert to schema objects
@@ -172,7 +200,8 @@ class ExecutionTraceService:
                 traces=trace_items,
                 total=total_count,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                next_cursor=next_cursor(traces, limit, "created_at")
             )
             
         except SQLAlchemyError as e:
@@ -231,6 +260,47 @@ class ExecutionTraceService:
             logger.error(f"Error creating trace: {str(e)}")
             raise
     
+    @staticmethod
+    async def create_traces(traces: List[Dict[str, Any]]) -> int:
+        """
+        Create several traces in a single transaction.
+        
+        Args:
+            traces: List of dictionaries with trace data for existing jobs
+            
+        Returns:
+            Number of created traces
+        """
+        try:
+            return await execution_trace_repository.create_many(traces)
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error creating {len(traces)} traces: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error creating {len(traces)} traces: {str(e)}")
+            raise
+    
+    @staticmethod
+    def get_queue_stats(job_id: str) -> ExecutionQueueStatsResponse:
+        """
+        Get drop and lag counters of the trace and log queues for a job.
+        
+        Args:
+            job_id: String ID of the execution (job_id)
+            
+        Returns:
+            ExecutionQueueStatsResponse with counters for both queues
+        """
+        from src.services.trace_queue import get_trace_queue_job_stats
+        from src.services.execution_logs_queue import get_log_queue_job_stats
+        
+        return ExecutionQueueStatsResponse(
+            job_id=job_id,
+            trace_queue=QueueJobStats(**(get_trace_queue_job_stats(job_id) or {})),
+            log_queue=QueueJobStats(**(get_log_queue_job_stats(job_id) or {}))
+        )
+    
     @staticmethod
     async def delete_trace(trace_id: int) -> Optional[DeleteTraceResponse]:
         """
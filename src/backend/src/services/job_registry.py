@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class JobRegistry:
+    """
+    Bounded LRU/TTL registry of job IDs known to exist in executionhistory.
+
+    Execution creation registers the job so the trace writer can skip its
+    first-trace database lookup. Entries expire after a TTL, are shortened to
+    a grace period once the job reaches a terminal status, and the least
+    recently used entries are evicted beyond the maximum size.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, finished_ttl_seconds: float):
+        self._max_size = max(1, max_size)
+        self._ttl_seconds = ttl_seconds
+        self._finished_ttl_seconds = finished_ttl_seconds
+        self._lock = threading.Lock()
+        # job_id -> expiry (monotonic seconds), oldest use first
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def register(self, job_id: str) -> None:
+        """Record that job_id exists in the database."""
+        if not job_id:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._entries[job_id] = now + self._ttl_seconds
+            self._entries.move_to_end(job_id)
+            if len(self._entries) > self._max_size:
+                # Reclaim finished/expired jobs first, then the least recently used
+                self._purge_expired_locked(now)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def contains(self, job_id: str) -> bool:
+        """Check whether job_id is known to exist, refreshing its LRU position."""
+        with self._lock:
+            expires_at = self._entries.get(job_id)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[job_id]
+                return False
+            self._entries.move_to_end(job_id)
+            return True
+
+    def mark_finished(self, job_id: str) -> None:
+        """Shorten a job's TTL to the finished grace period so late traces still hit."""
+        with self._lock:
+            if job_id in self._entries:
+                self._entries[job_id] = min(
+                    self._entries[job_id],
+                    time.monotonic() + self._finished_ttl_seconds
+                )
+
+    def forget(self, job_id: str) -> None:
+        """Remove a job, e.g. after its execution record was deleted."""
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Remove all jobs, e.g. after all execution records were deleted."""
+        with self._lock:
+            self._entries.clear()
+
+    def _purge_expired_locked(self, now: float) -> int:
+        expired = [job_id for job_id, expires_at in self._entries.items() if expires_at <= now]
+        for job_id in expired:
+            del self._entries[job_id]
+        return len(expired)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries and return how many were removed."""
+        with self._lock:
+            return self._purge_expired_locked(time.monotonic())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_registry: Optional[JobRegistry] = None
+_registry_lock = threading.Lock()
+
+# Function to get the singleton registry instance easily
+def get_job_registry() -> JobRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from src.config.settings import settings
+                _registry = JobRegistry(
+                    max_size=settings.JOB_REGISTRY_MAX_SIZE,
+                    ttl_seconds=settings.JOB_REGISTRY_TTL_SECONDS,
+                    finished_ttl_seconds=settings.JOB_REGISTRY_FINISHED_TTL_SECONDS,
+                )
+    return _registry
@@ -0,0 +1,65 @@
+"""
+Service for aggregated LLM usage.
+
+This module provides the LLM usage of single executions and usage summaries
+per model, read from the totals written by the LLM usage recorder.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.llm_usage_repository import LLMUsageRepository
+from src.schemas.llm_usage import ExecutionLLMUsageResponse, LLMUsageItem, ModelUsageSummary
+
+
+class LLMUsageService:
+    """Service for reading aggregated LLM usage."""
+    
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the service with a database session.
+        
+        Args:
+            session: Database session for operations
+        """
+        self.repository = LLMUsageRepository(session)
+    
+    async def get_execution_usage(self, execution_id: str) -> ExecutionLLMUsageResponse:
+        """
+        Get the LLM usage of an execution per agent and model, with its totals.
+        
+        Args:
+            execution_id: Execution ID
+            
+        Returns:
+            ExecutionLLMUsageResponse, with no usage rows if none were recorded
+        """
+        rows = await self.repository.find_by_execution_id(execution_id)
+        usage = []
+        for row in rows:
+            item = LLMUsageItem.model_validate(row)
+            item.avg_latency_ms = row.latency_ms_total / row.calls if row.calls else 0.0
+            usage.append(item)
+        return ExecutionLLMUsageResponse(
+            execution_id=execution_id,
+            calls=sum(item.calls for item in usage),
+            total_tokens=sum(item.total_tokens for item in usage),
+            cost=sum(item.cost for item in usage),
+            usage=usage,
+        )
+    
+    async def get_model_summary(self, days: Optional[int] = None) -> List[ModelUsageSummary]:
+        """
+        Get LLM usage per model across executions.
+        
+        Args:
+            days: Only include usage from the last N days; all usage if None
+            
+        Returns:
+            List of ModelUsageSummary ordered by model
+        """
+        since = datetime.utcnow() - timedelta(days=days) if days else None
+        summary = await self.repository.summarize_by_model(since)
+        return [ModelUsageSummary(**item) for item in summary]
@@ -1,10 +1,73 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Iterable
+from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.log import LLMLog
+from src.models.log import LLMLog, LATENCY_BUCKET_BOUNDS_MS
 from src.repositories.log_repository import LLMLogRepository
 
+# Latency percentiles reported by get_log_stats
+STATS_PERCENTILES = (50, 90, 99)
+
+
+def _latency_percentiles(buckets: Dict[int, Dict[str, int]], percentiles: Iterable[int] = STATS_PERCENTILES) -> Dict[str, Optional[float]]:
+    """
+    Estimate latency percentiles from per-bucket call counts.
+    
+    Within a bucket, latencies are assumed to be spread evenly between the
+    bucket's lower bound and the smaller of its upper bound and the slowest
+    call it saw.
+    
+    Args:
+        buckets: Calls and duration_ms_max by latency bucket index; -1 is ignored
+        percentiles: Percentiles to estimate
+        
+    Returns:
+        Dictionary mapping "p50_ms" style keys to estimates, None without timed calls
+    """
+    timed = sorted((index, values) for index, values in buckets.items() if index >= 0 and values["calls"])
+    total = sum(values["calls"] for _, values in timed)
+    estimates: Dict[str, Optional[float]] = {}
+    for percentile in percentiles:
+        key = f"p{percentile}_ms"
+        if not total:
+            estimates[key] = None
+            continue
+        rank = total * percentile / 100
+        seen = 0
+        for index, values in timed:
+            if seen + values["calls"] >= rank:
+                lower = LATENCY_BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0
+                upper = LATENCY_BUCKET_BOUNDS_MS[index] if index < len(LATENCY_BUCKET_BOUNDS_MS) else values["duration_ms_max"]
+                upper = max(lower, min(upper, values["duration_ms_max"]))
+                estimates[key] = round(lower + (upper - lower) * (rank - seen) / values["calls"], 1)
+                break
+            seen += values["calls"]
+    return estimates
+
+
+def _summarize(groups: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine rollup groups into counts, token sums, error rate and latency percentiles."""
+    calls = errors = tokens_used = duration_total = timed_calls = 0
+    buckets: Dict[int, Dict[str, int]] = {}
+    for group in groups:
+        calls += group["calls"] or 0
+        errors += group["errors"] or 0
+        tokens_used += group["tokens_used"] or 0
+        if group["latency_bucket"] >= 0:
+            timed_calls += group["calls"] or 0
+            duration_total += group["duration_ms_total"] or 0
+        bucket = buckets.setdefault(group["latency_bucket"], {"calls": 0, "duration_ms_max": 0})
+        bucket["calls"] += group["calls"] or 0
+        bucket["duration_ms_max"] = max(bucket["duration_ms_max"], group["duration_ms_max"] or 0)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+        "tokens_used": tokens_used,
+        "avg_duration_ms": round(duration_total / timed_calls, 1) if timed_calls else None,
+        **_latency_percentiles(buckets),
+    }
+
 
 class LLMLogService:
     """
@@ -121,27 +184,43 @@ class LLMLogService:
     
     async def get_log_stats(self, days: int = 30) -> Dict[str, Any]:
         """
-        Get statistics about LLM usage.
+        Get statistics about LLM usage over the last days.
+        
+        Reads the daily rollups with a single grouped query, so the cost
+        depends on the number of days, endpoints and models rather than on
+        the number of logs. Logs that predate the rollups are added when the
+        rollup table is created (see daily_stats_backfill).
         
         Args:
-            days: Number of days to include in stats
+            days: Number of days to include in stats, including today
             
         Returns:
-            Dictionary with usage statistics
+            Dictionary with totals, per-endpoint, per-model and per endpoint
+            and model counts, token sums, error rates and latency percentiles
         """
-        # This would be a more complex implementation in a real system
-        # but for this example, we'll just return a simple count
-        total_count = await self.count_logs()
-        endpoints = await self.get_unique_endpoints()
+        since = datetime.utcnow().date() - timedelta(days=days - 1)
+        groups = await self.repository.get_daily_stats(since)
         
-        # Count by endpoint
-        endpoint_counts = {}
-        for endpoint in endpoints:
-            endpoint_counts[endpoint] = await self.count_logs(endpoint)
-            
+        by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+        by_model: Dict[str, List[Dict[str, Any]]] = {}
+        by_endpoint_model: Dict[tuple, List[Dict[str, Any]]] = {}
+        for group in groups:
+            by_endpoint.setdefault(group["endpoint"], []).append(group)
+            by_model.setdefault(group["model"], []).append(group)
+            by_endpoint_model.setdefault((group["endpoint"], group["model"]), []).append(group)
+        
+        endpoint_stats = {endpoint: _summarize(items) for endpoint, items in sorted(by_endpoint.items())}
         return {
-            "total_logs": total_count,
-            "endpoints": endpoints,
-            "counts_by_endpoint": endpoint_counts,
-            "days_included": days
-        } 
\ No newline at end of file
+            "total_logs": sum(group["calls"] or 0 for group in groups),
+            "endpoints": list(endpoint_stats),
+            "counts_by_endpoint": {endpoint: stats["calls"] for endpoint, stats in endpoint_stats.items()},
+            "days_included": days,
+            "since": since.isoformat(),
+            "totals": _summarize(groups),
+            "by_endpoint": endpoint_stats,
+            "by_model": {model: _summarize(items) for model, items in sorted(by_model.items())},
+            "by_endpoint_model": [
+                {"endpoint": endpoint, "model": model, **_summarize(items)}
+                for (endpoint, model), items in sorted(by_endpoint_model.items())
+            ],
+        }
@@ -14,6 +14,8 @@ from src.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleRespons
 from src.schemas.scheduler import SchedulerJobCreate, SchedulerJobUpdate, SchedulerJobResponse
 from src.utils.cron_utils import ensure_utc, calculate_next_run_from_last
 from src.services.crewai_execution_service import CrewAIExecutionService, JobStatus
+from src.services.execution_admission import ExecutionTrigger
+from src.services.execution_queue_service import ExecutionQueueService
 from src.db.session import async_session_factory
 from src.models.execution_history import ExecutionHistory as Run
 from src.config.settings import settings
@@ -277,11 +279,19 @@ class SchedulerService:
                     created_at=execution_time
                 )
                 
-                # Run the job
-                await crew_execution_service.run_crew_execution(
-                    execution_id=job_id,
-                    config=config
-                )
+                # Run the job, or leave it to a queue worker
+                if settings.EXECUTION_QUEUE_ENABLED:
+                    await ExecutionQueueService.enqueue(
+                        job_id=job_id,
+                        payload=config.model_dump(mode="json"),
+                        trigger_type=ExecutionTrigger.SCHEDULE.value
+                    )
+                else:
+                    await crew_execution_service.run_crew_execution(
+                        execution_id=job_id,
+                        config=config,
+                        trigger_type=ExecutionTrigger.SCHEDULE.value
+                    )
                 
                 # Update schedule after execution
                 repo = ScheduleRepository(session)
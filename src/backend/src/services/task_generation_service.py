@@ -9,7 +9,6 @@ import logging
 import os
 from typing import Optional
 import re
-import litellm
 
 from src.schemas.model_provider import ModelProvider
 from src.schemas.task_generation import TaskGenerationRequest, TaskGenerationResponse
@@ -17,6 +16,7 @@ from src.services.template_service import TemplateService
 from src.utils.prompt_utils import robust_json_parser
 from src.services.log_service import LLMLogService
 from src.core.llm_manager import LLMManager
+from src.core.llm_response_cache import cached_acompletion
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -125,7 +125,7 @@ class TaskGenerationService:
             model_params = await LLMManager.configure_litellm(model)
             
             # Generate completion with litellm directly
-            response = await litellm.acompletion(
+            response = await cached_acompletion(
                 **model_params,
                 messages=messages,
                 temperature=0.7,
@@ -11,14 +11,13 @@ import traceback
 
 from typing import Optional
 
-import litellm
-
 from src.utils.model_config import get_model_config
 from src.services.template_service import TemplateService
 from src.schemas.template_generation import TemplateGenerationRequest, TemplateGenerationResponse
 from src.services.log_service import LLMLogService
 from src.utils.prompt_utils import robust_json_parser
 from src.core.llm_manager import LLMManager
+from src.core.llm_response_cache import cached_acompletion
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -125,7 +124,7 @@ class TemplateGenerationService:
             
             try:
                 # Generate completion with litellm directly
-                response = await litellm.acompletion(
+                response = await cached_acompletion(
                     **model_params,
                     messages=messages,
                     temperature=0.7,
@@ -0,0 +1,126 @@
+"""
+Token streaming from crew LLM calls to execution WebSocket subscribers.
+
+Executions started with ``stream_tokens`` run their LLMs in streaming mode.
+Every token delta is pushed here from the crew's thread and coalesced per
+execution; one frame with the deltas collected over
+``TOKEN_STREAM_FRAME_INTERVAL_SECONDS`` is then sent from the event loop
+serving the WebSockets. Frames only go to live subscribers and are never
+written to the execution logs table. In crew worker processes deltas are
+forwarded to the API process, which frames them the same way.
+"""
+import asyncio
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from src.core.logger import LoggerManager
+from src.services.execution_logs_service import execution_logs_service
+
+logger = LoggerManager.get_instance().system
+
+
+class TokenStreamer:
+    """
+    Coalesces token deltas per execution into WebSocket frames.
+
+    ``push`` is thread-safe and cheap: it appends the delta and, if no frame
+    is pending, schedules one on the WebSocket event loop after the frame
+    interval. Deltas for executions without subscribers are dropped.
+    """
+
+    def __init__(self, frame_interval: float = 0.05):
+        self._frame_interval = frame_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[str]] = {}
+        self._frame_scheduled = False
+        self._forward: Optional[Callable[[str, str], None]] = None
+        self._deltas = 0
+        self._frames = 0
+
+    def set_forwarder(self, forward: Optional[Callable[[str, str], None]]) -> None:
+        """
+        Send deltas to another process instead of framing them here.
+
+        Args:
+            forward: Callable taking an execution ID and a delta, or None to frame locally
+        """
+        self._forward = forward
+
+    def push(self, execution_id: str, delta: str) -> bool:
+        """
+        Add a token delta to the next frame of an execution.
+
+        Args:
+            execution_id: Execution the delta belongs to
+            delta: Streamed text
+
+        Returns:
+            True if the delta was accepted
+        """
+        if not delta:
+            return False
+        if self._forward is not None:
+            self._forward(execution_id, delta)
+            return True
+
+        loop = execution_logs_service.loop
+        if loop is None or loop.is_closed() or not execution_logs_service.has_subscribers(execution_id):
+            return False
+        with self._lock:
+            self._pending.setdefault(execution_id, []).append(delta)
+            self._deltas += 1
+            schedule = not self._frame_scheduled
+            self._frame_scheduled = True
+        if schedule:
+            loop.call_soon_threadsafe(loop.call_later, self._frame_interval, self._start_send)
+        return True
+
+    def _start_send(self) -> None:
+        asyncio.ensure_future(self.send_frames())
+
+    async def send_frames(self) -> int:
+        """
+        Send one frame per execution with the deltas collected since the last frame.
+
+        Returns:
+            Number of frames sent
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._frame_scheduled = False
+        timestamp = datetime.utcnow().isoformat()
+        for execution_id, deltas in pending.items():
+            await execution_logs_service.send_live(execution_id, {
+                "execution_id": execution_id,
+                "content": "".join(deltas),
+                "timestamp": timestamp,
+                "type": "token"
+            })
+        with self._lock:
+            self._frames += len(pending)
+        return len(pending)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get received deltas, sent frames and executions with pending deltas.
+
+        Returns:
+            Dictionary of streamer statistics
+        """
+        with self._lock:
+            return {"deltas": self._deltas, "frames": self._frames, "pending": len(self._pending)}
+
+
+_token_streamer: Optional[TokenStreamer] = None
+_token_streamer_lock = threading.Lock()
+
+# Function to get the singleton token streamer instance easily
+def get_token_streamer() -> TokenStreamer:
+    global _token_streamer
+    if _token_streamer is None:
+        with _token_streamer_lock:
+            if _token_streamer is None:
+                from src.config.settings import settings
+                _token_streamer = TokenStreamer(frame_interval=settings.TOKEN_STREAM_FRAME_INTERVAL_SECONDS)
+    return _token_streamer
@@ -1,4 +1,17 @@
-import queue
+from typing import Any, Dict, Optional
+
+from src.utils.bounded_queue import BoundedBridgeQueue, OverflowPolicy
+
+def _trace_policy(trace_data: Any) -> OverflowPolicy:
+    """Resolve the overflow policy for a trace from its event type."""
+    from src.config.settings import settings
+    
+    # Non-trace items (e.g. the None shutdown signal) are never dropped
+    if not isinstance(trace_data, dict):
+        return OverflowPolicy.BLOCK
+    event_type = trace_data.get("event_type")
+    policy = settings.TRACE_QUEUE_EVENT_POLICIES.get(event_type, settings.TRACE_QUEUE_DEFAULT_POLICY)
+    return OverflowPolicy(policy)
 
 class TraceQueue:
     """Singleton holder for the agent trace queue."""
@@ -7,14 +20,26 @@ class TraceQueue:
 
     def __new__(cls):
         if cls._instance is None:
+            from src.config.settings import settings
+            
             cls._instance = super(TraceQueue, cls).__new__(cls)
-            cls._instance._queue = queue.Queue()
+            cls._instance._queue = BoundedBridgeQueue(
+                maxsize=settings.TRACE_QUEUE_MAXSIZE,
+                policy_resolver=_trace_policy,
+                block_timeout=settings.QUEUE_BLOCK_TIMEOUT_SECONDS,
+                sample_rate=settings.QUEUE_SAMPLE_RATE,
+                sample_high_watermark=settings.QUEUE_SAMPLE_HIGH_WATERMARK,
+            )
         return cls._instance
 
-    def get_queue(self) -> queue.Queue:
+    def get_queue(self) -> BoundedBridgeQueue:
         """Get the singleton queue instance."""
         return self._queue
 
 # Function to get the singleton queue instance easily
-def get_trace_queue() -> queue.Queue:
-    return TraceQueue().get_queue() 
\ No newline at end of file
+def get_trace_queue() -> BoundedBridgeQueue:
+    return TraceQueue().get_queue()
+
+def get_trace_queue_job_stats(job_id: str) -> Optional[Dict[str, Any]]:
+    """Get drop and lag counters of the trace queue for a job, or None if unseen."""
+    return get_trace_queue().get_job_stats(job_id)
@@ -2,11 +2,16 @@
 Utilities for event loop management and handling asyncio operations across threads.
 """
 import asyncio
+import concurrent.futures
 import logging
-from typing import Any, Callable, List, TypeVar, Coroutine
+import queue
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Coroutine
 
 from src.core.logger import LoggerManager
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().system
@@ -14,56 +19,416 @@ logger = LoggerManager.get_instance().system
 # Type variable for the return value of the database operation
 T = TypeVar('T')
 
-async def execute_db_operation_with_fresh_engine(operation: Callable[[AsyncSession], Coroutine[Any, Any, T]]) -> T:
+class LoopEngineRegistry:
     """
-    Execute a database operation with a fresh engine and session to avoid event loop issues.
-    
+    Registry of pooled async engines, one per (thread, event loop) pair.
+
+    Async DB connections are bound to the event loop that opened them, so code
+    running on crew threads or short-lived loops cannot share the application
+    engine. Instead of creating and disposing an engine per operation, each
+    loop gets its own small pooled engine that is reused until the loop closes.
+    Loops should release their engine with ``dispose_loop`` before closing, as
+    ``create_and_run_loop`` and ``run_in_thread_with_loop`` do; connections of
+    loops closed without it are terminated without the loop when the registry
+    notices the closed loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (thread id, loop id) -> (weakref to loop, engine, session factory)
+        self._engines: Dict[Tuple[int, int], Tuple[weakref.ref, AsyncEngine, async_sessionmaker]] = {}
+        # id(engine) -> DBAPI connections the engine has open
+        self._connections: Dict[int, Set[Any]] = {}
+
+    @staticmethod
+    def _key(loop: asyncio.AbstractEventLoop) -> Tuple[int, int]:
+        return threading.get_ident(), id(loop)
+
+    def _create_engine(self) -> AsyncEngine:
+        # Import here to avoid circular imports
+        from src.config.settings import settings
+
+        engine_kwargs = {
+            "echo": False,
+            "future": True,
+            "pool_pre_ping": True,
+        }
+        if not str(settings.DATABASE_URI).startswith("sqlite"):
+            engine_kwargs["pool_size"] = settings.DB_LOOP_ENGINE_POOL_SIZE
+            engine_kwargs["max_overflow"] = settings.DB_LOOP_ENGINE_MAX_OVERFLOW
+        from src.db.session import configure_sqlite_engine
+
+        engine = create_async_engine(str(settings.DATABASE_URI), **engine_kwargs)
+        configure_sqlite_engine(engine)
+
+        # Track open connections so those of a closed loop can still be terminated
+        connections: Set[Any] = set()
+        event.listen(engine.sync_engine, "connect", lambda dbapi_connection, record: connections.add(dbapi_connection))
+        event.listen(engine.sync_engine, "close", lambda dbapi_connection, record: connections.discard(dbapi_connection))
+        event.listen(engine.sync_engine, "close_detached", lambda dbapi_connection: connections.discard(dbapi_connection))
+        self._connections[id(engine)] = connections
+        return engine
+
+    def _prune_closed_loops(self) -> None:
+        """Drop engines whose event loop was closed without calling dispose_loop. Caller holds the lock."""
+        for key, (loop_ref, engine, _) in list(self._engines.items()):
+            loop = loop_ref()
+            if loop is None or loop.is_closed():
+                del self._engines[key]
+                # The loop is gone, so connections cannot be closed gracefully.
+                # Terminating does not need the loop: asyncpg sends Terminate so
+                # the server ends the session, aiosqlite stops its thread.
+                for dbapi_connection in list(self._connections.pop(id(engine), ())):
+                    try:
+                        dbapi_connection.terminate()
+                    except Exception as e:
+                        logger.debug(f"[LoopEngineRegistry] Error terminating connection of closed loop: {e}")
+                try:
+                    engine.sync_engine.dispose(close=False)
+                except Exception as e:
+                    logger.warning(f"[LoopEngineRegistry] Error releasing engine of closed loop: {e}")
+
+    def get_session_factory(self) -> async_sessionmaker:
+        """
+        Get the session factory bound to the current thread's running event loop.
+
+        Returns:
+            async_sessionmaker whose engine is owned by the running loop
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(loop)
+        with self._lock:
+            entry = self._engines.get(key)
+            if entry is not None and entry[0]() is loop:
+                return entry[2]
+
+            self._prune_closed_loops()
+            engine = self._create_engine()
+            session_factory = async_sessionmaker(
+                engine,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            self._engines[key] = (weakref.ref(loop), engine, session_factory)
+            logger.debug(f"[LoopEngineRegistry] Created engine for loop {key}. Alive engines: {len(self._engines)}")
+            return session_factory
+
+    async def dispose_loop(self) -> None:
+        """Dispose the engine owned by the running event loop, if any. Call before closing the loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._engines.pop(self._key(loop), None)
+            if entry is not None:
+                self._connections.pop(id(entry[1]), None)
+        if entry is not None:
+            await entry[1].dispose()
+            logger.debug(f"[LoopEngineRegistry] Disposed engine for closing loop. Alive engines: {self.alive_count()}")
+
+    def alive_count(self) -> int:
+        """Number of engines currently held, after dropping those of closed loops."""
+        with self._lock:
+            self._prune_closed_loops()
+            return len(self._engines)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the engines currently held by the registry.
+
+        Returns:
+            Dictionary with the alive engine count and per-engine pool status
+        """
+        with self._lock:
+            self._prune_closed_loops()
+            return {
+                "alive_engines": len(self._engines),
+                "engines": [
+                    {
+                        "thread_id": thread_id,
+                        "loop_id": loop_id,
+                        "pool": engine.sync_engine.pool.status(),
+                    }
+                    for (thread_id, loop_id), (_, engine, _) in self._engines.items()
+                ],
+            }
+
+
+# Process-wide registry of per-loop engines
+engine_registry = LoopEngineRegistry()
+
+
+async def execute_db_operation(operation: Callable[[AsyncSession], Coroutine[Any, Any, T]]) -> T:
+    """
+    Execute a database operation on the pooled engine owned by the running event loop.
+
+    Safe to call from any thread or event loop: every loop gets its own engine
+    from ``engine_registry``, so connections are never shared across loops.
+
     Args:
         operation: A callable that takes an AsyncSession and returns a coroutine
-        
+
     Returns:
         The result of the operation
-        
+
     Example:
         ```
         async def get_user(session, user_id):
             # Database operation
             return await session.execute(...)
-            
-        result = await execute_db_operation_with_fresh_engine(
+
+        result = await execute_db_operation(
             lambda session: get_user(session, 123)
         )
         ```
     """
-    # Import here to avoid circular imports
-    from src.config.settings import settings
-    
-    # Create a new engine for this operation
-    engine = create_async_engine(
-        str(settings.DATABASE_URI),
-        echo=False,
-        future=True,
-        pool_pre_ping=True,
-    )
-    
-    # Create a new session factory
-    session_factory = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
-        autoflush=False,
-    )
-    
+    session_factory = engine_registry.get_session_factory()
     try:
-        # Create a session and execute the operation
         async with session_factory() as session:
-            result = await operation(session)
-            return result
+            return await operation(session)
     except Exception as e:
-        logger.error(f"Error executing DB operation with fresh engine: {str(e)}")
+        logger.error(f"Error executing DB operation on loop engine: {str(e)}")
         raise
-    finally:
-        # Always dispose the engine
-        await engine.dispose()
+
+
+class SingleWriterLane:
+    """
+    Runs write transactions one at a time on a single writer task.
+
+    SQLite has one write lock per database. When the log writer, trace writer,
+    status updates and requests write concurrently, each waits on the others
+    and fails with "database is locked" once busy_timeout runs out. Operations
+    submitted with ``execute_db_write`` from any thread or event loop are
+    queued to the writer task instead, which runs them in order, each in its
+    own session on the loop that started the lane. Readers are unaffected.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Guards _accepting against submissions from other threads racing stop()
+        self._lock = threading.Lock()
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer task is accepting operations."""
+        return self._accepting and self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        """Start the writer task on the running loop."""
+        if not self.running:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+            with self._lock:
+                self._accepting = True
+        return self._task
+
+    async def _execute(self, operation: Callable[[AsyncSession], Coroutine[Any, Any, T]], future: concurrent.futures.Future) -> None:
+        # Skip operations whose caller stopped waiting
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = await execute_db_operation(operation)
+        except asyncio.CancelledError:
+            future.set_exception(RuntimeError("Writer lane stopped during the operation"))
+            raise
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            await self._execute(*item)
+
+    def _enqueue(self, item: Tuple[Callable, concurrent.futures.Future]) -> None:
+        """Queue an operation. Runs on the lane's loop."""
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(item)
+        else:
+            # Submitted while the lane stopped; run it directly rather than lose it
+            self._loop.create_task(self._execute(*item))
+
+    async def submit(self, operation: Callable[[AsyncSession], Coroutine[Any, Any, T]]) -> T:
+        """
+        Run a write operation on the writer task and wait for its result.
+
+        Args:
+            operation: A callable that takes an AsyncSession and returns a coroutine
+
+        Returns:
+            The result of the operation
+        """
+        # Writes issued by a queued operation would wait on themselves
+        if asyncio.current_task() is self._task:
+            return await execute_db_operation(operation)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            accepted = self.running
+            if accepted:
+                try:
+                    if asyncio.get_running_loop() is self._loop:
+                        self._enqueue((operation, future))
+                    else:
+                        self._loop.call_soon_threadsafe(self._enqueue, (operation, future))
+                except RuntimeError:
+                    # The lane's loop is closed
+                    accepted = False
+        if not accepted:
+            # The lane is stopped or stopping and its loop may never run the
+            # operation; write directly from the caller instead
+            return await execute_db_operation(operation)
+        return await asyncio.wrap_future(future)
+
+    async def stop(self) -> None:
+        """Finish the queued operations and stop the writer task. Call on the lane's loop."""
+        if self._task is None:
+            return
+        with self._lock:
+            self._accepting = False
+        # Let operations accepted from other threads before this point reach the queue
+        await asyncio.sleep(0)
+        if not self._task.done():
+            self._queue.put_nowait(None)
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                await self._execute(*item)
+
+
+# Process-wide writer lane, started by the application when SQLITE_SINGLE_WRITER is on
+writer_lane = SingleWriterLane()
+
+
+async def execute_db_write(operation: Callable[[AsyncSession], Coroutine[Any, Any, T]]) -> T:
+    """
+    Execute a database write through the single writer lane if it is running.
+
+    Otherwise behaves exactly like execute_db_operation. The operation must
+    commit its own transaction.
+
+    Args:
+        operation: A callable that takes an AsyncSession and returns a coroutine
+
+    Returns:
+        The result of the operation
+    """
+    if writer_lane.running:
+        return await writer_lane.submit(operation)
+    return await execute_db_operation(operation)
+
+
+async def execute_db_operation_with_fresh_engine(operation: Callable[[AsyncSession], Coroutine[Any, Any, T]]) -> T:
+    """
+    Deprecated alias of execute_db_operation, kept for backward compatibility.
+
+    Args:
+        operation: A callable that takes an AsyncSession and returns a coroutine
+
+    Returns:
+        The result of the operation
+    """
+    return await execute_db_operation(operation)
+
+
+class AsyncBridgeQueue(queue.Queue):
+    """
+    Thread-safe queue that can be consumed from an asyncio event loop without blocking it.
+
+    Producers (crew threads, callbacks) keep using the regular ``queue.Queue``
+    API. A single asyncio consumer awaits ``get_batch`` which sleeps on an
+    ``asyncio.Event`` that producers set via ``call_soon_threadsafe``, so the
+    event loop is only woken when data actually arrives.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._consumer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._data_event: Optional[asyncio.Event] = None
+        self._wakeup_pending = False
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        super().put(item, block, timeout)
+        self._notify_consumer()
+
+    def _notify_consumer(self) -> None:
+        """Wake the asyncio consumer, scheduling at most one wakeup per drain."""
+        loop = self._consumer_loop
+        event = self._data_event
+        if loop is None or event is None or self._wakeup_pending:
+            return
+        self._wakeup_pending = True
+        try:
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is loop:
+                event.set()
+            else:
+                loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Consumer loop is closed; the next get_batch call rebinds
+            self._wakeup_pending = False
+
+    def _bind_consumer_loop(self) -> asyncio.Event:
+        """Bind the queue to the currently running loop (rebinding if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._consumer_loop is not loop or self._data_event is None:
+            self._consumer_loop = loop
+            self._data_event = asyncio.Event()
+            self._wakeup_pending = False
+        return self._data_event
+
+    def _drain(self, max_items: int) -> List[Any]:
+        items = []
+        while len(items) < max_items:
+            try:
+                items.append(self.get_nowait())
+            except queue.Empty:
+                break
+            self.task_done()
+        return items
+
+    async def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Wait for data without blocking the event loop and return up to ``max_items`` items.
+
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Maximum seconds to wait for the first item; None waits forever
+
+        Returns:
+            List of items in FIFO order, empty if the timeout expired
+        """
+        event = self._bind_consumer_loop()
+
+        # Clear the wakeup flag before draining so a put racing with the
+        # drain always schedules a fresh wakeup.
+        event.clear()
+        self._wakeup_pending = False
+        items = self._drain(max_items)
+        if items:
+            return items
+
+        try:
+            if timeout is None:
+                await event.wait()
+            else:
+                await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        event.clear()
+        self._wakeup_pending = False
+        return self._drain(max_items)
+
 
 def create_and_run_loop(coroutine: Any) -> Any:
     """Create a new event loop, run the coroutine, and clean up properly."""
@@ -82,6 +447,8 @@ def create_and_run_loop(coroutine: Any) -> Any:
             # Run the event loop until all tasks are canceled
             if pending:
                 new_loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            # Release the DB engine owned by this loop
+            new_loop.run_until_complete(engine_registry.dispose_loop())
             # Remove the loop from the current context and close it
             asyncio.set_event_loop(None)
             new_loop.close()
@@ -119,6 +486,8 @@ def create_task_lifecycle_callback(loop_handler: Callable, callbacks: List, task
                 # Run the event loop until all tasks are canceled
                 if pending:
                     new_loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                # Release the DB engine owned by this loop
+                new_loop.run_until_complete(engine_registry.dispose_loop())
                 # Remove the loop from the current context and close it
                 asyncio.set_event_loop(None)
                 new_loop.close()
@@ -152,6 +521,8 @@ def run_in_thread_with_loop(func: Callable, *args, **kwargs) -> Any:
         # Clean up the event loop only if we created it
         if created_loop and loop is not None:
             try:
+                # Release the DB engine owned by this loop before closing it
+                loop.run_until_complete(engine_registry.dispose_loop())
                 # Only close the loop if we created it
                 asyncio.set_event_loop(None)
                 loop.close()
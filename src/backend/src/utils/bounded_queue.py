@@ -0,0 +1,226 @@
+"""
+Bounded thread-to-asyncio queue with per-item overflow policies.
+
+Producers on crew threads enqueue traces and log lines much faster than the
+writers can persist them when an agent runs away. This queue caps memory by
+applying a policy per item when it is under pressure, and keeps per-job
+counters of what was dropped and how far the consumer lags behind.
+"""
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.asyncio_utils import AsyncBridgeQueue
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with an item when the queue is under pressure."""
+    BLOCK = "block"              # Wait for space; never dropped
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest droppable item when full
+    SAMPLE = "sample"            # Keep 1 in N above the high-water mark
+
+
+class BoundedBridgeQueue(AsyncBridgeQueue):
+    """
+    AsyncBridgeQueue with a maximum size and a per-item overflow policy.
+
+    Overflow handling is decided by the item's policy rather than by the
+    ``block``/``timeout`` arguments of ``put``, so existing ``put_nowait``
+    producers get the configured behaviour:
+
+    - BLOCK items wait up to ``block_timeout`` for space (except on the consumer
+      thread, where waiting would deadlock), then evict the oldest droppable
+      item, and as a last resort are appended beyond ``maxsize``.
+    - DROP_OLDEST items evict the oldest droppable item when the queue is full.
+    - SAMPLE items are kept 1 in ``sample_rate`` once the queue is above
+      ``sample_high_watermark`` of its capacity, and dropped when full.
+    """
+
+    # Number of jobs to keep counters for before the oldest are forgotten
+    MAX_TRACKED_JOBS = 1000
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy_resolver: Callable[[Any], OverflowPolicy],
+        block_timeout: float = 1.0,
+        sample_rate: int = 10,
+        sample_high_watermark: float = 0.5,
+    ):
+        super().__init__(maxsize)
+        self._policy_resolver = policy_resolver
+        self._block_timeout = block_timeout
+        self._sample_rate = max(1, sample_rate)
+        self._sample_high_watermark = sample_high_watermark
+        self._consumer_thread: Optional[int] = None
+        self._sample_counter = 0
+        # Queued items whose policy allows evicting them
+        self._droppable = 0
+        self._job_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    # --- Internal storage: items are stored with their enqueue time and
+    # whether their policy allows evicting them, resolved once by put ---
+
+    def _put(self, item: Any, droppable: bool = False) -> None:
+        self.queue.append((time.monotonic(), droppable, item))
+        self._droppable += droppable
+
+    def _get(self) -> Any:
+        enqueued_at, droppable, item = self.queue.popleft()
+        self._droppable -= droppable
+        stats = self._stats_for(item)
+        if stats is not None:
+            lag = time.monotonic() - enqueued_at
+            stats["pending"] -= 1
+            stats["last_lag_seconds"] = lag
+            stats["max_lag_seconds"] = max(stats["max_lag_seconds"], lag)
+        return item
+
+    def _bind_consumer_loop(self):
+        self._consumer_thread = threading.get_ident()
+        return super()._bind_consumer_loop()
+
+    # --- Per-job accounting (caller holds self.mutex) ---
+
+    @staticmethod
+    def _job_id_of(item: Any) -> Optional[str]:
+        if isinstance(item, dict):
+            return item.get("job_id")
+        return None
+
+    def _stats_for(self, item: Any) -> Optional[Dict[str, Any]]:
+        job_id = self._job_id_of(item)
+        if job_id is None:
+            return None
+        stats = self._job_stats.get(job_id)
+        if stats is None:
+            stats = {
+                "enqueued": 0,
+                "dropped": 0,
+                "sampled_out": 0,
+                "overflowed": 0,
+                "pending": 0,
+                "last_lag_seconds": 0.0,
+                "max_lag_seconds": 0.0,
+            }
+            self._job_stats[job_id] = stats
+            while len(self._job_stats) > self.MAX_TRACKED_JOBS:
+                self._job_stats.popitem(last=False)
+        return stats
+
+    def _count_drop(self, item: Any, counter: str) -> None:
+        stats = self._stats_for(item)
+        if stats is not None:
+            stats[counter] += 1
+
+    def _evict_oldest_droppable(self) -> bool:
+        """Remove the oldest item whose policy allows dropping. Caller holds self.mutex."""
+        if not self._droppable:
+            return False
+        for index, (_, droppable, queued_item) in enumerate(self.queue):
+            if droppable:
+                del self.queue[index]
+                self._droppable -= 1
+                self.unfinished_tasks -= 1
+                stats = self._stats_for(queued_item)
+                if stats is not None:
+                    stats["pending"] -= 1
+                    stats["dropped"] += 1
+                return True
+        return False
+
+    def _keep_sample(self) -> bool:
+        """Deterministically keep one in every sample_rate items. Caller holds self.mutex."""
+        self._sample_counter += 1
+        return self._sample_counter % self._sample_rate == 0
+
+    def _append(self, item: Any, policy: OverflowPolicy) -> None:
+        """Append an item and update counters. Caller holds self.mutex."""
+        self._put(item, droppable=policy != OverflowPolicy.BLOCK)
+        self.unfinished_tasks += 1
+        self.not_empty.notify()
+        stats = self._stats_for(item)
+        if stats is not None:
+            stats["enqueued"] += 1
+            stats["pending"] += 1
+
+    # --- Public API ---
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Enqueue an item according to its overflow policy.
+
+        Never raises ``queue.Full``; items that cannot be kept are counted as
+        dropped for their job instead.
+        """
+        policy = self._policy_resolver(item)
+        accepted = False
+        with self.not_full:
+            if policy == OverflowPolicy.SAMPLE:
+                fill = self._qsize() / self.maxsize if self.maxsize > 0 else 0.0
+                if self.maxsize > 0 and self._qsize() >= self.maxsize:
+                    self._count_drop(item, "dropped")
+                elif fill >= self._sample_high_watermark and not self._keep_sample():
+                    self._count_drop(item, "sampled_out")
+                else:
+                    self._append(item, policy)
+                    accepted = True
+
+            elif policy == OverflowPolicy.DROP_OLDEST:
+                if self.maxsize > 0 and self._qsize() >= self.maxsize and not self._evict_oldest_droppable():
+                    # Queue is full of never-drop items; drop this one instead
+                    self._count_drop(item, "dropped")
+                else:
+                    self._append(item, policy)
+                    accepted = True
+
+            else:
+                if self.maxsize > 0 and self._qsize() >= self.maxsize:
+                    # Waiting on the consumer's own thread would deadlock it
+                    if threading.get_ident() != self._consumer_thread:
+                        deadline = time.monotonic() + self._block_timeout
+                        while self._qsize() >= self.maxsize:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            self.not_full.wait(remaining)
+                    if self._qsize() >= self.maxsize and not self._evict_oldest_droppable():
+                        self._count_drop(item, "overflowed")
+                self._append(item, policy)
+                accepted = True
+
+        if accepted:
+            self._notify_consumer()
+
+    def get_job_stats(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get drop and lag counters for a job.
+
+        Args:
+            job_id: Job ID to look up
+
+        Returns:
+            Copy of the job's counters, or None if the job was never seen
+        """
+        with self.mutex:
+            stats = self._job_stats.get(job_id)
+            return dict(stats) if stats is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue-wide size and drop totals.
+
+        Returns:
+            Dictionary with size, capacity and dropped/sampled/overflowed totals
+        """
+        with self.mutex:
+            return {
+                "size": self._qsize(),
+                "maxsize": self.maxsize,
+                "tracked_jobs": len(self._job_stats),
+                "dropped": sum(s["dropped"] for s in self._job_stats.values()),
+                "sampled_out": sum(s["sampled_out"] for s in self._job_stats.values()),
+                "overflowed": sum(s["overflowed"] for s in self._job_stats.values()),
+            }
@@ -0,0 +1,146 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token holding the sort key of the last row of
+a page: its timestamp and ID. The next page is read with
+``WHERE (timestamp, id) < (cursor timestamp, cursor id)``, which an index on
+the sort key answers directly, so page N costs the same as page 1 instead of
+scanning and discarding every row before an OFFSET.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+
+def encode_cursor(timestamp: Optional[datetime], row_id: int) -> str:
+    """
+    Build the cursor pointing after a row.
+
+    Args:
+        timestamp: Sort timestamp of the row
+        row_id: Primary key of the row
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps([timestamp.isoformat() if timestamp else None, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    Read the sort key stored in a cursor.
+
+    Args:
+        cursor: Cursor created by encode_cursor
+
+    Returns:
+        Tuple of (timestamp, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(timestamp) if timestamp else None), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def keyset_paginate(
+    query: Select,
+    timestamp_column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+) -> Select:
+    """
+    Order a query by (timestamp, id) and restrict it to the page after a cursor.
+
+    Args:
+        query: Select statement with the caller's filters
+        timestamp_column: Timestamp column of the sort key
+        id_column: Primary key column breaking timestamp ties
+        limit: Page size
+        cursor: Cursor of the previous page, None for the first page
+        descending: Newest rows first if True
+
+    Returns:
+        Paginated select statement
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        key = tuple_(timestamp_column, id_column)
+        after = tuple_(timestamp, row_id)
+        query = query.where(key < after if descending else key > after)
+    if descending:
+        query = query.order_by(timestamp_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(timestamp_column.asc(), id_column.asc())
+    return query.limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, timestamp_attr: str) -> Optional[str]:
+    """
+    Get the cursor of the page following a full page of rows.
+
+    Args:
+        rows: Rows of the current page
+        limit: Page size the rows were requested with
+        timestamp_attr: Name of the row attribute holding the sort timestamp
+
+    Returns:
+        Cursor for the next page, or None if the page was the last one
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, timestamp_attr), last.id)
+
+
+def paginate_rows(
+    rows: Sequence[Any],
+    timestamp_attr: str,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+) -> List[Any]:
+    """
+    Apply the same ordering, offset and cursor paging as keyset_paginate to rows in memory.
+
+    Used for rows that are not in the database, such as archived executions.
+
+    Args:
+        rows: All rows
+        timestamp_attr: Name of the row attribute holding the sort timestamp
+        limit: Page size
+        offset: Number of rows to skip, ignored when a cursor is given
+        cursor: Cursor of the previous page, None for the first page
+        descending: Newest rows first if True
+
+    Returns:
+        Rows of the page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    def key(row: Any) -> Tuple[datetime, int]:
+        return getattr(row, timestamp_attr) or datetime.min, row.id
+
+    ordered = sorted(rows, key=key, reverse=descending)
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        after = (timestamp or datetime.min, row_id)
+        ordered = [row for row in ordered if (key(row) < after if descending else key(row) > after)]
+        offset = 0
+    return ordered[offset:offset + limit]
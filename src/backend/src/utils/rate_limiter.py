@@ -1,266 +1,327 @@
 """
-Rate limiting utilities for managing API request rates.
+Rate limiting of LLM requests and tokens per model.
+
+Limits come from the ``rpm_limit`` and ``tpm_limit`` of each model
+configuration and are shared by all crews and services in the process. Every
+model has a request bucket and a token bucket that refill continuously up to
+their per-minute capacity. Prompt tokens are estimated and taken before a
+call; completion tokens are taken once the call reports its usage.
+
+Async callers wait with ``asyncio.sleep`` so the event loop keeps running.
+Crew agents call LLMs from worker threads and wait in that thread. When
+``RATE_LIMIT_SHARED_DIR`` is set, bucket levels live in files locked with
+``flock`` so all processes on the host draw from the same buckets.
 """
+import asyncio
+import json
+import os
+import re
 import threading
 import time
-from typing import Dict, Optional
-import logging
+from typing import Any, Callable, Dict, NamedTuple, Optional
 
 from src.core.logger import LoggerManager
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 # Get logger from the centralized logging system
 logger = LoggerManager.get_instance().crew
 
-class TokenBucket:
+
+class RateLimit(NamedTuple):
+    """Per-minute limits of a model; 0 means unlimited."""
+    rpm: int
+    tpm: int
+
+
+def model_key(model: str) -> str:
+    """
+    Normalize a model name so "databricks/x" and "x" share a bucket.
+
+    LiteLLM reports models to callbacks without the provider prefix that
+    callers pass in.
+    """
+    return model.split("/", 1)[1] if model and "/" in model else (model or "")
+
+
+def estimate_tokens(messages: Any) -> int:
     """
-    A token bucket rate limiter for managing API rate limits.
-    This is designed to handle token-based rate limits for LLM APIs like Anthropic.
-    
-    The implementation uses a token bucket algorithm where:
-    - A bucket has a maximum capacity of tokens
-    - Tokens are added to the bucket at a constant rate
-    - When a request needs tokens, it takes them from the bucket if available
-    - If insufficient tokens, the request waits until enough tokens are available
+    Roughly estimate the prompt tokens of chat messages or texts.
+
+    Args:
+        messages: Chat messages, a list of texts or a single string
+
+    Returns:
+        Estimated token count, about four characters per token
     """
-    
+    if isinstance(messages, str):
+        chars = len(messages)
+    else:
+        chars = 0
+        for message in messages or []:
+            content = message.get("content") if isinstance(message, dict) else message
+            chars += len(content) if isinstance(content, str) else len(str(content or ""))
+    return max(1, chars // 4)
+
+
+def _refill(state: Dict[str, float], limit: RateLimit, now: float) -> None:
+    elapsed = max(0.0, now - state["updated_at"])
+    if limit.rpm:
+        state["requests"] = min(float(limit.rpm), state["requests"] + elapsed * limit.rpm / 60.0)
+    if limit.tpm:
+        state["tokens"] = min(float(limit.tpm), state["tokens"] + elapsed * limit.tpm / 60.0)
+    state["updated_at"] = now
+
+
+def _take(state: Dict[str, float], limit: RateLimit, tokens: int) -> float:
+    # A request larger than the whole bucket waits for a full bucket, not forever
+    tokens = min(tokens, limit.tpm) if limit.tpm else 0
+    waits = []
+    if limit.rpm and state["requests"] < 1:
+        waits.append((1 - state["requests"]) * 60.0 / limit.rpm)
+    if limit.tpm and state["tokens"] < tokens:
+        waits.append((tokens - state["tokens"]) * 60.0 / limit.tpm)
+    if waits:
+        return max(waits)
+    if limit.rpm:
+        state["requests"] -= 1
+    if limit.tpm:
+        state["tokens"] -= tokens
+    return 0.0
+
+
+class RateLimiter:
+    """
+    Request and token buckets per model, safe to use from any thread or event loop.
+
+    Bucket state is only touched under a short lock; waiting happens outside
+    it, so a waiting caller never blocks callers of other models.
+    """
+
     def __init__(
-        self, 
-        tokens_per_minute: int,
-        max_capacity: Optional[int] = None,
-        initial_tokens: Optional[int] = None
+        self,
+        enabled: bool = True,
+        shared_dir: Optional[str] = None,
+        default_rpm: int = 0,
+        default_tpm: int = 0,
     ):
+        self._enabled = enabled
+        self._shared_dir = shared_dir if shared_dir and fcntl is not None else None
+        if shared_dir and fcntl is None:
+            logger.warning("[RateLimiter] File locking unavailable, rate limits are per process")
+        self._default = RateLimit(default_rpm or 0, default_tpm or 0)
+        self._lock = threading.Lock()
+        self._limits: Dict[str, RateLimit] = {}
+        self._states: Dict[str, Dict[str, float]] = {}
+        self._waits: Dict[str, int] = {}
+        self._wait_seconds: Dict[str, float] = {}
+
+    def configure(self, model: str, rpm: Optional[int], tpm: Optional[int]) -> None:
         """
-        Initialize the token bucket rate limiter.
-        
+        Set the limits of a model, falling back to the defaults for unset values.
+
         Args:
-            tokens_per_minute: The rate at which tokens refill (tokens per minute)
-            max_capacity: The maximum number of tokens the bucket can hold
-            initial_tokens: The initial number of tokens in the bucket
+            model: Model name as passed to LiteLLM
+            rpm: Requests per minute, None or 0 for the default
+            tpm: Tokens per minute, None or 0 for the default
         """
-        self.tokens_per_minute = tokens_per_minute
-        self.max_capacity = max_capacity if max_capacity is not None else tokens_per_minute
-        self.tokens = initial_tokens if initial_tokens is not None else self.max_capacity
-        self.last_refill_time = time.time()
-        self.lock = threading.RLock()
-        
-        # Token replenishment rate in tokens per second
-        self.refill_rate = tokens_per_minute / 60.0
-        
-        logger.info(f"TokenBucket initialized with {tokens_per_minute} tokens per minute " 
-                   f"({self.refill_rate:.2f} tokens/second), max capacity: {self.max_capacity}")
-    
-    def _refill(self):
-        """Refill the token bucket based on elapsed time."""
+        if not self._enabled:
+            return
+        limit = RateLimit(rpm or self._default.rpm, tpm or self._default.tpm)
+        key = model_key(model)
+        with self._lock:
+            if self._limits.get(key) != limit:
+                self._limits[key] = limit
+                # Start a changed limit from a full bucket
+                self._states.pop(key, None)
+
+    def get_limit(self, model: str) -> Optional[RateLimit]:
+        """
+        Get the limits that apply to a model.
+
+        Returns:
+            The model's limits, the defaults for unconfigured models, or None if unlimited
+        """
+        if not self._enabled:
+            return None
+        with self._lock:
+            limit = self._limits.get(model_key(model), self._default)
+        return limit if limit.rpm or limit.tpm else None
+
+    def _state_path(self, key: str) -> str:
+        return os.path.join(self._shared_dir, re.sub(r"[^A-Za-z0-9._-]", "_", key) + ".json")
+
+    def _update(self, key: str, limit: RateLimit, update: Callable[[Dict[str, float]], Any]) -> Any:
         now = time.time()
-        elapsed = now - self.last_refill_time
-        
-        # Calculate tokens to add based on elapsed time
-        tokens_to_add = elapsed * self.refill_rate
-        
-        if tokens_to_add > 0:
-            self.tokens = min(self.tokens + tokens_to_add, self.max_capacity)
-            self.last_refill_time = now
-            logger.debug(f"Added {tokens_to_add:.2f} tokens, current tokens: {self.tokens:.2f}")
-    
-    def consume(self, tokens: int, wait: bool = True) -> bool:
+        full = {"requests": float(limit.rpm), "tokens": float(limit.tpm), "updated_at": now}
+        with self._lock:
+            if self._shared_dir is None:
+                state = self._states.get(key) or full
+                _refill(state, limit, now)
+                result = update(state)
+                self._states[key] = state
+                return result
+
+            os.makedirs(self._shared_dir, exist_ok=True)
+            with open(self._state_path(key), "a+", encoding="utf-8") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                handle.seek(0)
+                raw = handle.read()
+                try:
+                    state = json.loads(raw) if raw else full
+                except ValueError:
+                    state = full
+                _refill(state, limit, now)
+                result = update(state)
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state))
+                handle.flush()
+            return result
+
+    def try_acquire(self, model: str, tokens: int = 0) -> float:
         """
-        Consume tokens from the bucket.
-        
+        Take one request and the given tokens if both are available.
+
         Args:
-            tokens: Number of tokens to consume
-            wait: Whether to wait for tokens to be available
-            
+            model: Model name as passed to LiteLLM
+            tokens: Estimated prompt tokens
+
         Returns:
-            True if tokens were consumed, False if not and wait=False
+            0 if taken, otherwise the seconds to wait before trying again
         """
-        with self.lock:
-            self._refill()
-            
-            if self.tokens >= tokens:
-                # If we have enough tokens, consume them immediately
-                self.tokens -= tokens
-                logger.debug(f"Consumed {tokens} tokens, remaining: {self.tokens:.2f}")
-                return True
-            
-            if not wait:
-                # If we don't have enough tokens and we're not waiting, return False
-                logger.debug(f"Not enough tokens ({self.tokens:.2f}) for request ({tokens}), not waiting")
-                return False
-            
-            # Calculate time needed to accumulate required tokens
-            deficit = tokens - self.tokens
-            wait_time = deficit / self.refill_rate
-            
-            logger.info(f"Rate limit: Waiting {wait_time:.2f}s for {deficit:.2f} more tokens")
-            
-            # Release lock while waiting
-            self.lock.release()
-            try:
-                time.sleep(wait_time)
-            finally:
-                # Reacquire lock
-                self.lock.acquire()
-            
-            # Recalculate after waiting
-            self._refill()
-            
-            # We should have enough tokens now, but double-check
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                logger.debug(f"After waiting, consumed {tokens} tokens, remaining: {self.tokens:.2f}")
-                return True
-            else:
-                # This shouldn't happen in normal operation
-                logger.warning(f"Still not enough tokens after waiting: {self.tokens:.2f}, needed: {tokens}")
-                # Try to consume what we can
-                self.tokens = 0
-                return True  # Return true since we waited as requested
-
-class TokenBucketManager:
-    """
-    Manages multiple token buckets for different models/providers.
-    This allows for different rate limits for different APIs.
-    """
-    
-    def __init__(self):
-        self.buckets: Dict[str, TokenBucket] = {}
-        self.lock = threading.Lock()
-    
-    def get_bucket(self, key: str, tokens_per_minute: int) -> TokenBucket:
+        limit = self.get_limit(model)
+        if limit is None:
+            return 0.0
+        return self._update(model_key(model), limit, lambda state: _take(state, limit, tokens))
+
+    def _record_wait(self, model: str, seconds: float) -> None:
+        key = model_key(model)
+        with self._lock:
+            self._waits[key] = self._waits.get(key, 0) + 1
+            self._wait_seconds[key] = self._wait_seconds.get(key, 0.0) + seconds
+
+    async def acquire(self, model: str, tokens: int = 0) -> float:
         """
-        Get or create a token bucket for the specified key.
-        
+        Wait without blocking the event loop until a request can be made.
+
         Args:
-            key: The identifier for this bucket (e.g., 'anthropic-input', 'anthropic-output')
-            tokens_per_minute: Rate limit in tokens per minute
-            
+            model: Model name as passed to LiteLLM
+            tokens: Estimated prompt tokens
+
         Returns:
-            TokenBucket instance
+            Seconds spent waiting
         """
-        with self.lock:
-            if key not in self.buckets:
-                self.buckets[key] = TokenBucket(tokens_per_minute)
-            return self.buckets[key]
-    
-    def consume_tokens(self, key: str, tokens: int, tokens_per_minute: int, wait: bool = True) -> bool:
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(model, tokens)
+            if wait <= 0:
+                return waited
+            if not waited:
+                logger.info(f"[RateLimiter.acquire] Waiting {wait:.2f}s for rate limit of {model}")
+            self._record_wait(model, wait)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def acquire_blocking(self, model: str, tokens: int = 0) -> float:
         """
-        Consume tokens from the specified bucket.
-        
+        Wait in the calling thread until a request can be made.
+
+        Meant for worker threads such as crew executions. Called on a thread
+        running an event loop it does not wait, so the loop is never frozen.
+
         Args:
-            key: The bucket identifier
-            tokens: Number of tokens to consume
-            tokens_per_minute: Rate limit for this bucket (used if bucket doesn't exist)
-            wait: Whether to wait for tokens to become available
-            
+            model: Model name as passed to LiteLLM
+            tokens: Estimated prompt tokens
+
         Returns:
-            True if tokens were consumed, False otherwise
+            Seconds spent waiting
         """
-        bucket = self.get_bucket(key, tokens_per_minute)
-        return bucket.consume(tokens, wait)
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
 
-# Global token bucket manager
-token_bucket_manager = TokenBucketManager()
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(model, tokens)
+            if wait <= 0:
+                return waited
+            if in_event_loop:
+                logger.warning(f"[RateLimiter.acquire_blocking] Rate limit of {model} reached on an event loop thread, not waiting")
+                return waited
+            if not waited:
+                logger.info(f"[RateLimiter.acquire_blocking] Waiting {wait:.2f}s for rate limit of {model}")
+            self._record_wait(model, wait)
+            time.sleep(wait)
+            waited += wait
 
-# Default token rate limits based on Anthropic's tier 1 limits
-DEFAULT_ANTHROPIC_INPUT_TPM = 40000   # Input tokens per minute
-DEFAULT_ANTHROPIC_OUTPUT_TPM = 8000   # Output tokens per minute
+    def record_usage(self, model: Optional[str], tokens: int) -> None:
+        """
+        Take tokens used by a finished call, such as its completion tokens.
 
-# Default token rate limits for Google Gemini
-DEFAULT_GOOGLE_INPUT_TPM = 60000    # Input tokens per minute (estimate)
-DEFAULT_GOOGLE_OUTPUT_TPM = 12000   # Output tokens per minute (estimate)
+        The token bucket may go below zero; later calls then wait until it refills.
 
-def consume_anthropic_input_tokens(tokens: int, wait: bool = True, rpm: Optional[int] = None) -> bool:
-    """
-    Consume input tokens for Anthropic API requests.
-    
-    Args:
-        tokens: Number of input tokens to consume
-        wait: Whether to wait for tokens to become available
-        rpm: Optional RPM setting that will be used to calculate TPM
-        
-    Returns:
-        True if tokens were consumed, False otherwise
-    """
-    # If an RPM setting is provided, use it to calculate TPM
-    # Assuming average input tokens per request: ~10,000 tokens per request for Anthropic
-    tpm = DEFAULT_ANTHROPIC_INPUT_TPM
-    if rpm is not None and rpm > 0:
-        # Conservative estimate: 10,000 input tokens per request
-        estimated_tpm = rpm * 10000
-        # Use the lower of the two values to be safe
-        tpm = min(estimated_tpm, DEFAULT_ANTHROPIC_INPUT_TPM)
-        logger.info(f"Using max_rpm={rpm} to calculate input TPM={tpm}")
-    
-    return token_bucket_manager.consume_tokens('anthropic-input', tokens, tpm, wait)
-
-def consume_anthropic_output_tokens(tokens: int, wait: bool = True, rpm: Optional[int] = None) -> bool:
-    """
-    Consume output tokens for Anthropic API requests.
-    
-    Args:
-        tokens: Number of output tokens to consume
-        wait: Whether to wait for tokens to become available
-        rpm: Optional RPM setting that will be used to calculate TPM
-        
-    Returns:
-        True if tokens were consumed, False otherwise
-    """
-    # If an RPM setting is provided, use it to calculate TPM
-    # Assuming average output tokens per request: ~2,000 tokens per request for Anthropic
-    tpm = DEFAULT_ANTHROPIC_OUTPUT_TPM
-    if rpm is not None and rpm > 0:
-        # Conservative estimate: 2,000 output tokens per request
-        estimated_tpm = rpm * 2000
-        # Use the lower of the two values to be safe
-        tpm = min(estimated_tpm, DEFAULT_ANTHROPIC_OUTPUT_TPM)
-        logger.info(f"Using max_rpm={rpm} to calculate output TPM={tpm}")
-    
-    return token_bucket_manager.consume_tokens('anthropic-output', tokens, tpm, wait)
-
-def consume_google_input_tokens(tokens: int, wait: bool = True, rpm: Optional[int] = None) -> bool:
-    """
-    Consume input tokens for Google Gemini API requests.
-    
-    Args:
-        tokens: Number of input tokens to consume
-        wait: Whether to wait for tokens to become available
-        rpm: Optional RPM setting that will be used to calculate TPM
-        
-    Returns:
-        True if tokens were consumed, False otherwise
-    """
-    # If an RPM setting is provided, use it to calculate TPM
-    # Assuming average input tokens per request: ~6,000 tokens per request for Gemini
-    tpm = DEFAULT_GOOGLE_INPUT_TPM
-    if rpm is not None and rpm > 0:
-        # Conservative estimate: 6,000 input tokens per request
-        estimated_tpm = rpm * 6000
-        # Use the lower of the two values to be safe
-        tpm = min(estimated_tpm, DEFAULT_GOOGLE_INPUT_TPM)
-        logger.info(f"Using max_rpm={rpm} to calculate Google input TPM={tpm}")
-    
-    return token_bucket_manager.consume_tokens('google-input', tokens, tpm, wait)
-
-def consume_google_output_tokens(tokens: int, wait: bool = True, rpm: Optional[int] = None) -> bool:
-    """
-    Consume output tokens for Google Gemini API requests.
-    
-    Args:
-        tokens: Number of output tokens to consume
-        wait: Whether to wait for tokens to become available
-        rpm: Optional RPM setting that will be used to calculate TPM
-        
-    Returns:
-        True if tokens were consumed, False otherwise
-    """
-    # If an RPM setting is provided, use it to calculate TPM
-    # Assuming average output tokens per request: ~2,000 tokens per request for Gemini
-    tpm = DEFAULT_GOOGLE_OUTPUT_TPM
-    if rpm is not None and rpm > 0:
-        # Conservative estimate: 2,000 output tokens per request
-        estimated_tpm = rpm * 2000
-        # Use the lower of the two values to be safe
-        tpm = min(estimated_tpm, DEFAULT_GOOGLE_OUTPUT_TPM)
-        logger.info(f"Using max_rpm={rpm} to calculate Google output TPM={tpm}")
-    
-    return token_bucket_manager.consume_tokens('google-output', tokens, tpm, wait) 
\ No newline at end of file
+        Args:
+            model: Model name as reported by LiteLLM
+            tokens: Tokens to take
+        """
+        if not model or not tokens or tokens <= 0:
+            return
+        limit = self.get_limit(model)
+        if limit is None or not limit.tpm:
+            return
+
+        def take(state: Dict[str, float]) -> None:
+            state["tokens"] -= tokens
+
+        self._update(model_key(model), limit, take)
+
+    def get_levels(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current bucket levels and wait counters of each configured model.
+
+        Returns:
+            Dictionary of levels by model
+        """
+        with self._lock:
+            limits = {key: limit for key, limit in self._limits.items() if limit.rpm or limit.tpm}
+        levels = {}
+        for key, limit in limits.items():
+            state = self._update(key, limit, dict)
+            with self._lock:
+                waits = self._waits.get(key, 0)
+                wait_seconds = self._wait_seconds.get(key, 0.0)
+            levels[key] = {
+                "rpm_limit": limit.rpm,
+                "tpm_limit": limit.tpm,
+                "requests_available": round(state["requests"], 2) if limit.rpm else None,
+                "tokens_available": round(state["tokens"], 1) if limit.tpm else None,
+                "waits": waits,
+                "wait_seconds": round(wait_seconds, 2),
+                "shared": self._shared_dir is not None,
+            }
+        return levels
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+# Function to get the singleton rate limiter instance easily
+def get_rate_limiter() -> RateLimiter:
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                from src.config.settings import settings
+                _limiter = RateLimiter(
+                    enabled=settings.RATE_LIMIT_ENABLED,
+                    shared_dir=settings.RATE_LIMIT_SHARED_DIR or None,
+                    default_rpm=settings.RATE_LIMIT_DEFAULT_RPM,
+                    default_tpm=settings.RATE_LIMIT_DEFAULT_TPM,
+                )
+    return _limiter
@@ -0,0 +1,164 @@
+"""
+Process-local cache of decrypted secrets.
+
+Decrypting a stored API key costs a database read plus an RSA unwrap and a
+Fernet decryption, and API keys are read every time an agent, LLM or tool is
+created. This cache keeps decrypted values for a short TTL. Values are held
+in bytearrays that are overwritten with zeros when an entry expires, is
+evicted or invalidated, so cached plaintext does not linger in freed memory.
+Strings already handed to callers are immutable and outside its reach.
+Invalidation is process-local: a key rotated through the API is only dropped
+from the cache of the process that wrote it, other processes see the new key
+once their entry expires.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class _SecretValue:
+    """A secret held in a mutable buffer that can be wiped."""
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, value: Optional[str]):
+        # None records that the secret does not exist
+        self._buffer = bytearray(value.encode("utf-8")) if value is not None else None
+
+    def reveal(self) -> Optional[str]:
+        return self._buffer.decode("utf-8") if self._buffer is not None else None
+
+    def wipe(self) -> None:
+        if self._buffer is not None:
+            for index in range(len(self._buffer)):
+                self._buffer[index] = 0
+            self._buffer = None
+
+
+class SecretCache:
+    """
+    Bounded TTL cache of decrypted secrets by name.
+
+    Lookups of secrets that do not exist are cached too, so repeated checks
+    for unset provider keys do not hit the database. Every invalidation bumps
+    a version; values resolved before it are not stored.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max(1, max_size)
+        self._lock = threading.Lock()
+        self._version = 0
+        # name -> (expiry in monotonic seconds, value), oldest use first
+        self._entries: "OrderedDict[str, Tuple[float, _SecretValue]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def version(self) -> int:
+        """Current cache version; pass it to ``put`` after decrypting."""
+        with self._lock:
+            return self._version
+
+    def _drop_locked(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            entry[1].wipe()
+
+    def lookup(self, name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a secret.
+
+        Args:
+            name: Secret name
+
+        Returns:
+            Tuple of (found in cache, value); value is None for secrets known not to exist
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._drop_locked(name)
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(name)
+            self._hits += 1
+            return True, entry[1].reveal()
+
+    def put(self, name: str, value: Optional[str], version: int) -> bool:
+        """
+        Store a decrypted secret if nothing was invalidated since version was read.
+
+        Args:
+            name: Secret name
+            value: Decrypted value, or None if the secret does not exist
+            version: Cache version read before the database lookup
+
+        Returns:
+            True if the value was stored
+        """
+        if self._ttl_seconds <= 0:
+            return False
+        with self._lock:
+            if version != self._version:
+                return False
+            self._drop_locked(name)
+            self._entries[name] = (time.monotonic() + self._ttl_seconds, _SecretValue(value))
+            while len(self._entries) > self._max_size:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                evicted.wipe()
+                self._evictions += 1
+            return True
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Wipe one secret, or all secrets when name is None.
+
+        Args:
+            name: Secret name, e.g. after the key was created, updated or deleted
+        """
+        with self._lock:
+            self._version += 1
+            if name is not None:
+                self._drop_locked(name)
+                return
+            for _, value in self._entries.values():
+                value.wipe()
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_cache: Optional[SecretCache] = None
+_cache_lock = threading.Lock()
+
+# Function to get the singleton cache instance easily
+def get_secret_cache() -> SecretCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from src.config.settings import settings
+                _cache = SecretCache(
+                    ttl_seconds=settings.SECRET_CACHE_TTL_SECONDS,
+                    max_size=settings.SECRET_CACHE_MAX_SIZE,
+                )
+    return _cache
@@ -0,0 +1,51 @@
+"""
+Standalone execution queue worker.
+
+Runs an ExecutionQueueWorker without the API so execution throughput can be
+scaled by starting more worker processes or nodes against the same database:
+
+    python -m src.worker
+
+Requires ``EXECUTION_QUEUE_ENABLED`` on the API nodes so they enqueue
+executions instead of running them.
+"""
+
+import asyncio
+import os
+import signal
+
+from src.core.logger import LoggerManager
+from src.db.session import init_db
+from src.services.execution_queue_service import get_execution_queue_worker
+from src.utils.asyncio_utils import engine_registry
+
+
+async def main() -> None:
+    """Run the worker until SIGINT or SIGTERM."""
+    logger_manager = LoggerManager.get_instance(os.environ.get("LOG_DIR"))
+    logger_manager.initialize()
+    logger = logger_manager.system
+    await init_db()
+
+    worker = get_execution_queue_worker()
+    loop = asyncio.get_running_loop()
+    stop_requested = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_requested.set)
+        except NotImplementedError:
+            # Signal handlers are unavailable on some platforms (e.g. Windows)
+            pass
+
+    worker.start()
+    logger.info(f"Execution queue worker {worker.worker_id} running")
+    try:
+        await stop_requested.wait()
+    finally:
+        await worker.stop()
+        await engine_registry.dispose_loop()
+        logger.info(f"Execution queue worker {worker.worker_id} stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
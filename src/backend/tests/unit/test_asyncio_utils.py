@@ -0,0 +1,146 @@
+"""
+Unit tests for asyncio utilities.
+
+Tests the thread-to-asyncio queue bridge used by the trace and log writers
+and the per-event-loop engine registry.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from src.utils.asyncio_utils import AsyncBridgeQueue, LoopEngineRegistry
+
+
+class TestAsyncBridgeQueue:
+    """Test cases for AsyncBridgeQueue."""
+
+    @pytest.mark.asyncio
+    async def test_get_batch_returns_available_items_in_order(self):
+        """Test that queued items are drained in FIFO order up to the limit."""
+        q = AsyncBridgeQueue()
+        for i in range(5):
+            q.put_nowait(i)
+
+        assert await q.get_batch(3, timeout=0.1) == [0, 1, 2]
+        assert await q.get_batch(10, timeout=0.1) == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_get_batch_times_out_with_empty_list(self):
+        """Test that an idle queue returns an empty batch after the timeout."""
+        q = AsyncBridgeQueue()
+
+        assert await q.get_batch(10, timeout=0.05) == []
+
+    @pytest.mark.asyncio
+    async def test_put_from_thread_wakes_consumer(self):
+        """Test that a producer thread wakes a waiting consumer."""
+        q = AsyncBridgeQueue()
+
+        def producer():
+            time.sleep(0.05)
+            q.put_nowait("trace")
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        start = time.monotonic()
+        items = await q.get_batch(10, timeout=5.0)
+        thread.join()
+
+        assert items == ["trace"]
+        assert time.monotonic() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_waiting_does_not_block_event_loop(self):
+        """Test that other coroutines keep running while the consumer waits."""
+        q = AsyncBridgeQueue()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        await asyncio.gather(q.get_batch(10, timeout=0.2), ticker())
+
+        assert ticks == 5
+
+
+class TestLoopEngineRegistry:
+    """Test cases for LoopEngineRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_engine_is_reused_within_a_loop(self):
+        """Test that repeated lookups on one loop create a single engine."""
+        registry = LoopEngineRegistry()
+        with patch.object(registry, "_create_engine", return_value=MagicMock()) as create_engine:
+            first = registry.get_session_factory()
+            second = registry.get_session_factory()
+
+        assert first is second
+        assert create_engine.call_count == 1
+        assert registry.alive_count() == 1
+
+    def test_each_loop_gets_its_own_engine_and_closed_loops_are_released(self):
+        """Test that engines are per loop and dropped once their loop closes."""
+        registry = LoopEngineRegistry()
+
+        async def lookup():
+            return registry.get_session_factory()
+
+        with patch.object(registry, "_create_engine", side_effect=lambda: MagicMock()):
+            loop_a = asyncio.new_event_loop()
+            loop_b = asyncio.new_event_loop()
+            factory_a = loop_a.run_until_complete(lookup())
+            factory_b = loop_b.run_until_complete(lookup())
+
+            assert factory_a is not factory_b
+            assert registry.alive_count() == 2
+
+            loop_a.close()
+            assert registry.alive_count() == 1
+            loop_b.close()
+            assert registry.alive_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_dispose_loop_disposes_engine(self):
+        """Test that dispose_loop awaits the engine dispose for the running loop."""
+        registry = LoopEngineRegistry()
+        engine = MagicMock()
+        engine.dispose = AsyncMock()
+        with patch.object(registry, "_create_engine", return_value=engine):
+            registry.get_session_factory()
+            await registry.dispose_loop()
+
+        engine.dispose.assert_awaited_once()
+        assert registry.alive_count() == 0
+
+    def test_connections_of_loops_closed_without_dispose_are_terminated(self):
+        """Test that pooled connections of a loop closed without dispose_loop are closed when it is pruned."""
+        registry = LoopEngineRegistry()
+
+        async def query():
+            async with registry.get_session_factory()() as session:
+                await session.execute(text("SELECT 1"))
+
+        with tempfile.TemporaryDirectory() as db_dir, \
+                patch("src.config.settings.settings.DATABASE_URI", f"sqlite+aiosqlite:///{os.path.join(db_dir, 'loop.db')}"):
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(query())
+            connections = list(next(iter(registry._connections.values())))
+            threads = [connection._connection._thread for connection in connections]
+            assert connections and all(thread.is_alive() for thread in threads)
+
+            loop.close()
+            assert registry.alive_count() == 0
+            for thread in threads:
+                thread.join(timeout=5.0)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert registry._connections == {}
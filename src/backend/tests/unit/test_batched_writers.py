@@ -0,0 +1,234 @@
+"""
+Unit tests for the batched log and trace writers.
+
+Tests that the writer loops cut batches at WRITER_BATCH_SIZE and flush what
+is pending on shutdown, that the repositories store a batch in one
+transaction and roll it back as a whole when the insert fails, and that the
+services retry a failed batch row by row so one bad entry does not drop the
+rest.
+"""
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.engines.crewai.trace_management import TraceManager
+from src.models.execution_history import ExecutionHistory
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_trace import ExecutionTrace
+from src.repositories.execution_logs_repository import execution_logs_repository
+from src.repositories.execution_trace_repository import execution_trace_repository
+from src.services import execution_logs_service as logs_module
+from src.services.execution_logs_service import execution_logs_service
+from src.utils.asyncio_utils import AsyncBridgeQueue
+
+
+@pytest.fixture
+def session_factory():
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'writers.db')}")
+        yield async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_tables(factory):
+    tables = [ExecutionHistory.__table__, ExecutionLog.__table__, ExecutionTrace.__table__]
+    async with factory.kw["bind"].begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+    async with factory() as session:
+        session.add(ExecutionHistory(id=1, job_id="job-1", status="RUNNING"))
+        await session.commit()
+
+
+async def count(factory, model):
+    async with factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+def log_entry(n, content="line"):
+    return {"execution_id": "job-1", "content": content, "timestamp": datetime(2024, 1, 1, 0, 0, n)}
+
+
+def trace_entry(n, agent_name="agent"):
+    return {"run_id": 1, "job_id": "job-1", "agent_name": agent_name, "task_name": "task",
+            "event_type": "llm_call", "output": {"n": n}}
+
+
+class TestBatchedRepositories:
+    """Test cases for the multi-row inserts of the log and trace repositories."""
+
+    @pytest.mark.asyncio
+    async def test_logs_create_many(self, session_factory):
+        """Test that a batch of logs is stored and a failing batch is rolled back whole."""
+        await create_tables(session_factory)
+        async with session_factory() as session:
+            assert await execution_logs_repository.create_many(session, []) == 0
+            assert await execution_logs_repository.create_many(session, [log_entry(n) for n in range(3)]) == 3
+
+            # A NULL content violates the schema and takes the whole batch down
+            with pytest.raises(Exception):
+                await execution_logs_repository.create_many(session, [log_entry(3), log_entry(4, content=None)])
+
+            # The session was rolled back and remains usable
+            assert await execution_logs_repository.create_many(session, [log_entry(5)]) == 1
+
+        assert await count(session_factory, ExecutionLog) == 4
+
+    @pytest.mark.asyncio
+    async def test_traces_create_many(self, session_factory):
+        """Test that a batch of traces is stored and a failing batch is rolled back whole."""
+        await create_tables(session_factory)
+        with patch("src.repositories.execution_trace_repository.async_session_factory", session_factory):
+            assert await execution_trace_repository.create_many([trace_entry(n) for n in range(3)]) == 3
+
+            with pytest.raises(Exception):
+                await execution_trace_repository.create_many([trace_entry(3), trace_entry(4, agent_name=None)])
+
+        assert await count(session_factory, ExecutionTrace) == 3
+
+
+class TestBatchFallback:
+    """Test cases for the row-by-row retry of failed batches."""
+
+    @pytest.mark.asyncio
+    async def test_create_execution_logs_retries_rows(self):
+        """Test that a failed bulk insert stores every good log one by one."""
+        bulk = AsyncMock(side_effect=RuntimeError("constraint failed"))
+        single = AsyncMock(side_effect=[True, False, True])
+        with patch.object(execution_logs_repository, "create_many_with_managed_session", bulk), \
+             patch.object(execution_logs_service, "create_execution_log", single):
+            assert await execution_logs_service.create_execution_logs([log_entry(n) for n in range(3)]) == 2
+
+        assert single.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_create_execution_logs_bulk_success(self):
+        """Test that a successful bulk insert is not retried."""
+        bulk = AsyncMock(return_value=3)
+        single = AsyncMock()
+        with patch.object(execution_logs_repository, "create_many_with_managed_session", bulk), \
+             patch.object(execution_logs_service, "create_execution_log", single):
+            assert await execution_logs_service.create_execution_logs([log_entry(n) for n in range(3)]) == 3
+            assert await execution_logs_service.create_execution_logs([]) == 0
+
+        bulk.assert_awaited_once()
+        single.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flush_traces_retries_rows(self):
+        """Test that a failed bulk trace insert is retried per trace and failures are counted."""
+        stored = []
+
+        async def create_trace(trace_dict):
+            if trace_dict["agent_name"] is None:
+                raise ValueError("agent_name is required")
+            stored.append(trace_dict["output"]["n"])
+
+        with patch("src.services.execution_trace_service.ExecutionTraceService.create_traces",
+                   AsyncMock(side_effect=RuntimeError("constraint failed"))), \
+             patch("src.services.execution_trace_service.ExecutionTraceService.create_trace", create_trace):
+            failures = await TraceManager._flush_traces(
+                [trace_entry(0), trace_entry(1, agent_name=None), trace_entry(2)], batch_count=1
+            )
+
+        assert failures == 1
+        assert stored == [0, 2]
+
+
+class TestWriterLoops:
+    """Test cases for batch boundaries and the shutdown flush of the writer loops."""
+
+    @pytest.mark.asyncio
+    async def test_logs_writer_batches_and_flushes_on_shutdown(self):
+        """Test that logs are cut into full batches and the remainder is flushed on stop."""
+        queue = AsyncBridgeQueue()
+        batches = []
+
+        async def flush(pending, batch_count):
+            batches.append([log["content"] for log in pending])
+
+        shutdown_event = asyncio.Event()
+        with patch.object(logs_module, "get_job_output_queue", return_value=queue), \
+             patch.object(logs_module, "_flush_logs", flush), \
+             patch("src.config.settings.settings.WRITER_BATCH_SIZE", 3), \
+             patch("src.config.settings.settings.WRITER_FLUSH_INTERVAL_SECONDS", 60):
+            for n in range(7):
+                queue.put({"job_id": "job-1", "content": f"line {n}"})
+            await logs_module.start_logs_writer(shutdown_event)
+            while len(batches) < 2:
+                await asyncio.sleep(0.01)
+
+            # The last entry waits for the flush interval until shutdown
+            await asyncio.sleep(0.05)
+            assert len(batches) == 2
+            shutdown_event.set()
+            assert await logs_module.stop_logs_writer(timeout=5.0)
+
+        assert batches == [["line 0", "line 1", "line 2"], ["line 3", "line 4", "line 5"], ["line 6"]]
+
+    @pytest.mark.asyncio
+    async def test_logs_writer_survives_failed_flush(self):
+        """Test that a failing batch is logged and later batches are still written."""
+        queue = AsyncBridgeQueue()
+        batches = []
+
+        async def flush(pending, batch_count):
+            batches.append(len(pending))
+            if batch_count == 1:
+                raise RuntimeError("database is locked")
+
+        shutdown_event = asyncio.Event()
+        with patch.object(logs_module, "get_job_output_queue", return_value=queue), \
+             patch.object(logs_module, "_flush_logs", flush), \
+             patch("src.config.settings.settings.WRITER_BATCH_SIZE", 2), \
+             patch("src.config.settings.settings.WRITER_FLUSH_INTERVAL_SECONDS", 60):
+            for n in range(4):
+                queue.put({"job_id": "job-1", "content": f"line {n}"})
+            task = asyncio.ensure_future(logs_module.logs_writer_loop(shutdown_event))
+            while len(batches) < 2:
+                await asyncio.wait([task], timeout=0.01)
+            shutdown_event.set()
+            queue.put(None)
+            await asyncio.wait_for(task, timeout=5.0)
+
+        assert batches == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_trace_writer_batches_and_flushes_on_shutdown(self):
+        """Test that important traces are batched, others dropped, and the rest flushed on stop."""
+        queue = AsyncBridgeQueue()
+        batches = []
+
+        async def flush(traces, batch_count):
+            batches.append([trace["trace_metadata"]["n"] for trace in traces])
+            return 0
+
+        def trace(n, event_type="llm_call"):
+            return {"job_id": "job-1", "event_type": event_type, "extra_data": {"n": n}}
+
+        with patch("src.services.trace_queue.get_trace_queue", return_value=queue), \
+             patch.object(TraceManager, "_flush_traces", flush), \
+             patch.object(TraceManager, "_ensure_job_exists", AsyncMock(return_value=True)), \
+             patch.object(TraceManager, "_shutdown_event", asyncio.Event()), \
+             patch("src.config.settings.settings.WRITER_BATCH_SIZE", 2), \
+             patch("src.config.settings.settings.WRITER_FLUSH_INTERVAL_SECONDS", 60):
+            for n in range(3):
+                queue.put(trace(n))
+            queue.put(trace(99, event_type="debug"))
+            queue.put({"event_type": "llm_call"})  # unknown job_id
+            task = asyncio.ensure_future(TraceManager._trace_writer_loop())
+            while not batches:
+                await asyncio.wait([task], timeout=0.01)
+            await asyncio.sleep(0.05)
+            assert batches == [[0, 1]]
+
+            TraceManager._shutdown_event.set()
+            queue.put(None)
+            await asyncio.wait_for(task, timeout=5.0)
+
+        assert batches == [[0, 1], [2]]
@@ -0,0 +1,105 @@
+"""
+Unit tests for BoundedBridgeQueue.
+
+Tests the overflow policies, that each item's policy is resolved only once,
+and per-job drop/lag accounting of the bounded trace/log queue.
+"""
+import pytest
+
+from src.utils.bounded_queue import BoundedBridgeQueue, OverflowPolicy
+
+
+POLICIES = {
+    "crew_completed": OverflowPolicy.BLOCK,
+    "llm_call": OverflowPolicy.SAMPLE,
+    "tool_usage": OverflowPolicy.DROP_OLDEST,
+}
+
+
+def resolve_policy(item):
+    """Resolve test policies by event type; non-dict items are never dropped."""
+    if not isinstance(item, dict):
+        return OverflowPolicy.BLOCK
+    return POLICIES[item["event_type"]]
+
+
+def trace(event_type, n=0, job_id="job-1"):
+    """Build a minimal trace item."""
+    return {"job_id": job_id, "event_type": event_type, "n": n}
+
+
+@pytest.fixture
+def bounded_queue():
+    """Create a small queue that never waits when full."""
+    return BoundedBridgeQueue(
+        maxsize=3,
+        policy_resolver=resolve_policy,
+        block_timeout=0,
+        sample_rate=1000000,
+        sample_high_watermark=0.5,
+    )
+
+
+class TestBoundedBridgeQueue:
+    """Test cases for BoundedBridgeQueue."""
+
+    def test_drop_oldest_evicts_head(self, bounded_queue):
+        """Test that a full queue evicts its oldest droppable item."""
+        for n in range(4):
+            bounded_queue.put_nowait(trace("tool_usage", n))
+
+        assert [bounded_queue.get_nowait()["n"] for _ in range(3)] == [1, 2, 3]
+        stats = bounded_queue.get_job_stats("job-1")
+        assert stats["dropped"] == 1
+        assert stats["enqueued"] == 4
+        assert stats["pending"] == 0
+
+    def test_block_items_are_never_dropped(self, bounded_queue):
+        """Test that never-drop items evict droppable ones or overflow the bound."""
+        bounded_queue.put_nowait(trace("tool_usage", 0))
+        for n in range(1, 4):
+            bounded_queue.put_nowait(trace("crew_completed", n))
+        bounded_queue.put_nowait(trace("crew_completed", 4))
+
+        items = [bounded_queue.get_nowait() for _ in range(bounded_queue.qsize())]
+        assert [item["n"] for item in items] == [1, 2, 3, 4]
+        stats = bounded_queue.get_job_stats("job-1")
+        assert stats["dropped"] == 1
+        assert stats["overflowed"] == 1
+
+    def test_policy_is_resolved_once_per_item(self):
+        """Test that evicting items never resolves the policies of queued items again."""
+        resolved = []
+
+        def counting_resolver(item):
+            resolved.append(item["n"])
+            return resolve_policy(item)
+
+        bounded_queue = BoundedBridgeQueue(maxsize=3, policy_resolver=counting_resolver, block_timeout=0)
+        for n in range(3):
+            bounded_queue.put_nowait(trace("crew_completed", n))
+        # Nothing queued can be evicted, so this item is dropped
+        bounded_queue.put_nowait(trace("tool_usage", 3))
+        bounded_queue.get_nowait()
+        for n in range(4, 7):
+            bounded_queue.put_nowait(trace("tool_usage", n))
+
+        assert resolved == list(range(7))
+        assert [bounded_queue.get_nowait()["n"] for _ in range(3)] == [1, 2, 6]
+        assert bounded_queue.get_job_stats("job-1")["dropped"] == 3
+
+    def test_sampled_items_are_thinned_above_watermark(self, bounded_queue):
+        """Test that sampled event types are skipped once the queue is under pressure."""
+        bounded_queue.put_nowait(trace("llm_call", 0))
+        bounded_queue.put_nowait(trace("llm_call", 1))
+        bounded_queue.put_nowait(trace("llm_call", 2))
+
+        assert bounded_queue.qsize() == 2
+        assert bounded_queue.get_job_stats("job-1")["sampled_out"] == 1
+
+    def test_unknown_job_has_no_stats(self, bounded_queue):
+        """Test that jobs never seen by the queue report no counters."""
+        bounded_queue.put_nowait(None)
+
+        assert bounded_queue.get_job_stats("job-unknown") is None
+        assert bounded_queue.get_stats()["size"] == 1
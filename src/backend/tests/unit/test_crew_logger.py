@@ -0,0 +1,83 @@
+"""
+Unit tests for CrewLogger.
+
+Tests that crew output is routed by the job bound to the current context,
+so concurrent jobs only receive their own logs.
+"""
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.engines.crewai.crew_logger import CrewLogger, get_current_job_id
+
+
+@pytest.fixture
+def crew_logger():
+    """Get the CrewLogger singleton with its job output queue patched."""
+    with patch("src.engines.crewai.crew_logger.enqueue_log") as mock_enqueue:
+        instance = CrewLogger()
+        instance.enqueued = mock_enqueue
+        yield instance
+
+
+def logs_by_job(mock_enqueue):
+    """Group enqueued log contents by job ID."""
+    result = {}
+    for call in mock_enqueue.call_args_list:
+        result.setdefault(call.kwargs["execution_id"], []).append(call.kwargs["content"])
+    return result
+
+
+class TestCrewLogger:
+    """Test cases for context-local job log routing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_receive_only_their_own_logs(self, crew_logger):
+        """Test that records from two concurrent jobs reach exactly one sink each."""
+        async def run_job(job_id):
+            crew_logger.setup_for_job(job_id)
+            try:
+                await asyncio.to_thread(crew_logger._crew_logger.info, f"hello from {job_id}")
+            finally:
+                crew_logger.cleanup_for_job(job_id)
+
+        await asyncio.gather(run_job("job-a"), run_job("job-b"))
+
+        logs = logs_by_job(crew_logger.enqueued)
+        assert any("hello from job-a" in line for line in logs["job-a"])
+        assert not any("job-b" in line for line in logs["job-a"])
+        assert any("hello from job-b" in line for line in logs["job-b"])
+        assert not any("job-a" in line for line in logs["job-b"])
+
+    @pytest.mark.asyncio
+    async def test_capture_only_captures_current_context(self, crew_logger):
+        """Test that stdout is captured for the job's context and passes through elsewhere."""
+        crew_logger.setup_for_job("job-c")
+        try:
+            with crew_logger.capture_stdout_stderr("job-c"):
+                await asyncio.to_thread(print, "crew output")
+                # A plain thread does not inherit the job's context
+                other = threading.Thread(target=print, args=("server output",))
+                other.start()
+                other.join()
+        finally:
+            crew_logger.cleanup_for_job("job-c")
+
+        logs = logs_by_job(crew_logger.enqueued)
+        assert any("CREW-STDOUT: crew output" in line for line in logs["job-c"])
+        assert not any("server output" in line for line in logs["job-c"])
+
+    def test_cleanup_unbinds_job(self, crew_logger):
+        """Test that the job is unbound from the context after cleanup."""
+        crew_logger.setup_for_job("job-d")
+        assert get_current_job_id() == "job-d"
+
+        crew_logger.cleanup_for_job("job-d")
+
+        assert get_current_job_id() is None
+        crew_logger._crew_logger.info("after cleanup")
+        assert not any(
+            "after cleanup" in line for line in logs_by_job(crew_logger.enqueued).get("job-d", [])
+        )
@@ -0,0 +1,73 @@
+"""
+Unit tests for EmbeddingCache and its use by LLMManager.get_embeddings.
+
+Tests float32 round trips keyed by provider, model and text hash, and that
+embedding unchanged texts a second time makes no provider calls.
+"""
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.embedding_cache import EmbeddingCache
+from src.utils.rate_limiter import RateLimiter
+
+REQUEST = ("databricks", {"model": "databricks-gte-large-en", "api_key": "dapi", "api_base": ""})
+
+
+@pytest.fixture
+def cache():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = EmbeddingCache(os.path.join(cache_dir, "embeddings.db"))
+        yield store
+        store.close()
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_round_trip_as_float32(self, cache):
+        """Test that stored vectors come back as float32 values in input order."""
+        assert cache.put_many("openai", "text-embedding-3-small", ["a", "b"], [[0.5, 0.25], [1.0, -2.0]]) == 2
+
+        vectors = cache.get_many("openai", "text-embedding-3-small", ["b", "missing", "a"])
+
+        assert vectors == [[1.0, -2.0], None, [0.5, 0.25]]
+        stats = cache.get_stats()
+        assert (stats["size"], stats["hits"], stats["misses"]) == (2, 2, 1)
+
+    def test_key_includes_provider_and_model(self, cache):
+        """Test that vectors are not shared across models, but provider prefixes are ignored."""
+        cache.put_many("databricks", "databricks/databricks-gte-large-en", ["a"], [[0.5]])
+
+        assert cache.get_many("databricks", "databricks-gte-large-en", ["a"]) == [[0.5]]
+        assert cache.get_many("databricks", "databricks-bge-large-en", ["a"]) == [None]
+        assert cache.get_many("openai", "databricks-gte-large-en", ["a"]) == [None]
+
+
+class TestCachedEmbeddings:
+    """Test cases for the embedding cache in LLMManager.get_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_reembedding_unchanged_texts_makes_no_calls(self, cache):
+        """Test that a second run over the same texts is served from the cache."""
+        from src.core.llm_manager import LLMManager
+
+        async def fake_aembedding(input, **kwargs):
+            return {"data": [{"index": index, "embedding": [float(len(text))]} for index, text in enumerate(input)]}
+
+        aembedding = AsyncMock(side_effect=fake_aembedding)
+        settings = MagicMock(EMBEDDING_BATCH_SIZE=0, EMBEDDING_MAX_CONCURRENCY=2)
+        texts = ["chunk one", "chunk two", "chunk one"]
+        with patch("src.config.settings.settings", settings), \
+             patch("src.core.llm_manager.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch("src.core.llm_manager.get_embedding_cache", return_value=cache), \
+             patch.object(LLMManager, "_embedding_request", AsyncMock(return_value=REQUEST)), \
+             patch("src.core.llm_manager.litellm.aembedding", aembedding):
+            first = await LLMManager.get_embeddings(texts)
+            second = await LLMManager.get_embeddings(texts)
+
+        assert first == second == [[9.0], [9.0], [9.0]]
+        aembedding.assert_awaited_once()
+        assert aembedding.await_args.kwargs["input"] == ["chunk one", "chunk two"]
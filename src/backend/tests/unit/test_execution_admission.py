@@ -0,0 +1,122 @@
+"""
+Unit tests for ExecutionAdmissionController.
+
+Tests global and per-model concurrency caps, priority ordering of pending
+executions, queue position reporting, and that terminal status updates in
+any case release the execution's slot.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.execution_admission import ExecutionAdmissionController
+from src.services.execution_status_service import ExecutionStatusService
+
+
+async def start(controller, execution_id, trigger="api", model=None):
+    """Start acquiring a slot in the background and let it reach the queue."""
+    task = asyncio.create_task(controller.acquire(execution_id, trigger=trigger, model=model))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestExecutionAdmissionController:
+    """Test cases for ExecutionAdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_global_cap_queues_excess_executions(self):
+        """Test that executions beyond the global cap wait until a slot is released."""
+        controller = ExecutionAdmissionController(max_concurrent=1)
+        first = await start(controller, "job-1")
+        second = await start(controller, "job-2")
+
+        assert first.done()
+        assert not second.done()
+        assert controller.get_queue_position("job-2")["position"] == 1
+
+        controller.release("job-1")
+        await asyncio.sleep(0)
+
+        assert second.done()
+        assert controller.get_stats() == {
+            "running": 1,
+            "pending": 0,
+            "max_concurrent": 1,
+            "running_by_model": {"None": 1},
+        }
+
+    @pytest.mark.asyncio
+    async def test_pending_executions_are_admitted_by_trigger_priority(self):
+        """Test that API runs overtake earlier schedules and flows."""
+        controller = ExecutionAdmissionController(max_concurrent=1)
+        await start(controller, "running")
+        flow = await start(controller, "flow", trigger="flow")
+        schedule = await start(controller, "schedule", trigger="schedule")
+        api = await start(controller, "api", trigger="api")
+
+        assert controller.get_queue_position("api")["position"] == 1
+        assert controller.get_queue_position("flow")["position"] == 3
+
+        controller.release("running")
+        await asyncio.sleep(0)
+        assert api.done() and not schedule.done() and not flow.done()
+
+        controller.release("api")
+        await asyncio.sleep(0)
+        assert schedule.done() and not flow.done()
+
+    @pytest.mark.asyncio
+    async def test_model_cap_does_not_block_other_models(self):
+        """Test that a model at its cap only holds back executions on that model."""
+        controller = ExecutionAdmissionController(max_concurrent=0, max_per_model={"gpt-4o": 1})
+        await start(controller, "job-1", model="gpt-4o")
+        blocked = await start(controller, "job-2", model="gpt-4o")
+        other = await start(controller, "job-3", model="claude")
+
+        assert not blocked.done()
+        assert other.done()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        """Test that cancelling a queued execution removes it without taking a slot."""
+        controller = ExecutionAdmissionController(max_concurrent=1)
+        await start(controller, "job-1")
+        waiting = await start(controller, "job-2")
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert controller.get_queue_position("job-2") is None
+        controller.release("job-1")
+        assert controller.get_stats()["running"] == 0
+
+
+class TestTerminalStatusUpdates:
+    """Test cases for terminal status updates of ExecutionStatusService."""
+
+    @pytest.mark.asyncio
+    async def test_lowercase_terminal_status_finishes_the_execution(self):
+        """Test that a lowercase terminal status releases the slot, sets completed_at and is stored upper case."""
+        repo = MagicMock()
+        repo.get_execution_by_job_id = AsyncMock(return_value=SimpleNamespace(id=1))
+        repo.update_execution = AsyncMock(return_value=True)
+        controller = MagicMock()
+        registry = MagicMock()
+
+        async def write(operation):
+            return await operation(AsyncMock())
+
+        with patch("src.services.execution_status_service.ExecutionRepository", return_value=repo), \
+                patch("src.services.execution_status_service.execute_db_write", write), \
+                patch("src.services.execution_status_service.get_admission_controller", return_value=controller), \
+                patch("src.services.execution_status_service.get_job_registry", return_value=registry):
+            assert await ExecutionStatusService.update_status("job-1", "completed", "done")
+
+        controller.release.assert_called_once_with("job-1")
+        registry.mark_finished.assert_called_once_with("job-1")
+        data = repo.update_execution.await_args.kwargs["data"]
+        assert data["status"] == "COMPLETED"
+        assert "completed_at" in data
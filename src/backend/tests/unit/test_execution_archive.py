@@ -0,0 +1,155 @@
+"""
+Unit tests for ExecutionArchiver.
+
+Tests that finished executions past the retention period have their logs and
+traces moved to compressed archives and out of the hot tables, that archived
+rows read back as model instances and page like database rows, that the
+SQLite file shrinks after archiving, and that deleting an execution's archive
+removes its files.
+"""
+import os
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.db.session import configure_sqlite_engine
+from src.models.execution_history import ExecutionHistory
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_trace import ExecutionTrace
+from src.services.execution_archive_service import ExecutionArchiver
+from src.utils.pagination import next_cursor, paginate_rows
+
+
+@pytest.fixture
+def workdir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+@pytest.fixture
+def session_factory(workdir):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(workdir, 'archive.db')}")
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def setup_database(factory):
+    old = datetime.utcnow() - timedelta(days=40)
+    tables = [ExecutionHistory.__table__, ExecutionLog.__table__, ExecutionTrace.__table__]
+    async with factory.kw["bind"].begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+    async with factory() as session:
+        session.add_all([
+            ExecutionHistory(id=1, job_id="job-old", status="COMPLETED", created_at=old),
+            ExecutionHistory(id=2, job_id="job-running", status="RUNNING", created_at=old),
+            ExecutionHistory(id=3, job_id="job-new", status="COMPLETED", created_at=datetime.utcnow()),
+        ])
+        for run_id, job_id in [(1, "job-old"), (2, "job-running"), (3, "job-new")]:
+            session.add_all([
+                ExecutionLog(execution_id=job_id, content=f"{job_id} log {i}", timestamp=old + timedelta(seconds=i))
+                for i in range(5)
+            ])
+            session.add_all([
+                ExecutionTrace(run_id=run_id, job_id=job_id, agent_name="a", task_name="t",
+                               output={"step": i}, created_at=old + timedelta(seconds=i))
+                for i in range(3)
+            ])
+        await session.commit()
+
+
+async def count(factory, model, condition):
+    async with factory() as session:
+        return (await session.execute(select(func.count()).select_from(model).where(condition))).scalar()
+
+
+class TestExecutionArchiver:
+    """Test cases for ExecutionArchiver."""
+
+    @pytest.mark.asyncio
+    async def test_archive_due_moves_old_finished_executions(self, workdir, session_factory):
+        """Test that only finished executions past retention leave the hot tables."""
+        await setup_database(session_factory)
+
+        async def execute(operation):
+            async with session_factory() as session:
+                return await operation(session)
+
+        archiver = ExecutionArchiver(os.path.join(workdir, "archives"), retention_days=30, batch_size=2)
+        with patch("src.services.execution_archive_service.execute_db_operation", execute):
+            assert await archiver.archive_due() == 1
+            # Archived executions are not due again
+            assert await archiver.archive_due() == 0
+
+        assert await count(session_factory, ExecutionLog, ExecutionLog.execution_id == "job-old") == 0
+        assert await count(session_factory, ExecutionTrace, ExecutionTrace.run_id == 1) == 0
+        assert await count(session_factory, ExecutionLog, ExecutionLog.execution_id == "job-running") == 5
+        assert await count(session_factory, ExecutionLog, ExecutionLog.execution_id == "job-new") == 5
+        async with session_factory() as session:
+            history = await session.get(ExecutionHistory, 1)
+            assert history.archived_at is not None
+            assert (await session.get(ExecutionHistory, 2)).archived_at is None
+
+        logs = await archiver.get_archived("job-old", "logs")
+        assert sorted(log.content for log in logs) == [f"job-old log {i}" for i in range(5)]
+        assert all(isinstance(log.timestamp, datetime) for log in logs)
+        traces = await archiver.get_archived("job-old", "traces")
+        assert sorted(trace.output["step"] for trace in traces) == [0, 1, 2]
+
+        first = paginate_rows(logs, "timestamp", limit=2, descending=False)
+        cursor = next_cursor(first, 2, "timestamp")
+        second = paginate_rows(logs, "timestamp", limit=2, cursor=cursor, descending=False)
+        assert [log.content for log in first + second] == [f"job-old log {i}" for i in range(4)]
+
+        assert archiver.delete(["job-old"]) == 2
+        assert await archiver.get_archived("job-old", "logs") == []
+
+    @pytest.mark.asyncio
+    async def test_archive_path_rejects_unsafe_job_ids(self, workdir):
+        """Test that job IDs cannot point outside the archive directory."""
+        archiver = ExecutionArchiver(workdir)
+        with pytest.raises(ValueError):
+            archiver.archive_path("../etc", "logs")
+        assert await archiver.get_archived("../etc", "logs") == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("incremental", [True, False])
+    async def test_archiving_compacts_the_database(self, workdir, incremental):
+        """Test that pages freed by archived rows are returned to the file system."""
+        db_path = os.path.join(workdir, "compact.db")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        if incremental:
+            # New databases get incremental auto-vacuum from the connection profile
+            configure_sqlite_engine(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        await setup_database(factory)
+        async with factory() as session:
+            session.add_all([ExecutionLog(execution_id="job-old", content="x" * 2000) for _ in range(300)])
+            await session.commit()
+
+        async def execute(operation):
+            async with factory() as session:
+                return await operation(session)
+
+        # Without incremental auto-vacuum, only an allowed full VACUUM compacts
+        archiver = ExecutionArchiver(
+            os.path.join(workdir, "archives"), batch_size=100, sqlite_path=db_path, full_vacuum=not incremental
+        )
+        def file_size():
+            # Committed pages may still sit in the WAL
+            wal_path = f"{db_path}-wal"
+            return os.path.getsize(db_path) + (os.path.getsize(wal_path) if os.path.exists(wal_path) else 0)
+
+        size_before = file_size()
+        with patch("src.services.execution_archive_service.execute_db_operation", execute):
+            assert await archiver.archive_due() == 1
+        await engine.dispose()
+
+        with sqlite3.connect(db_path) as connection:
+            assert connection.execute("PRAGMA freelist_count").fetchone()[0] == 0
+            assert connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert file_size() < size_before / 2
@@ -0,0 +1,62 @@
+"""
+Unit tests for the summary mode of the execution history list.
+
+Tests that summary items carry a truncated result preview instead of the
+inputs and full result, and that the full result is loaded by job id.
+"""
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.models.execution_history import ExecutionHistory
+from src.repositories.execution_history_repository import ExecutionHistoryRepository
+from src.services.execution_history_service import ExecutionHistoryService
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+REPORT = "x" * 5000
+
+
+@pytest.fixture
+def session_factory():
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'history.db')}")
+        yield async_sessionmaker(engine, expire_on_commit=False)
+
+
+class TestExecutionHistorySummary:
+    """Test cases for summary history lists."""
+
+    @pytest.mark.asyncio
+    async def test_summary_items_have_previews_and_results_load_by_job_id(self, session_factory):
+        """Test that summary items leave out inputs and results and previews are cut off."""
+        async with session_factory.kw["bind"].begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, tables=[ExecutionHistory.__table__])
+        async with session_factory() as session:
+            session.add_all([
+                ExecutionHistory(job_id="report", status="completed", inputs={"topic": "ai"},
+                                 result={"content": REPORT}, created_at=START + timedelta(minutes=1)),
+                ExecutionHistory(job_id="short", status="completed", result={"content": "ok"}, created_at=START),
+                ExecutionHistory(job_id="running", status="running", created_at=START - timedelta(minutes=1)),
+            ])
+            await session.commit()
+
+        with patch("src.repositories.execution_history_repository.async_session_factory", session_factory), \
+             patch("src.services.execution_history_service.settings.EXECUTION_HISTORY_RESULT_PREVIEW_CHARS", 100):
+            service = ExecutionHistoryService(ExecutionHistoryRepository(), None, None)
+            history = await service.get_execution_history(limit=10, summary=True)
+            result = await service.get_execution_result("report")
+            missing = await service.get_execution_result("missing")
+
+        report, short, running = history.executions
+        assert report.job_id == "report" and report.result is None and report.input is None
+        assert len(report.result_preview) == 100 and report.result_truncated
+        assert "ok" in short.result_preview and not short.result_truncated
+        assert running.result_preview is None and not running.result_truncated
+        assert history.total == 3
+        assert result.result == {"content": REPORT}
+        assert missing is None
@@ -0,0 +1,215 @@
+"""
+Unit tests for ExecutionPurger.
+
+Tests that purging an execution deletes its rows from every dependent table
+in bounded batches and leaves other executions alone, that progress is
+stored per table where any worker can read it, that purging everything
+empties the tables, and that purges interrupted by a shutdown or crash are
+resumed at startup within their original scope.
+"""
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.models.execution_history import ErrorTrace, ExecutionHistory, TaskStatus
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_purge import ExecutionPurge
+from src.models.execution_trace import ExecutionTrace
+from src.models.llm_usage import LLMUsage
+from src.models.task_checkpoint import TaskCheckpoint
+from src.repositories.execution_purge_repository import PURGE_MODELS
+from src.services.execution_purge_service import ExecutionPurger, PurgeStatus, find_executions
+
+
+@pytest.fixture
+def session_factory():
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'purge.db')}")
+        yield async_sessionmaker(engine, expire_on_commit=False)
+
+
+def execution_rows(run_id, job_id, logs):
+    return [
+        ExecutionHistory(id=run_id, job_id=job_id, status="completed"),
+        *[ExecutionLog(execution_id=job_id, content=f"log {i}") for i in range(logs)],
+        *[ExecutionTrace(run_id=run_id, job_id=job_id, agent_name="a", task_name="t") for _ in range(3)],
+        ExecutionTrace(run_id=run_id, agent_name="a", task_name="t"),
+        TaskStatus(job_id=job_id, task_id="task-1", status="completed"),
+        ErrorTrace(run_id=run_id, task_key="task-1", error_type="ValueError", error_message="boom"),
+        LLMUsage(execution_id=job_id, agent_name="a", model="gpt-4o"),
+        TaskCheckpoint(job_id=job_id, task_index=0, task_key="k"),
+    ]
+
+
+async def setup_database(factory):
+    tables = [model.__table__ for model in PURGE_MODELS.values()] + [ExecutionPurge.__table__]
+    async with factory.kw["bind"].begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+    async with factory() as session:
+        session.add_all(execution_rows(1, "job-1", logs=5) + execution_rows(2, "job-2", logs=1))
+        await session.commit()
+
+
+async def count_rows(factory):
+    async with factory() as session:
+        return {
+            name: (await session.execute(select(func.count()).select_from(model))).scalar()
+            for name, model in PURGE_MODELS.items()
+        }
+
+
+class TestExecutionPurger:
+    """Test cases for ExecutionPurger."""
+
+    @pytest.mark.asyncio
+    async def test_purge_deletes_one_execution_in_batches(self, session_factory):
+        """Test that every table loses exactly the purged execution's rows."""
+        await setup_database(session_factory)
+
+        async def execute(operation):
+            async with session_factory() as session:
+                return await operation(session)
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute):
+            executions = await find_executions(job_ids=["job-1"])
+            assert executions == [(1, "job-1")]
+            assert await find_executions(run_ids=[2]) == [(2, "job-2")]
+
+            purger = ExecutionPurger(batch_size=2)
+            purge_id = await purger.start(executions)
+            await purger.wait(purge_id)
+
+            # Another API worker reads the progress from the database
+            status = await ExecutionPurger().get_status(purge_id)
+
+        assert status["status"] == PurgeStatus.COMPLETED and status["error"] is None
+        assert status["deleted"] == {
+            "execution_trace": 4, "execution_logs": 5, "taskstatus": 1, "errortrace": 1,
+            "llm_usage": 1, "task_checkpoint": 1, "executionhistory": 1,
+        }
+        assert await count_rows(session_factory) == {
+            "execution_trace": 4, "execution_logs": 1, "taskstatus": 1, "errortrace": 1,
+            "llm_usage": 1, "task_checkpoint": 1, "executionhistory": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_purge_all_empties_every_table(self, session_factory):
+        """Test that a purge without executions removes all existing rows."""
+        await setup_database(session_factory)
+
+        async def execute(operation):
+            async with session_factory() as session:
+                return await operation(session)
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute):
+            purger = ExecutionPurger(batch_size=3)
+            purge_id = await purger.start()
+            await purger.wait(purge_id)
+
+            assert (await purger.get_status(purge_id))["scope"] == "all"
+            assert await purger.get_status("unknown") is None
+
+        assert set((await count_rows(session_factory)).values()) == {0}
+
+    @pytest.mark.asyncio
+    async def test_progress_is_stored_and_stopped_purge_resumes(self, session_factory):
+        """Test that a running purge reports each batch and a stopped one is resumed by the next process."""
+        await setup_database(session_factory)
+        proceed = asyncio.Event()
+
+        async def execute(operation):
+            async with session_factory() as session:
+                result = await operation(session)
+            if isinstance(result, int) and result > 0:
+                # Pause after each deleted batch
+                await proceed.wait()
+            return result
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute):
+            purger = ExecutionPurger(batch_size=2)
+            purge_id = await purger.start([(1, "job-1")])
+            try:
+                status = await ExecutionPurger().get_status(purge_id)
+                while status["current_table"] is None:
+                    await asyncio.sleep(0.01)
+                    status = await ExecutionPurger().get_status(purge_id)
+
+                assert status["status"] == PurgeStatus.RUNNING
+                assert status["current_table"] == "execution_trace"
+                assert status["deleted"]["execution_trace"] == 2
+            finally:
+                await purger.stop()
+            status = await ExecutionPurger().get_status(purge_id)
+            assert status["status"] == PurgeStatus.RUNNING
+            assert status["deleted"]["execution_trace"] == 2 and status["finished_at"] is None
+
+            proceed.set()
+            restarted = ExecutionPurger(batch_size=2)
+            assert await restarted.resume_interrupted() == 1
+            await restarted.wait(purge_id)
+            status = await restarted.get_status(purge_id)
+
+        assert status["status"] == PurgeStatus.COMPLETED
+        assert status["current_table"] is None and status["finished_at"] is not None
+        assert status["deleted"]["execution_trace"] == 4 and status["deleted"]["executionhistory"] == 1
+        assert (await count_rows(session_factory))["executionhistory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_crashed_purges_resume_in_their_scope(self, session_factory):
+        """Test that purges left running resume with their stored scope and unknown scopes fail."""
+        await setup_database(session_factory)
+
+        async def execute(operation):
+            async with session_factory() as session:
+                return await operation(session)
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute), \
+                patch.object(ExecutionPurger, "_run", AsyncMock()):
+            # The process dies right after recording the purges
+            purger = ExecutionPurger()
+            all_id = await purger.start()
+            interrupted_id = await purger.start([(2, "job-2")])
+        async with session_factory() as session:
+            session.add_all(execution_rows(3, "job-3", logs=2))
+            session.add(ExecutionPurge(id="legacy", status=PurgeStatus.RUNNING, scope="all", deleted={}))
+            await session.commit()
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute):
+            restarted = ExecutionPurger()
+            assert await restarted.resume_interrupted() == 2
+            for purge_id in (all_id, interrupted_id):
+                await restarted.wait(purge_id)
+                assert (await restarted.get_status(purge_id))["status"] == PurgeStatus.COMPLETED
+            legacy = await restarted.get_status("legacy")
+
+        assert legacy["status"] == PurgeStatus.FAILED and legacy["error"] == "Purge was interrupted"
+        # Only the execution created after the purge of everything started is left
+        async with session_factory() as session:
+            job_ids = (await session.execute(select(ExecutionHistory.job_id))).scalars().all()
+        assert job_ids == ["job-3"]
+        assert (await count_rows(session_factory))["execution_logs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_recent_purges_are_kept(self, session_factory):
+        """Test that finished purges beyond max_tracked are removed."""
+        await setup_database(session_factory)
+
+        async def execute(operation):
+            async with session_factory() as session:
+                return await operation(session)
+
+        with patch("src.services.execution_purge_service.execute_db_operation", execute):
+            purger = ExecutionPurger(max_tracked=2)
+            purge_ids = []
+            for job_id in ["job-1", "job-2", "job-3"]:
+                purge_ids.append(await purger.start([(0, job_id)]))
+                await purger.wait(purge_ids[-1])
+
+            assert await purger.get_status(purge_ids[0]) is None
+            assert all([await purger.get_status(purge_id) for purge_id in purge_ids[1:]])
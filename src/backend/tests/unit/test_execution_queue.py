@@ -0,0 +1,145 @@
+"""
+Unit tests for ExecutionQueueWorker.
+
+Tests claiming up to the worker's capacity and how claimed executions are
+settled in the queue: completed, failed without retry, requeued after an
+error, cancelled and left alone after the lease was lost, or cancelled and
+released when the worker stops.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.execution_queue_service import ExecutionQueueService, ExecutionQueueWorker
+
+
+def make_item(job_id):
+    return {
+        "job_id": job_id,
+        "execution_type": "crew",
+        "trigger_type": "api",
+        "payload": {},
+        "attempts": 1,
+    }
+
+
+@pytest.fixture
+def queue():
+    """Patch the queue service so no database is used."""
+    with patch.object(ExecutionQueueService, "reclaim_expired", AsyncMock(return_value=0)), \
+         patch.object(ExecutionQueueService, "claim", AsyncMock(return_value=[])) as claim, \
+         patch.object(ExecutionQueueService, "heartbeat", AsyncMock(return_value=True)) as heartbeat, \
+         patch.object(ExecutionQueueService, "complete", AsyncMock(return_value=True)) as complete, \
+         patch.object(ExecutionQueueService, "fail", AsyncMock(return_value=True)) as fail, \
+         patch("src.services.crewai_execution_service.CrewAIExecutionService.cancel_execution",
+               AsyncMock(return_value=True)) as cancel:
+        yield SimpleNamespace(claim=claim, heartbeat=heartbeat, complete=complete, fail=fail, cancel=cancel)
+
+
+def make_worker(concurrency=2):
+    worker = ExecutionQueueWorker(
+        concurrency=concurrency,
+        lease_seconds=60,
+        heartbeat_seconds=0,
+        poll_seconds=0,
+        retry_delay_seconds=5,
+        worker_id="worker-1"
+    )
+    worker._run_execution = AsyncMock()
+    return worker
+
+
+def status_sequence(*statuses):
+    """Mock get_status returning each status in turn, then the last one."""
+    results = [SimpleNamespace(status=s) for s in statuses]
+    return AsyncMock(side_effect=lambda job_id: results.pop(0) if len(results) > 1 else results[0])
+
+
+async def drain(worker):
+    while worker.active_count():
+        await asyncio.sleep(0)
+
+
+class TestExecutionQueueWorker:
+    """Test cases for ExecutionQueueWorker."""
+
+    @pytest.mark.asyncio
+    async def test_claims_up_to_free_capacity_and_completes(self, queue):
+        """Test that a worker claims only what it can run and completes finished executions."""
+        worker = make_worker(concurrency=2)
+        queue.claim.return_value = [make_item("job-1"), make_item("job-2")]
+
+        with patch("src.services.execution_status_service.ExecutionStatusService.get_status",
+                   status_sequence("RUNNING", "COMPLETED")):
+            assert await worker.poll_once() == 2
+            queue.claim.assert_awaited_once_with("worker-1", 60, 2)
+            assert await worker.poll_once() == 0
+            await drain(worker)
+
+        assert queue.claim.await_count == 1
+        assert {c.args[0] for c in queue.complete.await_args_list} == {"job-1", "job-2"}
+        queue.heartbeat.assert_awaited()
+        queue.fail.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_is_not_retried(self, queue):
+        """Test that an execution that ran and failed is failed in the queue without retry."""
+        worker = make_worker()
+        queue.claim.return_value = [make_item("job-1")]
+
+        with patch("src.services.execution_status_service.ExecutionStatusService.get_status",
+                   status_sequence("failed")):
+            await worker.poll_once()
+            await drain(worker)
+
+        queue.fail.assert_awaited_once()
+        assert queue.fail.await_args.kwargs["retry"] is False
+        queue.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_start_error_requeues_with_delay(self, queue):
+        """Test that an error while starting an execution returns it to the queue."""
+        worker = make_worker()
+        worker._run_execution.side_effect = RuntimeError("boom")
+        queue.claim.return_value = [make_item("job-1")]
+
+        await worker.poll_once()
+        await drain(worker)
+
+        queue.fail.assert_awaited_once_with("job-1", "worker-1", "boom", retry_delay_seconds=5)
+        queue.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_cancels_run_and_leaves_item_to_new_owner(self, queue):
+        """Test that a worker that lost its lease cancels its run but neither completes nor fails the item."""
+        worker = make_worker()
+        queue.claim.return_value = [make_item("job-1")]
+        queue.heartbeat.return_value = False
+
+        with patch("src.services.execution_status_service.ExecutionStatusService.get_status",
+                   status_sequence("RUNNING")):
+            await worker.poll_once()
+            await drain(worker)
+
+        queue.complete.assert_not_awaited()
+        queue.fail.assert_not_awaited()
+        queue.cancel.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_runs_and_releases_items(self, queue):
+        """Test that stopping the worker cancels running executions and requeues their items."""
+        worker = make_worker()
+        queue.claim.return_value = [make_item("job-1")]
+
+        with patch("src.services.execution_status_service.ExecutionStatusService.get_status",
+                   status_sequence("RUNNING")):
+            await worker.poll_once()
+            await asyncio.sleep(0)
+            await worker.stop()
+
+        assert worker.active_count() == 0
+        queue.cancel.assert_awaited_once_with("job-1")
+        queue.fail.assert_awaited_once_with("job-1", "worker-1", "Worker stopped")
+        queue.complete.assert_not_awaited()
@@ -0,0 +1,128 @@
+"""
+Unit tests for JobRegistry.
+
+Tests TTL expiry, the shortened grace period of finished jobs, LRU eviction
+beyond the maximum size, and removal of jobs whose execution records were
+deleted.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.services.job_registry import JobRegistry
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("src.services.job_registry.time.monotonic", clock):
+        yield clock
+
+
+class TestJobRegistry:
+    """Test cases for JobRegistry."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that a job is known until its TTL runs out."""
+        registry = JobRegistry(max_size=10, ttl_seconds=60, finished_ttl_seconds=5)
+        registry.register("job-1")
+        registry.register("")
+
+        clock.now += 59
+        assert registry.contains("job-1")
+        assert not registry.contains("")
+
+        clock.now += 1
+        assert not registry.contains("job-1")
+        assert len(registry) == 0
+
+    def test_purge_expired(self, clock):
+        """Test that purge_expired drops only expired jobs."""
+        registry = JobRegistry(max_size=10, ttl_seconds=60, finished_ttl_seconds=5)
+        registry.register("job-1")
+        clock.now += 30
+        registry.register("job-2")
+
+        clock.now += 30
+        assert registry.purge_expired() == 1
+        assert registry.contains("job-2")
+        assert len(registry) == 1
+
+    def test_mark_finished_keeps_grace_period(self, clock):
+        """Test that finished jobs stay known for the grace period only."""
+        registry = JobRegistry(max_size=10, ttl_seconds=60, finished_ttl_seconds=5)
+        registry.register("job-1")
+        registry.mark_finished("job-1")
+        # Unknown jobs are not added by mark_finished
+        registry.mark_finished("job-2")
+
+        clock.now += 4
+        assert registry.contains("job-1")
+        assert not registry.contains("job-2")
+
+        clock.now += 1
+        assert not registry.contains("job-1")
+
+    def test_mark_finished_never_extends_ttl(self, clock):
+        """Test that a grace period longer than the remaining TTL does not extend it."""
+        registry = JobRegistry(max_size=10, ttl_seconds=60, finished_ttl_seconds=30)
+        registry.register("job-1")
+        clock.now += 50
+        registry.mark_finished("job-1")
+
+        clock.now += 10
+        assert not registry.contains("job-1")
+
+    def test_least_recently_used_is_evicted(self, clock):
+        """Test that the least recently used job is evicted beyond the maximum size."""
+        registry = JobRegistry(max_size=3, ttl_seconds=60, finished_ttl_seconds=5)
+        for job_id in ["job-1", "job-2", "job-3"]:
+            registry.register(job_id)
+
+        # A lookup makes job-1 the most recently used
+        assert registry.contains("job-1")
+        registry.register("job-4")
+
+        assert len(registry) == 3
+        assert not registry.contains("job-2")
+        assert all(registry.contains(job_id) for job_id in ["job-1", "job-3", "job-4"])
+
+    def test_expired_jobs_are_reclaimed_before_eviction(self, clock):
+        """Test that a full registry drops expired jobs before live ones."""
+        registry = JobRegistry(max_size=2, ttl_seconds=60, finished_ttl_seconds=5)
+        registry.register("job-1")
+        registry.register("job-2")
+        registry.mark_finished("job-2")
+        # job-2 is the most recently used but its grace period is over
+        clock.now += 10
+        registry.register("job-3")
+
+        assert len(registry) == 2
+        assert registry.contains("job-1")
+        assert not registry.contains("job-2")
+        assert registry.contains("job-3")
+
+    def test_forget_and_clear(self, clock):
+        """Test that forgotten and cleared jobs are no longer known."""
+        registry = JobRegistry(max_size=10, ttl_seconds=60, finished_ttl_seconds=5)
+        for job_id in ["job-1", "job-2", "job-3"]:
+            registry.register(job_id)
+
+        registry.forget("job-2")
+        registry.forget("job-unknown")
+        assert not registry.contains("job-2")
+        assert len(registry) == 2
+
+        registry.clear()
+        assert len(registry) == 0
+        assert not registry.contains("job-1")
@@ -0,0 +1,116 @@
+"""
+Unit tests for keyset pagination of execution history, logs and traces.
+
+Tests that walking the cursors visits every row exactly once in a stable
+order even when rows share a timestamp, that totals are only counted on
+request, and that malformed cursors are rejected.
+"""
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.models.execution_history import ExecutionHistory
+from src.models.execution_logs import ExecutionLog
+from src.models.execution_trace import ExecutionTrace
+from src.repositories.execution_history_repository import ExecutionHistoryRepository
+from src.repositories.execution_trace_repository import ExecutionTraceRepository
+from src.services.execution_logs_service import ExecutionLogsService
+from src.utils.pagination import decode_cursor, encode_cursor, next_cursor
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def session_factory():
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'executions.db')}")
+        yield async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_rows(factory, rows):
+    tables = [ExecutionHistory.__table__, ExecutionLog.__table__, ExecutionTrace.__table__]
+    async with factory.kw["bind"].begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=tables)
+    async with factory() as session:
+        session.add_all(rows)
+        await session.commit()
+
+
+class TestCursor:
+    """Test cases for cursor encoding."""
+
+    def test_cursor_round_trip_and_rejects_garbage(self):
+        """Test that cursors keep their sort key and malformed ones raise ValueError."""
+        assert decode_cursor(encode_cursor(START, 42)) == (START, 42)
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+        class Row:
+            id = 7
+            created_at = START
+
+        assert next_cursor([Row(), Row()], 2, "created_at") == encode_cursor(START, 7)
+        assert next_cursor([Row()], 2, "created_at") is None
+
+
+class TestKeysetPagination:
+    """Test cases for paginating with cursors."""
+
+    @pytest.mark.asyncio
+    async def test_history_pages_visit_each_execution_once(self, session_factory):
+        """Test that history pages are newest first, break ties by ID and skip the count."""
+        # Pairs of executions share a created_at
+        await create_rows(session_factory, [
+            ExecutionHistory(job_id=f"job-{i}", status="completed", created_at=START + timedelta(minutes=i // 2))
+            for i in range(7)
+        ])
+
+        seen = []
+        cursor = None
+        with patch("src.repositories.execution_history_repository.async_session_factory", session_factory):
+            repository = ExecutionHistoryRepository()
+            runs, total = await repository.get_execution_history(limit=3)
+            assert total == 7
+            while True:
+                runs, total = await repository.get_execution_history(limit=3, cursor=cursor, include_total=False)
+                assert total is None
+                seen.extend(run.job_id for run in runs)
+                cursor = next_cursor(runs, 3, "created_at")
+                if not cursor:
+                    break
+
+        assert seen == ["job-6", "job-5", "job-4", "job-3", "job-2", "job-1", "job-0"]
+
+    @pytest.mark.asyncio
+    async def test_log_and_trace_pages_are_oldest_first(self, session_factory):
+        """Test that one execution's logs and traces are paged in creation order."""
+        await create_rows(session_factory, [
+            *[ExecutionLog(execution_id="job-1", content=f"log {i}", timestamp=START) for i in range(5)],
+            ExecutionLog(execution_id="job-2", content="other", timestamp=START),
+            *[
+                ExecutionTrace(job_id="job-1", agent_name="a", task_name="t", output={"i": i},
+                               created_at=START + timedelta(seconds=i % 2))
+                for i in range(4)
+            ],
+        ])
+
+        with patch("src.repositories.execution_logs_repository.async_session_factory", session_factory), \
+             patch("src.repositories.execution_trace_repository.async_session_factory", session_factory):
+            service = ExecutionLogsService()
+            first = await service.get_execution_logs_page("job-1", limit=2)
+            second = await service.get_execution_logs_page("job-1", limit=2, cursor=first.next_cursor)
+            last = await service.get_execution_logs_page("job-1", limit=2, cursor=second.next_cursor)
+
+            repository = ExecutionTraceRepository()
+            traces = await repository.get_by_job_id("job-1", limit=2)
+            more = await repository.get_by_job_id("job-1", limit=2, cursor=next_cursor(traces, 2, "created_at"))
+
+        contents = [log.content for page in (first, second, last) for log in page.logs]
+        assert contents == ["log 0", "log 1", "log 2", "log 3", "log 4"]
+        assert last.next_cursor is None
+        assert [trace.output["i"] for trace in traces + more] == [0, 2, 1, 3]
@@ -0,0 +1,92 @@
+"""
+Unit tests for LLMCallLogWriter.
+
+Tests the per-call entry (latency, tokens, cost), payload truncation and
+sampling, dropping when the queue is full and writing JSON lines from the
+background thread.
+"""
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.core.llm_call_logger import LLMCallLogWriter
+
+START = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def make_response(content="Hello"):
+    return {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+def make_kwargs():
+    return {
+        "model": "gpt-4o",
+        "litellm_call_id": "call-1",
+        "response_cost": 0.0025,
+        "messages": [{"role": "user", "content": "x" * 50}],
+    }
+
+
+class TestLLMCallLogWriter:
+    """Test cases for LLMCallLogWriter."""
+
+    def test_success_entry_has_latency_usage_cost_and_truncated_payload(self):
+        """Test that a success entry carries metrics and truncated payloads."""
+        writer = LLMCallLogWriter("unused.jsonl", max_payload_chars=10)
+        with patch.object(writer, "_submit", side_effect=lambda call: call) as submit:
+            writer.record_success(make_kwargs(), make_response("y" * 30), START, START + timedelta(seconds=1.5))
+        entry = writer.build_entry(submit.call_args.args[0])
+
+        assert entry["model"] == "gpt-4o"
+        assert entry["call_id"] == "call-1"
+        assert entry["latency_ms"] == 1500.0
+        assert (entry["prompt_tokens"], entry["completion_tokens"], entry["total_tokens"]) == (10, 5, 15)
+        assert entry["cost"] == 0.0025
+        assert entry["messages"][0]["content"] == "x" * 10 + "...[truncated 40 chars]"
+        assert entry["response"] == ["y" * 10 + "...[truncated 20 chars]"]
+
+    def test_unsampled_success_omits_payload_but_failure_keeps_it(self):
+        """Test that payload sampling applies to successes only."""
+        writer = LLMCallLogWriter("unused.jsonl", payload_sample_rate=0.0)
+        with patch.object(writer, "_submit", side_effect=lambda call: call) as submit:
+            writer.record_success(make_kwargs(), make_response(), START, START)
+            success = writer.build_entry(submit.call_args.args[0])
+            kwargs = dict(make_kwargs(), exception=RuntimeError("rate limited"))
+            writer.record_failure(kwargs, None, START, START)
+            failure = writer.build_entry(submit.call_args.args[0])
+
+        assert "messages" not in success and "response" not in success
+        assert failure["status"] == "failure"
+        assert failure["error"] == "rate limited"
+        assert "messages" in failure
+
+    def test_full_queue_drops_without_blocking(self):
+        """Test that calls beyond the queue size are counted as dropped."""
+        writer = LLMCallLogWriter("unused.jsonl", maxsize=1)
+        with patch.object(writer, "_ensure_started"):
+            assert writer.record_success(make_kwargs(), make_response(), START, START)
+            assert not writer.record_success(make_kwargs(), make_response(), START, START)
+
+        assert writer.get_stats()["dropped"] == 1
+
+    def test_writes_one_json_line_per_call(self):
+        """Test that the writer thread appends compact JSON lines and flushes on close."""
+        with tempfile.TemporaryDirectory() as log_dir:
+            path = os.path.join(log_dir, "llm_calls.jsonl")
+            writer = LLMCallLogWriter(path, flush_interval=0.05)
+            writer.record_success(make_kwargs(), make_response(), START, START + timedelta(seconds=1))
+            writer.record_success(make_kwargs(), make_response(), START, START + timedelta(seconds=2))
+            writer.close()
+
+            with open(path, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+
+        assert len(lines) == 2
+        assert [json.loads(line)["latency_ms"] for line in lines] == [1000.0, 2000.0]
+        assert ": " not in lines[0]
+        assert writer.get_stats()["written"] == 2
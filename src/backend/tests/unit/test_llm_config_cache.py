@@ -0,0 +1,97 @@
+"""
+Unit tests for ResolvedLLMConfigCache and its use by LLMManager.
+
+Tests caching, expiry and version-based invalidation of resolved model
+bundles, and that configuring many LLMs for one model resolves it once.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.llm_config_cache import ResolvedLLMConfigCache
+
+
+class TestResolvedLLMConfigCache:
+    """Test cases for ResolvedLLMConfigCache."""
+
+    def test_put_and_get_returns_copy(self):
+        """Test that a stored bundle is returned as a copy and counted as a hit."""
+        cache = ResolvedLLMConfigCache(ttl_seconds=60, max_size=10)
+        assert cache.get("gpt-4o") is None
+
+        assert cache.put("gpt-4o", {"api_key": "sk-1"}, cache.version)
+        bundle = cache.get("gpt-4o")
+        bundle["api_key"] = "changed"
+
+        assert cache.get("gpt-4o") == {"api_key": "sk-1"}
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 1
+
+    def test_nested_values_are_copied(self):
+        """Test that mutating nested values of a stored or returned bundle leaves the cache intact."""
+        cache = ResolvedLLMConfigCache(ttl_seconds=60, max_size=10)
+        stored = {"api_key": "sk-1", "config": {"name": "gpt-4o", "extra": {"temperature": 0}}}
+        assert cache.put("gpt-4o", stored, cache.version)
+        stored["config"]["name"] = "changed"
+
+        bundle = cache.get("gpt-4o")
+        bundle["config"]["extra"]["temperature"] = 1
+        bundle["config"].pop("name")
+
+        assert cache.get("gpt-4o") == {
+            "api_key": "sk-1", "config": {"name": "gpt-4o", "extra": {"temperature": 0}}
+        }
+
+    def test_invalidate_drops_entries_and_rejects_racing_put(self):
+        """Test that a bundle resolved before an invalidation is not stored."""
+        cache = ResolvedLLMConfigCache(ttl_seconds=60, max_size=10)
+        cache.put("gpt-4o", {"api_key": "old"}, cache.version)
+
+        version = cache.version
+        cache.invalidate()
+
+        assert cache.get("gpt-4o") is None
+        assert not cache.put("gpt-4o", {"api_key": "old"}, version)
+        assert cache.get("gpt-4o") is None
+
+    def test_expired_and_evicted_entries_are_dropped(self):
+        """Test TTL expiry and LRU eviction beyond the maximum size."""
+        cache = ResolvedLLMConfigCache(ttl_seconds=60, max_size=2)
+        for model in ("a", "b", "c"):
+            cache.put(model, {}, cache.version)
+        assert cache.get("a") is None
+        assert cache.get("c") == {}
+
+        with patch("src.core.llm_config_cache.time.monotonic", return_value=float("inf")):
+            assert cache.get("c") is None
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 never stores bundles."""
+        cache = ResolvedLLMConfigCache(ttl_seconds=0, max_size=10)
+        assert not cache.put("gpt-4o", {}, cache.version)
+
+
+class TestLLMManagerResolution:
+    """Test cases for cached model resolution in LLMManager."""
+
+    @pytest.mark.asyncio
+    async def test_model_resolved_once_for_many_agents(self):
+        """Test that configuring an LLM per agent resolves the model only once."""
+        from src.core.llm_manager import LLMManager
+
+        cache = ResolvedLLMConfigCache(ttl_seconds=60, max_size=10)
+        service = MagicMock()
+        service.get_model_config = AsyncMock(return_value={"provider": "openai", "name": "gpt-4o"})
+        get_key = AsyncMock(return_value="sk-test")
+
+        with patch("src.core.llm_manager.get_llm_config_cache", return_value=cache), \
+             patch("src.core.llm_manager.UnitOfWork", MagicMock()), \
+             patch("src.core.llm_manager.ModelConfigService.from_unit_of_work", AsyncMock(return_value=service)), \
+             patch("src.core.llm_manager.ApiKeysService.get_provider_api_key", get_key), \
+             patch("src.core.llm_manager.LLM") as llm_class:
+            for _ in range(10):
+                await LLMManager.configure_crewai_llm("gpt-4o")
+
+        service.get_model_config.assert_awaited_once_with("gpt-4o")
+        get_key.assert_awaited_once()
+        assert llm_class.call_args.kwargs["api_key"] == "sk-test"
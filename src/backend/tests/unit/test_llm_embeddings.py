@@ -0,0 +1,98 @@
+"""
+Unit tests for batched embeddings in LLMManager.
+
+Tests that get_embeddings splits texts into provider-sized batches, keeps
+input order, limits concurrent batches and isolates failed batches.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.llm_manager import LLMManager
+from src.utils.rate_limiter import RateLimiter
+
+REQUEST = ("openai", {"model": "text-embedding-3-small", "api_key": "sk-test"})
+
+
+def make_settings(batch_size=2, concurrency=4):
+    return MagicMock(
+        EMBEDDING_BATCH_SIZE=batch_size,
+        EMBEDDING_MAX_CONCURRENCY=concurrency,
+        EMBEDDING_CACHE_ENABLED=False,
+    )
+
+
+async def fake_aembedding(input, **kwargs):
+    # Return vectors in reverse order to check placement by index
+    data = [{"index": index, "embedding": [float(len(text))]} for index, text in enumerate(input)]
+    return {"data": list(reversed(data))}
+
+
+class TestGetEmbeddings:
+    """Test cases for LLMManager.get_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_batches_keep_input_order(self):
+        """Test that texts are sent in batches and vectors come back in input order."""
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        aembedding = AsyncMock(side_effect=fake_aembedding)
+        with patch("src.config.settings.settings", make_settings()), \
+             patch("src.core.llm_manager.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch.object(LLMManager, "_embedding_request", AsyncMock(return_value=REQUEST)), \
+             patch("src.core.llm_manager.litellm.aembedding", aembedding):
+            embeddings = await LLMManager.get_embeddings(texts)
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert [call.kwargs["input"] for call in aembedding.await_args_list] == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_are_limited(self):
+        """Test that no more than max_concurrency batches are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_aembedding(input, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await fake_aembedding(input)
+
+        with patch("src.config.settings.settings", make_settings(batch_size=1)), \
+             patch("src.core.llm_manager.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch.object(LLMManager, "_embedding_request", AsyncMock(return_value=REQUEST)), \
+             patch("src.core.llm_manager.litellm.aembedding", AsyncMock(side_effect=slow_aembedding)):
+            embeddings = await LLMManager.get_embeddings([str(index) for index in range(10)], max_concurrency=3)
+
+        assert len(embeddings) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_yields_none_for_its_texts(self):
+        """Test that a failing batch does not affect the other batches."""
+        async def flaky_aembedding(input, **kwargs):
+            if "boom" in input:
+                raise RuntimeError("rate limited")
+            return await fake_aembedding(input)
+
+        with patch("src.config.settings.settings", make_settings()), \
+             patch("src.core.llm_manager.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch.object(LLMManager, "_embedding_request", AsyncMock(return_value=REQUEST)), \
+             patch("src.core.llm_manager.litellm.aembedding", AsyncMock(side_effect=flaky_aembedding)):
+            embeddings = await LLMManager.get_embeddings(["a", "bb", "boom", "c"])
+
+        assert embeddings == [[1.0], [2.0], None, None]
+
+    @pytest.mark.asyncio
+    async def test_missing_api_key_returns_none_per_text(self):
+        """Test that no request is made without provider credentials."""
+        aembedding = AsyncMock()
+        with patch.object(LLMManager, "_embedding_request", AsyncMock(return_value=None)), \
+             patch("src.core.llm_manager.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch("src.core.llm_manager.litellm.aembedding", aembedding):
+            assert await LLMManager.get_embeddings(["a", "b"]) == [None, None]
+            assert await LLMManager.get_embedding("a") is None
+
+        aembedding.assert_not_awaited()
@@ -0,0 +1,94 @@
+"""
+Unit tests for LLMResponseCache and cached_acompletion.
+
+Tests key construction, TTL expiry and LRU eviction of the SQLite store, and
+that cached completions skip the LLM call while sampled ones bypass the cache
+unless forced.
+"""
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.llm_response_cache import LLMResponseCache, cached_acompletion
+from src.utils.rate_limiter import RateLimiter
+
+MESSAGES = [{"role": "user", "content": "Generate a crew"}]
+RESPONSE = {"choices": [{"message": {"content": "{}"}}]}
+
+
+@pytest.fixture
+def cache():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = LLMResponseCache(os.path.join(cache_dir, "responses.db"), ttl_seconds=60, max_entries=2)
+        yield store
+        store.close()
+
+
+def make_settings(enabled=True, force=False):
+    return MagicMock(LLM_RESPONSE_CACHE_ENABLED=enabled, LLM_RESPONSE_CACHE_FORCE=force)
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache."""
+
+    def test_key_ignores_credentials_but_not_sampling(self):
+        """Test that the key depends on sampling parameters only."""
+        key = LLMResponseCache.make_key("gpt-4o", MESSAGES, {"temperature": 0, "api_key": "sk-1"})
+        assert key == LLMResponseCache.make_key("gpt-4o", MESSAGES, {"temperature": 0, "api_key": "sk-2"})
+        assert key != LLMResponseCache.make_key("gpt-4o", MESSAGES, {"temperature": 0, "max_tokens": 20})
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", MESSAGES, {"temperature": 0})
+
+    def test_put_get_and_lru_eviction(self, cache):
+        """Test that the least recently used entry is evicted beyond the limit."""
+        cache.put("a", "gpt-4o", RESPONSE)
+        cache.put("b", "gpt-4o", RESPONSE)
+        assert cache.get("a") == RESPONSE
+        cache.put("c", "gpt-4o", RESPONSE)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == RESPONSE
+        stats = cache.get_stats()
+        assert (stats["size"], stats["evictions"], stats["hits"], stats["misses"]) == (2, 1, 2, 1)
+
+    def test_expired_entry_is_a_miss(self, cache):
+        """Test that entries older than the TTL are dropped."""
+        cache.put("a", "gpt-4o", RESPONSE)
+        with patch("src.core.llm_response_cache.time.time", return_value=float("inf")):
+            assert cache.get("a") is None
+        assert cache.get_stats()["size"] == 0
+
+
+class TestCachedAcompletion:
+    """Test cases for cached_acompletion."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_deterministic_call_is_served_from_cache(self, cache):
+        """Test that a repeated temperature 0 request calls the LLM once."""
+        acompletion = AsyncMock(return_value=RESPONSE)
+        with patch("src.config.settings.settings", make_settings()), \
+             patch("src.core.llm_response_cache.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch("src.core.llm_response_cache.get_llm_response_cache", return_value=cache), \
+             patch("src.core.llm_response_cache.litellm.acompletion", acompletion):
+            first = await cached_acompletion(model="gpt-4o", messages=MESSAGES, temperature=0)
+            second = await cached_acompletion(model="gpt-4o", messages=MESSAGES, temperature=0)
+
+        acompletion.assert_awaited_once()
+        assert first == second == RESPONSE
+
+    @pytest.mark.asyncio
+    async def test_sampled_call_bypasses_cache_unless_forced(self, cache):
+        """Test that temperature above zero is cached only when forced."""
+        acompletion = AsyncMock(return_value=RESPONSE)
+        with patch("src.config.settings.settings", make_settings()), \
+             patch("src.core.llm_response_cache.get_rate_limiter", return_value=RateLimiter(enabled=False)), \
+             patch("src.core.llm_response_cache.get_llm_response_cache", return_value=cache), \
+             patch("src.core.llm_response_cache.litellm.acompletion", acompletion):
+            for _ in range(2):
+                await cached_acompletion(model="gpt-4o", messages=MESSAGES, temperature=0.7)
+            assert acompletion.await_count == 2
+
+            for _ in range(2):
+                await cached_acompletion(force=True, model="gpt-4o", messages=MESSAGES, temperature=0.7)
+            assert acompletion.await_count == 3
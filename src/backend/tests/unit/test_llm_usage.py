@@ -0,0 +1,134 @@
+"""
+Unit tests for LLMUsageRecorder and the LiteLLM pre-call hook.
+
+Tests aggregation of calls by execution, agent and model, metadata
+extraction from LiteLLM callbacks, batched flushes that keep failed batches,
+and rate limiting and execution and agent tagging of crew LLM calls.
+"""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.llm_usage import (
+    LLMUsageRecorder,
+    reset_current_execution,
+    set_current_execution,
+    track_agent_executions,
+)
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def callback_kwargs(execution_id="exec-1", agent_name="Researcher", model="gpt-4o", cost=0.01):
+    return {
+        "model": model,
+        "response_cost": cost,
+        "litellm_params": {"metadata": {"execution_id": execution_id, "agent_name": agent_name}},
+    }
+
+
+def response(prompt_tokens, completion_tokens):
+    return {"usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}}
+
+
+class TestLLMUsageRecorder:
+    """Test cases for LLMUsageRecorder."""
+
+    def test_calls_are_aggregated_per_execution_agent_and_model(self):
+        """Test that calls of one combination add up into a single pending row."""
+        recorder = LLMUsageRecorder()
+        with patch.object(recorder, "_ensure_started"):
+            recorder.record_call(callback_kwargs(), response(100, 20), START, START + timedelta(seconds=2))
+            recorder.record_call(callback_kwargs(), response(50, 10), START, START + timedelta(seconds=1))
+            recorder.record_call(callback_kwargs(), None, START, START + timedelta(seconds=3), success=False)
+            recorder.record_call(callback_kwargs(model="gpt-4o-mini"), response(10, 5), START, START)
+            assert not recorder.record_call({"model": "gpt-4o"}, response(1, 1), START, START)
+
+        rows = {row["model"]: row for row in recorder._drain()}
+        row = rows["gpt-4o"]
+        assert (row["execution_id"], row["agent_name"]) == ("exec-1", "Researcher")
+        assert (row["calls"], row["failed_calls"]) == (3, 1)
+        assert (row["prompt_tokens"], row["completion_tokens"], row["total_tokens"]) == (150, 30, 180)
+        assert row["cost"] == pytest.approx(0.02)
+        assert (row["latency_ms_total"], row["latency_ms_max"]) == (6000.0, 3000.0)
+        assert rows["gpt-4o-mini"]["calls"] == 1
+        assert recorder.get_stats()["recorded_calls"] == 4
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_one_batch_and_keeps_failed_ones(self):
+        """Test that a flush writes all pending rows at once and requeues them on errors."""
+        recorder = LLMUsageRecorder()
+        with patch.object(recorder, "_ensure_started"):
+            for execution_id in ("exec-1", "exec-2"):
+                recorder.record(execution_id, "Researcher", "gpt-4o", 10, 5, 0.01, 100.0)
+
+        failing = AsyncMock(side_effect=RuntimeError("database is locked"))
+        with patch("src.utils.asyncio_utils.execute_db_operation", failing):
+            assert await recorder.flush() == 0
+        assert recorder.get_stats()["pending"] == 2
+
+        with patch.object(recorder, "_ensure_started"):
+            recorder.record("exec-1", "Researcher", "gpt-4o", 10, 5, 0.01, 300.0)
+        written = AsyncMock(side_effect=lambda operation: 2)
+        with patch("src.utils.asyncio_utils.execute_db_operation", written):
+            assert await recorder.flush() == 2
+            assert await recorder.flush() == 0
+
+        written.assert_awaited_once()
+        stats = recorder.get_stats()
+        assert (stats["pending"], stats["written_rows"], stats["errors"]) == (0, 2, 1)
+
+
+class TestPreCallHook:
+    """Test cases for the pre-call hook of LiteLLMFileLogger."""
+
+    def test_crewai_calls_are_limited_and_tagged_with_the_executing_agent(self):
+        """Test that calls made the way CrewAI makes them wait for the rate limit and carry the running agent."""
+        from crewai import LLM
+        from crewai.utilities.agent_utils import get_llm_response
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.agent_events import (
+            AgentExecutionCompletedEvent,
+            AgentExecutionStartedEvent,
+        )
+        from crewai.utilities.printer import Printer
+
+        from src.core.llm_manager import litellm_file_logger
+
+        recorded = []
+        all_recorded = threading.Event()
+
+        def record_usage(kwargs, response_obj, start_time, end_time, success):
+            recorded.append(kwargs["litellm_params"].get("metadata"))
+            if len(recorded) == 3:
+                all_recorded.set()
+
+        llm = LLM(model="openai/gpt-4o", api_key="sk-test", mock_response="done")
+        messages = [{"role": "user", "content": "hi"}]
+        agent = type("Agent", (), {"role": "Writer"})()
+        limiter = MagicMock()
+        track_agent_executions()
+        with patch("src.core.llm_manager.get_rate_limiter", return_value=limiter), \
+                patch.object(litellm_file_logger, "enabled", False), \
+                patch.object(litellm_file_logger, "_record_usage", side_effect=record_usage):
+            token = set_current_execution("exec-1")
+            try:
+                crewai_event_bus.emit(agent, AgentExecutionStartedEvent.model_construct(agent=agent, task=None))
+                assert get_llm_response(llm, messages, callbacks=[], printer=Printer()) == "done"
+                crewai_event_bus.emit(agent, AgentExecutionCompletedEvent.model_construct(agent=agent, task=None))
+                get_llm_response(llm, messages, callbacks=[], printer=Printer())
+            finally:
+                reset_current_execution(token)
+            # Outside of an execution calls are limited but not tagged
+            get_llm_response(llm, messages, callbacks=[], printer=Printer())
+            assert all_recorded.wait(timeout=10)
+
+        assert limiter.acquire_blocking.call_count == 3
+        assert limiter.acquire_blocking.call_args.args[0] == "gpt-4o"
+        # Success callbacks may run on LiteLLM's logging threads, in any order
+        tags = [((metadata or {}).get("execution_id"), (metadata or {}).get("agent_name")) for metadata in recorded]
+        assert sorted(tags, key=str) == sorted([("exec-1", "Writer"), ("exec-1", ""), (None, None)], key=str)
+        # The tags belong to each call, never to the LLM
+        assert "metadata" not in llm.additional_params
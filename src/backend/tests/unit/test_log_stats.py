@@ -0,0 +1,164 @@
+"""
+Unit tests for LLM log statistics.
+
+Tests that writing logs maintains the daily rollups, that stats are computed
+from the rollups per endpoint and model within the requested days, and that
+logs written before the rollup table existed are backfilled when it is created.
+"""
+import glob
+import importlib.util
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.base import Base
+from src.db.session import _backfill_new_tables, _get_table_names
+from src.models.log import LLMLog, LLMLogDailyStats
+from src.repositories.log_repository import LLMLogRepository, latency_bucket
+from src.services.log_service import LLMLogService, _latency_percentiles
+
+
+@pytest.fixture
+def session_factory():
+    with tempfile.TemporaryDirectory() as db_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'logs.db')}")
+        yield async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_tables(factory):
+    async with factory.kw["bind"].begin() as connection:
+        await connection.run_sync(
+            Base.metadata.create_all, tables=[LLMLog.__table__, LLMLogDailyStats.__table__]
+        )
+
+
+def log(endpoint, model, duration_ms, status="success", tokens=100, age_days=0):
+    return {
+        "endpoint": endpoint,
+        "prompt": "prompt",
+        "response": "response",
+        "model": model,
+        "status": status,
+        "tokens_used": tokens,
+        "duration_ms": duration_ms,
+        "created_at": datetime.utcnow() - timedelta(days=age_days),
+    }
+
+
+LOGS = [
+    log("generate-crew", "gpt-4o", 800),
+    log("generate-crew", "gpt-4o", 1500),
+    log("generate-crew", "gpt-4o", 4000, status="error", tokens=None),
+    log("generate-agent", "gpt-4o-mini", 90),
+    log("generate-agent", "gpt-4o-mini", None),
+    log("generate-agent", "gpt-4o-mini", 300, age_days=40),
+]
+
+
+class TestLatencyPercentiles:
+    """Test cases for percentile estimation from latency buckets."""
+
+    def test_percentiles_interpolate_within_buckets(self):
+        """Test that estimates stay within the bucket holding the rank."""
+        buckets = {
+            latency_bucket(50): {"calls": 50, "duration_ms_max": 100},
+            latency_bucket(1500): {"calls": 40, "duration_ms_max": 2000},
+            latency_bucket(200000): {"calls": 10, "duration_ms_max": 200000},
+            -1: {"calls": 5, "duration_ms_max": 0},
+        }
+
+        estimates = _latency_percentiles(buckets)
+
+        assert estimates["p50_ms"] == 100.0
+        assert 1000 < estimates["p90_ms"] <= 2000
+        assert 120000 < estimates["p99_ms"] <= 200000
+        assert _latency_percentiles({-1: {"calls": 3, "duration_ms_max": 0}})["p50_ms"] is None
+
+
+class TestLogStats:
+    """Test cases for LLMLogService.get_log_stats."""
+
+    @pytest.mark.asyncio
+    async def test_stats_per_endpoint_and_model_from_rollups(self, session_factory):
+        """Test that logs written through the repository are counted in the window."""
+        await create_tables(session_factory)
+        with patch("src.repositories.log_repository.async_session_factory", session_factory):
+            repository = LLMLogRepository()
+            for values in LOGS:
+                await repository.create(values)
+            stats = await LLMLogService(repository).get_log_stats(days=30)
+
+        assert stats["total_logs"] == 5
+        assert stats["counts_by_endpoint"] == {"generate-agent": 2, "generate-crew": 3}
+        crew = stats["by_endpoint"]["generate-crew"]
+        assert (crew["calls"], crew["errors"], crew["tokens_used"]) == (3, 1, 200)
+        assert crew["error_rate"] == pytest.approx(1 / 3, abs=1e-4)
+        assert crew["avg_duration_ms"] == pytest.approx(2100.0)
+        assert 1000 < crew["p50_ms"] <= 1500
+        assert stats["by_model"]["gpt-4o-mini"]["avg_duration_ms"] == 90.0
+        assert [(row["endpoint"], row["model"]) for row in stats["by_endpoint_model"]] == [
+            ("generate-agent", "gpt-4o-mini"),
+            ("generate-crew", "gpt-4o"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_existing_logs_are_backfilled_when_rollups_are_created(self, session_factory):
+        """Test that logs predating the rollup table count, alongside logs written afterwards."""
+        async with session_factory.kw["bind"].begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, tables=[LLMLog.__table__])
+        async with session_factory() as session:
+            session.add_all([LLMLog(**values) for values in LOGS])
+            await session.commit()
+
+        # What init_db does for a database created before the rollups existed
+        async with session_factory.kw["bind"].begin() as connection:
+            existing_tables = await connection.run_sync(_get_table_names)
+            await connection.run_sync(Base.metadata.create_all, tables=[LLMLogDailyStats.__table__])
+            await connection.run_sync(_backfill_new_tables, existing_tables)
+            # Only a newly created rollup table is backfilled
+            await connection.run_sync(_backfill_new_tables, existing_tables | {"llmlog_daily_stats"})
+
+        with patch("src.repositories.log_repository.async_session_factory", session_factory):
+            repository = LLMLogRepository()
+            await repository.create(log("generate-agent", "gpt-4o-mini", 120))
+            stats = await LLMLogService(repository).get_log_stats(days=60)
+
+        assert stats["total_logs"] == 7
+        assert stats["by_endpoint"]["generate-agent"]["calls"] == 4
+        assert stats["by_endpoint"]["generate-crew"]["errors"] == 1
+        assert stats["totals"]["tokens_used"] == 600
+
+    @pytest.mark.asyncio
+    async def test_migration_backfills_existing_logs(self, session_factory):
+        """Test that the migration creating the rollup table fills it from llmlog."""
+        migration_path = glob.glob(os.path.join(
+            os.path.dirname(__file__), "..", "..", "migrations", "versions", "e8b4c1a9d263_*.py"
+        ))[0]
+        spec = importlib.util.spec_from_file_location("llmlog_daily_stats_migration", migration_path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        async with session_factory.kw["bind"].begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, tables=[LLMLog.__table__])
+        async with session_factory() as session:
+            session.add_all([LLMLog(**values) for values in LOGS])
+            await session.commit()
+
+        def upgrade(connection):
+            with Operations.context(MigrationContext.configure(connection)):
+                migration.upgrade()
+
+        async with session_factory.kw["bind"].begin() as connection:
+            await connection.run_sync(upgrade)
+
+        with patch("src.repositories.log_repository.async_session_factory", session_factory):
+            stats = await LLMLogService(LLMLogRepository()).get_log_stats(days=60)
+
+        assert stats["total_logs"] == 6
+        assert stats["totals"]["tokens_used"] == 500
@@ -0,0 +1,155 @@
+"""
+Unit tests for the crew process pool.
+
+Tests IPC forwarding of traces and logs from worker processes and the
+lifecycle of worker processes, including crashes and cancellation.
+"""
+import asyncio
+import pickle
+import queue
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.engines.crewai.process_executor import (
+    CrewProcessPool,
+    LOG_CHANNEL,
+    TRACE_CHANNEL,
+    _IpcForwardingQueue,
+)
+
+
+def fake_process(alive_checks=1, exitcode=0):
+    """Create a mock worker process that is alive for a number of checks."""
+    process = MagicMock()
+    process.pid = 1234
+    process.exitcode = exitcode
+    process.is_alive.side_effect = [True] * alive_checks + [False] * 100
+    return process
+
+
+@pytest.fixture
+def pool():
+    """Create a pool that polls quickly."""
+    pool = CrewProcessPool(max_workers=2, terminate_timeout=0.1)
+    pool.POLL_INTERVAL_SECONDS = 0.01
+    return pool
+
+
+class TestIpcForwarding:
+    """Test cases for forwarding queue items between processes."""
+
+    def test_forwarding_queue_pickles_items_and_skips_shutdown_signal(self):
+        """Test that items are forwarded on their channel and None is not."""
+        ipc_queue = queue.Queue()
+        forwarder = _IpcForwardingQueue(ipc_queue, TRACE_CHANNEL)
+
+        forwarder.put_nowait({"job_id": "job-1", "output": threading.Lock()})
+        forwarder.put_nowait(None)
+
+        channel, payload = ipc_queue.get_nowait()
+        assert channel == TRACE_CHANNEL
+        item = pickle.loads(payload)
+        assert item["job_id"] == "job-1"
+        assert isinstance(item["output"], str)
+        assert ipc_queue.empty()
+
+    def test_pump_routes_items_to_local_queues(self):
+        """Test that the pump delivers traces and logs to their own queues."""
+        ipc_queue = queue.Queue()
+        trace_queue = queue.Queue()
+        log_queue = queue.Queue()
+        _IpcForwardingQueue(ipc_queue, TRACE_CHANNEL).put_nowait({"job_id": "job-1", "event_type": "tool_usage"})
+        _IpcForwardingQueue(ipc_queue, LOG_CHANNEL).put_nowait({"job_id": "job-1", "content": "hello"})
+        ipc_queue.put(None)
+
+        with patch("src.services.trace_queue.get_trace_queue", return_value=trace_queue), \
+             patch("src.services.execution_logs_queue.get_job_output_queue", return_value=log_queue):
+            CrewProcessPool._pump(ipc_queue)
+
+        assert trace_queue.get_nowait()["event_type"] == "tool_usage"
+        assert log_queue.get_nowait()["content"] == "hello"
+
+
+    def test_pump_survives_bad_messages_and_stops_on_closed_queue(self):
+        """Test that unreadable or malformed items are skipped and a broken queue ends the pump."""
+        log_queue = queue.Queue()
+        good = (LOG_CHANNEL, pickle.dumps({"job_id": "job-1", "content": "hello"}))
+        ipc_queue = MagicMock()
+        ipc_queue.get.side_effect = [
+            pickle.UnpicklingError("truncated"),
+            ("unknown", b"not a pickle"),
+            good,
+            EOFError(),
+        ]
+
+        with patch("src.services.execution_logs_queue.get_job_output_queue", return_value=log_queue):
+            CrewProcessPool._pump(ipc_queue)
+
+        assert log_queue.get_nowait()["content"] == "hello"
+        assert log_queue.empty()
+
+    def test_pump_drains_then_stops_when_asked(self):
+        """Test that a stopped pump still forwards the items already queued."""
+        ipc_queue = queue.Queue()
+        log_queue = queue.Queue()
+        _IpcForwardingQueue(ipc_queue, LOG_CHANNEL).put_nowait({"job_id": "job-1", "content": "last"})
+        stop = threading.Event()
+        stop.set()
+
+        with patch("src.services.execution_logs_queue.get_job_output_queue", return_value=log_queue):
+            CrewProcessPool._pump(ipc_queue, stop, poll_interval=0.01)
+
+        assert log_queue.get_nowait()["content"] == "last"
+
+
+class TestCrewProcessPool:
+    """Test cases for CrewProcessPool."""
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_marks_execution_failed(self, pool):
+        """Test that a worker dying with a non-zero exit code fails the execution."""
+        process = fake_process(exitcode=-9)
+        running_jobs = {"job-1": {}}
+        with patch.object(pool._ctx, "Process", return_value=process), \
+             patch("src.engines.crewai.execution_runner.update_execution_status_with_retry",
+                   new_callable=AsyncMock) as update_status:
+            await pool.run_crew("job-1", {}, running_jobs)
+
+        update_status.assert_awaited_once()
+        assert update_status.await_args.args[1] == "FAILED"
+        assert running_jobs == {}
+        assert pool.active_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_terminates_worker(self, pool):
+        """Test that cancelling the execution task terminates its worker."""
+        process = MagicMock()
+        process.is_alive.return_value = True
+        with patch.object(pool._ctx, "Process", return_value=process):
+            task = asyncio.create_task(pool.run_crew("job-1", {}, {}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        process.terminate.assert_called_once()
+        process.kill.assert_called_once()
+        assert pool.active_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_workers_wait_for_a_free_slot(self, pool):
+        """Test that no more than max_workers workers run at once."""
+        processes = [fake_process(alive_checks=5) for _ in range(3)]
+        with patch.object(pool._ctx, "Process", side_effect=processes) as create_process:
+            runs = [asyncio.create_task(pool.run_crew(f"job-{i}", {}, {})) for i in range(3)]
+            await asyncio.sleep(0.02)
+            assert pool.active_count() == 2
+            assert processes[2].start.call_count == 0
+            await asyncio.gather(*runs)
+
+        assert all(p.start.call_count == 1 for p in processes)
+        # No worker shares its IPC queue with another
+        ipc_queues = [call.kwargs["args"][2] for call in create_process.call_args_list]
+        assert len({id(ipc_queue) for ipc_queue in ipc_queues}) == 3
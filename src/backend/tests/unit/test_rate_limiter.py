@@ -0,0 +1,94 @@
+"""
+Unit tests for RateLimiter.
+
+Tests request and token buckets per model, non-blocking async waits,
+completion token accounting, file-shared buckets and the exposed levels.
+"""
+import asyncio
+import tempfile
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter, estimate_tokens, model_key
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_unconfigured_model_is_unlimited(self):
+        """Test that models without limits never wait."""
+        limiter = RateLimiter()
+        assert limiter.get_limit("gpt-4o") is None
+        assert all(limiter.try_acquire("gpt-4o", 10**6) == 0 for _ in range(100))
+
+    def test_request_bucket_returns_wait_time(self):
+        """Test that the request bucket empties and reports the refill wait."""
+        limiter = RateLimiter()
+        limiter.configure("databricks/databricks-claude", rpm=60, tpm=None)
+
+        assert limiter.try_acquire("databricks-claude") == 0
+        for _ in range(59):
+            limiter.try_acquire("databricks/databricks-claude")
+
+        assert limiter.try_acquire("databricks-claude") == pytest.approx(1.0, abs=0.05)
+
+    def test_completion_tokens_drain_token_bucket(self):
+        """Test that recorded usage makes the next call wait for tokens."""
+        limiter = RateLimiter()
+        limiter.configure("gpt-4o", rpm=None, tpm=6000)
+
+        assert limiter.try_acquire("gpt-4o", 1000) == 0
+        limiter.record_usage("gpt-4o", 5000)
+
+        # 1000 tokens at 100 tokens per second
+        assert limiter.try_acquire("gpt-4o", 1000) == pytest.approx(10.0, abs=0.1)
+        levels = limiter.get_levels()["gpt-4o"]
+        assert levels["tokens_available"] == pytest.approx(0.0, abs=1)
+        assert levels["requests_available"] is None
+
+    @pytest.mark.asyncio
+    async def test_async_wait_yields_to_event_loop(self):
+        """Test that waiting for a limit lets other coroutines run."""
+        limiter = RateLimiter()
+        limiter.configure("gpt-4o", rpm=600, tpm=None)
+        for _ in range(600):
+            limiter.try_acquire("gpt-4o")
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        waited = await limiter.acquire("gpt-4o")
+        task.cancel()
+
+        assert waited == pytest.approx(0.1, abs=0.05)
+        assert ticks >= 5
+        assert limiter.get_levels()["gpt-4o"]["waits"] == 1
+
+    def test_shared_dir_shares_buckets_between_limiters(self):
+        """Test that limiters using the same directory draw from one bucket."""
+        with tempfile.TemporaryDirectory() as shared_dir:
+            first = RateLimiter(shared_dir=shared_dir)
+            second = RateLimiter(shared_dir=shared_dir)
+            for limiter in (first, second):
+                limiter.configure("gpt-4o", rpm=2, tpm=None)
+
+            assert first.try_acquire("gpt-4o") == 0
+            assert second.try_acquire("gpt-4o") == 0
+            assert first.try_acquire("gpt-4o") > 0
+            assert second.get_levels()["gpt-4o"]["shared"]
+
+    def test_disabled_limiter_and_helpers(self):
+        """Test disabling, model key normalization and token estimates."""
+        limiter = RateLimiter(enabled=False)
+        limiter.configure("gpt-4o", rpm=1, tpm=1)
+        assert limiter.get_limit("gpt-4o") is None
+
+        assert model_key("ollama/llama3:8b") == "llama3:8b"
+        assert estimate_tokens([{"role": "user", "content": "x" * 400}]) == 100
+        assert estimate_tokens(["abcd", "efgh"]) == 2
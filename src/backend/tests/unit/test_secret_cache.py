@@ -0,0 +1,61 @@
+"""
+Unit tests for SecretCache.
+
+Tests hits and misses, caching of absent secrets, wiping of values on
+invalidation and eviction, and rejection of values resolved before an
+invalidation.
+"""
+from unittest.mock import patch
+
+from src.utils.secret_cache import SecretCache
+
+
+class TestSecretCache:
+    """Test cases for SecretCache."""
+
+    def test_lookup_counts_hits_and_misses(self):
+        """Test that lookups report cached values and update the counters."""
+        cache = SecretCache(ttl_seconds=60, max_size=10)
+        assert cache.lookup("OPENAI_API_KEY") == (False, None)
+
+        cache.put("OPENAI_API_KEY", "sk-test", cache.version)
+        assert cache.lookup("OPENAI_API_KEY") == (True, "sk-test")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_absent_secret_is_cached(self):
+        """Test that a secret known not to exist is served from the cache."""
+        cache = SecretCache(ttl_seconds=60, max_size=10)
+        cache.put("GEMINI_API_KEY", None, cache.version)
+        assert cache.lookup("GEMINI_API_KEY") == (True, None)
+
+    def test_invalidate_wipes_value_and_rejects_racing_put(self):
+        """Test that invalidation zeroes the buffer and blocks stale values."""
+        cache = SecretCache(ttl_seconds=60, max_size=10)
+        cache.put("OPENAI_API_KEY", "sk-old", cache.version)
+        secret = cache._entries["OPENAI_API_KEY"][1]
+        buffer = secret._buffer
+
+        version = cache.version
+        cache.invalidate("OPENAI_API_KEY")
+
+        assert bytes(buffer) == b"\x00" * len("sk-old")
+        assert cache.lookup("OPENAI_API_KEY") == (False, None)
+        assert not cache.put("OPENAI_API_KEY", "sk-old", version)
+
+    def test_expiry_and_eviction_wipe_values(self):
+        """Test that expired and evicted entries are dropped and wiped."""
+        cache = SecretCache(ttl_seconds=60, max_size=1)
+        cache.put("A", "first", cache.version)
+        evicted = cache._entries["A"][1]._buffer
+        cache.put("B", "second", cache.version)
+
+        assert bytes(evicted) == b"\x00" * len("first")
+        assert cache.get_stats()["evictions"] == 1
+
+        with patch("src.utils.secret_cache.time.monotonic", return_value=float("inf")):
+            assert cache.lookup("B") == (False, None)
+        assert cache.get_stats()["size"] == 0
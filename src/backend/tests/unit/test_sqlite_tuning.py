@@ -0,0 +1,155 @@
+"""
+Unit tests for the tuned SQLite mode.
+
+Tests that new SQLite connections get the performance profile, and that the
+single writer lane runs write operations one at a time, including those
+submitted from other threads, finishes queued writes when stopped, and
+leaves later writes to their callers.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config.settings import settings
+from src.db.session import configure_sqlite_engine
+from src.utils.asyncio_utils import SingleWriterLane
+
+
+class TestSQLiteTuning:
+    """Test cases for the SQLite performance profile."""
+
+    @pytest.mark.asyncio
+    async def test_connections_get_pragmas(self):
+        """Test that every connection of a configured engine is tuned."""
+        with tempfile.TemporaryDirectory() as db_dir:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(db_dir, 'tuned.db')}")
+            configure_sqlite_engine(engine)
+            # Configuring twice must not register the listener twice
+            configure_sqlite_engine(engine)
+            try:
+                async with engine.connect() as connection:
+                    pragma = lambda name: connection.execute(text(f"PRAGMA {name}"))
+                    assert (await pragma("journal_mode")).scalar() == "wal"
+                    assert (await pragma("synchronous")).scalar() == 1
+                    assert (await pragma("busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+                    assert (await pragma("cache_size")).scalar() == -settings.SQLITE_CACHE_SIZE_KB
+            finally:
+                await engine.dispose()
+
+
+class TestSingleWriterLane:
+    """Test cases for SingleWriterLane."""
+
+    @pytest.mark.asyncio
+    async def test_writes_run_one_at_a_time(self):
+        """Test that concurrent writes from this and another thread never overlap."""
+        active = 0
+        overlaps = 0
+
+        async def run(operation):
+            nonlocal active, overlaps
+            active += 1
+            overlaps += active > 1
+            try:
+                await asyncio.sleep(0.001)
+                return await operation(None)
+            finally:
+                active -= 1
+
+        async def write(value):
+            return value
+
+        lane = SingleWriterLane()
+        with patch("src.utils.asyncio_utils.execute_db_operation", run):
+            lane.start()
+            thread_results = []
+
+            async def submit_from_thread():
+                thread_results.extend(
+                    await asyncio.gather(*[lane.submit(lambda s, i=i: write(100 + i)) for i in range(5)])
+                )
+
+            thread = threading.Thread(target=lambda: asyncio.run(submit_from_thread()))
+            thread.start()
+            results = await asyncio.gather(*[lane.submit(lambda s, i=i: write(i)) for i in range(10)])
+            await asyncio.to_thread(thread.join)
+
+            # Queued before stop, finished by stop
+            pending = asyncio.ensure_future(lane.submit(lambda s: write("last")))
+            await asyncio.sleep(0)
+            await lane.stop()
+
+        assert results == list(range(10))
+        assert thread_results == [100 + i for i in range(5)]
+        assert await pending == "last"
+        assert overlaps == 0
+        assert not lane.running
+
+    @pytest.mark.asyncio
+    async def test_writes_after_stop_run_in_the_caller(self):
+        """Test that writes submitted during or after stop never wait on the stopped lane."""
+        loops = []
+
+        async def run(operation):
+            loops.append(asyncio.get_running_loop())
+            return await operation(None)
+
+        async def write(value):
+            return value
+
+        lane = SingleWriterLane()
+        with patch("src.utils.asyncio_utils.execute_db_operation", run):
+            lane.start()
+            started = threading.Event()
+            thread_results = []
+
+            async def submit_from_thread():
+                started.set()
+                for i in range(50):
+                    thread_results.append(await lane.submit(lambda s, i=i: write(i)))
+
+            # Writes from another thread race the stop
+            thread = threading.Thread(target=lambda: asyncio.run(submit_from_thread()))
+            thread.start()
+            await asyncio.to_thread(started.wait)
+            await lane.stop()
+            await asyncio.wait_for(asyncio.to_thread(thread.join), timeout=5.0)
+
+            assert await lane.submit(lambda s: write("after")) == "after"
+            assert loops[-1] is asyncio.get_running_loop()
+
+            # With the lane's loop blocked, as when it is shutting down, a
+            # write from another thread must not wait for it
+            late_results = []
+            thread = threading.Thread(
+                target=lambda: late_results.append(asyncio.run(lane.submit(lambda s: write("late")))),
+                daemon=True,
+            )
+            thread.start()
+            thread.join(timeout=5.0)
+            assert late_results == ["late"]
+
+        assert thread_results == list(range(50))
+        assert not lane.running
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_the_caller(self):
+        """Test that a failing write raises in the submitting coroutine."""
+        async def run(operation):
+            return await operation(None)
+
+        async def fail(session):
+            raise ValueError("locked")
+
+        lane = SingleWriterLane()
+        with patch("src.utils.asyncio_utils.execute_db_operation", run):
+            lane.start()
+            with pytest.raises(ValueError):
+                await lane.submit(fail)
+            await lane.stop()
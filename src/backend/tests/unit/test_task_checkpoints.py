@@ -0,0 +1,108 @@
+"""
+Unit tests for TaskCheckpointer.
+
+Tests recording task outputs from task callbacks, restoring persisted
+checkpoints and trimming a crew to resume at the first unfinished task.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.engines.crewai.task_checkpoints import TaskCheckpointer, task_key
+
+
+def make_crew(count=3, process="sequential"):
+    tasks = [
+        SimpleNamespace(description=f"task {i}", expected_output="text", context=None, callback=None, output=None)
+        for i in range(count)
+    ]
+    return SimpleNamespace(tasks=list(tasks), process=process)
+
+
+def finish(task, raw):
+    """Simulate CrewAI completing a task."""
+    output = SimpleNamespace(raw=raw, json_dict=None, agent="Writer")
+    task.output = output
+    task.callback(output)
+
+
+class TestTaskCheckpointer:
+    """Test cases for TaskCheckpointer."""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_finished_tasks_and_passes_their_context(self):
+        """Test that a retry starts at the first unfinished task with earlier tasks as context."""
+        crew = make_crew()
+        tasks = list(crew.tasks)
+        original_callback = MagicMock()
+        tasks[0].callback = original_callback
+        db = AsyncMock()
+
+        with patch("src.engines.crewai.task_checkpoints.execute_db_operation", db):
+            checkpointer = TaskCheckpointer("job-1", crew)
+            checkpointer.install()
+            finish(tasks[0], "first")
+            await checkpointer.flush()
+
+        original_callback.assert_called_once_with(tasks[0].output)
+        db.assert_awaited_once()
+
+        assert checkpointer.resume() == 1
+        assert crew.tasks == tasks[1:]
+        assert tasks[1].context == tasks[:1]
+        assert tasks[2].context == tasks[:2]
+
+        checkpointer.restore()
+        assert crew.tasks == tasks
+        assert tasks[1].context is None
+
+    @pytest.mark.asyncio
+    async def test_load_restores_only_matching_checkpoints(self):
+        """Test that persisted checkpoints are applied only to the task they were taken from."""
+        crew = make_crew(count=2)
+        tasks = list(crew.tasks)
+        checkpoints = [
+            SimpleNamespace(task_index=0, task_key=task_key(tasks[0]), raw_output="first", json_output=None, agent_name="Writer"),
+            SimpleNamespace(task_index=1, task_key="changed-task", raw_output="stale", json_output=None, agent_name="Writer"),
+        ]
+
+        with patch("src.engines.crewai.task_checkpoints.execute_db_operation", AsyncMock(return_value=checkpoints)):
+            checkpointer = TaskCheckpointer("job-1", crew)
+            assert await checkpointer.load() == 1
+
+        assert tasks[0].output.raw == "first"
+        assert tasks[1].output is None
+        assert checkpointer.first_unfinished() == 1
+        assert not checkpointer.is_complete()
+
+    @pytest.mark.asyncio
+    async def test_all_tasks_finished_uses_last_output(self):
+        """Test that a crew whose tasks all finished reports the last task output."""
+        crew = make_crew(count=2)
+        tasks = list(crew.tasks)
+
+        with patch("src.engines.crewai.task_checkpoints.execute_db_operation", AsyncMock()):
+            checkpointer = TaskCheckpointer("job-1", crew)
+            checkpointer.install()
+            finish(tasks[0], "first")
+            finish(tasks[1], "second")
+            await checkpointer.flush()
+
+        assert checkpointer.is_complete()
+        assert checkpointer.final_output() == "second"
+
+    @pytest.mark.asyncio
+    async def test_hierarchical_crew_is_rerun_in_full(self):
+        """Test that crews not run sequentially are never trimmed."""
+        crew = make_crew(process="hierarchical")
+        tasks = list(crew.tasks)
+
+        with patch("src.engines.crewai.task_checkpoints.execute_db_operation", AsyncMock()):
+            checkpointer = TaskCheckpointer("job-1", crew)
+            checkpointer.install()
+            finish(tasks[0], "first")
+            await checkpointer.flush()
+
+        assert checkpointer.resume() == 0
+        assert crew.tasks == tasks
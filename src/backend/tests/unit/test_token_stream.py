@@ -0,0 +1,86 @@
+"""
+Unit tests for TokenStreamer.
+
+Tests that token deltas pushed from crew threads reach WebSocket subscribers
+as coalesced frames without being stored, that executions without
+subscribers are skipped, and that worker processes forward their deltas.
+"""
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.execution_logs_service import ExecutionLogsService
+from src.services.token_stream_service import TokenStreamer
+
+
+class FakeWebSocket:
+    """WebSocket stand-in recording sent messages."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text):
+        self.messages.append(json.loads(text))
+
+
+class TestTokenStreamer:
+    """Test cases for TokenStreamer."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_are_coalesced_into_frames_and_not_stored(self):
+        """Test that deltas within a frame interval are sent as one unstored frame."""
+        service = ExecutionLogsService()
+        websocket = FakeWebSocket()
+        service.active_connections["exec-1"] = {websocket}
+        service.loop = asyncio.get_running_loop()
+        streamer = TokenStreamer(frame_interval=0.05)
+
+        def crew_thread():
+            for delta in ("Hel", "lo", " world"):
+                assert streamer.push("exec-1", delta)
+            assert not streamer.push("exec-2", "unwatched")
+
+        with patch("src.services.token_stream_service.execution_logs_service", service), \
+             patch("src.services.execution_logs_service.enqueue_log") as enqueue_log:
+            thread = threading.Thread(target=crew_thread)
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.15)
+            streamer.push("exec-1", "!")
+            await asyncio.sleep(0.15)
+
+        assert [(message["type"], message["content"]) for message in websocket.messages] == [
+            ("token", "Hello world"),
+            ("token", "!"),
+        ]
+        enqueue_log.assert_not_called()
+        assert streamer.get_stats() == {"deltas": 4, "frames": 2, "pending": 0}
+
+    def test_forwarder_receives_deltas_in_worker_processes(self):
+        """Test that a forwarder takes every delta instead of local framing."""
+        forwarded = []
+        streamer = TokenStreamer()
+        streamer.set_forwarder(lambda execution_id, delta: forwarded.append((execution_id, delta)))
+
+        assert streamer.push("exec-1", "token")
+        assert not streamer.push("exec-1", "")
+
+        assert forwarded == [("exec-1", "token")]
+
+    def test_crew_llms_are_switched_to_streaming(self):
+        """Test that each distinct agent and manager LLM is set to stream once."""
+        from src.engines.crewai.execution_runner import _enable_llm_streaming
+
+        shared = SimpleNamespace(stream=False)
+        manager = SimpleNamespace(stream=False)
+        crew = SimpleNamespace(
+            agents=[SimpleNamespace(llm=shared), SimpleNamespace(llm=shared), SimpleNamespace(llm="gpt-4o")],
+            manager_llm=manager,
+        )
+
+        assert _enable_llm_streaming(crew) == 2
+        assert shared.stream and manager.stream